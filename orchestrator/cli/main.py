@@ -195,23 +195,25 @@ def team_status(
 @app.command()
 def team_messages(
     team_name: str = typer.Argument(..., help="チーム名"),
-    limit: int = typer.Option(10, "--limit", "-l", help="表示数（デフォルト: 10）"),
+    limit: int = typer.Option(10, "--limit", "-l", help="表示数（デフォルト: 10、0で全件）"),
+    since: str | None = typer.Option(None, "--since", help="このタイムスタンプ以降のみ表示"),
+    until: str | None = typer.Option(None, "--until", help="このタイムスタンプより前のみ表示"),
     json_output: bool = typer.Option(False, "--json", help="JSON形式で出力"),
 ) -> None:
     """チームのメッセージを表示します。
 
-    チーム内のメッセージ履歴を表示します。
+    チーム内のメッセージ履歴を、最新のものからlimit件までタイムスタンプ順に表示します。
     """
     monitor = TeamsMonitor()
-    messages = monitor.get_team_messages(team_name)
+    # 全件を変換せず、インデックスから必要な件数だけを取得する
+    messages = monitor.get_team_messages_page(
+        team_name, limit=limit if limit > 0 else None, since=since, until=until
+    ).items
 
     if not messages:
         typer.echo(f"チーム '{team_name}' のメッセージが見つかりませんでした")
         return
 
-    # 制限を適用
-    messages = messages[-limit:] if limit > 0 else messages
-
     if json_output:
         typer.echo(json.dumps(messages, ensure_ascii=False, indent=2))
         return
@@ -355,7 +357,8 @@ def health(
 def show_logs(
     team_name: str = typer.Argument(..., help="チーム名"),
     agent: str = typer.Option(None, "--agent", "-a", help="エージェント名でフィルタ"),
-    limit: int = typer.Option(20, "--limit", "-l", help="表示数（デフォルト: 20）"),
+    category: str | None = typer.Option(None, "--category", "-c", help="カテゴリでフィルタ"),
+    limit: int = typer.Option(20, "--limit", "-l", help="表示数（デフォルト: 20、0で全件）"),
     follow: bool = typer.Option(False, "--follow", "-f", help="リアルタイム監視"),
     json_output: bool = typer.Option(False, "--json", help="JSON形式で出力"),
 ) -> None:
@@ -364,19 +367,16 @@ def show_logs(
     チーム内のエージェントの思考ログを表示します。
     """
     handler = get_thinking_log_handler()
-    logs = handler.get_logs(team_name)
+    # エージェント・カテゴリの絞り込みと件数の制限はインデックス上で行う
+    page = handler.get_logs_page(
+        team_name, agent=agent, category=category, limit=limit if limit > 0 else None
+    )
+    logs = page.items
 
     if not logs:
         typer.echo(f"チーム '{team_name}' の思考ログが見つかりませんでした")
         return
 
-    # エージェントでフィルタ
-    if agent:
-        logs = [log for log in logs if log.get("agentName") == agent]
-
-    # 制限を適用
-    logs = logs[-limit:] if limit > 0 else logs
-
     if json_output:
         typer.echo(json.dumps(logs, ensure_ascii=False, indent=2))
         return
@@ -385,6 +385,8 @@ def show_logs(
     typer.echo(f"チーム '{team_name}' の思考ログ ({len(logs)}件)")
     if agent:
         typer.echo(f"エージェント: {agent}")
+    if category:
+        typer.echo(f"カテゴリ: {category}")
     typer.echo(f"{'=' * 60}\n")
 
     def _display_logs(logs_to_display: list[dict[str, Any]]) -> None:
@@ -415,24 +417,18 @@ def show_logs(
     # リアルタイム監視モード
     if follow:
         typer.echo("リアルタイム監視中... (Ctrl+C で終了)", err=True)
-        displayed_log_ids = {log.get("id") for log in logs if log.get("id")}
+        cursor = page.after
 
         try:
             while True:
                 time.sleep(1)
-                new_logs = handler.get_logs(team_name)
-
-                # エージェントでフィルタ
-                if agent:
-                    new_logs = [log for log in new_logs if log.get("agentName") == agent]
-
-                # 新しいログのみを表示
-                fresh_logs = [log for log in new_logs if log.get("id") not in displayed_log_ids]
-                if fresh_logs:
-                    for log in fresh_logs:
-                        if log.get("id"):
-                            displayed_log_ids.add(log["id"])
-                    _display_logs(fresh_logs)
+                # 前回表示した最後のログより新しいログのみを取得する
+                fresh = handler.get_logs_page(
+                    team_name, agent=agent, category=category, after=cursor
+                )
+                if fresh.items:
+                    cursor = fresh.after
+                    _display_logs(fresh.items)
 
         except KeyboardInterrupt:
             typer.echo("\n監視を終了しました", err=True)
@@ -187,19 +187,45 @@ class AgentHealthMonitor:
             status: dict[str, Any] = {}
 
             for team_name, agents in self._health_status.items():
-                status[team_name] = {}
-
-                for agent_name, health in agents.items():
-                    is_healthy = health.check_health()
-                    status[team_name][agent_name] = {
-                        "isHealthy": is_healthy,
-                        "lastActivity": health.last_activity.isoformat(),
-                        "timeoutThreshold": health.timeout_threshold,
-                        "elapsed": (datetime.now() - health.last_activity).total_seconds(),
-                    }
+                status[team_name] = self._team_health(agents)
 
             return status
 
+    def get_team_health(self, team_name: str) -> dict[str, Any]:
+        """1つのチームのヘルス状態を取得します。
+
+        他のチームのエージェントは参照しないため、チーム数に関係なく一定の時間で取得できます。
+
+        Args:
+            team_name: チーム名
+
+        Returns:
+            エージェント名 -> ヘルス状態の辞書（監視対象でないチームは空の辞書）
+        """
+        with self._lock:
+            return self._team_health(self._health_status.get(team_name, {}))
+
+    @staticmethod
+    def _team_health(agents: dict[str, AgentHealthStatus]) -> dict[str, Any]:
+        """チームのエージェントのヘルス状態を辞書に変換します（ロック内で呼び出し）。
+
+        Args:
+            agents: エージェント名 -> ヘルス状態
+
+        Returns:
+            エージェント名 -> ヘルス状態の辞書
+        """
+        status: dict[str, Any] = {}
+        for agent_name, health in agents.items():
+            is_healthy = health.check_health()
+            status[agent_name] = {
+                "isHealthy": is_healthy,
+                "lastActivity": health.last_activity.isoformat(),
+                "timeoutThreshold": health.timeout_threshold,
+                "elapsed": (datetime.now() - health.last_activity).total_seconds(),
+            }
+        return status
+
     def _monitor_loop(self) -> None:
         """監視ループ"""
         while not self._stop_event.is_set():
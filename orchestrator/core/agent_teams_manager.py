@@ -143,9 +143,7 @@ class AgentTeamsManager:
         logger.info(f"Team deleted: {team_name}")
         return True
 
-    def graceful_shutdown_team(
-        self, team_name: str, timeout: float = 30.0
-    ) -> dict[str, Any]:
+    def graceful_shutdown_team(self, team_name: str, timeout: float = 30.0) -> dict[str, Any]:
         """チームをグレースフルシャットダウンします。
 
         注: このメソッドは手動実行用のフォールバック機能です。
@@ -265,6 +263,10 @@ class AgentTeamsManager:
     def get_team_status(self, team_name: str) -> dict[str, Any]:
         """チームの状態を取得します。
 
+        メンバーとタスクはconfig.jsonとタスクファイルの内容をそのまま返します
+        （ダッシュボードの /api/teams/{team_name}/status は正規化した形式で、
+        schemaVersionを含みます）。
+
         Args:
             team_name: チーム名
 
@@ -288,8 +290,7 @@ class AgentTeamsManager:
         tasks = self.get_team_tasks(team_name)
 
         # ヘルス状態を取得
-        health_status = self._health_monitor.get_health_status()
-        team_health = health_status.get(team_name, {})
+        team_health = self._health_monitor.get_team_health(team_name)
 
         return {
             "name": team_name,
@@ -13,6 +13,7 @@ from orchestrator.core.agent_teams_manager import AgentTeamsManager
 from orchestrator.web.team_models import GlobalState
 from orchestrator.web.teams_monitor import TeamsMonitor
 from orchestrator.web.thinking_log_handler import ThinkingLogHandler
+from orchestrator.web.watch_service import get_watch_service
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
@@ -278,6 +279,16 @@ async def stop_teams_monitoring() -> dict[str, str]:
     return {"message": "Teams monitoring stopped"}
 
 
+@router.get("/teams/monitoring/stats")
+async def get_teams_monitoring_stats() -> dict[str, Any]:
+    """ファイル監視の統計情報を取得します。
+
+    Returns:
+        監視中のwatch数やイベントキューの深さなどの統計情報
+    """
+    return {"watch": get_watch_service().get_stats()}
+
+
 @router.get("/")
 async def api_info() -> dict[str, Any]:
     """API情報を返します"""
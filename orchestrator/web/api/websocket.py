@@ -97,6 +97,8 @@ async def websocket_endpoint(
             {
                 "type": "connected",
                 "message": "Connected to Orchestrator CC Dashboard",
+                "seq": ws_manager.current_seq,
+                "epoch": ws_manager.epoch,
             },
             websocket,
         )
@@ -166,16 +168,12 @@ async def handle_join_channel(
     """
     channel_name = message.get("channel")
     if not channel_name:
-        await websocket.send_json(
-            {"type": "error", "message": "Channel name is required"}
-        )
+        await websocket.send_json({"type": "error", "message": "Channel name is required"})
         return
 
     channel_manager = _get_channel_manager()
     if not channel_manager:
-        await websocket.send_json(
-            {"type": "error", "message": "Channel manager not available"}
-        )
+        await websocket.send_json({"type": "error", "message": "Channel manager not available"})
         return
 
     # ChannelManagerからチャンネルを取得または作成
@@ -207,16 +205,12 @@ async def handle_leave_channel(
     """
     channel_name = message.get("channel")
     if not channel_name:
-        await websocket.send_json(
-            {"type": "error", "message": "Channel name is required"}
-        )
+        await websocket.send_json({"type": "error", "message": "Channel name is required"})
         return
 
     channel_manager = _get_channel_manager()
     if not channel_manager:
-        await websocket.send_json(
-            {"type": "error", "message": "Channel manager not available"}
-        )
+        await websocket.send_json({"type": "error", "message": "Channel manager not available"})
         return
 
     channel = channel_manager.get_channel(channel_name)
@@ -247,16 +241,12 @@ async def handle_channel_message(
     """
     channel_name = message.get("channel")
     if not channel_name:
-        await websocket.send_json(
-            {"type": "error", "message": "Channel name is required"}
-        )
+        await websocket.send_json({"type": "error", "message": "Channel name is required"})
         return
 
     channel_manager = _get_channel_manager()
     if not channel_manager:
-        await websocket.send_json(
-            {"type": "error", "message": "Channel manager not available"}
-        )
+        await websocket.send_json({"type": "error", "message": "Channel manager not available"})
         return
 
     channel = channel_manager.get_channel(channel_name)
@@ -283,9 +273,7 @@ async def handle_list_channels(
     """
     channel_manager = _get_channel_manager()
     if not channel_manager:
-        await websocket.send_json(
-            {"type": "error", "message": "Channel manager not available"}
-        )
+        await websocket.send_json({"type": "error", "message": "Channel manager not available"})
         return
 
     channels = channel_manager.list_channels()
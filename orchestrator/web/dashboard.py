@@ -9,26 +9,42 @@
 - リアルタイム状態配信
 """
 
+import asyncio
 import logging
+import os
+from collections.abc import Callable, Hashable, Iterator
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
-from fastapi import FastAPI, Query, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from orchestrator.core.agent_health_monitor import get_agent_health_monitor
 from orchestrator.core.agent_teams_manager import get_agent_teams_manager
 from orchestrator.web import init_channel_client
+from orchestrator.web.encoding import encode_json
+from orchestrator.web.event_bus import EventBus
 from orchestrator.web.message_handler import (
     ChannelManager,
+    OverflowPolicy,
     WebSocketManager,
     WebSocketMessageHandler,
 )
-from orchestrator.web.team_models import GlobalState
+from orchestrator.web.pubsub import (
+    EVENT_BACKEND_INPROCESS,
+    IpcEventSubscriber,
+    event_backend_from_env,
+    event_socket_from_env,
+)
+from orchestrator.web.response_cache import ResponseCache, etag_matches
+from orchestrator.web.team_models import GlobalState, teams_roots_from_env
 from orchestrator.web.teams_monitor import TeamsMonitor
-from orchestrator.web.thinking_log_handler import get_thinking_log_handler
+from orchestrator.web.thinking_log_handler import ThinkingLogEntry, get_thinking_log_handler
+from orchestrator.web.versions import VERSION_EPOCH, next_version
+from orchestrator.web.watch_service import get_watch_service
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
@@ -48,45 +64,75 @@ async def lifespan(_app: FastAPI):
     # 起動時
     logger.info("FastAPIアプリケーションを起動します")
 
-    # WebSocketマネージャーを初期化
-    ws_manager = WebSocketManager()
+    # WebSocketマネージャーを初期化（ORCHESTRATOR_WS_OVERFLOW_POLICYで送信キュー溢れ時の動作を指定可能）
+    ws_manager = WebSocketManager(
+        overflow_policy=os.environ.get(
+            "ORCHESTRATOR_WS_OVERFLOW_POLICY", OverflowPolicy.DROP_OLDEST
+        ),
+    )
     channel_manager = ChannelManager()
-    ws_handler = WebSocketMessageHandler(ws_manager, channel_manager)
+    ws_handler = WebSocketMessageHandler(ws_manager, channel_manager, _build_snapshot)
+    ws_handler.register_handler("get_team_status", _handle_get_team_status)
 
     # ChannelClientを初期化
     channel_client = init_channel_client(channel_manager)
 
+    # イベントバスを開始（サーバーのイベントループを捕捉）
+    event_bus = EventBus()
+    event_bus.subscribe(ws_manager.broadcast)
+    await event_bus.start()
+
+    # 無通信の接続へのpingとタイムアウトした接続の切断を開始
+    await ws_manager.start_heartbeat()
+    _global_state.event_loop = asyncio.get_running_loop()
+    _global_state.event_bus = event_bus
+
     # GlobalStateに設定
     _global_state.ws_manager = ws_manager
     _global_state.channel_manager = channel_manager
     _global_state.ws_handler = ws_handler
     _global_state.channel_client = channel_client
+    _global_state.response_cache = ResponseCache()
+
+    # イベントバックエンド（ORCHESTRATOR_EVENT_BACKEND=ipcの場合、監視はingestプロセスが行う）
+    ingest_locally = event_backend_from_env() == EVENT_BACKEND_INPROCESS
 
-    # TeamsMonitorを初期化
-    teams_monitor = TeamsMonitor()
+    # TeamsMonitorを初期化（ORCHESTRATOR_TEAMS_ROOTSで監視対象のルートを指定可能）
+    teams_monitor = TeamsMonitor(roots=teams_roots_from_env())
     teams_monitor.register_update_callback(_broadcast_teams_update)
-    teams_monitor.start_monitoring()
+    if ingest_locally:
+        teams_monitor.start_monitoring()
+        logger.info("Teams monitoring started")
     _global_state.teams_monitor = teams_monitor
-    logger.info("Teams monitoring started")
 
     # ThinkingLogHandlerを初期化
     thinking_log_handler = get_thinking_log_handler()
     thinking_log_handler.register_callback(_broadcast_thinking_log)
-    thinking_log_handler.start_monitoring()
+    if ingest_locally:
+        thinking_log_handler.start_monitoring()
+        logger.info("Thinking log monitoring started")
     _global_state.thinking_log_handler = thinking_log_handler
-    logger.info("Thinking log monitoring started")
+
+    # ingestプロセスからイベントを受信
+    if not ingest_locally:
+        event_subscriber = IpcEventSubscriber(
+            _apply_remote_event, event_socket_from_env(), on_connect=_resync_from_disk
+        )
+        await event_subscriber.start()
+        _global_state.event_subscriber = event_subscriber
 
     # AgentTeamsManagerを初期化
     teams_manager = get_agent_teams_manager()
     _global_state.teams_manager = teams_manager
     logger.info("AgentTeamsManager initialized")
 
-    # AgentHealthMonitorを初期化
-    health_monitor = get_agent_health_monitor()
-    health_monitor.register_callback(_on_health_event)
-    health_monitor.start_monitoring()
-    _global_state.health_monitor = health_monitor
-    logger.info("AgentHealthMonitor started")
+    # AgentHealthMonitorを初期化（ipcの場合はingestプロセスが監視し、health_eventの配信のみ行う）
+    if ingest_locally:
+        health_monitor = get_agent_health_monitor()
+        health_monitor.register_callback(_on_health_event)
+        health_monitor.start_monitoring()
+        logger.info("AgentHealthMonitor started")
+        _global_state.health_monitor = health_monitor
 
     yield
 
@@ -98,18 +144,27 @@ async def lifespan(_app: FastAPI):
         _global_state.teams_monitor.stop_monitoring()
 
     # 思考ログ監視を停止
-    if (
-        _global_state.thinking_log_handler
-        and _global_state.thinking_log_handler.is_running()
-    ):
+    if _global_state.thinking_log_handler and _global_state.thinking_log_handler.is_running():
         _global_state.thinking_log_handler.stop_monitoring()
 
     # ヘルスモニターを停止
     if _global_state.health_monitor and _global_state.health_monitor.is_running():
         _global_state.health_monitor.stop_monitoring()
 
+    # ingestプロセスからの受信を停止
+    if _global_state.event_subscriber:
+        await _global_state.event_subscriber.stop()
+        _global_state.event_subscriber = None
+
+    # イベントバスを停止
+    if _global_state.event_bus:
+        await _global_state.event_bus.stop()
+        _global_state.event_bus = None
+        _global_state.event_loop = None
+
     # 全てのWebSocket接続を閉じる
     if _global_state.ws_manager:
+        await _global_state.ws_manager.stop_heartbeat()
         await _global_state.ws_manager.close_all()
 
 
@@ -140,22 +195,64 @@ if _static_dir.exists():
     app.mount("/static", StaticFiles(directory=str(_static_dir)), name="static")
 
 
+def _publish_event(data: dict) -> None:
+    """イベントバスにイベントを発行します。
+
+    watchdogのオブザーバースレッドやヘルスモニタースレッドから呼び出されるため、
+    イベントバス経由でイベントループに受け渡します。
+
+    Args:
+        data: 送信するデータ
+    """
+    if _global_state.event_bus is None:
+        return
+
+    if not _global_state.event_bus.publish(data):
+        logger.debug(f"Event bus not running or queue full, event lost: {data.get('type')}")
+
+
+def _apply_remote_event(event: dict) -> None:
+    """ingestプロセスから受信したイベントを処理します。
+
+    チームと思考ログのイベントはローカルの状態（API用）に反映してから配信し、
+    それ以外のイベントはそのまま配信します。
+
+    Args:
+        event: 受信したイベント
+    """
+    if event.get("type") == "thinking_log" and _global_state.thinking_log_handler is not None:
+        entry = ThinkingLogEntry.from_dict(event.get("log") or {})
+        _global_state.thinking_log_handler.add_log(entry, persist=False)
+        return
+
+    if _global_state.teams_monitor is not None and _global_state.teams_monitor.apply_event(event):
+        return
+
+    _publish_event(event)
+
+
+async def _resync_from_disk() -> None:
+    """ingestプロセスへの接続時に状態をディスクから読み直し、クライアントに再同期を要求します。
+
+    未接続・切断中にingestプロセスが配信したイベントは受信できないため、
+    接続のたびにTeamsMonitorとThinkingLogHandlerを読み直してからresync_requiredを配信します。
+    読み直しから受信開始までに届いたイベントは、読み込んだ内容と重複する場合があります
+    （思考ログは内容で重複を除きます）。
+    """
+    if _global_state.teams_monitor is not None:
+        _global_state.teams_monitor.reload()
+    if _global_state.thinking_log_handler is not None:
+        _global_state.thinking_log_handler.reload()
+    _publish_event({"type": "resync_required"})
+
+
 def _broadcast_teams_update(data: dict) -> None:
     """TeamsMonitorの更新をWebSocketにブロードキャストします。
 
     Args:
         data: 更新データ
     """
-    if _global_state.ws_manager:
-        # 非同期でブロードキャスト
-        import asyncio
-
-        try:
-            asyncio.get_running_loop()
-            asyncio.create_task(_global_state.ws_manager.broadcast(data))
-        except RuntimeError:
-            # イベントループが実行中でない場合は無視
-            pass
+    _publish_event(data)
 
 
 def _broadcast_thinking_log(data: dict) -> None:
@@ -164,16 +261,226 @@ def _broadcast_thinking_log(data: dict) -> None:
     Args:
         data: 更新データ
     """
-    if _global_state.ws_manager:
-        # 非同期でブロードキャスト
-        import asyncio
+    _publish_event(data)
+
+
+# スナップショットに含められるセクション
+SNAPSHOT_SECTIONS = ("messages", "tasks", "thinking", "health")
+
+
+def _snapshot_teams(team_names: list[str] | None = None) -> list[dict[str, Any]]:
+    """スナップショットの対象チームを取得します。
 
-        try:
-            asyncio.get_running_loop()
-            asyncio.create_task(_global_state.ws_manager.broadcast(data))
-        except RuntimeError:
-            # イベントループが実行中でない場合は無視
-            pass
+    Args:
+        team_names: 対象のチーム名（Noneの場合は全チーム）
+
+    Returns:
+        チーム情報の辞書のリスト
+    """
+    if _global_state.teams_monitor is None:
+        return []
+    teams = _global_state.teams_monitor.get_teams()
+    if team_names is not None:
+        teams = [team for team in teams if team.get("name") in team_names]
+    return teams
+
+
+def _read_section(section: str, team_name: str) -> tuple[int, Callable[[], list[dict[str, Any]]]]:
+    """チームのメッセージ・タスク・思考ログのいずれかのバージョン番号と取得関数を返します。
+
+    バージョン番号は内容より先に読むため、取得関数が返す内容は常にそのバージョン以降の状態です。
+
+    Args:
+        section: messages, tasks, thinking のいずれか
+        team_name: チーム名
+
+    Returns:
+        （バージョン番号, 辞書のリストを返す関数）のタプル
+    """
+    teams_monitor = _global_state.teams_monitor
+    thinking_log_handler = _global_state.thinking_log_handler
+    if section == "thinking":
+        if thinking_log_handler is None:
+            return 0, list
+        return (
+            thinking_log_handler.get_version(team_name),
+            lambda: thinking_log_handler.get_logs(team_name),
+        )
+    if teams_monitor is None:
+        return 0, list
+    if section == "messages":
+        return (
+            teams_monitor.get_version("messages", team_name),
+            lambda: teams_monitor.get_team_messages(team_name),
+        )
+    return (
+        teams_monitor.get_version("tasks", team_name),
+        lambda: teams_monitor.get_team_tasks(team_name),
+    )
+
+
+def _build_snapshot(team_names: list[str] | None = None) -> dict[str, Any]:
+    """再接続したクライアントに送るスナップショットを作成します。
+
+    Args:
+        team_names: 対象のチーム名（Noneの場合は全チーム）
+
+    Returns:
+        チーム一覧と、チームごとのメッセージ・タスク・思考ログの辞書
+    """
+    teams = _snapshot_teams(team_names)
+    names = [team["name"] for team in teams]
+    snapshot: dict[str, Any] = {"teams": teams}
+    for section in ("messages", "tasks", "thinking"):
+        snapshot[section] = {name: _read_section(section, name)[1]() for name in names}
+    return snapshot
+
+
+def _iter_snapshot(
+    team_names: list[str] | None, sections: list[str], since: int | None
+) -> Iterator[bytes]:
+    """/api/snapshot の応答本文を少しずつ作成します。
+
+    最初に発行したバージョン番号（version）より後に変更されたコレクションは、
+    次回sinceにversionを指定すると再び含まれます。
+    セクションの本文はチーム・バージョン番号ごとに応答キャッシュから再利用します。
+    ipcイベントバックエンドのWebワーカーはヘルスモニターを持たないため、healthは常に空です。
+
+    Args:
+        team_names: 対象のチーム名（Noneの場合は全チーム）
+        sections: 含めるセクション（SNAPSHOT_SECTIONSの部分集合）
+        since: このバージョン番号以前から変更されていないコレクションを省略する
+
+    Yields:
+        UTF-8のJSON本文の断片
+    """
+    version = next_version()
+    teams = _snapshot_teams(team_names)
+    names = [team["name"] for team in teams]
+    cache = _global_state.response_cache
+
+    header = {"epoch": VERSION_EPOCH, "version": version, "since": since, "teams": teams}
+    yield encode_json(header)[:-1].encode("utf-8")
+
+    for section in sections:
+        if section == "health":
+            continue
+        yield f',"{section}":{{'.encode()
+        first = True
+        for name in names:
+            section_version, read = _read_section(section, name)
+            if since is not None and section_version <= since:
+                continue
+            if cache is not None:
+                body = cache.get_or_build(
+                    (f"snapshot:{section}", name, section_version, None), read
+                ).body
+            else:
+                body = encode_json(read()).encode("utf-8")
+            yield (b"" if first else b",") + encode_json(name).encode("utf-8") + b":" + body
+            first = False
+        yield b"}"
+
+    if "health" in sections:
+        health: dict[str, Any] = {}
+        if _global_state.health_monitor is not None:
+            status = _global_state.health_monitor.get_health_status()
+            health = {name: status[name] for name in names if name in status}
+        yield b',"health":' + encode_json(health).encode("utf-8")
+
+    yield b"}"
+
+
+def _team_status(team_name: str) -> dict[str, Any]:
+    """TeamsMonitorが保持する状態とチームのヘルス状態からチームの状態を作成します。
+
+    ディスクを読まず、他のチームのヘルス状態も参照しません。
+    ipcイベントバックエンドのWebワーカーはヘルスモニターを持たないため、healthは常に空です。
+
+    Args:
+        team_name: チーム名
+
+    Returns:
+        チーム状態の辞書（エラーの場合はerrorキーを含む辞書）
+    """
+    if _global_state.teams_monitor is None:
+        return {"error": "Teams monitor not initialized"}
+
+    status = _global_state.teams_monitor.get_team_status(team_name)
+    if status is None:
+        return {"error": "Team not found"}
+
+    health_monitor = _global_state.health_monitor
+    status["health"] = health_monitor.get_team_health(team_name) if health_monitor else {}
+    return status
+
+
+def _get_team_status_reply(data: dict[str, Any]) -> dict[str, Any]:
+    """get_team_statusメッセージの応答を作成します。
+
+    Args:
+        data: メッセージデータ（teamNameを含む）
+
+    Returns:
+        team_statusメッセージ（エラーの場合はerrorメッセージ）
+    """
+    team_name = data.get("teamName")
+    if not isinstance(team_name, str) or not team_name:
+        return {"type": "error", "message": "teamName is required"}
+    status = _team_status(team_name)
+    if "error" in status:
+        return {"type": "error", "message": status["error"]}
+    return {"type": "team_status", "teamName": team_name, "data": status}
+
+
+async def _handle_get_team_status(data: dict[str, Any], websocket: WebSocket) -> None:
+    """get_team_statusメッセージに応答します（メモリ上の状態のみを参照するためループ上で実行）。
+
+    Args:
+        data: メッセージデータ（teamNameを含む）
+        websocket: WebSocket接続
+    """
+    if _global_state.ws_manager is not None:
+        await _global_state.ws_manager.send_personal(_get_team_status_reply(data), websocket)
+
+
+def _cached_json(
+    request: Request,
+    endpoint: str,
+    team_name: str | None,
+    version: int,
+    query: Hashable,
+    build: Callable[[], dict[str, Any]],
+) -> Response | dict[str, Any]:
+    """バージョン番号付きのキャッシュからJSON応答を返します。
+
+    If-None-MatchがETagに一致する場合は本文なしの304を返します。
+    応答キャッシュが初期化されていない場合は、作成した辞書をそのまま返します。
+
+    Args:
+        request: リクエスト
+        endpoint: エンドポイント名
+        team_name: チーム名（チーム一覧の場合はNone）
+        version: 応答の元になるコレクションのバージョン番号
+        query: 応答を変えるクエリパラメータ
+        build: 応答の辞書を作成する関数
+
+    Returns:
+        JSON応答、または304応答
+
+    Raises:
+        ValueError: buildが不正なパラメータを検出した場合
+    """
+    cache = _global_state.response_cache
+    if cache is None:
+        return build()
+
+    cached = cache.get_or_build((endpoint, team_name, version, query), build)
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        cache.record_not_modified()
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
 
 
 # ============================================================================
@@ -194,27 +501,48 @@ _static_dir = Path(__file__).parent / "static"
 async def websocket_endpoint(
     websocket: WebSocket,
     _token: str | None = Query(None, description="認証トークン（オプション）"),
+    last_seq: int | None = Query(None, alias="lastSeq", description="最後に受信したシーケンス番号"),
+    epoch: str | None = Query(None, description="リプレイログの識別子"),
+    capabilities: str | None = Query(
+        None, description="要求する機能（カンマ区切り、例: batch,msgpack）"
+    ),
 ):
     """WebSocketエンドポイント
 
     クライアントからの接続を受け入れ、リアルタイム更新を配信します。
+    再接続時にlastSeqを指定すると、切断中に配信されたメッセージを再送します
+    （再送できない場合はスナップショットを送信します）。
+    capabilitiesにbatchを指定すると、短い時間内のイベントがbatchフレームにまとめて送信されます。
+    msgpackを指定すると、ブロードキャストがキー辞書付きのMessagePack（バイナリフレーム）で
+    送信されます（キー辞書は接続直後のencodingメッセージで通知されます）。
 
     Args:
         websocket: WebSocket接続オブジェクト
         _token: 認証トークン（将来的な実装用）
+        last_seq: 最後に受信したシーケンス番号
+        epoch: 最後に受信したリプレイログの識別子
+        capabilities: 要求する機能（カンマ区切り）
     """
     if _global_state.ws_manager is None or _global_state.ws_handler is None:
         await websocket.close(code=1011, reason="Server not initialized")
         return
 
-    await _global_state.ws_manager.connect(websocket)
+    requested = [name.strip() for name in (capabilities or "").split(",") if name.strip()]
+    await _global_state.ws_manager.connect(websocket, requested)
 
     try:
+        # 差分を再送（接続直後に行い、以降のブロードキャストとの順序を保つ）
+        if last_seq is not None:
+            await _global_state.ws_handler.resume(websocket, last_seq, epoch)
+
         # 接続確立メッセージを送信
         await _global_state.ws_manager.send_personal(
             {
                 "type": "connected",
                 "message": "Connected to Orchestrator CC Dashboard",
+                "seq": _global_state.ws_manager.current_seq,
+                "epoch": _global_state.ws_manager.epoch,
+                "capabilities": _global_state.ws_manager.get_capabilities(websocket),
             },
             websocket,
         )
@@ -243,16 +571,18 @@ async def websocket_endpoint(
                 websocket,
             )
 
-        # メッセージ受信ループ
+        # メッセージ受信ループ（処理は接続ごとの受信キューで行い、受信ループは待たない）
         while True:
             message = await websocket.receive_text()
-            await _global_state.ws_handler.handle_message(message, websocket)
+            await _global_state.ws_handler.dispatch(message, websocket)
 
     except WebSocketDisconnect:
+        _global_state.ws_handler.release(websocket)
         _global_state.ws_manager.disconnect(websocket)
         logger.info(f"WebSocket接続が切断されました: {websocket.client}")
     except Exception as e:
         logger.error(f"WebSocketエラーが発生: {e}")
+        _global_state.ws_handler.release(websocket)
         _global_state.ws_manager.disconnect(websocket)
 
 
@@ -262,54 +592,154 @@ async def websocket_endpoint(
 
 
 @app.get("/api/teams")
-async def get_teams():
+async def get_teams(request: Request):
     """チーム一覧を取得します。
 
+    応答はチーム一覧のバージョン番号ごとにキャッシュされ、ETagによる条件付きGETに対応します。
+
+    Args:
+        request: リクエスト
+
     Returns:
         チーム情報のリスト
     """
-    if _global_state.teams_monitor is None:
+    teams_monitor = _global_state.teams_monitor
+    if teams_monitor is None:
         return {"error": "Teams monitor not initialized"}
 
-    return {"teams": _global_state.teams_monitor.get_teams()}
+    return _cached_json(
+        request,
+        "teams",
+        None,
+        teams_monitor.get_version("teams"),
+        None,
+        lambda: {"teams": teams_monitor.get_teams()},
+    )
 
 
 @app.get("/api/teams/{team_name}/messages")
-async def get_team_messages(team_name: str):
+async def get_team_messages(
+    request: Request,
+    team_name: str,
+    limit: int | None = Query(None, ge=1, description="最大件数"),
+    before: str | None = Query(None, description="このカーソルより古いメッセージを取得"),
+    after: str | None = Query(None, description="このカーソルより新しいメッセージを取得"),
+    since: str | None = Query(None, description="このタイムスタンプ以降のメッセージを取得"),
+    until: str | None = Query(None, description="このタイムスタンプより前のメッセージを取得"),
+):
     """チームのメッセージ履歴を取得します。
 
+    メッセージはタイムスタンプ順インデックスから取得し、タイムスタンプの昇順で返します。
+    limitのみを指定すると最新のlimit件を返します。
+    さらに古いページはpage.beforeをbeforeに、新しいページはpage.afterをafterに指定して取得します。
+    応答はメッセージのバージョン番号とクエリごとにキャッシュされ、ETagによる条件付きGETに対応します。
+
     Args:
+        request: リクエスト
         team_name: チーム名
+        limit: 最大件数（省略時は全件）
+        before: このカーソルより古いメッセージを取得
+        after: このカーソルより新しいメッセージを取得
+        since: このタイムスタンプ以降のメッセージを取得（ISO 8601）
+        until: このタイムスタンプより前のメッセージを取得（ISO 8601）
 
     Returns:
-        メッセージのリスト
+        メッセージのリストとページ情報
     """
-    if _global_state.teams_monitor is None:
+    teams_monitor = _global_state.teams_monitor
+    if teams_monitor is None:
         return {"error": "Teams monitor not initialized"}
 
-    return {
-        "teamName": team_name,
-        "messages": _global_state.teams_monitor.get_team_messages(team_name),
-    }
+    def build() -> dict[str, Any]:
+        page = teams_monitor.get_team_messages_page(
+            team_name, limit=limit, before=before, after=after, since=since, until=until
+        )
+        return {"teamName": team_name, "messages": page.items, "page": page.to_dict()}
+
+    try:
+        return _cached_json(
+            request,
+            "messages",
+            team_name,
+            teams_monitor.get_version("messages", team_name),
+            (limit, before, after, since, until),
+            build,
+        )
+    except ValueError as e:
+        return {"error": str(e)}
 
 
 @app.get("/api/teams/{team_name}/tasks")
-async def get_team_tasks(team_name: str):
+async def get_team_tasks(request: Request, team_name: str):
     """チームのタスクリストを取得します。
 
+    応答はタスクのバージョン番号ごとにキャッシュされ、ETagによる条件付きGETに対応します。
+
     Args:
+        request: リクエスト
         team_name: チーム名
 
     Returns:
         タスクのリスト
     """
+    teams_monitor = _global_state.teams_monitor
+    if teams_monitor is None:
+        return {"error": "Teams monitor not initialized"}
+
+    return _cached_json(
+        request,
+        "tasks",
+        team_name,
+        teams_monitor.get_version("tasks", team_name),
+        None,
+        lambda: {"teamName": team_name, "tasks": teams_monitor.get_team_tasks(team_name)},
+    )
+
+
+@app.get("/api/snapshot")
+async def get_snapshot(
+    teams: str | None = Query(None, description="対象のチーム名（カンマ区切り、省略時は全チーム）"),
+    sections: str | None = Query(
+        None, description="含めるセクション（カンマ区切り、省略時は全セクション）"
+    ),
+    since: int | None = Query(None, ge=0, description="前回のスナップショットのversion"),
+    epoch: str | None = Query(None, description="前回のスナップショットのepoch"),
+):
+    """全チームのメッセージ・タスク・思考ログ・ヘルス状態を1回のリクエストで取得します。
+
+    応答はチームごとに組み立てながらストリーミングで返します。
+    前回の応答のversionとepochをsince・epochに指定すると、それ以降に変更されていない
+    チームのメッセージ・タスク・思考ログは省略されます（チーム一覧とヘルス状態は常に含まれます）。
+    epochが一致しない場合（別のワーカーや再起動後のプロセス）は全件を返します。
+
+    Args:
+        teams: 対象のチーム名（カンマ区切り）
+        sections: messages, tasks, thinking, health のうち含めるもの（カンマ区切り）
+        since: 前回のスナップショットのversion
+        epoch: 前回のスナップショットのepoch
+
+    Returns:
+        チーム一覧とセクションごとのチーム名 -> 内容の辞書（ストリーミング応答）
+    """
     if _global_state.teams_monitor is None:
         return {"error": "Teams monitor not initialized"}
 
-    return {
-        "teamName": team_name,
-        "tasks": _global_state.teams_monitor.get_team_tasks(team_name),
-    }
+    team_names = [name for name in teams.split(",") if name] if teams else None
+    requested = [section for section in sections.split(",") if section] if sections else None
+    unknown = set(requested or ()) - set(SNAPSHOT_SECTIONS)
+    if unknown:
+        return {"error": f"Unknown sections: {', '.join(sorted(unknown))}"}
+    selected = [
+        section for section in SNAPSHOT_SECTIONS if requested is None or section in requested
+    ]
+    if epoch != VERSION_EPOCH:
+        since = None
+
+    return StreamingResponse(
+        _iter_snapshot(team_names, selected, since),
+        media_type="application/json",
+        headers={"Cache-Control": "no-store"},
+    )
 
 
 def _on_health_event(event) -> None:
@@ -318,22 +748,12 @@ def _on_health_event(event) -> None:
     Args:
         event: ヘルスチェックイベント
     """
-    if _global_state.ws_manager:
-        # 非同期でブロードキャスト
-        import asyncio
-
-        try:
-            asyncio.get_running_loop()
-            asyncio.create_task(
-                _global_state.ws_manager.broadcast(
-                    {
-                        "type": "health_event",
-                        "event": event.to_dict(),
-                    }
-                )
-            )
-        except RuntimeError:
-            pass
+    _publish_event(
+        {
+            "type": "health_event",
+            "event": event.to_dict(),
+        }
+    )
 
 
 # ============================================================================
@@ -345,16 +765,17 @@ def _on_health_event(event) -> None:
 async def get_team_status(team_name: str):
     """チームの状態を取得します。
 
+    TeamsMonitorが監視で保持しているチーム情報・タスクと、チームのヘルス状態から作成します。
+    応答形式はTeamsMonitor.get_team_statusを参照してください（CLIのteam-statusとは
+    メンバー・タスクの形式が異なり、schemaVersionで区別できます）。
+
     Args:
         team_name: チーム名
 
     Returns:
         チーム状態
     """
-    if _global_state.teams_manager is None:
-        return {"error": "Teams manager not initialized"}
-
-    return _global_state.teams_manager.get_team_status(team_name)
+    return _team_status(team_name)
 
 
 @app.post("/api/teams/{team_name}/activity")
@@ -375,13 +796,22 @@ async def update_agent_activity(team_name: str, agent_name: str):
     return {"message": "Activity updated"}
 
 
+# ipcイベントバックエンドではヘルスモニターはingestプロセスで動作する
+HEALTH_UNSUPPORTED_ERROR = "Health monitoring is not supported with the ipc event backend"
+
+
 @app.get("/api/health")
 async def get_health_status():
     """ヘルスモニターの状態を取得します。
 
+    ipcイベントバックエンドのWebワーカーでは使用できません
+    （ヘルスの変化はingestプロセスからhealth_eventとして配信されます）。
+
     Returns:
         ヘルス状態
     """
+    if _global_state.event_subscriber is not None:
+        return {"error": HEALTH_UNSUPPORTED_ERROR}
     if _global_state.health_monitor is None:
         return {"error": "Health monitor not initialized"}
 
@@ -390,11 +820,13 @@ async def get_health_status():
 
 @app.post("/api/health/start")
 async def start_health_monitoring():
-    """ヘルスモニタリングを開始します。
+    """ヘルスモニタリングを開始します（ipcイベントバックエンドのWebワーカーでは使用できません）。
 
     Returns:
         成功メッセージ
     """
+    if _global_state.event_subscriber is not None:
+        return {"error": HEALTH_UNSUPPORTED_ERROR}
     if _global_state.health_monitor is None:
         return {"error": "Health monitor not initialized"}
 
@@ -407,11 +839,13 @@ async def start_health_monitoring():
 
 @app.post("/api/health/stop")
 async def stop_health_monitoring():
-    """ヘルスモニタリングを停止します。
+    """ヘルスモニタリングを停止します（ipcイベントバックエンドのWebワーカーでは使用できません）。
 
     Returns:
         成功メッセージ
     """
+    if _global_state.event_subscriber is not None:
+        return {"error": HEALTH_UNSUPPORTED_ERROR}
     if _global_state.health_monitor is None:
         return {"error": "Health monitor not initialized"}
 
@@ -428,25 +862,72 @@ async def stop_health_monitoring():
 
 
 @app.get("/api/teams/{team_name}/thinking")
-async def get_team_thinking(team_name: str, agent: str | None = None):
+async def get_team_thinking(
+    request: Request,
+    team_name: str,
+    agent: str | None = None,
+    category: str | None = None,
+    emotion: str | None = None,
+    limit: int | None = Query(None, ge=1, description="最大件数"),
+    before: str | None = Query(None, description="このカーソルより古いログを取得"),
+    after: str | None = Query(None, description="このカーソルより新しいログを取得"),
+    since: str | None = Query(None, description="このタイムスタンプ以降のログを取得"),
+    until: str | None = Query(None, description="このタイムスタンプより前のログを取得"),
+):
     """チームの思考ログを取得します。
 
+    エージェント・カテゴリ・感情の条件は組み合わせて指定でき、
+    ページの取得方法とキャッシュ・ETagの扱いは /api/teams/{team_name}/messages と同じです。
+
     Args:
+        request: リクエスト
         team_name: チーム名
         agent: エージェント名でフィルタ（オプション）
+        category: カテゴリでフィルタ（オプション）
+        emotion: 感情タイプでフィルタ（オプション）
+        limit: 最大件数（省略時は全件）
+        before: このカーソルより古いログを取得
+        after: このカーソルより新しいログを取得
+        since: このタイムスタンプ以降のログを取得（ISO 8601）
+        until: このタイムスタンプより前のログを取得（ISO 8601）
 
     Returns:
-        思考ログのリスト
+        思考ログのリストとページ情報
     """
-    if _global_state.thinking_log_handler is None:
+    thinking_log_handler = _global_state.thinking_log_handler
+    if thinking_log_handler is None:
         return {"error": "Thinking log handler not initialized"}
 
-    logs = _global_state.thinking_log_handler.get_logs(team_name)
-
-    if agent:
-        logs = [log for log in logs if log.get("agentName") == agent]
+    def build() -> dict[str, Any]:
+        page = thinking_log_handler.get_logs_page(
+            team_name,
+            agent=agent,
+            category=category,
+            emotion=emotion,
+            limit=limit,
+            before=before,
+            after=after,
+            since=since,
+            until=until,
+        )
+        return {
+            "teamName": team_name,
+            "agent": agent,
+            "thinking": page.items,
+            "page": page.to_dict(),
+        }
 
-    return {"teamName": team_name, "agent": agent, "thinking": logs}
+    try:
+        return _cached_json(
+            request,
+            "thinking",
+            team_name,
+            thinking_log_handler.get_version(team_name),
+            (agent, category, emotion, limit, before, after, since, until),
+            build,
+        )
+    except ValueError as e:
+        return {"error": str(e)}
 
 
 @app.post("/api/teams/monitoring/start")
@@ -483,6 +964,27 @@ async def stop_teams_monitoring():
     return {"message": "Teams monitoring stopped"}
 
 
+@app.get("/api/teams/monitoring/stats")
+async def get_teams_monitoring_stats():
+    """ファイル監視・イベントバス・WebSocket送信キューの統計情報を取得します。
+
+    Returns:
+        監視中のwatch数やイベントキューの深さなどの統計情報
+    """
+    return {
+        "watch": get_watch_service().get_stats(),
+        "eventBus": _global_state.event_bus.get_stats() if _global_state.event_bus else None,
+        "eventSubscriber": (
+            _global_state.event_subscriber.get_stats() if _global_state.event_subscriber else None
+        ),
+        "websocket": _global_state.ws_manager.get_stats() if _global_state.ws_manager else None,
+        "inbound": _global_state.ws_handler.get_stats() if _global_state.ws_handler else None,
+        "responseCache": (
+            _global_state.response_cache.get_stats() if _global_state.response_cache else None
+        ),
+    }
+
+
 # ============================================================================
 # SPA Serving (最後に定義して、他のルートが優先されるようにする)
 # ============================================================================
@@ -512,6 +1014,7 @@ async def root():
         ),
         "endpoints": {
             "teams": "/api/teams",
+            "snapshot": "/api/snapshot",
             "teams_messages": "/api/teams/{team_name}/messages",
             "teams_tasks": "/api/teams/{team_name}/tasks",
             "teams_thinking": "/api/teams/{team_name}/thinking",
@@ -530,6 +1033,7 @@ async def api_info():
         "version": "0.1.0",
         "endpoints": {
             "teams": "/api/teams",
+            "snapshot": "/api/snapshot",
             "teams_messages": "/api/teams/{team_name}/messages",
             "teams_tasks": "/api/teams/{team_name}/tasks",
             "teams_thinking": "/api/teams/{team_name}/thinking",
@@ -575,4 +1079,10 @@ async def serve_spa(full_path: str):
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+    # permessage-deflateはクライアントが要求した場合に有効になる（ORCHESTRATOR_WS_DEFLATE=0で無効化）
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=8000,
+        ws_per_message_deflate=os.environ.get("ORCHESTRATOR_WS_DEFLATE", "1") != "0",
+    )
@@ -0,0 +1,192 @@
+"""ファイルイベントのデバウンスモジュール
+
+このモジュールでは、watchdogのファイルイベントをパスごとに集約し、
+書き込みが落ち着いた時点で1回だけ処理するCoalescingDebouncerクラスを提供します。
+
+先頭のイベントのみを処理して後続を捨てる方式とは異なり、
+バースト中の最後の書き込み（JSONが完成した状態）が必ず処理されます。
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingEvent:
+    """集約中のイベント
+
+    Attributes:
+        first_time: 最初のイベントを受け付けた時刻
+        last_time: 最後のイベントを受け付けた時刻
+        callback: 発火時に呼び出すコールバック（最後に登録されたもの）
+    """
+
+    first_time: float
+    last_time: float
+    callback: Callable[[], None]
+
+
+class CoalescingDebouncer:
+    """トレーリングエッジ方式のデバウンサー
+
+    キーごとにイベントを集約し、quiet_time秒間新しいイベントがなければ発火します。
+    イベントが途切れない場合でも、最初のイベントからmax_latency秒後には発火します。
+    コールバックは専用のワーカースレッドで順番に呼び出されます。
+
+    Attributes:
+        _quiet_time: 発火までの静止時間（秒）
+        _max_latency: 最初のイベントから発火までの最大遅延（秒）
+        _clock: 現在時刻の取得関数
+        _pending: 集約中のイベントの辞書（キー -> _PendingEvent）
+        _condition: ワーカースレッドとの同期用条件変数
+        _thread: ワーカースレッド
+        _submitted: 受け付けたイベント数
+        _fired: 発火した回数
+    """
+
+    def __init__(
+        self,
+        quiet_time: float = 0.1,
+        max_latency: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """CoalescingDebouncerを初期化します。
+
+        Args:
+            quiet_time: 発火までの静止時間（秒）
+            max_latency: 最初のイベントから発火までの最大遅延（秒）
+            clock: 現在時刻の取得関数
+        """
+        self._quiet_time = quiet_time
+        self._max_latency = max(max_latency, quiet_time)
+        self._clock = clock
+        self._pending: dict[Hashable, _PendingEvent] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._submitted = 0
+        self._fired = 0
+
+    def submit(self, key: Hashable, callback: Callable[[], None]) -> None:
+        """イベントを登録します。
+
+        同じキーのイベントが集約中の場合は、コールバックを置き換えて発火を延期します。
+
+        Args:
+            key: 集約キー（通常はファイルパス）
+            callback: 発火時に呼び出すコールバック
+        """
+        with self._condition:
+            if self._closed:
+                return
+
+            now = self._clock()
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = _PendingEvent(first_time=now, last_time=now, callback=callback)
+            else:
+                pending.last_time = now
+                pending.callback = callback
+            self._submitted += 1
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="coalescing-debouncer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def flush(self) -> None:
+        """集約中の全イベントを即座に発火します。"""
+        with self._condition:
+            due = list(self._pending.values())
+            self._pending.clear()
+        self._fire(due)
+
+    def close(self) -> None:
+        """集約中のイベントを発火し、ワーカースレッドを停止します。"""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            thread = self._thread
+            self._thread = None
+            self._condition.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def pending_count(self) -> int:
+        """集約中のイベント数を返します。
+
+        Returns:
+            集約中のキーの数
+        """
+        with self._condition:
+            return len(self._pending)
+
+    def get_stats(self) -> dict[str, Any]:
+        """統計情報を取得します。
+
+        Returns:
+            統計情報の辞書
+        """
+        with self._condition:
+            return {
+                "pending": len(self._pending),
+                "submitted": self._submitted,
+                "fired": self._fired,
+                "coalesced": self._submitted - self._fired - len(self._pending),
+            }
+
+    def _deadline(self, pending: _PendingEvent) -> float:
+        """イベントの発火時刻を計算します。
+
+        Args:
+            pending: 集約中のイベント
+
+        Returns:
+            発火時刻
+        """
+        return min(pending.last_time + self._quiet_time, pending.first_time + self._max_latency)
+
+    def _run(self) -> None:
+        """発火時刻に達したイベントを処理するワーカーループ"""
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+
+                now = self._clock()
+                due_keys = [
+                    key for key, pending in self._pending.items() if self._deadline(pending) <= now
+                ]
+                due = [self._pending.pop(key) for key in due_keys]
+
+                if not due:
+                    if self._pending:
+                        timeout = min(self._deadline(p) for p in self._pending.values()) - now
+                        self._condition.wait(timeout=max(timeout, 0.001))
+                    else:
+                        self._condition.wait()
+                    continue
+
+            self._fire(due)
+
+    def _fire(self, due: list[_PendingEvent]) -> None:
+        """コールバックを呼び出します。
+
+        Args:
+            due: 発火するイベントのリスト
+        """
+        for pending in due:
+            try:
+                pending.callback()
+            except Exception as e:
+                logger.error(f"Debounced callback error: {e}")
+            with self._condition:
+                self._fired += 1
@@ -0,0 +1,155 @@
+"""WebSocketメッセージのエンコードモジュール
+
+このモジュールでは、ブロードキャストするメッセージを一度だけエンコードするための
+関数を提供します。
+
+orjsonがインストールされている場合はorjsonを使用し、
+ない場合は標準のjsonモジュールで同じ形式（区切り文字の空白なし・非ASCII文字をそのまま出力）の
+テキストを生成します。
+
+msgpackがインストールされている場合は、頻出するキー（teamName, agentName, timestampなど）を
+KEY_DICTIONARYの番号に置き換えたMessagePackのバイナリも生成できます。
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjsonは任意の依存関係
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpackは任意の依存関係
+    msgpack = None
+
+# MessagePackエンコード時に番号へ置き換えるキー（番号はインデックス）
+# クライアントは接続時に受け取ったこの一覧で復元するため、既存の順序は変更せず末尾に追加すること
+KEY_DICTIONARY: tuple[str, ...] = (
+    "type",
+    "seq",
+    "events",
+    "teamName",
+    "agentName",
+    "timestamp",
+    "content",
+    "category",
+    "emotion",
+    "data",
+    "log",
+    "message",
+    "task",
+    "team",
+    "sender",
+    "recipient",
+    "owner",
+    "status",
+    "id",
+    "taskId",
+    "subject",
+    "description",
+    "name",
+    "members",
+    "read",
+    "summary",
+    "text",
+)
+
+_KEY_INDEX = {key: index for index, key in enumerate(KEY_DICTIONARY)}
+
+
+def json_encoder_name() -> str:
+    """使用中のJSONエンコーダー名を返します。
+
+    Returns:
+        "orjson" または "json"
+    """
+    return "orjson" if orjson is not None else "json"
+
+
+def encode_json(message: Any) -> str:
+    """メッセージをJSONテキストにエンコードします。
+
+    StarletteのWebSocket.send_jsonと同じ形式のテキストを返すため、
+    エンコード済みのテキストをsend_textでそのまま送信できます。
+
+    Args:
+        message: エンコードするメッセージ
+
+    Returns:
+        JSONテキスト
+    """
+    if orjson is not None:
+        return orjson.dumps(message).decode("utf-8")
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def msgpack_available() -> bool:
+    """MessagePackエンコードが利用可能かどうかを返します。
+
+    Returns:
+        msgpackがインストールされている場合True
+    """
+    return msgpack is not None
+
+
+def _compact_keys(value: Any) -> Any:
+    """辞書のキーをKEY_DICTIONARYの番号に再帰的に置き換えます。
+
+    Args:
+        value: 変換する値
+
+    Returns:
+        変換後の値
+    """
+    if isinstance(value, dict):
+        return {_KEY_INDEX.get(key, key): _compact_keys(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_compact_keys(item) for item in value]
+    return value
+
+
+def encode_msgpack(message: Any) -> bytes:
+    """メッセージをキー辞書付きのMessagePackにエンコードします。
+
+    Args:
+        message: エンコードするメッセージ
+
+    Returns:
+        MessagePackのバイナリ
+
+    Raises:
+        RuntimeError: msgpackがインストールされていない場合
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    packed: bytes = msgpack.packb(_compact_keys(message))
+    return packed
+
+
+def encode_msgpack_batch(frames: list[bytes]) -> bytes:
+    """エンコード済みのMessagePackをbatchフレームにまとめます。
+
+    各フレームは再エンコードせず、配列の要素としてそのまま連結します。
+
+    Args:
+        frames: encode_msgpackでエンコード済みのバイナリのリスト
+
+    Returns:
+        {"type": "batch", "events": [...]} に相当するMessagePackのバイナリ
+
+    Raises:
+        RuntimeError: msgpackがインストールされていない場合
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    packer = msgpack.Packer()
+    header: bytes = (
+        packer.pack_map_header(2)
+        + packer.pack(_KEY_INDEX["type"])
+        + packer.pack("batch")
+        + packer.pack(_KEY_INDEX["events"])
+        + packer.pack_array_header(len(frames))
+    )
+    return header + b"".join(frames)
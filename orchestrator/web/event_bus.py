@@ -0,0 +1,206 @@
+"""イベントバスモジュール
+
+このモジュールでは、watchdogのオブザーバースレッドやヘルスモニタースレッドから
+asyncioイベントループへ、スレッドセーフにイベントを受け渡すEventBusクラスを提供します。
+
+イベントは有界のasyncio.Queueに格納され、単一のコンシューマータスクが
+登録された全ハンドラーへ順番に配信します。
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# イベントハンドラーの型（イベント辞書を受け取るコルーチン関数）
+EventHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class EventBus:
+    """スレッドセーフなイベントバス
+
+    サーバーのイベントループを起動時に捕捉し、任意のスレッドから
+    publish()されたイベントをcall_soon_threadsafeでループに渡します。
+
+    Attributes:
+        _maxsize: キューの最大長
+        _loop: 捕捉したイベントループ
+        _queue: イベントキュー
+        _handlers: 配信先ハンドラーのリスト
+        _consumer_task: コンシューマータスク
+        _pending: 受け付けて未配信のイベント数（ループへ受け渡し中のものを含む）
+        _published: publishされたイベント数
+        _delivered: 配信済みイベント数
+        _dropped: キュー溢れで破棄されたイベント数
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        """EventBusを初期化します。
+
+        Args:
+            maxsize: キューの最大長（溢れた場合は最も古いイベントを破棄）
+        """
+        self._maxsize = maxsize
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._handlers: list[EventHandler] = []
+        self._consumer_task: asyncio.Task[None] | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+
+    def subscribe(self, handler: EventHandler) -> None:
+        """配信先ハンドラーを登録します。
+
+        Args:
+            handler: イベント辞書を受け取るコルーチン関数
+        """
+        with self._lock:
+            self._handlers.append(handler)
+
+    async def start(self) -> None:
+        """実行中のイベントループを捕捉し、コンシューマータスクを開始します。
+
+        イベントループ上（例: FastAPIのlifespan内）で呼び出す必要があります。
+        """
+        if self._consumer_task is not None:
+            logger.warning("Event bus is already running")
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._pending = 0
+        self._consumer_task = self._loop.create_task(self._consume())
+        logger.info(f"Event bus started (maxsize={self._maxsize})")
+
+    async def stop(self) -> None:
+        """コンシューマータスクを停止します。"""
+        if self._consumer_task is None:
+            return
+
+        self._consumer_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._consumer_task
+        self._consumer_task = None
+        self._queue = None
+        self._loop = None
+        logger.info("Event bus stopped")
+
+    def is_running(self) -> bool:
+        """実行中かどうかを返します。
+
+        Returns:
+            実行中ならTrue
+        """
+        return self._consumer_task is not None and not self._consumer_task.done()
+
+    def publish(self, event: dict[str, Any]) -> bool:
+        """イベントを発行します。
+
+        任意のスレッドから呼び出せます。イベントループ外のスレッドからの
+        呼び出しはcall_soon_threadsafeでループに受け渡されます。
+
+        キューが満杯の場合、イベントは受け付けられますが最も古いイベントが破棄され、
+        Falseを返します（呼び出し側はイベントの欠落を検知できます）。
+
+        Args:
+            event: イベントデータ
+
+        Returns:
+            イベントを欠落なく受け付けた場合True。
+            バスが開始されていない場合、またはキュー溢れでイベントを破棄した場合False
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return False
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        # 満杯の判定はループへ受け渡し中のイベントも含めて行う
+        with self._lock:
+            overflow = self._pending >= self._maxsize
+            if overflow:
+                self._dropped += 1
+            else:
+                self._pending += 1
+            self._published += 1
+
+        if running_loop is loop:
+            self._enqueue(event, overflow)
+        else:
+            try:
+                loop.call_soon_threadsafe(self._enqueue, event, overflow)
+            except RuntimeError:
+                # ループが既に閉じられている
+                return False
+        return not overflow
+
+    def get_stats(self) -> dict[str, Any]:
+        """バックプレッシャー監視用の統計情報を取得します。
+
+        Returns:
+            統計情報の辞書
+        """
+        return {
+            "running": self.is_running(),
+            "queueSize": self._queue.qsize() if self._queue else 0,
+            "maxSize": self._maxsize,
+            "published": self._published,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "handlers": len(self._handlers),
+        }
+
+    def _enqueue(self, event: dict[str, Any], overflow: bool) -> None:
+        """イベントをキューに追加します（イベントループ上で実行）。
+
+        Args:
+            event: イベントデータ
+            overflow: publish時にキューが満杯と判定されたかどうか
+        """
+        if self._queue is None:
+            return
+
+        if self._queue.full():
+            # 最も古いイベントを破棄して新しいイベントを優先する（未配信数は変わらない）
+            self._queue.get_nowait()
+            self._queue.task_done()
+            logger.warning(
+                f"Event bus queue full, dropped oldest event (total dropped: {self._dropped})"
+            )
+        elif overflow:
+            # 受け渡しの間にコンシューマーが取り出して空きができた場合は破棄しない
+            with self._lock:
+                self._dropped -= 1
+                self._pending += 1
+        self._queue.put_nowait(event)
+
+    async def _consume(self) -> None:
+        """キューからイベントを取り出し、全ハンドラーに配信します。"""
+        assert self._queue is not None
+        queue = self._queue
+
+        while True:
+            event = await queue.get()
+            with self._lock:
+                self._pending -= 1
+            try:
+                with self._lock:
+                    handlers = list(self._handlers)
+                for handler in handlers:
+                    try:
+                        await handler(event)
+                    except Exception as e:
+                        logger.error(f"Event handler error: {e}")
+                self._delivered += 1
+            finally:
+                queue.task_done()
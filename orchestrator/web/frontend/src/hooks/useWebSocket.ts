@@ -14,6 +14,7 @@ import { getTeamMessages, getTeamTasks } from "../services/api";
 import { useTeamStore } from "../stores/teamStore";
 import { notify } from "../stores/uiStore";
 import { errorHandler } from "../services/errorHandler";
+import type { TaskInfo, TeamMessage } from "../services/types";
 
 // ============================================================================
 // モジュールレベルの変数（シングルトン）
@@ -51,6 +52,43 @@ function setConnectionState(state: ConnectionState): void {
   }
 }
 
+/**
+ * 選択中のチームのメッセージとタスクを上書きする
+ */
+function replaceTeamData(messages: TeamMessage[], tasks: TaskInfo[]): void {
+  // setStateで直接上書き（重複チェック済みのため）
+  useTeamStore.setState({
+    messages,
+    messageCount: {
+      total: messages.length,
+      thinking: messages.filter((m) => m.messageType === "thinking").length,
+      task: messages.filter((m) => m.messageType === "task").length,
+      result: messages.filter((m) => m.messageType === "result").length,
+    },
+    tasks,
+  });
+}
+
+/**
+ * 選択中のチームデータをREST APIから再取得する（Issue #45対応）
+ */
+async function refetchSelectedTeam(): Promise<void> {
+  const selectedTeamName = useTeamStore.getState().selectedTeamName;
+  if (!selectedTeamName) {
+    return;
+  }
+
+  try {
+    const [messages, tasks] = await Promise.all([
+      getTeamMessages(selectedTeamName),
+      getTeamTasks(selectedTeamName),
+    ]);
+    replaceTeamData(messages, tasks);
+  } catch (error) {
+    console.error(`再接続時のデータ取得エラー (${selectedTeamName}):`, error);
+  }
+}
+
 /**
  * WebSocketクライアントを初期化し、イベントハンドラーを登録します
  * この関数は1回のみ実行されます
@@ -71,6 +109,8 @@ function initializeWebSocket() {
   const addThinkingLog = useTeamStore.getState().addThinkingLog;
   const addSystemLog = useTeamStore.getState().addSystemLog;
   const setTasks = useTeamStore.getState().setTasks;
+  const upsertTask = useTeamStore.getState().upsertTask;
+  const removeTask = useTeamStore.getState().removeTask;
   const setHasErrors = useTeamStore.getState().setHasErrors;
   const addChannel = useTeamStore.getState().addChannel;
   const addChannelMessage = useTeamStore.getState().addChannelMessage;
@@ -79,35 +119,28 @@ function initializeWebSocket() {
   const unsubscribeConnected = wsClient.on("connected", async () => {
     setConnectionState("connected");
 
-    // 再接続時に選択中のチームデータを再取得（Issue #45対応）
-    const selectedTeamName = useTeamStore.getState().selectedTeamName;
-    if (selectedTeamName) {
-      try {
-        // メッセージとタスクを再取得して上書き
-        const [messages, tasks] = await Promise.all([
-          getTeamMessages(selectedTeamName),
-          getTeamTasks(selectedTeamName),
-        ]);
-
-        // setStateで直接上書き（重複チェック済みのため）
-        useTeamStore.setState({
-          messages,
-          messageCount: {
-            total: messages.length,
-            thinking: messages.filter((m) => m.messageType === "thinking").length,
-            task: messages.filter((m) => m.messageType === "task").length,
-            result: messages.filter((m) => m.messageType === "result").length,
-          },
-          tasks,
-        });
-      } catch (error) {
-        console.error(`再接続時のデータ取得エラー (${selectedTeamName}):`, error);
-      }
+    // resumeした場合は切断中の差分（またはスナップショット）を受信済みのため再取得しない
+    if (!wsClient?.isResuming()) {
+      await refetchSelectedTeam();
     }
 
     notify.success("ダッシュボードに接続しました");
   });
 
+  const unsubscribeSnapshot = wsClient.on("snapshot", (msg) => {
+    if (msg.type === "snapshot") {
+      // 差分を再送できなかった場合はスナップショットで選択中のチームデータを上書き
+      const selectedTeamName = useTeamStore.getState().selectedTeamName;
+      if (selectedTeamName && msg.messages[selectedTeamName]) {
+        replaceTeamData(msg.messages[selectedTeamName], msg.tasks[selectedTeamName] ?? []);
+      }
+    }
+  });
+
+  const unsubscribeResyncRequired = wsClient.on("resync_required", async () => {
+    await refetchSelectedTeam();
+  });
+
   const unsubscribeTeamCreated = wsClient.on("team_created", (msg) => {
     if (msg.type === "team_created") {
       addTeam(msg.team);
@@ -157,6 +190,18 @@ function initializeWebSocket() {
     }
   });
 
+  const unsubscribeTaskUpserted = wsClient.on("task_upserted", (msg) => {
+    if (msg.type === "task_upserted") {
+      upsertTask(msg.task);
+    }
+  });
+
+  const unsubscribeTaskDeleted = wsClient.on("task_deleted", (msg) => {
+    if (msg.type === "task_deleted") {
+      removeTask(msg.taskId);
+    }
+  });
+
   const unsubscribeSystemLog = wsClient.on("system_log", (msg) => {
     if (msg.type === "system_log") {
       addSystemLog({
@@ -250,12 +295,16 @@ function initializeWebSocket() {
   // クリーンアップ関数を保存
   unsubscribers = [
     unsubscribeConnected,
+    unsubscribeSnapshot,
+    unsubscribeResyncRequired,
     unsubscribeTeamCreated,
     unsubscribeTeamDeleted,
     unsubscribeTeamUpdated,
     unsubscribeTeamMessage,
     unsubscribeThinkingLog,
     unsubscribeTasksUpdated,
+    unsubscribeTaskUpserted,
+    unsubscribeTaskDeleted,
     unsubscribeSystemLog,
     unsubscribeHealthEvent,
     unsubscribeAgents,
@@ -7,12 +7,16 @@
 import type {
   ApiErrorResponse,
   GetHealthStatusResponse,
+  GetSnapshotResponse,
   GetTeamMessagesResponse,
   GetTeamStatusResponse,
   GetTeamTasksResponse,
   GetTeamThinkingResponse,
   GetTeamsResponse,
+  MessagePageQuery,
+  SnapshotQuery,
   TeamInfo,
+  ThinkingPageQuery,
 } from "./types";
 
 // ============================================================================
@@ -58,6 +62,20 @@ async function fetchApi<T>(
   return response.json() as Promise<T>;
 }
 
+/**
+ * 値が指定された条件からクエリ文字列（先頭の?を含む）を作成する
+ */
+function toQueryString(query: object): string {
+  const params = new URLSearchParams();
+  Object.entries(query).forEach(([key, value]) => {
+    if (value !== undefined && value !== "") {
+      params.set(key, String(value));
+    }
+  });
+  const queryString = params.toString();
+  return queryString ? `?${queryString}` : "";
+}
+
 // ============================================================================
 // チームAPI
 // ============================================================================
@@ -76,12 +94,25 @@ export async function getTeams(): Promise<TeamInfo[]> {
 export async function getTeamMessages(
   teamName: string,
 ): Promise<import("./types").TeamMessage[]> {
-  const response = await fetchApi<GetTeamMessagesResponse>(
-    `/teams/${encodeURIComponent(teamName)}/messages`,
-  );
+  const response = await getTeamMessagesPage(teamName);
   return response.messages;
 }
 
+/**
+ * チームのメッセージを1ページ分取得する
+ *
+ * limitのみを指定すると最新のlimit件を返す。
+ * さらに古いページはpage.beforeをbeforeに指定して取得する
+ */
+export async function getTeamMessagesPage(
+  teamName: string,
+  query: MessagePageQuery = {},
+): Promise<GetTeamMessagesResponse> {
+  return fetchApi<GetTeamMessagesResponse>(
+    `/teams/${encodeURIComponent(teamName)}/messages${toQueryString(query)}`,
+  );
+}
+
 /**
  * チームのタスクリストを取得する
  */
@@ -101,16 +132,31 @@ export async function getTeamThinking(
   teamName: string,
   agent?: string,
 ): Promise<import("./types").ThinkingLog[]> {
-  const params = new URLSearchParams();
-  if (agent) {
-    params.set("agent", agent);
-  }
+  const response = await getTeamThinkingPage(teamName, { agent });
+  return response.thinking;
+}
 
-  const queryString = params.toString();
-  const endpoint = `/teams/${encodeURIComponent(teamName)}/thinking${queryString ? `?${queryString}` : ""}`;
+/**
+ * チームの思考ログを1ページ分取得する
+ *
+ * エージェント・カテゴリ・感情の条件はサーバー側のインデックスで絞り込まれる
+ */
+export async function getTeamThinkingPage(
+  teamName: string,
+  query: ThinkingPageQuery = {},
+): Promise<GetTeamThinkingResponse> {
+  return fetchApi<GetTeamThinkingResponse>(
+    `/teams/${encodeURIComponent(teamName)}/thinking${toQueryString(query)}`,
+  );
+}
 
-  const response = await fetchApi<GetTeamThinkingResponse>(endpoint);
-  return response.thinking;
+/**
+ * 全チームのメッセージ・タスク・思考ログ・ヘルス状態を1回のリクエストで取得する
+ *
+ * 前回の応答のversionとepochをsince・epochに指定すると、変更のないチームは省略される
+ */
+export async function getSnapshot(query: SnapshotQuery = {}): Promise<GetSnapshotResponse> {
+  return fetchApi<GetSnapshotResponse>(`/snapshot${toQueryString(query)}`);
 }
 
 /**
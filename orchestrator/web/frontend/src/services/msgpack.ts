@@ -0,0 +1,150 @@
+/**
+ * MessagePackデコーダー
+ *
+ * サーバーがmsgpack機能で送信するバイナリフレームをデコードします。
+ * サーバーが生成する型（nil, bool, 整数, 浮動小数点数, 文字列, バイナリ, 配列, マップ）のみに対応します。
+ */
+
+const textDecoder = new TextDecoder();
+
+class Reader {
+  private offset = 0;
+  private readonly bytes: Uint8Array;
+  private readonly view: DataView;
+
+  constructor(bytes: Uint8Array) {
+    this.bytes = bytes;
+    this.view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  }
+
+  read(): unknown {
+    const byte = this.uint8();
+
+    if (byte <= 0x7f) return byte;
+    if (byte >= 0xe0) return byte - 0x100;
+    if ((byte & 0xf0) === 0x80) return this.map(byte & 0x0f);
+    if ((byte & 0xf0) === 0x90) return this.array(byte & 0x0f);
+    if ((byte & 0xe0) === 0xa0) return this.str(byte & 0x1f);
+
+    switch (byte) {
+      case 0xc0:
+        return null;
+      case 0xc2:
+        return false;
+      case 0xc3:
+        return true;
+      case 0xc4:
+        return this.bin(this.uint8());
+      case 0xc5:
+        return this.bin(this.uint16());
+      case 0xc6:
+        return this.bin(this.uint32());
+      case 0xca:
+        return this.advance(4, (offset) => this.view.getFloat32(offset));
+      case 0xcb:
+        return this.advance(8, (offset) => this.view.getFloat64(offset));
+      case 0xcc:
+        return this.uint8();
+      case 0xcd:
+        return this.uint16();
+      case 0xce:
+        return this.uint32();
+      case 0xcf:
+        return this.advance(8, (offset) => Number(this.view.getBigUint64(offset)));
+      case 0xd0:
+        return this.advance(1, (offset) => this.view.getInt8(offset));
+      case 0xd1:
+        return this.advance(2, (offset) => this.view.getInt16(offset));
+      case 0xd2:
+        return this.advance(4, (offset) => this.view.getInt32(offset));
+      case 0xd3:
+        return this.advance(8, (offset) => Number(this.view.getBigInt64(offset)));
+      case 0xd9:
+        return this.str(this.uint8());
+      case 0xda:
+        return this.str(this.uint16());
+      case 0xdb:
+        return this.str(this.uint32());
+      case 0xdc:
+        return this.array(this.uint16());
+      case 0xdd:
+        return this.array(this.uint32());
+      case 0xde:
+        return this.map(this.uint16());
+      case 0xdf:
+        return this.map(this.uint32());
+      default:
+        throw new Error(`未対応のMessagePack型: 0x${byte.toString(16)}`);
+    }
+  }
+
+  private advance<T>(size: number, read: (offset: number) => T): T {
+    const value = read(this.offset);
+    this.offset += size;
+    return value;
+  }
+
+  private uint8(): number {
+    return this.advance(1, (offset) => this.view.getUint8(offset));
+  }
+
+  private uint16(): number {
+    return this.advance(2, (offset) => this.view.getUint16(offset));
+  }
+
+  private uint32(): number {
+    return this.advance(4, (offset) => this.view.getUint32(offset));
+  }
+
+  private str(length: number): string {
+    return this.advance(length, (offset) =>
+      textDecoder.decode(this.bytes.subarray(offset, offset + length)),
+    );
+  }
+
+  private bin(length: number): Uint8Array {
+    return this.advance(length, (offset) => this.bytes.slice(offset, offset + length));
+  }
+
+  private array(length: number): unknown[] {
+    const items: unknown[] = [];
+    for (let i = 0; i < length; i++) {
+      items.push(this.read());
+    }
+    return items;
+  }
+
+  private map(length: number): Map<unknown, unknown> {
+    const entries = new Map<unknown, unknown>();
+    for (let i = 0; i < length; i++) {
+      const key = this.read();
+      entries.set(key, this.read());
+    }
+    return entries;
+  }
+}
+
+/**
+ * 番号に置き換えられたキーをキー辞書で復元し、マップをオブジェクトに変換する
+ */
+function expandKeys(value: unknown, keys: readonly string[]): unknown {
+  if (Array.isArray(value)) {
+    return value.map((item) => expandKeys(item, keys));
+  }
+  if (value instanceof Map) {
+    const result: Record<string, unknown> = {};
+    value.forEach((item, key) => {
+      const name = typeof key === "number" ? (keys[key] ?? String(key)) : String(key);
+      result[name] = expandKeys(item, keys);
+    });
+    return result;
+  }
+  return value;
+}
+
+/**
+ * キー辞書付きのMessagePackをデコードする
+ */
+export function decodeMessagePack(data: ArrayBuffer, keys: readonly string[]): unknown {
+  return expandKeys(new Reader(new Uint8Array(data)).read(), keys);
+}
@@ -142,18 +142,74 @@ export interface HealthEvent {
 /** WebSocketメッセージのベース型 */
 export interface BaseWebSocketMessage {
   type: string;
+  /** リクエストの識別子（応答には同じ値が付与される） */
+  requestId?: string;
 }
 
 /** 接続確立メッセージ */
 export interface ConnectedMessage extends BaseWebSocketMessage {
   type: "connected";
   message: string;
+  /** 接続時点のシーケンス番号 */
+  seq?: number;
+  /** リプレイログの識別子 */
+  epoch?: string;
+  /** サーバーが有効にした機能 */
+  capabilities?: string[];
+}
+
+/** エンコーディングメッセージ（MessagePackのキー辞書） */
+export interface EncodingMessage extends BaseWebSocketMessage {
+  type: "encoding";
+  format: "msgpack";
+  keys: string[];
+}
+
+/** バッチメッセージ（短い時間内のイベントをまとめたもの） */
+export interface BatchMessage extends BaseWebSocketMessage {
+  type: "batch";
+  events: WebSocketMessage[];
+}
+
+/** 差分再送完了メッセージ（切断中のメッセージは直前に再送済み） */
+export interface ResumedMessage extends BaseWebSocketMessage {
+  type: "resumed";
+  lastSeq: number;
+  seq?: number;
+  epoch?: string;
+  replayed: number;
+}
+
+/** スナップショットメッセージ（差分を再送できない場合に送信） */
+export interface SnapshotMessage extends BaseWebSocketMessage {
+  type: "snapshot";
+  seq?: number;
+  epoch?: string;
+  teams: TeamInfo[];
+  messages: Record<string, TeamMessage[]>;
+  tasks: Record<string, TaskInfo[]>;
+  thinking: Record<string, ThinkingLog[]>;
+}
+
+/** 再取得要求メッセージ（スナップショットを生成できない場合に送信） */
+export interface ResyncRequiredMessage extends BaseWebSocketMessage {
+  type: "resync_required";
+  seq?: number;
+  epoch?: string;
+}
+
+/** 購読条件（空の配列はその条件で絞り込まないことを表す） */
+export interface SubscriptionFilter {
+  teams?: string[];
+  eventTypes?: string[];
+  agents?: string[];
 }
 
 /** 購読確定メッセージ */
 export interface SubscribedMessage extends BaseWebSocketMessage {
   type: "subscribed";
   channels: string[];
+  subscription?: Required<SubscriptionFilter>;
 }
 
 /** Pongメッセージ */
@@ -169,11 +225,23 @@ export interface PingMessage extends BaseWebSocketMessage {
 }
 
 /** Subscribeメッセージ */
-export interface SubscribeMessage extends BaseWebSocketMessage {
+export interface SubscribeMessage extends BaseWebSocketMessage, SubscriptionFilter {
   type: "subscribe";
   channels: string[];
 }
 
+/** Unsubscribeメッセージ */
+export interface UnsubscribeMessage extends BaseWebSocketMessage, SubscriptionFilter {
+  type: "unsubscribe";
+}
+
+/** 購読解除確定メッセージ */
+export interface UnsubscribedMessage extends BaseWebSocketMessage {
+  type: "unsubscribed";
+  channels: string[];
+  subscription?: Required<SubscriptionFilter>;
+}
+
 /** ステータスメッセージ */
 export interface StatusMessage extends BaseWebSocketMessage {
   type: "status";
@@ -205,6 +273,13 @@ export interface AgentsMessage extends BaseWebSocketMessage {
   clusterName?: string;
 }
 
+/** チーム状態メッセージ（get_team_statusの応答） */
+export interface TeamStatusMessage extends BaseWebSocketMessage {
+  type: "team_status";
+  teamName: string;
+  data: GetTeamStatusResponse;
+}
+
 /** エラーメッセージ */
 export interface ErrorMessage extends BaseWebSocketMessage {
   type: "error";
@@ -267,6 +342,20 @@ export interface TasksUpdatedMessage extends BaseWebSocketMessage {
   tasks: TaskInfo[];
 }
 
+/** タスク追加・更新メッセージ */
+export interface TaskUpsertedMessage extends BaseWebSocketMessage {
+  type: "task_upserted";
+  teamName: string;
+  task: TaskInfo;
+}
+
+/** タスク削除メッセージ */
+export interface TaskDeletedMessage extends BaseWebSocketMessage {
+  type: "task_deleted";
+  teamName: string;
+  taskId: string;
+}
+
 /** ヘルスイベントメッセージ */
 export interface HealthEventMessage extends BaseWebSocketMessage {
   type: "health_event";
@@ -359,11 +448,19 @@ export interface ChannelsListMessage extends BaseWebSocketMessage {
 /** WebSocketメッセージの共用体型 */
 export type WebSocketMessage =
   | ConnectedMessage
+  | BatchMessage
+  | EncodingMessage
+  | ResumedMessage
+  | SnapshotMessage
+  | ResyncRequiredMessage
   | SubscribedMessage
   | SubscribeMessage
+  | UnsubscribeMessage
+  | UnsubscribedMessage
   | PongMessage
   | PingMessage
   | StatusMessage
+  | TeamStatusMessage
   | AgentMessage
   | ThinkingMessage
   | AgentsMessage
@@ -376,6 +473,8 @@ export type WebSocketMessage =
   | TeamMessageMessage
   | ThinkingLogMessage
   | TasksUpdatedMessage
+  | TaskUpsertedMessage
+  | TaskDeletedMessage
   | HealthEventMessage
   | ChannelMessageMessage
   | JoinChannelMessage
@@ -400,6 +499,24 @@ export interface GetTeamsResponse {
 export interface GetTeamMessagesResponse {
   teamName: string;
   messages: TeamMessage[];
+  page?: PageInfo;
+}
+
+/** ページ情報（カーソルは次のページの取得に使用する） */
+export interface PageInfo {
+  hasMore: boolean;
+  before: string | null;
+  after: string | null;
+  total: number;
+}
+
+/** メッセージのページ取得条件 */
+export interface MessagePageQuery {
+  limit?: number;
+  before?: string;
+  after?: string;
+  since?: string;
+  until?: string;
 }
 
 /** チームタスクAPIレスポンス */
@@ -413,13 +530,26 @@ export interface GetTeamThinkingResponse {
   teamName: string;
   agent?: string;
   thinking: ThinkingLog[];
+  page?: PageInfo;
 }
 
-/** チームステータスAPIレスポンス */
+/** 思考ログのページ取得条件（エージェント・カテゴリ・感情は組み合わせ可能） */
+export interface ThinkingPageQuery extends MessagePageQuery {
+  agent?: string;
+  category?: string;
+  emotion?: string;
+}
+
+/** チームステータスAPIレスポンス（CLIのteam-statusとは異なる正規化済みの形式） */
 export interface GetTeamStatusResponse {
+  /** 応答形式のバージョン（メンバー・タスクがTeamMember/TaskInfo形式の場合は2） */
+  schemaVersion: 2;
   name: string;
-  status: string;
+  description: string;
   members: TeamMember[];
+  taskCount: number;
+  tasks: TaskInfo[];
+  health: Record<string, AgentHealth>;
 }
 
 /** ヘルスステータスAPIレスポンス */
@@ -428,6 +558,45 @@ export interface GetHealthStatusResponse {
   events: HealthEvent[];
 }
 
+/** エージェントのヘルス状態（/api/snapshot のhealthセクション） */
+export interface AgentHealth {
+  isHealthy: boolean;
+  lastActivity: string;
+  timeoutThreshold: number;
+  elapsed: number;
+}
+
+/** スナップショットに含められるセクション */
+export type SnapshotSection = "messages" | "tasks" | "thinking" | "health";
+
+/** スナップショットの取得条件 */
+export interface SnapshotQuery {
+  /** 対象のチーム名（省略時は全チーム） */
+  teams?: string[];
+  /** 含めるセクション（省略時は全セクション） */
+  sections?: SnapshotSection[];
+  /** 前回のスナップショットのversion（変更のないチームのセクションを省略する） */
+  since?: number;
+  /** 前回のスナップショットのepoch */
+  epoch?: string;
+}
+
+/**
+ * スナップショットAPIレスポンス
+ *
+ * sinceを指定した場合、変更のないチームはmessages/tasks/thinkingに含まれない
+ */
+export interface GetSnapshotResponse {
+  epoch: string;
+  version: number;
+  since: number | null;
+  teams: TeamInfo[];
+  messages?: Record<string, TeamMessage[]>;
+  tasks?: Record<string, TaskInfo[]>;
+  thinking?: Record<string, ThinkingLog[]>;
+  health?: Record<string, Record<string, AgentHealth>>;
+}
+
 /** APIエラーレスポンス */
 export interface ApiErrorResponse {
   error: string;
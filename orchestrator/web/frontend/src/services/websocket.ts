@@ -4,22 +4,32 @@
  * orchestrator-ccバックエンドとのWebSocket通信を担当します
  */
 
-import type { WebSocketMessage } from "./types";
+import { decodeMessagePack } from "./msgpack";
+import type { SubscriptionFilter, WebSocketMessage } from "./types";
 
 // ============================================================================
 // 設定
 // ============================================================================
 
-const WS_URL = () => {
+const WS_URL = (resume?: { lastSeq: number; epoch: string }) => {
   const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
   const host = import.meta.env.DEV ? "127.0.0.1:8000" : window.location.host;
-  return `${protocol}//${host}/ws`;
+  // 高頻度のイベントはbatchフレームにまとめ、MessagePack（バイナリフレーム）で受信する
+  // （サーバーがmsgpackに対応していない場合はJSONテキストで届く）
+  const params = new URLSearchParams({ capabilities: "batch,msgpack" });
+  // 再接続時は最後に受信したシーケンス番号を渡し、切断中の差分だけを受け取る
+  if (resume) {
+    params.set("lastSeq", String(resume.lastSeq));
+    params.set("epoch", resume.epoch);
+  }
+  return `${protocol}//${host}/ws?${params.toString()}`;
 };
 
 const RECONNECT_DELAY = 3000;
 const MAX_RECONNECT_ATTEMPTS = 10;
 const HEARTBEAT_INTERVAL = 15000;
 const HEARTBEAT_TIMEOUT = 30000;
+const REQUEST_TIMEOUT = 10000;
 
 // ============================================================================
 // 型定義
@@ -38,6 +48,13 @@ type MessageHandler = (message: WebSocketMessage) => void;
 /** イベントハンドラー型 */
 type EventHandler = () => void;
 
+/** 応答待ちのリクエスト */
+interface PendingRequest {
+  resolve: (message: WebSocketMessage) => void;
+  reject: (error: Error) => void;
+  timer: ReturnType<typeof setTimeout>;
+}
+
 // ============================================================================
 // WebSocketClientクラス
 // ============================================================================
@@ -51,6 +68,18 @@ export class WebSocketClient {
   private messageHandlers = new Map<string, Set<MessageHandler>>();
   private connectionStateHandlers = new Set<EventHandler>();
   private currentState: ConnectionState = "disconnected";
+  /** 最後に受信したブロードキャストのシーケンス番号 */
+  private lastSeq = 0;
+  /** サーバーのリプレイログの識別子 */
+  private epoch: string | null = null;
+  /** 現在の接続でresumeを要求したかどうか */
+  private resuming = false;
+  /** MessagePackのキー辞書（encodingメッセージで受信） */
+  private messagePackKeys: readonly string[] = [];
+  /** 次に発行するリクエストの番号 */
+  private nextRequestId = 1;
+  /** 応答待ちのリクエスト（requestIdごと） */
+  private pendingRequests = new Map<string, PendingRequest>();
 
   constructor() {
     // ウィンドウフォーカス時に接続状態をチェック
@@ -76,7 +105,11 @@ export class WebSocketClient {
     this.setState("connecting");
 
     try {
-      this.ws = new WebSocket(WS_URL());
+      this.resuming = this.epoch !== null;
+      this.ws = new WebSocket(
+        this.epoch !== null ? WS_URL({ lastSeq: this.lastSeq, epoch: this.epoch }) : WS_URL(),
+      );
+      this.ws.binaryType = "arraybuffer";
       this.setupEventListeners();
     } catch (error) {
       console.error("WebSocket接続エラー:", error);
@@ -94,6 +127,7 @@ export class WebSocketClient {
       clearTimeout(this.reconnectTimer);
       this.reconnectTimer = null;
     }
+    this.rejectPendingRequests("WebSocket切断");
     if (this.ws) {
       this.ws.onclose = null;
       this.ws.onerror = null;
@@ -126,7 +160,11 @@ export class WebSocketClient {
 
     this.ws.onmessage = (event) => {
       try {
-        const message = JSON.parse(event.data) as WebSocketMessage;
+        const message = (
+          event.data instanceof ArrayBuffer
+            ? decodeMessagePack(event.data, this.messagePackKeys)
+            : JSON.parse(event.data)
+        ) as WebSocketMessage;
         this.handleMessage(message);
       } catch (error) {
         console.error("メッセージ解析エラー:", error, event.data);
@@ -140,6 +178,7 @@ export class WebSocketClient {
     this.ws.onclose = () => {
       console.log("WebSocket切断");
       this.stopHeartbeat();
+      this.rejectPendingRequests("WebSocket切断");
       this.setState("disconnected");
       this.scheduleReconnect();
     };
@@ -180,6 +219,57 @@ export class WebSocketClient {
     }
   }
 
+  /**
+   * requestIdを付けてメッセージを送信し、同じrequestIdの応答を待つ
+   *
+   * 応答を待たずに複数のリクエストを送信できる（errorメッセージの応答はrejectされる）
+   */
+  request(
+    data: Record<string, unknown>,
+    timeout: number = REQUEST_TIMEOUT,
+  ): Promise<WebSocketMessage> {
+    if (this.ws?.readyState !== WebSocket.OPEN) {
+      return Promise.reject(new Error("WebSocket未接続"));
+    }
+
+    const requestId = String(this.nextRequestId++);
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        this.pendingRequests.delete(requestId);
+        reject(new Error(`リクエストがタイムアウトしました: ${String(data.type)}`));
+      }, timeout);
+      this.pendingRequests.set(requestId, { resolve, reject, timer });
+      this.send({ ...data, requestId });
+    });
+  }
+
+  /**
+   * チームの状態を要求する
+   */
+  getTeamStatus(teamName: string): Promise<WebSocketMessage> {
+    return this.request({ type: "get_team_status", teamName });
+  }
+
+  /**
+   * 購読条件を追加する（チーム・イベントタイプ・エージェントで配信を絞り込む）
+   */
+  subscribe(filter: SubscriptionFilter): void {
+    this.send({
+      type: "subscribe",
+      ...filter,
+    } as WebSocketMessage);
+  }
+
+  /**
+   * 購読条件を削除する（条件を省略すると全ての購読条件を解除する）
+   */
+  unsubscribe(filter: SubscriptionFilter = {}): void {
+    this.send({
+      type: "unsubscribe",
+      ...filter,
+    } as WebSocketMessage);
+  }
+
   /**
    * チャンネルにメッセージを送信する
    */
@@ -232,6 +322,21 @@ export class WebSocketClient {
    * 受信メッセージを処理する
    */
   private handleMessage(message: WebSocketMessage): void {
+    // batchフレームは含まれるイベントを順番に処理する
+    if (message.type === "batch") {
+      message.events.forEach((event) => this.handleMessage(event));
+      return;
+    }
+
+    // 以降のバイナリフレームのデコードに使うキー辞書を記録する
+    if (message.type === "encoding") {
+      this.messagePackKeys = message.keys;
+      return;
+    }
+
+    this.trackSequence(message);
+    this.settleRequest(message);
+
     const handlers = this.messageHandlers.get(message.type);
     if (handlers) {
       handlers.forEach((handler) => {
@@ -247,6 +352,76 @@ export class WebSocketClient {
     if (message.type === "pong") {
       this.lastPongTime = Date.now();
     }
+
+    // サーバーからのPingに応答する（応答がない接続はサーバー側で切断される）
+    if (message.type === "ping") {
+      this.lastPongTime = Date.now();
+      this.send({ type: "pong", timestamp: message.timestamp } as WebSocketMessage);
+    }
+  }
+
+  /**
+   * 応答待ちのリクエストをrequestIdで照合して完了させる
+   */
+  private settleRequest(message: WebSocketMessage): void {
+    if (message.requestId === undefined) return;
+    const pending = this.pendingRequests.get(message.requestId);
+    if (!pending) return;
+
+    this.pendingRequests.delete(message.requestId);
+    clearTimeout(pending.timer);
+    if (message.type === "error") {
+      pending.reject(new Error(message.message));
+    } else {
+      pending.resolve(message);
+    }
+  }
+
+  /**
+   * 応答待ちのリクエストを全てrejectする
+   */
+  private rejectPendingRequests(reason: string): void {
+    this.pendingRequests.forEach((pending) => {
+      clearTimeout(pending.timer);
+      pending.reject(new Error(reason));
+    });
+    this.pendingRequests.clear();
+  }
+
+  /**
+   * 受信メッセージのシーケンス番号とリプレイログの識別子を記録する
+   */
+  private trackSequence(message: WebSocketMessage): void {
+    switch (message.type) {
+      case "connected":
+        // resumeした接続では、先に届くresumed/snapshotで追跡済みのため上書きしない
+        if (!this.resuming && message.epoch !== undefined) {
+          this.lastSeq = message.seq ?? 0;
+          this.epoch = message.epoch;
+        }
+        return;
+      case "resumed":
+        this.lastSeq = Math.max(this.lastSeq, message.seq ?? 0);
+        this.epoch = message.epoch ?? this.epoch;
+        return;
+      case "snapshot":
+      case "resync_required":
+        this.lastSeq = message.seq ?? 0;
+        this.epoch = message.epoch ?? this.epoch;
+        return;
+    }
+
+    const seq = (message as { seq?: unknown }).seq;
+    if (typeof seq === "number" && seq > this.lastSeq) {
+      this.lastSeq = seq;
+    }
+  }
+
+  /**
+   * 現在の接続でresume（差分の再送）を要求したかどうかを返す
+   */
+  isResuming(): boolean {
+    return this.resuming;
   }
 
   /**
@@ -90,6 +90,8 @@ interface TeamActions {
   setTasks: (tasks: TaskInfo[]) => void;
   updateTask: (taskId: string, updates: Partial<TaskInfo>) => void;
   addTask: (task: TaskInfo) => void;
+  upsertTask: (task: TaskInfo) => void;
+  removeTask: (taskId: string) => void;
 
   // 思考ログ操作
   addThinkingLog: (log: ThinkingLog) => void;
@@ -381,6 +383,40 @@ export const useTeamStore = create<TeamStore>()(
           });
         },
 
+        upsertTask: (task) => {
+          set((state) => {
+            const existingIndex = state.tasks.findIndex((t) => t.taskId === task.taskId);
+            const newTasks =
+              existingIndex >= 0
+                ? state.tasks.map((t, i) => (i === existingIndex ? task : t))
+                : [...state.tasks, task];
+            return {
+              tasks: newTasks,
+              taskStats: {
+                pending: newTasks.filter((t) => t.status === "pending").length,
+                inProgress: newTasks.filter((t) => t.status === "in_progress").length,
+                completed: newTasks.filter((t) => t.status === "completed").length,
+                total: newTasks.length,
+              },
+            };
+          });
+        },
+
+        removeTask: (taskId) => {
+          set((state) => {
+            const newTasks = state.tasks.filter((t) => t.taskId !== taskId);
+            return {
+              tasks: newTasks,
+              taskStats: {
+                pending: newTasks.filter((t) => t.status === "pending").length,
+                inProgress: newTasks.filter((t) => t.status === "in_progress").length,
+                completed: newTasks.filter((t) => t.status === "completed").length,
+                total: newTasks.length,
+              },
+            };
+          });
+        },
+
         // 思考ログ操作
         addThinkingLog: (log) => {
           set((state) => ({
@@ -0,0 +1,88 @@
+"""ingestプロセスモジュール
+
+~/.claude配下のチーム・タスク・思考ログの監視とヘルスチェックを1つのプロセスで行い、
+検出したイベントをUnixドメインソケット経由で全Webワーカーに配信します。
+
+複数ワーカーでダッシュボードを起動する場合の構成:
+    python -m orchestrator.web.ingest
+    ORCHESTRATOR_EVENT_BACKEND=ipc uvicorn orchestrator.web.dashboard:app --workers 4
+
+ソケットパスはORCHESTRATOR_EVENT_SOCKETで変更できます（ワーカーと同じ値を指定すること）。
+"""
+
+import asyncio
+import logging
+import signal
+from pathlib import Path
+
+from orchestrator.core.agent_health_monitor import get_agent_health_monitor
+from orchestrator.web.event_bus import EventBus
+from orchestrator.web.pubsub import IpcEventPublisher, event_socket_from_env
+from orchestrator.web.team_models import teams_roots_from_env
+from orchestrator.web.teams_monitor import TeamsMonitor
+from orchestrator.web.thinking_log_handler import get_thinking_log_handler
+
+logger = logging.getLogger(__name__)
+
+
+async def run_ingest(socket_path: Path, stop_event: asyncio.Event) -> None:
+    """監視を開始し、stop_eventがセットされるまでイベントを配信します。
+
+    Args:
+        socket_path: ソケットパス
+        stop_event: 停止を通知するイベント
+    """
+    publisher = IpcEventPublisher(socket_path)
+    await publisher.start()
+
+    event_bus = EventBus()
+    event_bus.subscribe(publisher.publish)
+    await event_bus.start()
+
+    def publish(data: dict) -> None:
+        if not event_bus.publish(data):
+            logger.debug(f"Event bus not running or queue full, event lost: {data.get('type')}")
+
+    teams_monitor = TeamsMonitor(roots=teams_roots_from_env())
+    teams_monitor.register_update_callback(publish)
+    teams_monitor.start_monitoring()
+
+    thinking_log_handler = get_thinking_log_handler()
+    thinking_log_handler.register_callback(publish)
+    thinking_log_handler.start_monitoring()
+
+    health_monitor = get_agent_health_monitor()
+    health_monitor.register_callback(
+        lambda event: publish({"type": "health_event", "event": event.to_dict()})
+    )
+    health_monitor.start_monitoring()
+
+    logger.info("Ingest process started")
+    try:
+        await stop_event.wait()
+    finally:
+        teams_monitor.stop_monitoring()
+        thinking_log_handler.stop_monitoring()
+        health_monitor.stop_monitoring()
+        await event_bus.stop()
+        await publisher.stop()
+        logger.info("Ingest process stopped")
+
+
+async def _main() -> None:
+    """シグナルを受け取るまでingestプロセスを実行します。"""
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+    await run_ingest(event_socket_from_env(), stop_event)
+
+
+def main() -> None:
+    """メインエントリーポイント"""
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -10,18 +10,44 @@
 - 会話チャンネル管理
 """
 
+import asyncio
+import contextvars
 import json
 import logging
 import re
 import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
 from contextlib import suppress
+from enum import Enum
 from typing import Any
 
 from fastapi import WebSocket
 
+from orchestrator.web.encoding import (
+    KEY_DICTIONARY,
+    encode_json,
+    encode_msgpack,
+    encode_msgpack_batch,
+    json_encoder_name,
+    msgpack_available,
+)
+from orchestrator.web.replay_log import ReplayEntry, ReplayLog
+from orchestrator.web.retention import RetentionPolicy
+from orchestrator.web.subscriptions import SubscriptionIndex
+
 # ロガーの設定
 logger = logging.getLogger(__name__)
 
+# 処理中の受信メッセージのrequestId（send_personalの応答に付与される）
+_current_request_id: contextvars.ContextVar[Any] = contextvars.ContextVar(
+    "current_request_id", default=None
+)
+
+# 接続ごとの未処理の受信メッセージ数の上限
+DEFAULT_MAX_PENDING_REQUESTS = 32
+
 
 # ============================================================================
 # チャンネル名検証
@@ -53,6 +79,7 @@ def validate_channel_name(channel_name: str) -> bool:
 # 会話チャンネルクラス
 # ============================================================================
 
+
 class ConversationChannel:
     """会話チャンネルクラス
 
@@ -205,28 +232,406 @@ class ChannelManager:
         return list(self.channels.keys())
 
 
+class OverflowPolicy(str, Enum):
+    """送信キュー溢れ時のポリシー
+
+    Attributes:
+        DROP_OLDEST: 最も古いメッセージを破棄して新しいメッセージを追加する
+        COALESCE: 同じ状態の未送信メッセージを新しいメッセージで置き換える
+            （状態イベントの置き換えはポリシーに関わらず常に行うため、溢れた場合は
+            DROP_OLDESTと同じく最も古いメッセージを破棄する。ログイベントは置き換えない）
+        DISCONNECT: 接続を切断する
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+    DISCONNECT = "disconnect"
+
+
+# 送信キューに格納するメッセージ
+# （辞書はJSONとして、文字列はエンコード済みテキストとして、バイト列はバイナリフレームとして送信）
+OutboundMessage = dict[str, Any] | str | bytes
+
+# 置き換えキー（type, teamName, taskId）
+CoalesceKey = tuple[Any, Any, Any]
+
+# 全体の状態を表すイベント（送信待ちの同じキーのイベントは常に新しいもので置き換える）
+# それ以外のイベント（team_message, thinking_logなど）はログとして全て順番に送信する
+STATE_EVENT_TYPES = frozenset({"team_updated", "task_upserted", "tasks_updated"})
+
+# クライアントが接続時に要求できる機能
+#   batch: 短い時間内のイベントをbatchフレームにまとめて受信する
+#   msgpack: ブロードキャストをキー辞書付きのMessagePack（バイナリフレーム）で受信する
+#            （msgpackがインストールされている場合のみ）
+SUPPORTED_CAPABILITIES = frozenset({"batch", "msgpack"} if msgpack_available() else {"batch"})
+
+
+def _coalesce_key(message: OutboundMessage) -> CoalesceKey | None:
+    """メッセージの置き換えキーを返します。
+
+    Args:
+        message: 送信メッセージ
+
+    Returns:
+        (type, teamName, taskId)のタプル、辞書でない場合はNone
+    """
+    if not isinstance(message, dict):
+        return None
+    task = message.get("task")
+    task_id = message.get("taskId") or (task.get("taskId") if isinstance(task, dict) else None)
+    return (message.get("type"), message.get("teamName"), task_id)
+
+
+class _ClientConnection:
+    """クライアント接続ごとの送信キューとライタータスク
+
+    ブロードキャストは送信キューへの追加のみを行い、実際の送信は
+    接続ごとのライタータスクが行うため、遅いクライアントが他のクライアントへの
+    配信を遅らせることはありません。
+
+    状態イベント（STATE_EVENT_TYPES）は、同じキーのイベントが送信待ちであれば
+    それを取り除いて末尾に追加するため、送信キューには各状態の最新のものだけが残ります。
+
+    バッチ送信が有効な場合、ライタータスクはbatch_window秒（またはbatch_max_events件）の間
+    イベントを蓄積し、{"type": "batch", "events": [...]} の1フレームにまとめて送信します。
+
+    msgpack機能が有効な場合、ブロードキャストはMessagePackのバイナリフレームで送信されます。
+    応答などの個別メッセージは従来どおりJSONテキストで送信されます。
+
+    Attributes:
+        websocket: WebSocket接続
+        maxsize: 送信キューの最大長
+        policy: 送信キュー溢れ時のポリシー
+        capabilities: 有効な機能（batchなど）
+        batch_window: バッチの蓄積時間（秒、Noneの場合はバッチ送信しない）
+        batch_max_events: 1バッチの最大イベント数
+        binary: ブロードキャストをMessagePackで送信するかどうか
+        last_seen: 最後にクライアントからメッセージを受信した時刻（time.monotonic）
+        dropped: キュー溢れで破棄したメッセージ数
+        coalesced: 新しい状態イベントで置き換えた送信待ちのメッセージ数
+        sent: 送信したメッセージ数
+        batches: 送信したbatchフレーム数
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        maxsize: int,
+        policy: OverflowPolicy,
+        on_error: Callable[[WebSocket], None],
+        capabilities: frozenset[str] = frozenset(),
+        batch_window: float = 0.05,
+        batch_max_events: int = 64,
+    ) -> None:
+        """クライアント接続を初期化します。
+
+        Args:
+            websocket: WebSocket接続
+            maxsize: 送信キューの最大長
+            policy: 送信キュー溢れ時のポリシー
+            on_error: 送信エラー時に呼び出すコールバック
+            capabilities: 有効な機能
+            batch_window: バッチの蓄積時間（秒、batch機能が有効な場合のみ使用）
+            batch_max_events: 1バッチの最大イベント数
+        """
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.policy = policy
+        self.capabilities = capabilities
+        self.batch_window = batch_window if "batch" in capabilities else None
+        self.batch_max_events = max(batch_max_events, 1)
+        self.binary = "msgpack" in capabilities
+        self.last_seen = time.monotonic()
+        self.dropped = 0
+        self.coalesced = 0
+        self.sent = 0
+        self.batches = 0
+        self._on_error = on_error
+        self._queue: deque[tuple[CoalesceKey | None, OutboundMessage]] = deque()
+        self._ready = asyncio.Event()
+        self._writer: asyncio.Task[None] | None = None
+        self._closed = False
+        self._close_task: asyncio.Task[None] | None = None
+
+    def _ensure_writer(self) -> None:
+        """ライタータスクが未起動なら起動します（イベントループ上で呼び出し）。"""
+        if self._writer is None and not self._closed:
+            self._writer = asyncio.get_running_loop().create_task(self._run())
+
+    def queue_size(self) -> int:
+        """送信待ちのメッセージ数を返します。"""
+        return len(self._queue)
+
+    def enqueue(self, message: OutboundMessage, key: CoalesceKey | None = None) -> bool:
+        """メッセージを送信キューに追加します。
+
+        Args:
+            message: 送信メッセージ
+            key: 置き換えキー（エンコード済みテキストの場合に元のメッセージから求めたもの）
+
+        Returns:
+            追加できた場合True、DISCONNECTポリシーでキューが溢れた場合False
+        """
+        if self._closed:
+            return True
+        self._ensure_writer()
+        if key is None:
+            key = _coalesce_key(message)
+        item = (key, message)
+        if key is not None and key[0] in STATE_EVENT_TYPES and self._replace_pending(item):
+            self.coalesced += 1
+        elif len(self._queue) >= self.maxsize:
+            if self.policy == OverflowPolicy.DISCONNECT:
+                return False
+            # ログイベントは置き換えず、最も古いメッセージを破棄する
+            self.dropped += 1
+            self._queue.popleft()
+            self._queue.append(item)
+        else:
+            self._queue.append(item)
+        self._ready.set()
+        return True
+
+    def _replace_pending(self, item: tuple[CoalesceKey | None, OutboundMessage]) -> bool:
+        """同じキーの未送信メッセージを置き換えます。
+
+        Args:
+            item: 新しいメッセージとその置き換えキー
+
+        Returns:
+            置き換えた場合True
+        """
+        key = item[0]
+        if key is None:
+            return False
+        for index in range(len(self._queue) - 1, -1, -1):
+            if self._queue[index][0] == key:
+                del self._queue[index]
+                self._queue.append(item)
+                return True
+        return False
+
+    def close(self, code: int | None = None) -> None:
+        """ライタータスクを停止します。
+
+        Args:
+            code: 指定した場合、このクローズコードでWebSocketも閉じる
+        """
+        self._closed = True
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+        self._queue.clear()
+        if code is not None:
+            self._close_task = asyncio.get_running_loop().create_task(self._close_socket(code))
+
+    async def _close_socket(self, code: int) -> None:
+        """WebSocketを閉じます。
+
+        Args:
+            code: クローズコード
+        """
+        with suppress(Exception):
+            await self.websocket.close(code=code)
+
+    def _next_frame(self) -> tuple[OutboundMessage, int]:
+        """送信キューから次に送信するフレームを取り出します。
+
+        バッチ送信が有効で複数のメッセージが待っている場合は、
+        エンコード済みのテキスト（またはMessagePack）を連結してbatchフレームを作成します
+        （再エンコードなし）。テキストとバイナリは同じフレームにまとめません。
+
+        Returns:
+            (フレーム, 含まれるメッセージ数)のタプル
+        """
+        if self.batch_window is None or len(self._queue) == 1:
+            return self._queue.popleft()[1], 1
+
+        binary = isinstance(self._queue[0][1], bytes)
+        messages: list[OutboundMessage] = []
+        while (
+            self._queue
+            and len(messages) < self.batch_max_events
+            and isinstance(self._queue[0][1], bytes) == binary
+        ):
+            messages.append(self._queue.popleft()[1])
+
+        if len(messages) == 1:
+            return messages[0], 1
+        if binary:
+            frames = [message for message in messages if isinstance(message, bytes)]
+            return encode_msgpack_batch(frames), len(frames)
+
+        events = [
+            message if isinstance(message, str) else encode_json(message) for message in messages
+        ]
+        return '{"type":"batch","events":[' + ",".join(events) + "]}", len(events)
+
+    async def _run(self) -> None:
+        """送信キューのメッセージを順番に送信します。"""
+        while True:
+            await self._ready.wait()
+            if self.batch_window is not None and len(self._queue) < self.batch_max_events:
+                # 後続のイベントを蓄積してからまとめて送信する
+                await asyncio.sleep(self.batch_window)
+            while self._queue:
+                frame, count = self._next_frame()
+                try:
+                    if isinstance(frame, str):
+                        await self.websocket.send_text(frame)
+                    elif isinstance(frame, bytes):
+                        await self.websocket.send_bytes(frame)
+                    else:
+                        await self.websocket.send_json(frame)
+                    self.sent += count
+                    if count > 1:
+                        self.batches += 1
+                except Exception as e:
+                    logger.error(f"メッセージ送信でエラーが発生: {e}")
+                    self._on_error(self.websocket)
+                    return
+            self._ready.clear()
+
+
 class WebSocketManager:
     """WebSocket接続管理クラス
 
     複数のWebSocket接続を管理し、メッセージのブロードキャストや
     個別送信を行います。
 
+    各接続は有界の送信キューとライタータスクを持ち、ブロードキャストは
+    キューへの追加のみを行うため、遅いクライアントが他のクライアントへの
+    配信を遅らせることはありません。
+
+    ハートビートを開始すると、heartbeat_interval秒以上メッセージを受信していない接続に
+    pingを送信し、heartbeat_timeout秒以上応答がない接続を切断します。
+
     Attributes:
-        active_connections: アクティブなWebSocket接続のリスト
+        _clients: 接続ごとの送信キュー（WebSocket -> _ClientConnection）
+        _queue_size: 接続ごとの送信キューの最大長
+        _overflow_policy: 送信キュー溢れ時のポリシー
+        _overflow_disconnects: キュー溢れで切断した接続数
+        _subscriptions: 接続ごとの購読条件とトピック逆引きインデックス
+        _replay: シーケンス番号付きのリプレイログ
+        _heartbeat_interval: pingを送信するまでの無通信時間（秒）
+        _heartbeat_timeout: 接続を切断するまでの無通信時間（秒）
+        _heartbeat_task: ハートビートタスク
+        _reaped: ハートビートのタイムアウトで切断した接続数
     """
 
-    def __init__(self) -> None:
-        """WebSocketManagerを初期化します。"""
-        self.active_connections: list[WebSocket] = []
+    def __init__(
+        self,
+        queue_size: int = 256,
+        overflow_policy: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        replay_policy: RetentionPolicy | None = None,
+        batch_window: float = 0.05,
+        batch_max_events: int = 64,
+        heartbeat_interval: float = 15.0,
+        heartbeat_timeout: float = 45.0,
+    ) -> None:
+        """WebSocketManagerを初期化します。
+
+        Args:
+            queue_size: 接続ごとの送信キューの最大長
+            overflow_policy: 送信キュー溢れ時のポリシー（drop_oldest, coalesce, disconnect）
+            replay_policy: リプレイログの保持ポリシー（指定しない場合は直近1024件・最大8MiB）
+            batch_window: batch機能を要求した接続でイベントを蓄積する時間（秒）
+            batch_max_events: 1つのbatchフレームにまとめる最大イベント数
+            heartbeat_interval: pingを送信するまでの無通信時間（秒）
+            heartbeat_timeout: 接続を切断するまでの無通信時間（秒）
+        """
+        self._clients: dict[WebSocket, _ClientConnection] = {}
+        self._queue_size = queue_size
+        self._overflow_policy = OverflowPolicy(overflow_policy)
+        self._overflow_disconnects = 0
+        self._subscriptions: SubscriptionIndex[WebSocket] = SubscriptionIndex()
+        self._replay = ReplayLog(replay_policy)
+        self._batch_window = batch_window
+        self._batch_max_events = batch_max_events
+        self._heartbeat_interval = heartbeat_interval
+        self._heartbeat_timeout = heartbeat_timeout
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        self._reaped = 0
+
+    @property
+    def current_seq(self) -> int:
+        """最後にブロードキャストしたメッセージのシーケンス番号を返します。"""
+        return self._replay.current_seq
+
+    @property
+    def epoch(self) -> str:
+        """リプレイログの識別子を返します。"""
+        return self._replay.epoch
+
+    @property
+    def active_connections(self) -> list[WebSocket]:
+        """アクティブなWebSocket接続のリストを返します。"""
+        return list(self._clients)
+
+    @active_connections.setter
+    def active_connections(self, websockets: list[WebSocket]) -> None:
+        """アクティブなWebSocket接続を置き換えます。
 
-    async def connect(self, websocket: WebSocket) -> None:
+        Args:
+            websockets: WebSocket接続のリスト
+        """
+        for websocket in list(self._clients):
+            self._unregister(websocket)
+        for websocket in websockets:
+            self._register(websocket)
+
+    def _register(self, websocket: WebSocket, capabilities: frozenset[str] = frozenset()) -> None:
+        """接続の送信キューを登録します。
+
+        ライタータスクは最初のメッセージを追加したときに起動します。
+
+        Args:
+            websocket: WebSocket接続オブジェクト
+            capabilities: 有効にする機能
+        """
+        self._clients[websocket] = _ClientConnection(
+            websocket,
+            self._queue_size,
+            self._overflow_policy,
+            self.disconnect,
+            capabilities=capabilities,
+            batch_window=self._batch_window,
+            batch_max_events=self._batch_max_events,
+        )
+        self._subscriptions.add(websocket)
+
+    def _unregister(self, websocket: WebSocket, code: int | None = None) -> bool:
+        """接続の送信キューと購読条件を削除します。
+
+        Args:
+            websocket: WebSocket接続オブジェクト
+            code: 指定した場合、このクローズコードでWebSocketも閉じる
+
+        Returns:
+            登録されていた場合True
+        """
+        self._subscriptions.remove(websocket)
+        client = self._clients.pop(websocket, None)
+        if client is None:
+            return False
+        client.close(code=code)
+        return True
+
+    async def connect(self, websocket: WebSocket, capabilities: Iterable[str] = ()) -> None:
         """新しい接続を受け入れます。
 
+        msgpack機能が有効な場合は、バイナリフレームより先に届くよう
+        キー辞書を含むencodingメッセージを送信キューの先頭に追加します。
+
         Args:
             websocket: WebSocket接続オブジェクト
+            capabilities: クライアントが要求した機能（未対応の機能は無視されます）
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self._register(websocket, frozenset(capabilities) & SUPPORTED_CAPABILITIES)
+        client = self._clients[websocket]
+        if client.binary:
+            client.enqueue({"type": "encoding", "format": "msgpack", "keys": list(KEY_DICTIONARY)})
         logger.info(f"WebSocket接続を確立しました: {websocket.client}")
 
     def disconnect(self, websocket: WebSocket) -> None:
@@ -235,17 +640,93 @@ class WebSocketManager:
         Args:
             websocket: WebSocket接続オブジェクト
         """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        if self._unregister(websocket):
             logger.info(f"WebSocket接続を解除しました: {websocket.client}")
 
+    def touch(self, websocket: WebSocket) -> None:
+        """クライアントからメッセージを受信したことを記録します。
+
+        Args:
+            websocket: WebSocket接続オブジェクト
+        """
+        client = self._clients.get(websocket)
+        if client is not None:
+            client.last_seen = time.monotonic()
+
+    def check_heartbeats(self, now: float | None = None) -> int:
+        """無通信の接続にpingを送信し、タイムアウトした接続を切断します。
+
+        Args:
+            now: 現在時刻（time.monotonic、省略時は現在の値）
+
+        Returns:
+            切断した接続数
+        """
+        if now is None:
+            now = time.monotonic()
+
+        reaped = 0
+        for client in list(self._clients.values()):
+            idle = now - client.last_seen
+            if idle >= self._heartbeat_timeout:
+                logger.warning(
+                    f"ハートビートがタイムアウトしたため接続を切断します: {client.websocket.client}"
+                )
+                # 1001: Going Away
+                self._unregister(client.websocket, code=1001)
+                reaped += 1
+            elif idle >= self._heartbeat_interval:
+                self._enqueue(client, {"type": "ping", "timestamp": int(time.time() * 1000)})
+
+        self._reaped += reaped
+        return reaped
+
+    async def start_heartbeat(self) -> None:
+        """ハートビートタスクを開始します（イベントループ上で呼び出し）。"""
+        if self._heartbeat_task is not None:
+            return
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat_loop())
+        logger.info(
+            f"WebSocketハートビートを開始しました "
+            f"(interval={self._heartbeat_interval}s, timeout={self._heartbeat_timeout}s)"
+        )
+
+    async def stop_heartbeat(self) -> None:
+        """ハートビートタスクを停止します。"""
+        if self._heartbeat_task is None:
+            return
+        self._heartbeat_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._heartbeat_task
+        self._heartbeat_task = None
+
+    async def _heartbeat_loop(self) -> None:
+        """一定間隔でハートビートを確認します。"""
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            self.check_heartbeats()
+
     async def send_personal(self, message: dict[str, Any], websocket: WebSocket) -> None:
         """特定のクライアントにメッセージを送信します。
 
+        登録済みの接続ではブロードキャストと同じ送信キューを経由するため、
+        送信順序が保たれます。
+        受信メッセージの処理中に送信する場合、そのメッセージのrequestIdが付与されます。
+
         Args:
             message: 送信するメッセージ（辞書形式）
             websocket: 送信先のWebSocket接続
         """
+        request_id = _current_request_id.get()
+        if request_id is not None and "requestId" not in message:
+            message = {**message, "requestId": request_id}
+
+        client = self._clients.get(websocket)
+        if client is not None:
+            self._enqueue(client, message)
+            await self._yield_to_writers()
+            return
+
         try:
             await websocket.send_json(message)
         except Exception as e:
@@ -253,22 +734,45 @@ class WebSocketManager:
             self.disconnect(websocket)
 
     async def broadcast(self, message: dict[str, Any]) -> None:
-        """全クライアントにメッセージをブロードキャストします。
+        """購読条件に一致するクライアントにメッセージをブロードキャストします。
+
+        メッセージには単調増加するシーケンス番号（seq）が付与され、リプレイログに記録されます。
+        送信先はトピック逆引きインデックスから求めるため、関心のない接続は走査されません。
+        メッセージは接続数に関わらず一度だけJSONテキストにエンコードされ、
+        各接続の送信キューには同じテキストが追加されます。
+        msgpack機能が有効な接続がある場合は、MessagePackへのエンコードも一度だけ行います。
+        送信キューに追加するのみで、送信完了は待ちません。
 
         Args:
             message: 送信するメッセージ（辞書形式）
         """
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"ブロードキャストでエラーが発生: {e}")
-                disconnected.append(connection)
+        seq = self._replay.current_seq + 1
+        message = {**message, "seq": seq}
+        try:
+            text = encode_json(message)
+        except (TypeError, ValueError) as e:
+            logger.error(f"ブロードキャストメッセージのエンコードに失敗: {e}")
+            return
+
+        key = _coalesce_key(message)
+        self._replay.append(ReplayEntry(seq=seq, message=message, text=text, key=key))
+
+        targets = self._subscriptions.match(message)
+        if not targets:
+            return
 
-        # 切断された接続を削除
-        for connection in disconnected:
-            self.disconnect(connection)
+        packed: bytes | None = None
+        for websocket in targets:
+            client = self._clients.get(websocket)
+            if client is None:
+                continue
+            if client.binary:
+                if packed is None:
+                    packed = encode_msgpack(message)
+                self._enqueue(client, packed, key)
+            else:
+                self._enqueue(client, text, key)
+        await self._yield_to_writers()
 
     async def broadcast_text(self, message: str) -> None:
         """全クライアントにテキストメッセージをブロードキャストします。
@@ -276,17 +780,143 @@ class WebSocketManager:
         Args:
             message: 送信するテキストメッセージ
         """
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"テキストブロードキャストでエラーが発生: {e}")
-                disconnected.append(connection)
+        for client in list(self._clients.values()):
+            self._enqueue(client, message)
+        await self._yield_to_writers()
+
+    @staticmethod
+    async def _yield_to_writers() -> None:
+        """イベントループに制御を一度戻し、ライタータスクに送信を開始させます。
+
+        送信完了は待たないため、遅いクライアントがあっても呼び出し元はブロックされません。
+        """
+        await asyncio.sleep(0)
+
+    def _enqueue(
+        self, client: _ClientConnection, message: OutboundMessage, key: CoalesceKey | None = None
+    ) -> None:
+        """接続の送信キューにメッセージを追加します。
+
+        DISCONNECTポリシーでキューが溢れた場合は接続を切断します。
+
+        Args:
+            client: クライアント接続
+            message: 送信メッセージ
+            key: 置き換えキー
+        """
+        if client.enqueue(message, key):
+            return
+
+        logger.warning(f"送信キューが溢れたため接続を切断します: {client.websocket.client}")
+        self._overflow_disconnects += 1
+        # 1013: Try Again Later
+        self._unregister(client.websocket, code=1013)
+
+    def resume(self, websocket: WebSocket, last_seq: int, epoch: str | None = None) -> int | None:
+        """切断中に配信されたメッセージを再送します。
+
+        リプレイログからlast_seqより後のメッセージのうち、購読条件に一致するものを
+        送信キューに追加します。
+
+        Args:
+            websocket: WebSocket接続オブジェクト
+            last_seq: クライアントが最後に受信したシーケンス番号
+            epoch: クライアントが受信したリプレイログの識別子
+
+        Returns:
+            再送したメッセージ数。欠落を埋められない場合（リプレイログにない・送信キューに
+            収まらない・識別子が異なる）はNone
+        """
+        client = self._clients.get(websocket)
+        if client is None:
+            return None
+
+        entries = self._replay.since(last_seq, epoch)
+        if entries is None:
+            return None
+
+        entries = [
+            entry for entry in entries if self._subscriptions.matches(websocket, entry.message)
+        ]
+        if len(entries) > self._queue_size:
+            return None
+
+        for entry in entries:
+            payload = encode_msgpack(entry.message) if client.binary else entry.text
+            self._enqueue(client, payload, entry.key)
+        return len(entries)
+
+    def subscribe(
+        self,
+        websocket: WebSocket,
+        teams: list[str] | None = None,
+        event_types: list[str] | None = None,
+        agents: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """接続の購読条件を追加します。
+
+        Args:
+            websocket: WebSocket接続オブジェクト
+            teams: 購読するチーム名
+            event_types: 購読するイベントタイプ
+            agents: 購読するエージェント名
+
+        Returns:
+            更新後の購読条件
+        """
+        subscription = self._subscriptions.subscribe(
+            websocket, teams=teams, event_types=event_types, agents=agents
+        )
+        return subscription.to_dict()
+
+    def unsubscribe(
+        self,
+        websocket: WebSocket,
+        teams: list[str] | None = None,
+        event_types: list[str] | None = None,
+        agents: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """接続の購読条件を削除します。
+
+        条件を指定しない場合は全ての購読条件を解除します（全てのメッセージを受信する状態）。
+
+        Args:
+            websocket: WebSocket接続オブジェクト
+            teams: 購読を解除するチーム名
+            event_types: 購読を解除するイベントタイプ
+            agents: 購読を解除するエージェント名
+
+        Returns:
+            更新後の購読条件
+        """
+        subscription = self._subscriptions.unsubscribe(
+            websocket, teams=teams, event_types=event_types, agents=agents
+        )
+        return subscription.to_dict()
+
+    def get_capabilities(self, websocket: WebSocket) -> list[str]:
+        """接続で有効な機能を取得します。
+
+        Args:
+            websocket: WebSocket接続オブジェクト
+
+        Returns:
+            有効な機能のリスト
+        """
+        client = self._clients.get(websocket)
+        return sorted(client.capabilities) if client is not None else []
 
-        # 切断された接続を削除
-        for connection in disconnected:
-            self.disconnect(connection)
+    def get_subscription(self, websocket: WebSocket) -> dict[str, Any] | None:
+        """接続の購読条件を取得します。
+
+        Args:
+            websocket: WebSocket接続オブジェクト
+
+        Returns:
+            購読条件（未登録の接続の場合はNone）
+        """
+        subscription = self._subscriptions.get_subscription(websocket)
+        return subscription.to_dict() if subscription is not None else None
 
     def get_connection_count(self) -> int:
         """現在の接続数を取得します。
@@ -294,7 +924,7 @@ class WebSocketManager:
         Returns:
             アクティブな接続数
         """
-        return len(self.active_connections)
+        return len(self._clients)
 
     def get_connections(self) -> list[WebSocket]:
         """全てのアクティブな接続を取得します。
@@ -302,43 +932,110 @@ class WebSocketManager:
         Returns:
             アクティブなWebSocket接続のリスト
         """
-        return self.active_connections.copy()
+        return list(self._clients)
+
+    def get_stats(self) -> dict[str, Any]:
+        """送信キューの統計情報を取得します。
+
+        Returns:
+            統計情報の辞書
+        """
+        clients = list(self._clients.values())
+        now = time.monotonic()
+        stale = sum(1 for client in clients if now - client.last_seen >= self._heartbeat_interval)
+        return {
+            "connections": len(clients),
+            "queueSize": self._queue_size,
+            "overflowPolicy": self._overflow_policy.value,
+            "encoder": json_encoder_name(),
+            "queued": sum(client.queue_size() for client in clients),
+            "maxQueued": max((client.queue_size() for client in clients), default=0),
+            "sent": sum(client.sent for client in clients),
+            "batches": sum(client.batches for client in clients),
+            "dropped": sum(client.dropped for client in clients),
+            "coalesced": sum(client.coalesced for client in clients),
+            "overflowDisconnects": self._overflow_disconnects,
+            "heartbeat": {
+                "interval": self._heartbeat_interval,
+                "timeout": self._heartbeat_timeout,
+                "live": len(clients) - stale,
+                "stale": stale,
+                "reaped": self._reaped,
+            },
+            "replay": self._replay.get_stats(),
+        }
 
     async def close_all(self) -> None:
         """全ての接続を閉じます。"""
-        for connection in self.active_connections:
+        clients = list(self._clients.values())
+        for client in clients:
+            self._unregister(client.websocket)
             with suppress(Exception):
-                await connection.close()
-        self.active_connections.clear()
+                await client.websocket.close()
         logger.info("全てのWebSocket接続を閉じました")
 
 
+def _peek_request_id(message: str) -> Any:
+    """未処理のメッセージからrequestIdを取り出します。
+
+    Args:
+        message: 受信したメッセージ（JSON文字列）
+
+    Returns:
+        requestId（取り出せない場合はNone）
+    """
+    try:
+        data = json.loads(message)
+    except json.JSONDecodeError:
+        return None
+    return data.get("requestId") if isinstance(data, dict) else None
+
+
 class WebSocketMessageHandler:
     """WebSocketメッセージハンドラクラス
 
     受信したメッセージを解析して適切な処理を実行します。
 
+    dispatchで受け付けたメッセージは接続ごとの受信キューに入り、
+    接続ごとに1つのワーカータスクが受信順に処理します。
+    受信ループは処理の完了を待たないため、クライアントは応答を待たずに
+    複数のリクエストを送信できます（応答にはリクエストのrequestIdが付与されます）。
+
     Attributes:
         _manager: WebSocketManagerインスタンス
+        _snapshot_provider: 再送できない場合に送るスナップショットの生成関数
+        _max_pending: 接続ごとの未処理メッセージ数の上限
+        _inbound: 接続ごとの受信キューとワーカータスク
+        _rejected: 受信キューが満杯で拒否したメッセージ数
     """
 
     def __init__(
         self,
         manager: WebSocketManager,
         channel_manager: ChannelManager | None = None,
+        snapshot_provider: Callable[[list[str] | None], dict[str, Any]] | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING_REQUESTS,
     ) -> None:
         """WebSocketMessageHandlerを初期化します。
 
         Args:
             manager: WebSocketManagerインスタンス
             channel_manager: ChannelManagerインスタンス（オプション）
+            snapshot_provider: スナップショットの生成関数（引数: 対象チーム名のリスト、Noneは全チーム）
+            max_pending: 接続ごとの未処理メッセージ数の上限
         """
         self._manager = manager
         self._channel_manager = channel_manager
+        self._snapshot_provider = snapshot_provider
+        self._max_pending = max_pending
+        self._inbound: dict[WebSocket, tuple[asyncio.Queue[str], asyncio.Task[None]]] = {}
+        self._rejected = 0
         self._handlers: dict[str, Any] = {
             "ping": self._handle_ping,
+            "pong": self._handle_pong,
             "subscribe": self._handle_subscribe,
             "unsubscribe": self._handle_unsubscribe,
+            "resume": self._handle_resume,
             "get_status": self._handle_get_status,
             "channel_message": self._handle_channel_message,
             "join_channel": self._handle_join_channel,
@@ -346,15 +1043,96 @@ class WebSocketMessageHandler:
             "list_channels": self._handle_list_channels,
         }
 
+    async def dispatch(self, message: str, websocket: WebSocket) -> None:
+        """受信したメッセージを接続の受信キューに追加します（処理の完了は待ちません）。
+
+        受信キューが満杯の場合は、そのメッセージを処理せずにエラーを返します。
+
+        Args:
+            message: 受信したメッセージ（JSON文字列）
+            websocket: 送信元のWebSocket接続
+        """
+        self._manager.touch(websocket)
+        inbound = self._inbound.get(websocket)
+        if inbound is None:
+            queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self._max_pending)
+            task = asyncio.get_running_loop().create_task(self._process_inbound(queue, websocket))
+            inbound = self._inbound[websocket] = (queue, task)
+
+        try:
+            inbound[0].put_nowait(message)
+        except asyncio.QueueFull:
+            self._rejected += 1
+            logger.warning("受信キューが満杯のため、メッセージを拒否しました")
+            token = _current_request_id.set(_peek_request_id(message))
+            try:
+                await self._manager.send_personal(
+                    {"type": "error", "message": "Too many pending requests"}, websocket
+                )
+            finally:
+                _current_request_id.reset(token)
+
+    def release(self, websocket: WebSocket) -> None:
+        """接続の受信キューを破棄し、ワーカータスクを停止します（切断時に呼び出し）。
+
+        Args:
+            websocket: WebSocket接続
+        """
+        inbound = self._inbound.pop(websocket, None)
+        if inbound is not None:
+            inbound[1].cancel()
+
+    def pending_count(self, websocket: WebSocket) -> int:
+        """接続の未処理メッセージ数を取得します。
+
+        Args:
+            websocket: WebSocket接続
+
+        Returns:
+            受信キュー内のメッセージ数
+        """
+        inbound = self._inbound.get(websocket)
+        return inbound[0].qsize() if inbound is not None else 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """受信キューの統計情報を取得します。
+
+        Returns:
+            統計情報の辞書
+        """
+        return {
+            "maxPending": self._max_pending,
+            "pending": sum(queue.qsize() for queue, _ in self._inbound.values()),
+            "rejected": self._rejected,
+        }
+
+    async def _process_inbound(self, queue: asyncio.Queue[str], websocket: WebSocket) -> None:
+        """受信キューのメッセージを受信順に処理します（接続ごとのワーカータスク）。
+
+        Args:
+            queue: 受信キュー
+            websocket: WebSocket接続
+        """
+        while True:
+            message = await queue.get()
+            await self.handle_message(message, websocket)
+
     async def handle_message(self, message: str, websocket: WebSocket) -> None:
         """受信したメッセージを処理します。
 
+        メッセージにrequestIdが含まれる場合、処理中に送信する応答には同じrequestIdが付与されます。
+
         Args:
             message: 受信したメッセージ（JSON文字列）
             websocket: 送信元のWebSocket接続
         """
+        self._manager.touch(websocket)
+        token = None
         try:
             data = json.loads(message)
+            if not isinstance(data, dict):
+                raise ValueError("Message must be a JSON object")
+            token = _current_request_id.set(data.get("requestId"))
             message_type = data.get("type")
 
             if message_type in self._handlers:
@@ -371,6 +1149,34 @@ class WebSocketMessageHandler:
         except Exception as e:
             logger.error(f"メッセージ処理でエラーが発生: {e}")
             await self._manager.send_personal({"type": "error", "message": str(e)}, websocket)
+        finally:
+            if token is not None:
+                _current_request_id.reset(token)
+
+    def register_handler(
+        self, message_type: str, handler: Callable[..., Any], blocking: bool = False
+    ) -> None:
+        """メッセージタイプのハンドラを登録します。
+
+        blocking=Trueの場合、handlerは (data) -> 応答メッセージ | None の同期関数として扱われ、
+        イベントループを止めないようにスレッドプールで実行されます。
+        戻り値がNoneでなければ、送信元の接続に応答として送信されます。
+
+        Args:
+            message_type: メッセージタイプ
+            handler: ハンドラ関数（blocking=Falseの場合は (data, websocket) を受け取るコルーチン関数）
+            blocking: ディスク読み込みなどの重い同期処理を行うハンドラかどうか
+        """
+        if not blocking:
+            self._handlers[message_type] = handler
+            return
+
+        async def run_in_thread(data: dict[str, Any], websocket: WebSocket) -> None:
+            response = await asyncio.to_thread(handler, data)
+            if response is not None:
+                await self._manager.send_personal(response, websocket)
+
+        self._handlers[message_type] = run_in_thread
 
     async def _handle_ping(self, data: dict[str, Any], websocket: WebSocket) -> None:
         """pingメッセージを処理します。
@@ -383,28 +1189,150 @@ class WebSocketMessageHandler:
             {"type": "pong", "timestamp": data.get("timestamp")}, websocket
         )
 
+    async def _handle_pong(self, data: dict[str, Any], websocket: WebSocket) -> None:
+        """サーバーが送信したpingへの応答を処理します。
+
+        受信時刻はhandle_messageで記録済みのため、ここでは何もしません。
+
+        Args:
+            data: メッセージデータ
+            websocket: WebSocket接続
+        """
+
     async def _handle_subscribe(self, data: dict[str, Any], websocket: WebSocket) -> None:
         """subscribeメッセージを処理します。
 
+        teams, eventTypes, agentsで指定した条件を接続の購読条件に追加します。
+        購読条件を指定した次元では、一致するメッセージのみが配信されます。
+
         Args:
             data: メッセージデータ
             websocket: WebSocket接続
         """
-        # 将来的にサブスクリプション管理を追加
+        try:
+            subscription = self._manager.subscribe(
+                websocket,
+                teams=data.get("teams"),
+                event_types=data.get("eventTypes"),
+                agents=data.get("agents"),
+            )
+        except (TypeError, ValueError) as e:
+            await self._manager.send_personal(
+                {"type": "error", "message": f"Invalid subscription: {e}"}, websocket
+            )
+            return
+
         await self._manager.send_personal(
-            {"type": "subscribed", "channels": data.get("channels", [])}, websocket
+            {
+                "type": "subscribed",
+                "channels": data.get("channels", []),
+                "subscription": subscription,
+            },
+            websocket,
         )
 
     async def _handle_unsubscribe(self, data: dict[str, Any], websocket: WebSocket) -> None:
         """unsubscribeメッセージを処理します。
 
+        teams, eventTypes, agentsで指定した条件を接続の購読条件から削除します。
+        条件を指定しない場合は全ての購読条件を解除します。
+
         Args:
             data: メッセージデータ
             websocket: WebSocket接続
         """
-        # 将来的にサブスクリプション管理を追加
+        try:
+            subscription = self._manager.unsubscribe(
+                websocket,
+                teams=data.get("teams"),
+                event_types=data.get("eventTypes"),
+                agents=data.get("agents"),
+            )
+        except (TypeError, ValueError) as e:
+            await self._manager.send_personal(
+                {"type": "error", "message": f"Invalid subscription: {e}"}, websocket
+            )
+            return
+
+        await self._manager.send_personal(
+            {
+                "type": "unsubscribed",
+                "channels": data.get("channels", []),
+                "subscription": subscription,
+            },
+            websocket,
+        )
+
+    async def _handle_resume(self, data: dict[str, Any], websocket: WebSocket) -> None:
+        """resumeメッセージを処理します。
+
+        lastSeqより後のメッセージをリプレイログから再送し、resumedメッセージを送信します。
+        リプレイログで欠落を埋められない場合はスナップショットを送信します。
+
+        Args:
+            data: メッセージデータ（lastSeq, epoch）
+            websocket: WebSocket接続
+        """
+        last_seq = data.get("lastSeq")
+        if not isinstance(last_seq, int) or isinstance(last_seq, bool):
+            await self._manager.send_personal(
+                {"type": "error", "message": "lastSeq must be an integer"}, websocket
+            )
+            return
+
+        await self.resume(websocket, last_seq, data.get("epoch"))
+
+    async def resume(self, websocket: WebSocket, last_seq: int, epoch: str | None = None) -> None:
+        """切断中のメッセージを再送し、再送できない場合はスナップショットを送信します。
+
+        接続直後（他のメッセージが送信キューに入る前）に呼び出すと、
+        再送したメッセージとその後のブロードキャストの順序が保たれます。
+
+        Args:
+            websocket: WebSocket接続
+            last_seq: クライアントが最後に受信したシーケンス番号
+            epoch: クライアントが受信したリプレイログの識別子
+        """
+        replayed = self._manager.resume(websocket, last_seq, epoch)
+        if replayed is not None:
+            await self._manager.send_personal(
+                {
+                    "type": "resumed",
+                    "lastSeq": last_seq,
+                    "seq": self._manager.current_seq,
+                    "epoch": self._manager.epoch,
+                    "replayed": replayed,
+                },
+                websocket,
+            )
+            return
+
+        await self._send_snapshot(websocket)
+
+    async def _send_snapshot(self, websocket: WebSocket) -> None:
+        """現在の状態のスナップショットを送信します。
+
+        スナップショットの生成関数が設定されていない場合はresync_requiredを送信し、
+        クライアントにREST APIでの再取得を促します。
+
+        Args:
+            websocket: WebSocket接続
+        """
+        # スナップショット生成前にシーケンス番号を取得し、以降のメッセージとの境界とする
+        seq = self._manager.current_seq
+        if self._snapshot_provider is None:
+            await self._manager.send_personal(
+                {"type": "resync_required", "seq": seq, "epoch": self._manager.epoch},
+                websocket,
+            )
+            return
+
+        subscription = self._manager.get_subscription(websocket)
+        teams = subscription["teams"] if subscription and subscription["teams"] else None
+        snapshot = self._snapshot_provider(teams)
         await self._manager.send_personal(
-            {"type": "unsubscribed", "channels": data.get("channels", [])}, websocket
+            {"type": "snapshot", "seq": seq, "epoch": self._manager.epoch, **snapshot},
+            websocket,
         )
 
     async def _handle_get_status(self, _data: dict[str, Any], websocket: WebSocket) -> None:
@@ -615,11 +1543,13 @@ class WebSocketMessageHandler:
         for name in channel_names:
             ch = self._channel_manager.get_channel(name)
             if ch:
-                channel_info.append({
-                    "name": ch.channel_name,
-                    "participants": list(ch.get_participants()),
-                    "message_count": len(ch.get_messages()),
-                })
+                channel_info.append(
+                    {
+                        "name": ch.channel_name,
+                        "participants": list(ch.get_participants()),
+                        "message_count": len(ch.get_messages()),
+                    }
+                )
 
         await self._manager.send_personal(
             {
@@ -0,0 +1,318 @@
+"""プロセス間イベント配信モジュール
+
+このモジュールでは、1つのingestプロセスが監視したイベントを
+複数のWebワーカープロセスへUnixドメインソケットで配信するクラスを提供します。
+
+- IpcEventPublisher: ingestプロセス側。EventBusのハンドラーとして登録し、
+  接続中の全ワーカーへイベントを改行区切りのJSONで送信します。
+- IpcEventSubscriber: Webワーカー側。ソケットから受信したイベントをコールバックに渡します
+  （切断された場合は自動的に再接続し、接続のたびにon_connectで状態を取り直します）。
+
+イベントバックエンドはORCHESTRATOR_EVENT_BACKENDで選択します。
+- inprocess（デフォルト）: 各プロセスが自分で監視し、プロセス内のEventBusで配信
+- ipc: 監視はingestプロセス（python -m orchestrator.web.ingest）が行い、
+  Webワーカーはソケット経由で受信したイベントを配信
+  （ヘルスモニターもingestプロセスで動作するため、ワーカーのヘルスAPIは使用できません）
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+from orchestrator.web.encoding import encode_json
+
+logger = logging.getLogger(__name__)
+
+# イベントバックエンド
+EVENT_BACKEND_INPROCESS = "inprocess"
+EVENT_BACKEND_IPC = "ipc"
+EVENT_BACKENDS = (EVENT_BACKEND_INPROCESS, EVENT_BACKEND_IPC)
+
+# デフォルトのソケットパス
+DEFAULT_SOCKET_PATH = Path(tempfile.gettempdir()) / "orchestrator-cc-events.sock"
+
+# 1イベントの最大サイズ（バイト）
+_MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+def event_backend_from_env() -> str:
+    """環境変数ORCHESTRATOR_EVENT_BACKENDからイベントバックエンドを取得します。
+
+    Returns:
+        イベントバックエンド（inprocess または ipc）
+
+    Raises:
+        ValueError: 未知のバックエンドが指定された場合
+    """
+    backend = os.environ.get("ORCHESTRATOR_EVENT_BACKEND", EVENT_BACKEND_INPROCESS).strip().lower()
+    if backend not in EVENT_BACKENDS:
+        raise ValueError(f"Unknown event backend: {backend} (expected one of {EVENT_BACKENDS})")
+    return backend
+
+
+def event_socket_from_env() -> Path:
+    """環境変数ORCHESTRATOR_EVENT_SOCKETからソケットパスを取得します。
+
+    Returns:
+        ソケットパス（未設定の場合はDEFAULT_SOCKET_PATH）
+    """
+    value = os.environ.get("ORCHESTRATOR_EVENT_SOCKET")
+    return Path(value).expanduser() if value else DEFAULT_SOCKET_PATH
+
+
+class IpcEventPublisher:
+    """ingestプロセス側のイベント配信サーバー
+
+    イベントは一度だけエンコードされ、全ワーカーに同じバイト列が書き込まれます。
+    書き込みは送信完了を待たないため、遅いワーカーがingestプロセスを止めることはありません。
+    送信バッファがmax_buffer_bytesを超えたワーカーは切断されます
+    （切断中のイベントは失われるため、ワーカーは再接続時にディスクから状態を読み直します）。
+
+    Attributes:
+        _path: ソケットパス
+        _max_buffer_bytes: ワーカーごとの送信バッファの上限
+        _server: ソケットサーバー
+        _subscribers: 接続中のワーカー
+        _published: 配信したイベント数
+        _disconnected: 送信バッファ溢れで切断したワーカー数
+    """
+
+    def __init__(
+        self, path: str | Path = DEFAULT_SOCKET_PATH, max_buffer_bytes: int = 4 * 1024 * 1024
+    ) -> None:
+        """IpcEventPublisherを初期化します。
+
+        Args:
+            path: ソケットパス
+            max_buffer_bytes: ワーカーごとの送信バッファの上限（バイト）
+        """
+        self._path = Path(path)
+        self._max_buffer_bytes = max_buffer_bytes
+        self._server: asyncio.AbstractServer | None = None
+        self._subscribers: set[asyncio.StreamWriter] = set()
+        self._published = 0
+        self._disconnected = 0
+
+    async def start(self) -> None:
+        """ソケットサーバーを開始します。
+
+        前回の実行で残ったソケットファイルは削除されます。
+        """
+        if self._server is not None:
+            return
+        with suppress(FileNotFoundError):
+            self._path.unlink()
+        self._server = await asyncio.start_unix_server(self._on_connect, path=str(self._path))
+        logger.info(f"IPC event publisher listening on {self._path}")
+
+    async def stop(self) -> None:
+        """ソケットサーバーを停止し、全ワーカーとの接続を閉じます。"""
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in list(self._subscribers):
+            writer.close()
+        self._subscribers.clear()
+        await self._server.wait_closed()
+        self._server = None
+        with suppress(FileNotFoundError):
+            self._path.unlink()
+        logger.info("IPC event publisher stopped")
+
+    async def publish(self, event: dict[str, Any]) -> None:
+        """イベントを全ワーカーに送信します（EventBusのハンドラーとして使用）。
+
+        Args:
+            event: イベントデータ
+        """
+        if not self._subscribers:
+            return
+        line = (encode_json(event) + "\n").encode("utf-8")
+        for writer in list(self._subscribers):
+            if writer.is_closing():
+                self._subscribers.discard(writer)
+                continue
+            if writer.transport.get_write_buffer_size() > self._max_buffer_bytes:
+                logger.warning("IPC subscriber is too slow, disconnecting")
+                self._subscribers.discard(writer)
+                self._disconnected += 1
+                writer.close()
+                continue
+            writer.write(line)
+        self._published += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """統計情報を取得します。
+
+        Returns:
+            統計情報の辞書
+        """
+        return {
+            "backend": EVENT_BACKEND_IPC,
+            "role": "publisher",
+            "path": str(self._path),
+            "subscribers": len(self._subscribers),
+            "published": self._published,
+            "disconnected": self._disconnected,
+        }
+
+    async def _on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ワーカーの接続を処理します。
+
+        Args:
+            reader: 受信ストリーム（ワーカーの切断検知のみに使用）
+            writer: 送信ストリーム
+        """
+        self._subscribers.add(writer)
+        logger.info(f"IPC subscriber connected ({len(self._subscribers)} total)")
+        try:
+            # ワーカーからは何も送信されないため、切断まで待つ
+            await reader.read()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._subscribers.discard(writer)
+            writer.close()
+            logger.info(f"IPC subscriber disconnected ({len(self._subscribers)} total)")
+
+
+class IpcEventSubscriber:
+    """Webワーカー側のイベント受信クライアント
+
+    Attributes:
+        _path: ソケットパス
+        _on_event: 受信したイベントを渡すコールバック
+        _on_connect: 接続のたびに受信開始前に呼び出すコールバック
+        _reconnect_delay: 再接続までの待機時間（秒）
+        _task: 受信タスク
+        _connected: 接続中かどうか
+        _received: 受信したイベント数
+        _reconnects: 再接続を試みた回数
+        _connections: 接続に成功した回数
+    """
+
+    def __init__(
+        self,
+        on_event: Callable[[dict[str, Any]], None],
+        path: str | Path = DEFAULT_SOCKET_PATH,
+        reconnect_delay: float = 1.0,
+        on_connect: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        """IpcEventSubscriberを初期化します。
+
+        Args:
+            on_event: 受信したイベントを渡すコールバック（イベントループ上で呼び出されます）
+            path: ソケットパス
+            reconnect_delay: 再接続までの待機時間（秒）
+            on_connect: 接続のたびに受信開始前に呼び出すコールバック。
+                未接続・切断中に配信されたイベントは届かないため、状態の読み直しに使用します
+        """
+        self._path = Path(path)
+        self._on_event = on_event
+        self._on_connect = on_connect
+        self._reconnect_delay = reconnect_delay
+        self._task: asyncio.Task[None] | None = None
+        self._connected = False
+        self._received = 0
+        self._reconnects = 0
+        self._connections = 0
+
+    async def start(self) -> None:
+        """受信タスクを開始します（イベントループ上で呼び出し）。"""
+        if self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        logger.info(f"IPC event subscriber started: {self._path}")
+
+    async def stop(self) -> None:
+        """受信タスクを停止します。"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        logger.info("IPC event subscriber stopped")
+
+    def is_connected(self) -> bool:
+        """ingestプロセスに接続中かどうかを返します。
+
+        Returns:
+            接続中ならTrue
+        """
+        return self._connected
+
+    def get_stats(self) -> dict[str, Any]:
+        """統計情報を取得します。
+
+        Returns:
+            統計情報の辞書
+        """
+        return {
+            "backend": EVENT_BACKEND_IPC,
+            "role": "subscriber",
+            "path": str(self._path),
+            "connected": self._connected,
+            "received": self._received,
+            "reconnects": self._reconnects,
+            "connections": self._connections,
+        }
+
+    async def _run(self) -> None:
+        """接続と受信を繰り返します（切断された場合は再接続）。"""
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    str(self._path), limit=_MAX_LINE_BYTES
+                )
+            except OSError as e:
+                logger.debug(f"IPC publisher is not available ({e}), retrying")
+            else:
+                self._connected = True
+                self._connections += 1
+                logger.info(f"Connected to IPC publisher: {self._path}")
+                try:
+                    await self._notify_connected()
+                    await self._read(reader)
+                except (ConnectionError, OSError, ValueError) as e:
+                    logger.warning(f"IPC connection error: {e}")
+                finally:
+                    self._connected = False
+                    writer.close()
+                logger.warning("Disconnected from IPC publisher, reconnecting")
+
+            self._reconnects += 1
+            await asyncio.sleep(self._reconnect_delay)
+
+    async def _notify_connected(self) -> None:
+        """接続したことをon_connectコールバックに通知します。"""
+        if self._on_connect is None:
+            return
+        try:
+            await self._on_connect()
+        except Exception as e:
+            logger.error(f"IPC connect handler error: {e}")
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        """切断されるまでイベントを受信します。
+
+        Args:
+            reader: 受信ストリーム
+        """
+        while line := await reader.readline():
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid IPC event: {e}")
+                continue
+            self._received += 1
+            try:
+                self._on_event(event)
+            except Exception as e:
+                logger.error(f"IPC event handler error: {e}")
@@ -0,0 +1,122 @@
+"""ブロードキャストのリプレイログモジュール
+
+このモジュールでは、ブロードキャストしたメッセージにシーケンス番号を付与し、
+直近のメッセージを保持するReplayLogクラスを提供します。
+
+再接続したクライアントは最後に受信したシーケンス番号を送ることで、
+切断中に配信されたメッセージだけを受け取れます。
+"""
+
+import secrets
+from dataclasses import dataclass
+from typing import Any
+
+from orchestrator.web.retention import RetentionPolicy, RingBuffer
+
+# デフォルトの保持ポリシー（直近1024件・最大8MiB）
+DEFAULT_REPLAY_POLICY = RetentionPolicy(max_entries=1024, max_bytes=8 * 1024 * 1024)
+
+
+@dataclass(frozen=True)
+class ReplayEntry:
+    """リプレイログのエントリ
+
+    Attributes:
+        seq: シーケンス番号
+        message: シーケンス番号付きのメッセージ（購読条件の判定に使用）
+        text: エンコード済みのメッセージ
+        key: 送信キューでの置き換えキー
+    """
+
+    seq: int
+    message: dict[str, Any]
+    text: str
+    key: Any = None
+
+
+class ReplayLog:
+    """シーケンス番号付きのリプレイログ
+
+    シーケンス番号は1から始まり、ブロードキャストごとに1ずつ増加します。
+    保持するエントリは連続しているため、再送範囲は位置の計算だけで求められます。
+
+    Attributes:
+        epoch: ログの識別子（サーバー再起動後のシーケンス番号の取り違えを防ぐ）
+        _entries: 保持中のエントリ
+        _seq: 最後に発行したシーケンス番号
+    """
+
+    def __init__(self, policy: RetentionPolicy | None = None) -> None:
+        """ReplayLogを初期化します。
+
+        Args:
+            policy: 保持ポリシー（指定しない場合は直近1024件・最大8MiB）
+        """
+        self.epoch = secrets.token_hex(8)
+        self._entries: RingBuffer[ReplayEntry] = RingBuffer(
+            policy or DEFAULT_REPLAY_POLICY, size_of=lambda entry: len(entry.text)
+        )
+        self._seq = 0
+
+    @property
+    def current_seq(self) -> int:
+        """最後に発行したシーケンス番号を返します。"""
+        return self._seq
+
+    @property
+    def oldest_seq(self) -> int:
+        """保持している最も古いシーケンス番号を返します（空の場合は次の番号）。"""
+        return self._entries[0].seq if self._entries else self._seq + 1
+
+    def append(self, entry: ReplayEntry) -> None:
+        """エントリを追加します。
+
+        Args:
+            entry: current_seq + 1 のシーケンス番号を持つエントリ
+
+        Raises:
+            ValueError: シーケンス番号が連続していない場合
+        """
+        if entry.seq != self._seq + 1:
+            raise ValueError(
+                f"Non-contiguous sequence number: {entry.seq} (expected {self._seq + 1})"
+            )
+        self._seq = entry.seq
+        self._entries.append(entry)
+
+    def since(self, last_seq: int, epoch: str | None = None) -> list[ReplayEntry] | None:
+        """指定したシーケンス番号より後のエントリを返します。
+
+        Args:
+            last_seq: クライアントが最後に受信したシーケンス番号
+            epoch: クライアントが受信したログの識別子
+
+        Returns:
+            エントリのリスト。欠落を埋められない場合（古すぎる・識別子が異なる）はNone
+        """
+        if epoch is not None and epoch != self.epoch:
+            return None
+        if last_seq < 0 or last_seq > self._seq:
+            return None
+        if last_seq == self._seq:
+            return []
+
+        oldest = self.oldest_seq
+        if last_seq + 1 < oldest:
+            return None
+        return self._entries[last_seq + 1 - oldest :]
+
+    def get_stats(self) -> dict[str, Any]:
+        """統計情報を取得します。
+
+        Returns:
+            統計情報の辞書
+        """
+        return {
+            "epoch": self.epoch,
+            "seq": self._seq,
+            "oldestSeq": self.oldest_seq,
+            "entries": len(self._entries),
+            "bytes": self._entries.total_bytes,
+            "evicted": self._entries.evicted,
+        }
@@ -0,0 +1,168 @@
+"""応答キャッシュモジュール
+
+このモジュールでは、チームAPIのシリアライズ済みJSON応答をキャッシュし、
+ETag/If-None-Matchによる条件付きGETを処理するためのクラスを提供します。
+
+キャッシュのキーは（エンドポイント, チーム名, バージョン番号, クエリ）です。
+バージョン番号はコレクションの内容が変わるたびに新しくなるため、
+明示的な無効化は不要で、古いエントリはLRUで押し出されます。
+
+ETagは応答本文のハッシュのため、複数のワーカープロセスで同じ内容であれば同じ値になります。
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from orchestrator.web.encoding import encode_json
+
+# キャッシュのキー（エンドポイント, チーム名, バージョン番号, クエリ）
+CacheKey = tuple[str, str | None, int, Hashable]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """シリアライズ済みの応答
+
+    Attributes:
+        body: UTF-8のJSON本文
+        etag: 本文のハッシュから作成したETag（引用符付き）
+    """
+
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    """応答本文からETagを作成します。
+
+    Args:
+        body: 応答本文
+
+    Returns:
+        引用符付きの強いETag
+    """
+    return f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-MatchヘッダーがETagに一致するかどうかを判定します。
+
+    弱い比較（W/接頭辞を無視）を行い、"*" は常に一致とみなします。
+
+    Args:
+        if_none_match: If-None-Matchヘッダーの値
+        etag: 応答のETag
+
+    Returns:
+        一致する場合True（304を返せる）
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """シリアライズ済みJSON応答のLRUキャッシュ
+
+    スレッドプールで実行されるエンドポイントからも呼び出せるよう、ロックで保護します。
+
+    Attributes:
+        _max_entries: 保持する最大エントリ数
+        _max_bytes: 保持する本文の最大合計バイト数
+        _entries: キー -> 応答（最近使用した順）
+        _total_bytes: 保持中の本文の合計バイト数
+        _hits: キャッシュヒット数
+        _misses: キャッシュミス数
+        _not_modified: 304を返した回数
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """ResponseCacheを初期化します。
+
+        Args:
+            max_entries: 保持する最大エントリ数
+            max_bytes: 保持する本文の最大合計バイト数
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: CacheKey, build: Callable[[], Any]) -> CachedResponse:
+        """キャッシュ済みの応答を返します（ない場合は作成してキャッシュします）。
+
+        バージョン番号が0のキー（まだ存在しないコレクション）はキャッシュしません。
+
+        Args:
+            key: キャッシュのキー
+            build: 応答の辞書を作成する関数（キャッシュミス時のみ呼び出されます）
+
+        Returns:
+            シリアライズ済みの応答
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        # 作成とシリアライズはロックの外で行う（同じキーを同時に作成しても結果は同じ）
+        body = encode_json(build()).encode("utf-8")
+        cached = CachedResponse(body=body, etag=make_etag(body))
+        if key[2] == 0:
+            return cached
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous.body)
+            self._entries[key] = cached
+            self._total_bytes += len(body)
+            while len(self._entries) > 1 and (
+                len(self._entries) > self._max_entries or self._total_bytes > self._max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted.body)
+        return cached
+
+    def record_not_modified(self) -> None:
+        """304を返したことを記録します。"""
+        with self._lock:
+            self._not_modified += 1
+
+    def clear(self) -> None:
+        """全エントリを破棄します。"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """統計情報を取得します。
+
+        Returns:
+            統計情報の辞書
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "notModified": self._not_modified,
+            }
@@ -0,0 +1,169 @@
+"""保持ポリシーモジュール
+
+このモジュールでは、メッセージや思考ログなどのメモリ上の履歴を
+一定量に抑えるための保持ポリシーとリングバッファを提供します。
+
+保持期間を過ぎた古いエントリはメモリから破棄され、
+必要に応じてディスク（inboxファイルやJSONLファイル）から読み直します。
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Generic, TypeVar, overload
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """チームごとの保持ポリシー
+
+    いずれかの上限を超えた時点で、古いエントリから破棄します。
+    Noneの上限は無効です。
+
+    Attributes:
+        max_entries: 保持する最大エントリ数
+        max_bytes: 保持する最大バイト数（エントリサイズの見積もりの合計）
+        max_age: 保持する最大経過時間（秒、取り込み時刻基準）
+    """
+
+    max_entries: int | None = 10000
+    max_bytes: int | None = None
+    max_age: float | None = None
+
+
+class RingBuffer(Generic[T]):
+    """保持ポリシー付きのリングバッファ
+
+    追加順にエントリを保持し、保持ポリシーを超えた分を先頭から破棄します。
+
+    Attributes:
+        _policy: 保持ポリシー
+        _size_of: エントリサイズの見積もり関数
+        _clock: 取り込み時刻の取得関数
+        _items: （取り込み時刻, サイズ, エントリ）のキュー
+        _total_bytes: 保持中のエントリサイズの合計
+        _evicted: 破棄したエントリ数
+    """
+
+    def __init__(
+        self,
+        policy: RetentionPolicy | None = None,
+        size_of: Callable[[T], int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """RingBufferを初期化します。
+
+        Args:
+            policy: 保持ポリシー（指定しない場合はデフォルト）
+            size_of: エントリサイズの見積もり関数（max_bytes使用時に必要）
+            clock: 取り込み時刻の取得関数
+        """
+        self._policy = policy or RetentionPolicy()
+        self._size_of = size_of
+        self._clock = clock
+        self._items: deque[tuple[float, int, T]] = deque()
+        self._total_bytes = 0
+        self._evicted = 0
+
+    @property
+    def policy(self) -> RetentionPolicy:
+        """保持ポリシーを返します。"""
+        return self._policy
+
+    @property
+    def evicted(self) -> int:
+        """これまでに破棄したエントリ数を返します。"""
+        return self._evicted
+
+    @property
+    def total_bytes(self) -> int:
+        """保持中のエントリサイズの合計を返します。"""
+        return self._total_bytes
+
+    def append(self, item: T) -> None:
+        """エントリを追加します。
+
+        Args:
+            item: 追加するエントリ
+        """
+        size = self._size_of(item) if self._size_of else 0
+        self._items.append((self._clock(), size, item))
+        self._total_bytes += size
+        self._enforce()
+
+    def extend(self, items: Iterable[T]) -> None:
+        """複数のエントリを追加します。
+
+        Args:
+            items: 追加するエントリ
+        """
+        for item in items:
+            self.append(item)
+
+    def set_policy(self, policy: RetentionPolicy) -> None:
+        """保持ポリシーを変更し、即座に適用します。
+
+        Args:
+            policy: 新しい保持ポリシー
+        """
+        self._policy = policy
+        self._enforce()
+
+    def expire(self) -> None:
+        """保持期間を過ぎたエントリを破棄します。"""
+        if self._policy.max_age is None:
+            return
+
+        deadline = self._clock() - self._policy.max_age
+        while self._items and self._items[0][0] < deadline:
+            self._pop_oldest()
+
+    def clear(self) -> None:
+        """全エントリを破棄します（破棄数には含めません）。"""
+        self._items.clear()
+        self._total_bytes = 0
+
+    def __iter__(self) -> Iterator[T]:
+        self.expire()
+        return (item for _, _, item in self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [item for _, _, item in list(self._items)[index]]
+        return self._items[index][2]
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def _enforce(self) -> None:
+        """保持ポリシーを適用します。"""
+        max_entries = self._policy.max_entries
+        if max_entries is not None:
+            while len(self._items) > max_entries:
+                self._pop_oldest()
+
+        max_bytes = self._policy.max_bytes
+        if max_bytes is not None:
+            # 最新の1件は上限を超えていても保持する
+            while len(self._items) > 1 and self._total_bytes > max_bytes:
+                self._pop_oldest()
+
+        self.expire()
+
+    def _pop_oldest(self) -> None:
+        """最も古いエントリを破棄します。"""
+        _, size, _ = self._items.popleft()
+        self._total_bytes -= size
+        self._evicted += 1
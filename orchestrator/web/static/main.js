@@ -147,7 +147,8 @@ class DashboardClient {
         this.on('team_updated', handleTeamUpdatedMessage);
         this.on('team_message', handleTeamMessage);
         this.on('thinking_log', handleThinkingLogMessage);
-        this.on('tasks_updated', handleTasksUpdatedMessage);
+        this.on('task_upserted', handleTaskUpsertedMessage);
+        this.on('task_deleted', handleTaskDeletedMessage);
     }
 
     on(type, callback) {
@@ -523,14 +524,39 @@ function handleThinkingLogMessage(message) {
     addThinkingLogToDom(log);
 }
 
-function handleTasksUpdatedMessage(message) {
-    const { teamName, tasks } = message;
-    addSystemLog('info', `タスクが更新されました: ${teamName} (${tasks.length}件)`);
+function handleTaskUpsertedMessage(message) {
+    const { teamName, task } = message;
+    addSystemLog('info', `タスクが更新されました: ${teamName} #${task.taskId}`);
+
+    if (state.selectedTeam === teamName) {
+        const tasks = state.teamTasks.filter(t => t.taskId !== task.taskId);
+        tasks.push(task);
+        applyTeamTasks(teamName, tasks);
+    }
 
     // 要約カードを更新
     updateSummaryCards();
 }
 
+function handleTaskDeletedMessage(message) {
+    const { teamName, taskId } = message;
+    addSystemLog('info', `タスクが削除されました: ${teamName} #${taskId}`);
+
+    if (state.selectedTeam === teamName) {
+        applyTeamTasks(teamName, state.teamTasks.filter(t => t.taskId !== taskId));
+    }
+
+    // 要約カードを更新
+    updateSummaryCards();
+}
+
+function applyTeamTasks(teamName, tasks) {
+    state.teamTasks = tasks;
+    renderTaskBoard(tasks);
+    renderTimeline(teamName, tasks, state.teamMessages);
+    updateTaskStats(tasks);
+}
+
 // ============================================================================
 // チーム監視UI
 // ============================================================================
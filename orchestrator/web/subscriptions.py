@@ -0,0 +1,355 @@
+"""WebSocketサブスクリプション管理モジュール
+
+このモジュールでは、WebSocket接続ごとの購読条件（チーム・イベントタイプ・エージェント）と、
+トピックから接続への逆引きインデックスを管理するSubscriptionIndexクラスを提供します。
+
+各次元の購読条件が空の接続はその次元について全てのメッセージを受信します（ワイルドカード）。
+購読を一度も行っていない接続は全てのメッセージを受信するため、従来の動作と互換性があります。
+"""
+
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+# 購読条件の次元
+DIMENSIONS = ("teams", "event_types", "agents")
+
+# 接続の型（WebSocketなど）
+ConnectionT = TypeVar("ConnectionT", bound=Hashable)
+
+
+def message_topics(message: dict[str, Any]) -> dict[str, set[str]]:
+    """ブロードキャストメッセージのトピックを抽出します。
+
+    値が得られない次元は含まれません（その次元では全ての接続が対象になります）。
+
+    Args:
+        message: ブロードキャストメッセージ
+
+    Returns:
+        次元名 -> トピック値の集合 の辞書
+    """
+    topics: dict[str, set[str]] = {}
+
+    message_type = message.get("type")
+    if message_type:
+        topics["event_types"] = {message_type}
+
+    # 本体はメッセージ種別によって異なるキーに格納される
+    bodies = [message]
+    for key in ("log", "message", "task", "event", "data"):
+        body = message.get(key)
+        if isinstance(body, dict):
+            bodies.append(body)
+
+    teams = {
+        body["teamName"]
+        for body in bodies
+        if isinstance(body.get("teamName"), str) and body["teamName"]
+    }
+    if teams:
+        topics["teams"] = teams
+
+    agents: set[str] = set()
+    for body in bodies[1:]:
+        for key in ("agentName", "sender", "recipient", "owner"):
+            value = body.get(key)
+            if isinstance(value, str) and value:
+                agents.add(value)
+    if agents:
+        topics["agents"] = agents
+
+    return topics
+
+
+@dataclass
+class Subscription:
+    """接続ごとの購読条件
+
+    Attributes:
+        teams: 購読するチーム名（空の場合は全て）
+        event_types: 購読するイベントタイプ（空の場合は全て）
+        agents: 購読するエージェント名（空の場合は全て）
+    """
+
+    teams: set[str] = field(default_factory=set)
+    event_types: set[str] = field(default_factory=set)
+    agents: set[str] = field(default_factory=set)
+
+    def values(self, dimension: str) -> set[str]:
+        """次元の購読値を返します。
+
+        Args:
+            dimension: 次元名
+
+        Returns:
+            購読値の集合
+        """
+        values: set[str] = getattr(self, dimension)
+        return values
+
+    def to_dict(self) -> dict[str, Any]:
+        """辞書に変換します。"""
+        return {
+            "teams": sorted(self.teams),
+            "eventTypes": sorted(self.event_types),
+            "agents": sorted(self.agents),
+        }
+
+
+def _filtered_dimensions(subscription: Subscription) -> frozenset[str]:
+    """購読条件を持つ（ワイルドカードでない）次元の組を返します。
+
+    Args:
+        subscription: 購読条件
+
+    Returns:
+        次元名の集合
+    """
+    return frozenset(dimension for dimension in DIMENSIONS if subscription.values(dimension))
+
+
+class SubscriptionIndex(Generic[ConnectionT]):
+    """購読条件とトピック逆引きインデックス
+
+    ブロードキャスト時は、メッセージのトピックに一致する接続の集合を
+    インデックスから求めるため、関心のない接続は走査されません。
+
+    接続は購読条件を持つ次元の組ごとにグループ化されます。メッセージのトピックに
+    関係する次元を持たないグループ（全次元がワイルドカードの接続など）はそのまま対象となり、
+    それ以外のグループは最も小さいトピック値の接続集合から絞り込みます。
+
+    Attributes:
+        _subscriptions: 接続ごとの購読条件
+        _index: トピック逆引きインデックス（(次元, 値) -> 接続の集合）
+        _groups: 購読条件を持つ次元の組ごとの接続の集合（空の組は全次元ワイルドカード）
+    """
+
+    def __init__(self) -> None:
+        """SubscriptionIndexを初期化します。"""
+        self._subscriptions: dict[ConnectionT, Subscription] = {}
+        self._index: dict[tuple[str, str], set[ConnectionT]] = {}
+        self._groups: dict[frozenset[str], set[ConnectionT]] = {}
+
+    def __len__(self) -> int:
+        """登録されている接続数を返します。"""
+        return len(self._subscriptions)
+
+    def add(self, connection: ConnectionT) -> None:
+        """接続を登録します（全てのメッセージを受信する状態）。
+
+        Args:
+            connection: 接続
+        """
+        if connection in self._subscriptions:
+            return
+        self._subscriptions[connection] = Subscription()
+        self._groups.setdefault(frozenset(), set()).add(connection)
+
+    def remove(self, connection: ConnectionT) -> None:
+        """接続の登録を解除します。
+
+        Args:
+            connection: 接続
+        """
+        subscription = self._subscriptions.pop(connection, None)
+        if subscription is None:
+            return
+        self._ungroup(_filtered_dimensions(subscription), connection)
+        for dimension in DIMENSIONS:
+            for value in subscription.values(dimension):
+                self._discard(dimension, value, connection)
+
+    def subscribe(self, connection: ConnectionT, **filters: Iterable[str] | None) -> Subscription:
+        """購読条件を追加します。
+
+        Args:
+            connection: 接続
+            **filters: 次元名（teams, event_types, agents）-> 追加する値
+
+        Returns:
+            更新後の購読条件
+        """
+        self.add(connection)
+        subscription = self._subscriptions[connection]
+        before = _filtered_dimensions(subscription)
+        for dimension, values in self._normalize(filters).items():
+            for value in values - subscription.values(dimension):
+                subscription.values(dimension).add(value)
+                self._index.setdefault((dimension, value), set()).add(connection)
+        self._regroup(before, subscription, connection)
+        return subscription
+
+    def unsubscribe(self, connection: ConnectionT, **filters: Iterable[str] | None) -> Subscription:
+        """購読条件を削除します。
+
+        条件を指定しない場合は全ての購読条件を解除し、全てのメッセージを受信する状態に戻します。
+        次元の値が全て削除された場合、その次元はワイルドカードに戻ります。
+
+        Args:
+            connection: 接続
+            **filters: 次元名（teams, event_types, agents）-> 削除する値
+
+        Returns:
+            更新後の購読条件
+        """
+        self.add(connection)
+        subscription = self._subscriptions[connection]
+        normalized = self._normalize(filters)
+        if not any(normalized.values()):
+            normalized = {
+                dimension: set(subscription.values(dimension)) for dimension in DIMENSIONS
+            }
+
+        before = _filtered_dimensions(subscription)
+        for dimension, values in normalized.items():
+            for value in values & subscription.values(dimension):
+                subscription.values(dimension).discard(value)
+                self._discard(dimension, value, connection)
+        self._regroup(before, subscription, connection)
+        return subscription
+
+    def get_subscription(self, connection: ConnectionT) -> Subscription | None:
+        """接続の購読条件を返します。
+
+        Args:
+            connection: 接続
+
+        Returns:
+            購読条件（未登録の場合はNone）
+        """
+        return self._subscriptions.get(connection)
+
+    def matches(self, connection: ConnectionT, message: dict[str, Any]) -> bool:
+        """接続の購読条件にメッセージが一致するかどうかを判定します。
+
+        Args:
+            connection: 接続
+            message: ブロードキャストメッセージ
+
+        Returns:
+            一致する場合True（未登録の接続はFalse）
+        """
+        subscription = self._subscriptions.get(connection)
+        if subscription is None:
+            return False
+        for dimension, values in message_topics(message).items():
+            filters = subscription.values(dimension)
+            if filters and not filters & values:
+                return False
+        return True
+
+    def match(self, message: dict[str, Any]) -> set[ConnectionT]:
+        """メッセージを受信する接続の集合を返します。
+
+        Args:
+            message: ブロードキャストメッセージ
+
+        Returns:
+            接続の集合
+        """
+        topics = message_topics(message)
+        if not topics:
+            return set(self._subscriptions)
+
+        # トピックの次元ごとに、その値を購読している接続の集合（大半は1値のためコピーしない）
+        specific = {
+            dimension: self._lookup(dimension, values) for dimension, values in topics.items()
+        }
+
+        result: set[ConnectionT] = set()
+        for dimensions, connections in self._groups.items():
+            checked = [specific[dimension] for dimension in dimensions if dimension in specific]
+            if not checked:
+                # メッセージに関係する次元では全てワイルドカードの接続
+                result |= connections
+                continue
+            checked.sort(key=len)
+            for connection in checked[0]:
+                if connection in connections and all(connection in other for other in checked[1:]):
+                    result.add(connection)
+        return result
+
+    def _lookup(self, dimension: str, values: set[str]) -> set[ConnectionT]:
+        """トピック値のいずれかを購読している接続の集合を返します。
+
+        Args:
+            dimension: 次元名
+            values: トピック値の集合
+
+        Returns:
+            接続の集合（値が1つの場合はインデックスの集合そのもの）
+        """
+        if len(values) == 1:
+            return self._index.get((dimension, next(iter(values))), set())
+        matched: set[ConnectionT] = set()
+        for value in values:
+            matched |= self._index.get((dimension, value), set())
+        return matched
+
+    def _regroup(
+        self, before: frozenset[str], subscription: Subscription, connection: ConnectionT
+    ) -> None:
+        """購読条件を持つ次元の組が変わった接続のグループを移動します。
+
+        Args:
+            before: 変更前の購読条件を持つ次元の組
+            subscription: 変更後の購読条件
+            connection: 接続
+        """
+        after = _filtered_dimensions(subscription)
+        if after == before:
+            return
+        self._ungroup(before, connection)
+        self._groups.setdefault(after, set()).add(connection)
+
+    def _ungroup(self, dimensions: frozenset[str], connection: ConnectionT) -> None:
+        """接続をグループから削除します。
+
+        Args:
+            dimensions: 購読条件を持つ次元の組
+            connection: 接続
+        """
+        connections = self._groups.get(dimensions)
+        if connections is None:
+            return
+        connections.discard(connection)
+        if not connections:
+            del self._groups[dimensions]
+
+    def _discard(self, dimension: str, value: str, connection: ConnectionT) -> None:
+        """インデックスから接続を削除します。
+
+        Args:
+            dimension: 次元名
+            value: トピック値
+            connection: 接続
+        """
+        connections = self._index.get((dimension, value))
+        if connections is None:
+            return
+        connections.discard(connection)
+        if not connections:
+            del self._index[(dimension, value)]
+
+    @staticmethod
+    def _normalize(filters: dict[str, Iterable[str] | None]) -> dict[str, set[str]]:
+        """購読条件の引数を正規化します。
+
+        Args:
+            filters: 次元名 -> 値 の辞書
+
+        Returns:
+            次元名 -> 値の集合 の辞書
+
+        Raises:
+            ValueError: 未知の次元名が指定された場合
+        """
+        normalized: dict[str, set[str]] = {}
+        for dimension, values in filters.items():
+            if dimension not in DIMENSIONS:
+                raise ValueError(f"Unknown subscription dimension: {dimension}")
+            if isinstance(values, str):
+                values = [values]
+            normalized[dimension] = {str(value) for value in values or []}
+        return normalized
@@ -4,8 +4,8 @@
 """
 
 import logging
+import os
 import threading
-import time
 from collections.abc import Callable
 from pathlib import Path
 
@@ -15,7 +15,9 @@ from watchdog.events import (
     FileModifiedEvent,
     FileSystemEventHandler,
 )
-from watchdog.observers import Observer
+
+from orchestrator.web.debouncer import CoalescingDebouncer
+from orchestrator.web.watch_service import WatchService, get_watch_service
 
 logger = logging.getLogger(__name__)
 
@@ -24,20 +26,28 @@ class TeamFileObserver:
     """チームファイル監視クラス
 
     Agent Teams関連のファイルシステム変更を監視します。
+    監視は共有のWatchServiceにルートとして登録されます。
 
     Attributes:
         _base_dir: 監視対象のベースディレクトリ
         _callbacks: ファイル変更コールバックの辞書
-        _observer: watchdog Observerインスタンス
+        _watch_service: ファイル監視サービス
+        _handler: 登録中のイベントハンドラー
+        _debouncer: ファイルイベントのデバウンサー
     """
 
-    def __init__(self, base_dir: Path | str = Path.home() / ".claude" / "teams"):
+    def __init__(
+        self,
+        base_dir: Path | str = Path.home() / ".claude" / "teams",
+        watch_service: WatchService | None = None,
+    ):
         """TeamFileObserverを初期化します。
 
         Args:
             base_dir: 監視対象のベースディレクトリ
+            watch_service: ファイル監視サービス（指定しない場合は共有インスタンス）
         """
-        self._base_dir = Path(base_dir)
+        self._base_dir = Path(os.path.abspath(base_dir))
         self._callbacks: dict[str, list[Callable[[str, Path], None]]] = {
             "config_changed": [],
             "inbox_changed": [],
@@ -45,7 +55,9 @@ class TeamFileObserver:
             "team_created": [],
             "team_deleted": [],
         }
-        self._observer: Observer | None = None
+        self._watch_service = watch_service or get_watch_service()
+        self._handler: _TeamFileEventHandler | None = None
+        self._debouncer: CoalescingDebouncer | None = None
         self._lock = threading.Lock()
 
     def register_callback(self, event_type: str, callback: Callable[[str, Path], None]) -> None:
@@ -63,26 +75,27 @@ class TeamFileObserver:
 
     def start(self) -> None:
         """ファイル監視を開始します。"""
-        if self._observer is not None:
+        if self._handler is not None:
             logger.warning("Observer is already running")
             return
 
-        handler = _TeamFileEventHandler(self._callbacks)
-        self._observer = Observer()
-        self._observer.schedule(handler, str(self._base_dir), recursive=True)
-        self._observer.start()
+        self._debouncer = CoalescingDebouncer()
+        self._handler = _TeamFileEventHandler(self._callbacks, self._debouncer, self._base_dir)
+        self._watch_service.add_route(self._base_dir, self._handler)
         logger.info(f"Team file observer started: {self._base_dir}")
         logger.info(f"Watching directory: {self._base_dir}")
         logger.info(f"Event handlers registered: {list(self._callbacks.keys())}")
 
     def stop(self) -> None:
         """ファイル監視を停止します。"""
-        if self._observer is None:
+        if self._handler is None:
             return
 
-        self._observer.stop()
-        self._observer.join()
-        self._observer = None
+        self._watch_service.remove_route(self._base_dir, self._handler)
+        self._handler = None
+        if self._debouncer is not None:
+            self._debouncer.close()
+            self._debouncer = None
         logger.info("Team file observer stopped")
 
     def is_running(self) -> bool:
@@ -91,26 +104,38 @@ class TeamFileObserver:
         Returns:
             監視中ならTrue
         """
-        return self._observer is not None and self._observer.is_alive()
+        return self._handler is not None and self._watch_service.is_running()
 
 
 class _TeamFileEventHandler(FileSystemEventHandler):
     """チームファイルイベントハンドラー
 
+    ファイル変更イベントはパスごとにデバウンサーで集約され、
+    書き込みが落ち着いた時点で最新の状態が1回だけ処理されます。
+
     Attributes:
         _callbacks: イベントコールバックの辞書
+        _debouncer: ファイルイベントのデバウンサー
+        _base_dir: 監視対象のベースディレクトリ（チーム名の判定に使用）
     """
 
-    def __init__(self, callbacks: dict[str, list[Callable[[str, Path], None]]]):
+    def __init__(
+        self,
+        callbacks: dict[str, list[Callable[[str, Path], None]]],
+        debouncer: CoalescingDebouncer | None = None,
+        base_dir: Path | str = Path.home() / ".claude" / "teams",
+    ):
         """イベントハンドラーを初期化します。
 
         Args:
             callbacks: コールバックの辞書
+            debouncer: ファイルイベントのデバウンサー（指定しない場合は新規作成）
+            base_dir: 監視対象のベースディレクトリ
         """
         super().__init__()
         self._callbacks = callbacks
-        self._last_event_time: dict[str, float] = {}
-        self._debounce_interval = 0.5  # デバウンス間隔（秒）
+        self._debouncer = debouncer or CoalescingDebouncer()
+        self._base_dir = Path(os.path.abspath(base_dir))
 
     def on_created(self, event: FileCreatedEvent) -> None:
         """ファイル作成イベントを処理します。
@@ -121,7 +146,7 @@ class _TeamFileEventHandler(FileSystemEventHandler):
         if event.is_directory:
             self._handle_team_created(event.src_path)
         else:
-            self._handle_file_change("created", event.src_path)
+            self._schedule_file_change("created", event.src_path)
 
     def on_modified(self, event: FileModifiedEvent) -> None:
         """ファイル変更イベントを処理します。
@@ -130,7 +155,7 @@ class _TeamFileEventHandler(FileSystemEventHandler):
             event: ファイル変更イベント
         """
         if not event.is_directory:
-            self._handle_file_change("modified", event.src_path)
+            self._schedule_file_change("modified", event.src_path)
 
     def on_deleted(self, event: FileDeletedEvent) -> None:
         """ファイル削除イベントを処理します。
@@ -162,10 +187,23 @@ class _TeamFileEventHandler(FileSystemEventHandler):
             dir_path: ディレクトリパス
         """
         path = Path(dir_path)
+        # ベースディレクトリ直下のディレクトリのみがチーム
+        if path.parent != self._base_dir:
+            return
+
         team_name = path.name
         logger.info(f"Team deleted: {team_name}")
         self._invoke_callbacks("team_deleted", team_name, path)
 
+    def _schedule_file_change(self, change_type: str, file_path: str) -> None:
+        """ファイル変更の処理をデバウンサーに登録します。
+
+        Args:
+            change_type: 変更タイプ（created, modified）
+            file_path: ファイルパス
+        """
+        self._debouncer.submit(file_path, lambda: self._handle_file_change(change_type, file_path))
+
     def _handle_file_change(self, _change_type: str, file_path: str) -> None:
         """ファイル変更を処理します。
 
@@ -175,17 +213,11 @@ class _TeamFileEventHandler(FileSystemEventHandler):
         """
         path = Path(file_path)
 
-        # デバウンス処理
-        current_time = time.time()
-        last_time = self._last_event_time.get(file_path, 0)
-
-        if current_time - last_time < self._debounce_interval:
-            return
-
-        self._last_event_time[file_path] = current_time
-
         # ファイルパスからチーム名とファイル種別を判定
-        parts = path.relative_to(Path.home() / ".claude" / "teams").parts
+        try:
+            parts = path.relative_to(self._base_dir).parts
+        except ValueError:
+            return
 
         if len(parts) < 2:
             return
@@ -213,7 +245,9 @@ class _TeamFileEventHandler(FileSystemEventHandler):
             file_path: ファイルパス
         """
         callbacks = self._callbacks.get(event_type, [])
-        logger.info(f"Invoking {len(callbacks)} callbacks for event: {event_type}, team: {team_name}")
+        logger.info(
+            f"Invoking {len(callbacks)} callbacks for event: {event_type}, team: {team_name}"
+        )
         for callback in callbacks:
             try:
                 logger.info(f"Calling callback for event: {event_type}")
@@ -226,22 +260,32 @@ class TaskFileObserver:
     """タスクファイル監視クラス
 
     ~/.claude/tasks/ ディレクトリを監視します。
+    監視は共有のWatchServiceにルートとして登録されます。
 
     Attributes:
         _task_dir: タスクディレクトリ
         _callbacks: タスク変更コールバックのリスト
-        _observer: watchdog Observerインスタンス
+        _watch_service: ファイル監視サービス
+        _handler: 登録中のイベントハンドラー
+        _debouncer: ファイルイベントのデバウンサー
     """
 
-    def __init__(self, task_dir: Path | str = Path.home() / ".claude" / "tasks"):
+    def __init__(
+        self,
+        task_dir: Path | str = Path.home() / ".claude" / "tasks",
+        watch_service: WatchService | None = None,
+    ):
         """TaskFileObserverを初期化します。
 
         Args:
             task_dir: タスクディレクトリ
+            watch_service: ファイル監視サービス（指定しない場合は共有インスタンス）
         """
-        self._task_dir = Path(task_dir)
+        self._task_dir = Path(os.path.abspath(task_dir))
         self._callbacks: list[Callable[[str, Path], None]] = []
-        self._observer: Observer | None = None
+        self._watch_service = watch_service or get_watch_service()
+        self._handler: _TaskFileEventHandler | None = None
+        self._debouncer: CoalescingDebouncer | None = None
         self._lock = threading.Lock()
 
     def register_callback(self, callback: Callable[[str, Path], None]) -> None:
@@ -255,24 +299,25 @@ class TaskFileObserver:
 
     def start(self) -> None:
         """ファイル監視を開始します。"""
-        if self._observer is not None:
+        if self._handler is not None:
             logger.warning("Task observer is already running")
             return
 
-        handler = _TaskFileEventHandler(self._callbacks)
-        self._observer = Observer()
-        self._observer.schedule(handler, str(self._task_dir), recursive=True)
-        self._observer.start()
+        self._debouncer = CoalescingDebouncer()
+        self._handler = _TaskFileEventHandler(self._callbacks, self._debouncer, self._task_dir)
+        self._watch_service.add_route(self._task_dir, self._handler)
         logger.info(f"Task file observer started: {self._task_dir}")
 
     def stop(self) -> None:
         """ファイル監視を停止します。"""
-        if self._observer is None:
+        if self._handler is None:
             return
 
-        self._observer.stop()
-        self._observer.join()
-        self._observer = None
+        self._watch_service.remove_route(self._task_dir, self._handler)
+        self._handler = None
+        if self._debouncer is not None:
+            self._debouncer.close()
+            self._debouncer = None
         logger.info("Task file observer stopped")
 
     def is_running(self) -> bool:
@@ -281,7 +326,7 @@ class TaskFileObserver:
         Returns:
             監視中ならTrue
         """
-        return self._observer is not None and self._observer.is_alive()
+        return self._handler is not None and self._watch_service.is_running()
 
 
 class _TaskFileEventHandler(FileSystemEventHandler):
@@ -289,31 +334,53 @@ class _TaskFileEventHandler(FileSystemEventHandler):
 
     Attributes:
         _callbacks: コールバックのリスト
+        _debouncer: ファイルイベントのデバウンサー
+        _task_dir: タスクディレクトリ（チーム名の判定に使用）
     """
 
-    def __init__(self, callbacks: list[Callable[[str, Path], None]]):
+    def __init__(
+        self,
+        callbacks: list[Callable[[str, Path], None]],
+        debouncer: CoalescingDebouncer | None = None,
+        task_dir: Path | str = Path.home() / ".claude" / "tasks",
+    ):
         """イベントハンドラーを初期化します。
 
         Args:
             callbacks: コールバックのリスト
+            debouncer: ファイルイベントのデバウンサー（指定しない場合は新規作成）
+            task_dir: タスクディレクトリ
         """
         super().__init__()
         self._callbacks = callbacks
-        self._last_event_time: dict[str, float] = {}
-        self._debounce_interval = 0.5
+        self._debouncer = debouncer or CoalescingDebouncer()
+        self._task_dir = Path(os.path.abspath(task_dir))
 
     def on_created(self, event: FileCreatedEvent) -> None:
         """ファイル作成イベントを処理します。"""
         if not event.is_directory:
-            self._handle_task_change(event.src_path)
+            self._schedule_task_change(event.src_path)
 
     def on_modified(self, event: FileModifiedEvent) -> None:
         """ファイル変更イベントを処理します。"""
         if not event.is_directory:
-            self._handle_task_change(event.src_path)
+            self._schedule_task_change(event.src_path)
+
+    def on_deleted(self, event: FileDeletedEvent) -> None:
+        """ファイル削除イベントを処理します。"""
+        if not event.is_directory:
+            self._schedule_task_change(event.src_path)
+
+    def _schedule_task_change(self, file_path: str) -> None:
+        """タスク変更の処理をデバウンサーに登録します。
+
+        Args:
+            file_path: ファイルパス
+        """
+        self._debouncer.submit(file_path, lambda: self._handle_task_change(file_path))
 
     def _handle_task_change(self, file_path: str) -> None:
-        """タスク変更を処理します。
+        """タスク変更（作成・更新・削除）を処理します。
 
         Args:
             file_path: ファイルパス
@@ -323,19 +390,10 @@ class _TaskFileEventHandler(FileSystemEventHandler):
         if not path.name.endswith(".json"):
             return
 
-        # デバウンス処理
-        current_time = time.time()
-        last_time = self._last_event_time.get(file_path, 0)
-
-        if current_time - last_time < self._debounce_interval:
-            return
-
-        self._last_event_time[file_path] = current_time
-
         # パスからチーム名を取得
         try:
-            parts = path.relative_to(Path.home() / ".claude" / "tasks").parts
-            if len(parts) >= 1:
+            parts = path.relative_to(self._task_dir).parts
+            if len(parts) >= 2:
                 team_name = parts[0]
                 logger.debug(f"Task changed: {team_name}")
                 for callback in self._callbacks:
@@ -3,8 +3,10 @@
 このモジュールでは、Agent Teams監視用のデータモデルを定義します。
 """
 
+import hashlib
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -405,6 +407,64 @@ def _detect_emotion(content: str) -> EmotionType:
     return EmotionType.NEUTRAL
 
 
+@dataclass(frozen=True)
+class TeamsRoot:
+    """Agent Teamsのルートディレクトリ設定
+
+    1つのルートは、チームディレクトリとタスクディレクトリの組です。
+    デフォルトは ~/.claude/teams と ~/.claude/tasks です。
+
+    Attributes:
+        teams_dir: チームディレクトリ（チームごとのconfig.jsonとinboxesを含む）
+        tasks_dir: タスクディレクトリ（チームごとのタスクファイルを含む）
+    """
+
+    teams_dir: Path
+    tasks_dir: Path
+
+    @classmethod
+    def from_base(cls, base_dir: Path | str) -> "TeamsRoot":
+        """ベースディレクトリ配下のteams/tasksをルートとして作成します。
+
+        監視イベントのパスは絶対パスで届くため、相対パスは絶対パスに変換します。
+
+        Args:
+            base_dir: ベースディレクトリ（~/.claude 相当、相対パスも可）
+
+        Returns:
+            TeamsRootインスタンス
+        """
+        base = Path(os.path.abspath(Path(base_dir).expanduser()))
+        return cls(teams_dir=base / "teams", tasks_dir=base / "tasks")
+
+    @classmethod
+    def default(cls) -> "TeamsRoot":
+        """デフォルトのルート（~/.claude）を作成します。
+
+        Returns:
+            TeamsRootインスタンス
+        """
+        return cls.from_base(Path.home() / ".claude")
+
+
+def teams_roots_from_env(env_var: str = "ORCHESTRATOR_TEAMS_ROOTS") -> list[TeamsRoot]:
+    """環境変数からルートディレクトリ設定を読み込みます。
+
+    環境変数にはベースディレクトリをパス区切り文字（os.pathsep）で区切って指定します。
+
+    Args:
+        env_var: 環境変数名
+
+    Returns:
+        TeamsRootのリスト（未設定の場合はデフォルトのルートのみ）
+    """
+    value = os.getenv(env_var, "")
+    bases = [base for base in value.split(os.pathsep) if base.strip()]
+    if not bases:
+        return [TeamsRoot.default()]
+    return [TeamsRoot.from_base(Path(base.strip()).expanduser()) for base in bases]
+
+
 def load_team_config(team_path: Path) -> TeamInfo | None:
     """チーム設定ファイルを読み込みます。
 
@@ -425,6 +485,62 @@ def load_team_config(team_path: Path) -> TeamInfo | None:
         return None
 
 
+@dataclass
+class InboxCursor:
+    """inboxファイルの取り込み位置
+
+    inboxファイルごとに、どこまで取り込んだかを記録します。
+
+    Attributes:
+        mtime_ns: 取り込み時のファイル更新時刻（ナノ秒）
+        size: 取り込み時のファイルサイズ（バイト）
+        count: 取り込み済みのメッセージ数
+        digest: 取り込み済みのメッセージのハッシュ（既読化などの書き換えの検出用）
+    """
+
+    mtime_ns: int = 0
+    size: int = 0
+    count: int = 0
+    digest: bytes = b""
+
+
+def inbox_digest(messages: list[TeamMessage]) -> bytes:
+    """inboxのメッセージ列のハッシュを計算します。
+
+    Args:
+        messages: TeamMessageのリスト
+
+    Returns:
+        16バイトのハッシュ値
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for message in messages:
+        digest.update(repr(message).encode("utf-8"))
+    return digest.digest()
+
+
+def load_inbox_file(inbox_file: Path) -> list[TeamMessage] | None:
+    """inboxファイルを1つ読み込みます。
+
+    Args:
+        inbox_file: inboxファイルのパス
+
+    Returns:
+        TeamMessageのリスト、読み込み失敗時はNone
+    """
+    try:
+        with open(inbox_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if isinstance(data, list):
+        return [TeamMessage.from_dict(msg_data) for msg_data in data]
+    if isinstance(data, dict):
+        return [TeamMessage.from_dict(data)]
+    return []
+
+
 def load_team_messages(team_path: Path) -> list[TeamMessage]:
     """チームのメッセージinboxを読み込みます。
 
@@ -441,42 +557,53 @@ def load_team_messages(team_path: Path) -> list[TeamMessage]:
         return messages
 
     for inbox_file in inbox_dir.glob("*.json"):
-        try:
-            with open(inbox_file, encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, list):
-                for msg_data in data:
-                    messages.append(TeamMessage.from_dict(msg_data))
-            elif isinstance(data, dict):
-                messages.append(TeamMessage.from_dict(data))
-        except (FileNotFoundError, json.JSONDecodeError):
-            continue
+        inbox_messages = load_inbox_file(inbox_file)
+        if inbox_messages:
+            messages.extend(inbox_messages)
 
     return messages
 
 
-def load_team_tasks(team_name: str) -> list[TaskInfo]:
+def load_task_file(task_file: Path) -> TaskInfo | None:
+    """タスクファイルを1つ読み込みます。
+
+    Args:
+        task_file: タスクファイルのパス
+
+    Returns:
+        TaskInfo、読み込み失敗時はNone
+    """
+    try:
+        with open(task_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    return TaskInfo.from_dict(data)
+
+
+def load_team_tasks(team_name: str, tasks_dir: Path | None = None) -> list[TaskInfo]:
     """チームのタスクを読み込みます。
 
     Args:
         team_name: チーム名
+        tasks_dir: タスクディレクトリ（デフォルト: ~/.claude/tasks）
 
     Returns:
         TaskInfoのリスト
     """
     tasks: list[TaskInfo] = []
-    task_dir = Path.home() / ".claude" / "tasks" / team_name
+    task_dir = (tasks_dir or TeamsRoot.default().tasks_dir) / team_name
 
     if not task_dir.exists():
         return tasks
 
     for task_file in task_dir.glob("*.json"):
-        try:
-            with open(task_file, encoding="utf-8") as f:
-                data = json.load(f)
-            tasks.append(TaskInfo.from_dict(data))
-        except (FileNotFoundError, json.JSONDecodeError):
-            continue
+        task = load_task_file(task_file)
+        if task is not None:
+            tasks.append(task)
 
     return tasks
 
@@ -498,10 +625,13 @@ class GlobalState:
         teams_monitor: Teams監視モジュール
         thinking_log_handler: 思考ログハンドラー
         teams_manager: AgentTeamsManager
-        health_monitor: ヘルスモニター
+        health_monitor: ヘルスモニター（ipcバックエンド使用時はingestプロセスが持つためNone）
         channel_manager: チャンネルマネージャー
         channel_client: エージェント向けチャンネル操作クライアント
         event_loop: イベントループ（スレッドセーフなブロードキャスト用）
+        event_bus: イベントバス（スレッドからイベントループへの受け渡し用）
+        event_subscriber: ingestプロセスからのイベント受信クライアント（ipcバックエンド使用時）
+        response_cache: チームAPIの応答キャッシュ
     """
 
     ws_manager: Any | None = None
@@ -513,3 +643,6 @@ class GlobalState:
     channel_manager: Any | None = None
     channel_client: Any | None = None
     event_loop: Any | None = None
+    event_bus: Any | None = None
+    event_subscriber: Any | None = None
+    response_cache: Any | None = None
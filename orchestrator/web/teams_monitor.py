@@ -4,24 +4,48 @@
 """
 
 import logging
-from collections import defaultdict
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Any
 
+from orchestrator.web.retention import RetentionPolicy, RingBuffer
 from orchestrator.web.team_file_observer import TaskFileObserver, TeamFileObserver
 from orchestrator.web.team_models import (
+    InboxCursor,
     TaskInfo,
     TeamInfo,
     TeamMessage,
+    TeamsRoot,
     ThinkingLog,
+    inbox_digest,
+    load_inbox_file,
+    load_task_file,
     load_team_config,
     load_team_messages,
-    load_team_tasks,
 )
+from orchestrator.web.time_index import IndexedRingBuffer, Page
+from orchestrator.web.versions import next_version
 
 logger = logging.getLogger(__name__)
 
+# get_team_statusの応答形式のバージョン
+# 1: AgentTeamsManager.get_team_status（CLI）の形式。config.jsonのメンバーとタスクファイルをそのまま返す
+# 2: TeamMember.to_dict() / TaskInfo.to_dict() に正規化した形式（タスクIDはtaskId）
+TEAM_STATUS_SCHEMA_VERSION = 2
+
+
+def _estimate_message_size(message: TeamMessage) -> int:
+    """保持ポリシー用にメッセージのサイズを見積もります。
+
+    Args:
+        message: チームメッセージ
+
+    Returns:
+        見積もりバイト数
+    """
+    return len(message.content.encode("utf-8")) + len(message.summary.encode("utf-8"))
+
 
 class TeamsMonitor:
     """Agent Teams監視クラス
@@ -31,33 +55,74 @@ class TeamsMonitor:
 
     Attributes:
         _teams: チーム情報の辞書（チーム名 -> TeamInfo）
-        _messages: チームメッセージの辞書（チーム名 -> メッセージリスト）
-        _tasks: タスク情報の辞書（チーム名 -> タスクリスト）
-        _thinking_logs: 思考ログの辞書（チーム名 -> ログリスト）
-        _file_observer: ファイル監視オブザーバー
-        _task_observer: タスク監視オブザーバー
+        _messages: チームメッセージの辞書（チーム名 -> タイムスタンプ順インデックス付きリングバッファ）
+        _tasks: タスク情報の辞書（チーム名 -> タスクID -> TaskInfo）
+        _task_files: タスクファイルとタスクIDの対応（チーム名 -> ファイルパス -> タスクID）
+        _thinking_logs: 思考ログの辞書（チーム名 -> 保持ポリシー付きリングバッファ）
+        _retention: デフォルトの保持ポリシー
+        _team_retention: チームごとの保持ポリシー
+        _inbox_cursors: inboxファイルごとの取り込み位置（チーム名 -> ファイルパス -> InboxCursor）
+        _roots: 監視対象のルートディレクトリ設定のリスト
+        _team_roots: チームが属するルート（チーム名 -> TeamsRoot）
+        _file_observers: ルートごとのファイル監視オブザーバー
+        _task_observers: ルートごとのタスク監視オブザーバー
         _update_callbacks: 更新コールバックのリスト
+        _teams_version: チーム一覧のバージョン番号
+        _task_versions: タスクのバージョン番号（チーム名 -> バージョン番号）
         _thinking_polling_active: 思考ログポーリング中フラグ（現在は未使用）
+        _lock: メッセージ・思考ログのバッファを保護するロック
+            （監視スレッドが追加し、イベントループ上のAPIが読み出すため）
     """
 
-    def __init__(self) -> None:
-        """TeamsMonitorを初期化します。"""
+    def __init__(
+        self,
+        retention: RetentionPolicy | None = None,
+        roots: Sequence[TeamsRoot] | TeamsRoot | None = None,
+    ) -> None:
+        """TeamsMonitorを初期化します。
+
+        Args:
+            retention: メッセージ・思考ログのデフォルト保持ポリシー
+            roots: 監視対象のルートディレクトリ設定（複数指定可、デフォルト: ~/.claude）
+        """
+        if roots is None:
+            roots = [TeamsRoot.default()]
+        elif isinstance(roots, TeamsRoot):
+            roots = [roots]
+        self._roots = list(roots)
+        self._team_roots: dict[str, TeamsRoot] = {}
         self._teams: dict[str, TeamInfo] = {}
-        self._messages: dict[str, list[TeamMessage]] = defaultdict(list)
-        self._tasks: dict[str, list[TaskInfo]] = defaultdict(list)
-        self._thinking_logs: dict[str, list[ThinkingLog]] = defaultdict(list)
-        self._file_observer = TeamFileObserver()
-        self._task_observer = TaskFileObserver()
+        self._retention = retention or RetentionPolicy()
+        self._team_retention: dict[str, RetentionPolicy] = {}
+        self._messages: dict[str, IndexedRingBuffer[TeamMessage]] = {}
+        self._tasks: dict[str, dict[str, TaskInfo]] = {}
+        self._task_files: dict[str, dict[Path, str]] = {}
+        self._thinking_logs: dict[str, RingBuffer[ThinkingLog]] = {}
+        self._inbox_cursors: dict[str, dict[Path, InboxCursor]] = {}
+        self._file_observers = [TeamFileObserver(root.teams_dir) for root in self._roots]
+        self._task_observers = [TaskFileObserver(root.tasks_dir) for root in self._roots]
         self._update_callbacks: list[Callable[[dict[str, Any]], None]] = []
+        self._teams_version = next_version()
+        self._task_versions: dict[str, int] = {}
         self._thinking_polling_active = False
+        self._lock = threading.Lock()
         self._thinking_polling_interval = 2.0  # 秒
 
         # 既存のチームを読み込み
         self._load_existing_teams()
 
     def _load_existing_teams(self) -> None:
-        """既存のチームを読み込みます。"""
-        teams_dir = Path.home() / ".claude" / "teams"
+        """全ルートの既存のチームを読み込みます。"""
+        for root in self._roots:
+            self._load_root_teams(root)
+
+    def _load_root_teams(self, root: TeamsRoot) -> None:
+        """ルート配下の既存のチームを読み込みます。
+
+        Args:
+            root: ルートディレクトリ設定
+        """
+        teams_dir = root.teams_dir
 
         if not teams_dir.exists():
             return
@@ -67,14 +132,188 @@ class TeamsMonitor:
                 continue
 
             team_name = team_dir.name
+            if team_name in self._team_roots and self._team_roots[team_name] != root:
+                logger.warning(f"Team {team_name} exists in multiple roots, ignoring: {team_dir}")
+                continue
+
             team_info = load_team_config(team_dir)
 
             if team_info:
+                self._team_roots[team_name] = root
                 self._teams[team_name] = team_info
-                self._messages[team_name] = load_team_messages(team_dir)
-                self._tasks[team_name] = load_team_tasks(team_name)
+                messages = self._load_inboxes(team_name, team_dir)
+                with self._lock:
+                    self._messages[team_name] = self._new_message_buffer(team_name, messages)
+                self._load_tasks(team_name)
+                self._teams_version = next_version()
                 logger.info(f"Loaded existing team: {team_name}")
 
+    def set_team_retention(self, team_name: str, policy: RetentionPolicy) -> None:
+        """チームごとの保持ポリシーを設定します。
+
+        既に保持しているメッセージ・思考ログにも即座に適用されます。
+
+        Args:
+            team_name: チーム名
+            policy: 保持ポリシー
+        """
+        self._team_retention[team_name] = policy
+        with self._lock:
+            for buffers in (self._messages, self._thinking_logs):
+                buffer = buffers.get(team_name)
+                if isinstance(buffer, RingBuffer):
+                    buffer.set_policy(policy)
+
+    def _retention_for(self, team_name: str) -> RetentionPolicy:
+        """チームの保持ポリシーを取得します。
+
+        Args:
+            team_name: チーム名
+
+        Returns:
+            チーム固有のポリシー、未設定の場合はデフォルトのポリシー
+        """
+        return self._team_retention.get(team_name, self._retention)
+
+    def _new_message_buffer(
+        self, team_name: str, messages: list[TeamMessage]
+    ) -> IndexedRingBuffer[TeamMessage]:
+        """メッセージ用のリングバッファを作成します。
+
+        Args:
+            team_name: チーム名
+            messages: 初期メッセージ
+
+        Returns:
+            メッセージを格納したタイムスタンプ順インデックス付きリングバッファ
+        """
+        return IndexedRingBuffer(
+            lambda message: message.timestamp,
+            TeamMessage.to_dict,
+            self._retention_for(team_name),
+            _estimate_message_size,
+            messages,
+        )
+
+    def _root_for(self, team_name: str) -> TeamsRoot:
+        """チームが属するルートを取得します。
+
+        Args:
+            team_name: チーム名
+
+        Returns:
+            チームのルート、不明な場合は最初のルート
+        """
+        return self._team_roots.get(team_name, self._roots[0])
+
+    def _root_for_team_dir(self, team_dir: Path) -> TeamsRoot:
+        """チームディレクトリが属するルートを取得します。
+
+        Args:
+            team_dir: チームディレクトリ
+
+        Returns:
+            チームディレクトリの親をteams_dirとするルート、見つからない場合は最初のルート
+        """
+        for root in self._roots:
+            if team_dir.parent == root.teams_dir:
+                return root
+        return self._roots[0]
+
+    def _load_tasks(self, team_name: str) -> None:
+        """チームの全タスクを読み込み、タスクファイルとIDの対応を初期化します。
+
+        Args:
+            team_name: チーム名
+        """
+        tasks: dict[str, TaskInfo] = {}
+        task_files: dict[Path, str] = {}
+        task_dir = self._root_for(team_name).tasks_dir / team_name
+
+        if task_dir.exists():
+            for task_file in task_dir.glob("*.json"):
+                task = load_task_file(task_file)
+                if task is None:
+                    continue
+                tasks[task.task_id] = task
+                task_files[task_file] = task.task_id
+
+        self._tasks[team_name] = tasks
+        self._task_files[team_name] = task_files
+        self._task_versions[team_name] = next_version()
+
+    def _load_inboxes(self, team_name: str, team_dir: Path) -> list[TeamMessage]:
+        """チームの全inboxを読み込み、取り込み位置を初期化します。
+
+        Args:
+            team_name: チーム名
+            team_dir: チームディレクトリパス
+
+        Returns:
+            TeamMessageのリスト
+        """
+        messages: list[TeamMessage] = []
+        cursors: dict[Path, InboxCursor] = {}
+        inbox_dir = team_dir / "inboxes"
+
+        if inbox_dir.exists():
+            for inbox_file in inbox_dir.glob("*.json"):
+                cursor = InboxCursor()
+                result = self._read_inbox(inbox_file, cursor)
+                if result is None:
+                    continue
+                messages.extend(result[0])
+                cursors[inbox_file] = cursor
+
+        self._inbox_cursors[team_name] = cursors
+        return messages
+
+    def _read_inbox(
+        self, inbox_file: Path, cursor: InboxCursor
+    ) -> tuple[list[TeamMessage], bool] | None:
+        """inboxファイルから未取り込みのメッセージを読み込み、取り込み位置を進めます。
+
+        ファイルの更新時刻とサイズが前回と同じ場合は再パースしません。
+        取り込み済みのメッセージが書き換えられた場合（既読化・切り詰めなど）は
+        書き換えとして通知します。
+
+        Args:
+            inbox_file: inboxファイルパス
+            cursor: 取り込み位置
+
+        Returns:
+            (新しく追加されたメッセージのリスト, 取り込み済みの部分が書き換えられたか)、
+            読み込み失敗時はNone
+        """
+        try:
+            stat = inbox_file.stat()
+        except OSError:
+            return None
+
+        if cursor.count and stat.st_mtime_ns == cursor.mtime_ns and stat.st_size == cursor.size:
+            return [], False
+
+        messages = load_inbox_file(inbox_file)
+        if messages is None:
+            # 書き込み途中などで読めなかった場合は位置を進めない
+            return None
+
+        rewritten = False
+        if len(messages) < cursor.count:
+            # ファイルが切り詰められた・置き換えられた場合は先頭から取り込み直す
+            rewritten = True
+            cursor.count = 0
+        elif cursor.count and inbox_digest(messages[: cursor.count]) != cursor.digest:
+            # 取り込み済みのメッセージが書き換えられた場合（追加分は引き続き新規として扱う）
+            rewritten = True
+
+        new_messages = messages[cursor.count :]
+        cursor.mtime_ns = stat.st_mtime_ns
+        cursor.size = stat.st_size
+        cursor.count = len(messages)
+        cursor.digest = inbox_digest(messages)
+        return new_messages, rewritten
+
     def register_update_callback(self, callback: Callable[[dict[str, Any]], None]) -> None:
         """更新コールバックを登録します。
 
@@ -88,33 +327,50 @@ class TeamsMonitor:
         logger.info("Starting teams monitoring...")
 
         # コールバックを登録
-        self._file_observer.register_callback("config_changed", self._on_config_changed)
-        self._file_observer.register_callback("inbox_changed", self._on_inbox_changed)
-        self._file_observer.register_callback("team_created", self._on_team_created)
-        self._file_observer.register_callback("team_deleted", self._on_team_deleted)
-        self._task_observer.register_callback(self._on_task_changed)
-        logger.info(f"Callbacks registered. File observer running: {self._file_observer.is_running()}")
+        for file_observer in self._file_observers:
+            file_observer.register_callback("config_changed", self._on_config_changed)
+            file_observer.register_callback("inbox_changed", self._on_inbox_changed)
+            file_observer.register_callback("team_created", self._on_team_created)
+            file_observer.register_callback("team_deleted", self._on_team_deleted)
+        for task_observer in self._task_observers:
+            task_observer.register_callback(self._on_task_changed)
+        logger.info(f"Callbacks registered for {len(self._roots)} root(s)")
 
         # オブザーバーを開始
-        self._file_observer.start()
-        self._task_observer.start()
+        for file_observer in self._file_observers:
+            file_observer.start()
+        for task_observer in self._task_observers:
+            task_observer.start()
 
-        logger.info(f"Teams monitoring started. File observer running: {self._file_observer.is_running()}, Task observer running: {self._task_observer.is_running()}")
+        logger.info(f"Teams monitoring started: {[str(root.teams_dir) for root in self._roots]}")
 
     def stop_monitoring(self) -> None:
         """監視を停止します。"""
-        self._file_observer.stop()
-        self._task_observer.stop()
+        for file_observer in self._file_observers:
+            file_observer.stop()
+        for task_observer in self._task_observers:
+            task_observer.stop()
         self._thinking_polling_active = False
         logger.info("Teams monitoring stopped")
 
+    def reload(self) -> None:
+        """保持している全チームの状態を破棄し、ディスクから読み込み直します。
+
+        ipcイベントバックエンドのWebワーカーが、ingestプロセスへの再接続時に
+        切断中に失われたイベントの分を取り戻すために使用します。
+        """
+        for team_name in set(self._teams) | set(self._messages) | set(self._tasks):
+            self._forget_team(team_name)
+        self._load_existing_teams()
+        logger.info(f"Reloaded teams from disk: {len(self._teams)} team(s)")
+
     def is_running(self) -> bool:
         """監視中かどうかを返します。
 
         Returns:
             監視中ならTrue
         """
-        return self._file_observer.is_running()
+        return any(file_observer.is_running() for file_observer in self._file_observers)
 
     def get_teams(self) -> list[dict[str, Any]]:
         """チーム一覧を取得します。
@@ -124,17 +380,55 @@ class TeamsMonitor:
         """
         return [team.to_dict() for team in self._teams.values()]
 
-    def get_team_messages(self, team_name: str) -> list[dict[str, Any]]:
+    def get_team_messages(
+        self, team_name: str, include_history: bool = False
+    ) -> list[dict[str, Any]]:
         """チームのメッセージを取得します。
 
         Args:
             team_name: チーム名
+            include_history: 保持ポリシーで破棄された古いメッセージも
+                ディスク（inboxファイル）から読み込んで含めるかどうか
 
         Returns:
-            メッセージの辞書リスト
+            メッセージの辞書リスト（保持中のメッセージはタイムスタンプの昇順）
         """
-        messages = self._messages.get(team_name, [])
-        return [msg.to_dict() for msg in messages]
+        if include_history:
+            team_dir = self._root_for(team_name).teams_dir / team_name
+            return [msg.to_dict() for msg in load_team_messages(team_dir)]
+
+        return self.get_team_messages_page(team_name).items
+
+    def get_team_messages_page(
+        self,
+        team_name: str,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Page:
+        """保持中のチームメッセージをタイムスタンプ順インデックスから1ページ分取得します。
+
+        Args:
+            team_name: チーム名
+            limit: 最大件数（Noneの場合は全件）
+            before: このカーソルより古いメッセージのみを対象にする
+            after: このカーソルより新しいメッセージのみを対象にする
+            since: このタイムスタンプ以降のメッセージのみを対象にする
+            until: このタイムスタンプより前のメッセージのみを対象にする
+
+        Returns:
+            取得結果（メッセージはタイムスタンプの昇順）
+
+        Raises:
+            ValueError: カーソルの形式が不正な場合
+        """
+        with self._lock:
+            buffer = self._messages.get(team_name)
+            if buffer is None:
+                return Page()
+            return buffer.page(limit, before, after, since, until)
 
     def get_team_tasks(self, team_name: str) -> list[dict[str, Any]]:
         """チームのタスクを取得します。
@@ -145,8 +439,41 @@ class TeamsMonitor:
         Returns:
             タスクの辞書リスト
         """
-        tasks = self._tasks.get(team_name, [])
-        return [task.to_dict() for task in tasks]
+        tasks = self._tasks.get(team_name, {})
+        return [task.to_dict() for task in tasks.values()]
+
+    def get_team_status(self, team_name: str) -> dict[str, Any] | None:
+        """チームの状態を取得します。
+
+        config.jsonやタスクファイルを読み直さず、監視で保持しているチーム情報とタスクから
+        作成します（ヘルス状態は含みません）。
+
+        AgentTeamsManager.get_team_status（形式のバージョン1）とは異なり、メンバーは
+        TeamMember.to_dict()、タスクはTaskInfo.to_dict()の形式です（タスクIDはidではなくtaskId、
+        モデルにないキーは含みません）。ipcイベントバックエンドのWebワーカーも同じ形式で
+        応答できるよう、配信されるイベントと同じ正規化済みの形式を使用します。
+        応答のschemaVersionにはTEAM_STATUS_SCHEMA_VERSIONが入ります。
+
+        Args:
+            team_name: チーム名
+
+        Returns:
+            チーム状態の辞書（チームが存在しない場合はNone）
+        """
+        team = self._teams.get(team_name)
+        if team is None:
+            return None
+
+        team_dict = team.to_dict()
+        tasks = self.get_team_tasks(team_name)
+        return {
+            "schemaVersion": TEAM_STATUS_SCHEMA_VERSION,
+            "name": team_name,
+            "description": team_dict["description"],
+            "members": team_dict["members"],
+            "taskCount": len(tasks),
+            "tasks": tasks,
+        }
 
     def get_team_thinking(self, team_name: str) -> list[dict[str, Any]]:
         """チームの思考ログを取得します。
@@ -157,8 +484,35 @@ class TeamsMonitor:
         Returns:
             思考ログの辞書リスト
         """
-        logs = self._thinking_logs.get(team_name, [])
-        return [log.to_dict() for log in logs]
+        with self._lock:
+            logs = self._thinking_logs.get(team_name, [])
+            return [log.to_dict() for log in logs]
+
+    def get_version(self, collection: str, team_name: str | None = None) -> int:
+        """コレクションのバージョン番号を取得します。
+
+        内容が変わるたびに新しい番号になるため、応答キャッシュのキーに使用できます。
+        存在しないチームのメッセージ・タスクは0です。
+
+        Args:
+            collection: teams, messages, tasks のいずれか
+            team_name: チーム名（messages, tasksの場合）
+
+        Returns:
+            バージョン番号
+
+        Raises:
+            ValueError: 未知のコレクションの場合
+        """
+        if collection == "teams":
+            return self._teams_version
+        if collection == "messages":
+            with self._lock:
+                buffer = self._messages.get(team_name or "")
+                return buffer.current_version() if buffer is not None else 0
+        if collection == "tasks":
+            return self._task_versions.get(team_name or "", 0)
+        raise ValueError(f"Unknown collection: {collection}")
 
     def _on_team_created(self, team_name: str, path: Path) -> None:
         """チーム作成イベントを処理します。
@@ -169,9 +523,13 @@ class TeamsMonitor:
         """
         team_info = load_team_config(path)
         if team_info:
+            self._team_roots[team_name] = self._root_for_team_dir(path)
             self._teams[team_name] = team_info
-            self._messages[team_name] = load_team_messages(path)
-            self._tasks[team_name] = load_team_tasks(team_name)
+            messages = self._load_inboxes(team_name, path)
+            with self._lock:
+                self._messages[team_name] = self._new_message_buffer(team_name, messages)
+            self._load_tasks(team_name)
+            self._teams_version = next_version()
 
             self._broadcast(
                 {
@@ -189,14 +547,7 @@ class TeamsMonitor:
             team_name: チーム名
             _path: チームディレクトリパス
         """
-        if team_name in self._teams:
-            del self._teams[team_name]
-        if team_name in self._messages:
-            del self._messages[team_name]
-        if team_name in self._tasks:
-            del self._tasks[team_name]
-        if team_name in self._thinking_logs:
-            del self._thinking_logs[team_name]
+        self._forget_team(team_name)
 
         self._broadcast(
             {
@@ -206,6 +557,81 @@ class TeamsMonitor:
         )
         logger.info(f"Team deleted event processed: {team_name}")
 
+    def _forget_team(self, team_name: str) -> None:
+        """チームの状態を全て削除します。
+
+        Args:
+            team_name: チーム名
+        """
+        if team_name in self._teams:
+            del self._teams[team_name]
+        with self._lock:
+            self._messages.pop(team_name, None)
+            self._thinking_logs.pop(team_name, None)
+        if team_name in self._tasks:
+            del self._tasks[team_name]
+        self._task_files.pop(team_name, None)
+        self._task_versions.pop(team_name, None)
+        self._team_roots.pop(team_name, None)
+        self._inbox_cursors.pop(team_name, None)
+        self._teams_version = next_version()
+
+    def apply_event(self, event: dict[str, Any]) -> bool:
+        """他のプロセスのTeamsMonitorが配信したイベントを状態に反映します。
+
+        ipcイベントバックエンドのWebワーカーは自分ではファイルを監視せず、
+        ingestプロセスから受信したイベントでAPI用の状態を更新します。
+        反映したイベントは登録済みのコールバックに通知されます。
+
+        Args:
+            event: team_created, team_updated, team_deleted, team_message,
+                task_upserted, task_deleted のいずれかのイベント
+
+        Returns:
+            チームのイベントとして反映した場合True
+        """
+        event_type = event.get("type")
+        team_name = event.get("teamName")
+        if not isinstance(team_name, str) or not team_name:
+            return False
+
+        if event_type in ("team_created", "team_updated"):
+            is_new = team_name not in self._teams
+            self._teams[team_name] = TeamInfo.from_dict(event.get("team") or {})
+            self._teams_version = next_version()
+            if is_new:
+                # 作成時点のメッセージ・タスクはイベントに含まれないためディスクから読み込む
+                for root in self._roots:
+                    if (root.teams_dir / team_name).is_dir():
+                        self._team_roots[team_name] = root
+                        break
+                team_dir = self._root_for(team_name).teams_dir / team_name
+                messages = self._load_inboxes(team_name, team_dir)
+                with self._lock:
+                    self._messages[team_name] = self._new_message_buffer(team_name, messages)
+                self._load_tasks(team_name)
+        elif event_type == "team_deleted":
+            self._forget_team(team_name)
+        elif event_type == "team_message":
+            message = TeamMessage.from_dict(event.get("message") or {})
+            with self._lock:
+                if team_name in self._messages:
+                    self._messages[team_name].append(message)
+                else:
+                    self._messages[team_name] = self._new_message_buffer(team_name, [message])
+        elif event_type == "task_upserted":
+            task = TaskInfo.from_dict(event.get("task") or {})
+            self._tasks.setdefault(team_name, {})[task.task_id] = task
+            self._task_versions[team_name] = next_version()
+        elif event_type == "task_deleted":
+            self._tasks.get(team_name, {}).pop(event.get("taskId"), None)
+            self._task_versions[team_name] = next_version()
+        else:
+            return False
+
+        self._broadcast(event)
+        return True
+
     def _on_config_changed(self, team_name: str, path: Path) -> None:
         """config.json変更イベントを処理します。
 
@@ -218,6 +644,7 @@ class TeamsMonitor:
 
         if team_info:
             self._teams[team_name] = team_info
+            self._teams_version = next_version()
 
             self._broadcast(
                 {
@@ -231,50 +658,136 @@ class TeamsMonitor:
     def _on_inbox_changed(self, team_name: str, path: Path) -> None:
         """inbox変更イベントを処理します。
 
+        変更されたinboxファイルのみを読み込み、前回以降に追加された
+        メッセージを全てブロードキャストします。
+        取り込み済みのメッセージが書き換えられた場合は、チームのメッセージを読み直します。
+
         Args:
             team_name: チーム名
             path: inboxファイルパス
         """
         logger.info(f"Processing inbox changed for team: {team_name}, path: {path}")
-        team_dir = path.parent.parent
-        messages = load_team_messages(team_dir)
-        self._messages[team_name] = messages
+        cursors = self._inbox_cursors.setdefault(team_name, {})
+        cursor = cursors.get(path) or InboxCursor()
 
-        logger.info(f"Loaded {len(messages)} messages for team: {team_name}")
-
-        # 新しいメッセージのみを送信
-        if messages:
-            latest_message = messages[-1]
+        result = self._read_inbox(path, cursor)
+        if result is None:
+            logger.warning(f"Failed to read inbox: {path}")
+            return
+        new_messages, rewritten = result
+        cursors[path] = cursor
+
+        reloaded = None
+        if rewritten:
+            # inboxが書き換えられた・切り詰められた場合はチーム全体を読み直す
+            # (ディスクの読み込みはロックの外で行う)
+            logger.info(f"Inbox rewritten, reloading messages for team: {team_name}")
+            reloaded = self._load_inboxes(team_name, path.parent.parent)
+
+        with self._lock:
+            if reloaded is not None:
+                self._messages[team_name] = self._new_message_buffer(team_name, reloaded)
+            elif team_name in self._messages:
+                self._messages[team_name].extend(new_messages)
+            else:
+                self._messages[team_name] = self._new_message_buffer(team_name, new_messages)
+
+        logger.info(f"Ingested {len(new_messages)} new messages for team: {team_name}")
+
+        for message in new_messages:
             message_data = {
                 "type": "team_message",
                 "teamName": team_name,
-                "message": latest_message.to_dict(),
+                "message": message.to_dict(),
             }
-            logger.info(f"Broadcasting team_message: {message_data}")
+            logger.debug(f"Broadcasting team_message: {message_data}")
             self._broadcast(message_data)
-        else:
-            logger.warning(f"No messages found for team: {team_name}")
 
         logger.debug(f"Inbox changed: {team_name}")
 
-    def _on_task_changed(self, team_name: str, _path: Path) -> None:
+    def _on_task_changed(self, team_name: str, path: Path) -> None:
         """タスク変更イベントを処理します。
 
+        変更されたタスクファイルのみを読み込み、変更のあったタスクを
+        task_upserted / task_deleted として配信します（_broadcast_task_changeを参照）。
+
         Args:
             team_name: チーム名
-            _path: タスクファイルパス
+            path: タスクファイルパス
         """
-        tasks = load_team_tasks(team_name)
-        self._tasks[team_name] = tasks
+        tasks = self._tasks.setdefault(team_name, {})
+        task_files = self._task_files.setdefault(team_name, {})
 
+        if not path.exists():
+            self._on_task_deleted(team_name, path)
+            return
+
+        task = load_task_file(path)
+        if task is None:
+            # 書き込み途中などで読み込めない場合は次のイベントを待つ
+            return
+
+        # タスクIDが変わった場合は古いタスクを削除する
+        previous_id = task_files.get(path)
+        if previous_id is not None and previous_id != task.task_id:
+            self._on_task_deleted(team_name, path)
+
+        previous = tasks.get(task.task_id)
+        task_files[path] = task.task_id
+        if previous is not None and previous.to_dict() == task.to_dict():
+            return
+
+        tasks[task.task_id] = task
+        self._task_versions[team_name] = next_version()
+        self._broadcast_task_change(
+            {
+                "type": "task_upserted",
+                "teamName": team_name,
+                "task": task.to_dict(),
+            }
+        )
+        logger.debug(f"Task upserted: {team_name} - {task.task_id}")
+
+    def _on_task_deleted(self, team_name: str, path: Path) -> None:
+        """タスク削除を処理します。
+
+        Args:
+            team_name: チーム名
+            path: 削除されたタスクファイルパス
+        """
+        task_id = self._task_files.get(team_name, {}).pop(path, None)
+        if task_id is None:
+            return
+
+        self._tasks.get(team_name, {}).pop(task_id, None)
+        self._task_versions[team_name] = next_version()
+        self._broadcast_task_change(
+            {
+                "type": "task_deleted",
+                "teamName": team_name,
+                "taskId": task_id,
+            }
+        )
+        logger.debug(f"Task deleted: {team_name} - {task_id}")
+
+    def _broadcast_task_change(self, data: dict[str, Any]) -> None:
+        """タスクの差分イベントと、チームの全タスクのtasks_updatedを配信します。
+
+        同梱のビルド済みフロントエンド（templates/assets）はtasks_updatedのみを処理するため、
+        差分イベントに対応したビルドに置き換わるまでは両方を配信します。
+
+        Args:
+            data: task_upserted または task_deleted イベント
+        """
+        team_name = data["teamName"]
+        self._broadcast(data)
         self._broadcast(
             {
                 "type": "tasks_updated",
                 "teamName": team_name,
-                "tasks": [task.to_dict() for task in tasks],
+                "tasks": self.get_team_tasks(team_name),
             }
         )
-        logger.debug(f"Tasks changed: {team_name}")
 
     def _start_thinking_polling(self) -> None:
         """思考ログポーリングを開始します。
@@ -3,25 +3,31 @@
 このモジュールでは、Agent Teamsからの思考ログを収集・配信する機能を提供します。
 """
 
+import hashlib
 import json
 import logging
 import threading
-import time
+from collections import OrderedDict
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from watchdog.events import (
     DirCreatedEvent,
+    DirDeletedEvent,
     DirModifiedEvent,
     FileCreatedEvent,
+    FileDeletedEvent,
     FileModifiedEvent,
     FileSystemEventHandler,
 )
-from watchdog.observers import Observer
-from watchdog.observers.api import BaseObserver
+
+from orchestrator.web.debouncer import CoalescingDebouncer
+from orchestrator.web.retention import RetentionPolicy
+from orchestrator.web.time_index import IndexedRingBuffer, Page
+from orchestrator.web.watch_service import WatchService, get_watch_service
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +63,304 @@ class ThinkingLogEntry:
             "teamName": self.team_name,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ThinkingLogEntry":
+        """辞書からThinkingLogEntryを作成します。"""
+        return cls(
+            agent_name=data.get("agentName", ""),
+            content=data.get("content", ""),
+            timestamp=data.get("timestamp", ""),
+            category=data.get("category", "thinking"),
+            emotion=data.get("emotion", "neutral"),
+            team_name=data.get("teamName", ""),
+        )
+
+
+@dataclass
+class _TailState:
+    """ファイルごとの追従状態
+
+    Attributes:
+        offset: 読み込み済みのバイトオフセット
+        inode: ファイルのinode番号（ローテーション検出用）
+        own_lines: 自プロセスが書き込んだ未読行の開始オフセット
+    """
+
+    offset: int = 0
+    inode: int = 0
+    own_lines: set[int] = field(default_factory=set)
+
+
+class JsonlTailer:
+    """JSONLファイルの追記分のみを読み込むリーダー
+
+    ファイルごとに読み込み済みのバイトオフセットを記憶し、
+    変更イベントごとに追記されたバイトのみを読み込みます。
+    改行で終わっていない末尾の行は次回の読み込みに持ち越し、
+    ファイルの切り詰めやローテーション（inodeの変化）を検出した場合は
+    先頭から読み直します。
+
+    Attributes:
+        _states: ファイルパスごとの追従状態
+    """
+
+    def __init__(self) -> None:
+        """JsonlTailerを初期化します。"""
+        self._states: dict[Path, _TailState] = {}
+        self._lock = threading.Lock()
+
+    def read_new_lines(self, path: Path) -> list[dict[str, Any]]:
+        """前回以降に追記された行を読み込みます。
+
+        Args:
+            path: JSONLファイルのパス
+
+        Returns:
+            追記された行をパースした辞書のリスト（不正な行はスキップ）
+        """
+        with self._lock:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                self._states.pop(path, None)
+                return []
+
+            state = self._states.setdefault(path, _TailState())
+
+            if state.inode != stat.st_ino or stat.st_size < state.offset:
+                # ローテーションまたは切り詰め: 先頭から読み直す
+                if state.offset:
+                    logger.info(f"Log file rotated or truncated, re-reading: {path}")
+                state.offset = 0
+                state.inode = stat.st_ino
+                state.own_lines.clear()
+
+            if stat.st_size == state.offset:
+                return []
+
+            try:
+                with open(path, "rb") as f:
+                    f.seek(state.offset)
+                    chunk = f.read(stat.st_size - state.offset)
+            except FileNotFoundError:
+                self._states.pop(path, None)
+                return []
+
+            # 改行で終わっていない末尾の行は書き込み途中とみなして持ち越す
+            end = chunk.rfind(b"\n")
+            if end < 0:
+                return []
+            base = state.offset
+            state.offset += end + 1
+
+            return _parse_jsonl_lines(chunk[: end + 1], path, base, state.own_lines)
+
+    def read_tail(self, path: Path, max_bytes: int) -> list[dict[str, Any]]:
+        """ファイル末尾の最大max_bytes分のみを読み込み、追従を開始します。
+
+        起動時に巨大な履歴ファイル全体を読み込まないために使用します。
+        範囲の先頭で途切れた行は読み飛ばします。
+
+        Args:
+            path: JSONLファイルのパス
+            max_bytes: 読み込む最大バイト数
+
+        Returns:
+            パースした辞書のリスト（不正な行はスキップ）
+        """
+        with self._lock:
+            try:
+                stat = path.stat()
+                # 直前の1バイトも読み、範囲の先頭が行頭かどうかを判定する
+                start = max(0, stat.st_size - max_bytes - 1)
+                with open(path, "rb") as f:
+                    f.seek(start)
+                    chunk = f.read(stat.st_size - start)
+            except FileNotFoundError:
+                self._states.pop(path, None)
+                return []
+
+            if start > 0:
+                # 途中から読み始めた最初の行は不完全なので読み飛ばす
+                first = chunk.find(b"\n")
+                if first < 0:
+                    chunk = b""
+                    start = stat.st_size
+                else:
+                    chunk = chunk[first + 1 :]
+                    start += first + 1
+
+            end = chunk.rfind(b"\n")
+            state = _TailState(offset=start + end + 1, inode=stat.st_ino)
+            self._states[path] = state
+            if end < 0:
+                return []
+            return _parse_jsonl_lines(chunk[: end + 1], path, start)
+
+    def append_own_line(self, path: Path, line: bytes) -> None:
+        """自プロセスの行をファイルに追記し、読み込み済みとして記録します。
+
+        自分で書き込んだ行が変更イベント経由で再度読み込まれないようにします。
+        他プロセスの未読の追記が残っている場合は、自分の行の開始オフセットを
+        記録して読み込み時にスキップします。
+
+        Args:
+            path: JSONLファイルのパス
+            line: 改行で終わる1行分のバイト列
+        """
+        with self._lock:
+            with open(path, "ab", buffering=0) as f:
+                # O_APPENDの書き込みはファイル末尾への移動と書き込みが不可分なため、
+                # 他プロセスの追記と競合しないよう書き込み後の位置から開始オフセットを求める
+                written = f.write(line)
+                start = f.tell() - written
+                while written < len(line):
+                    written += f.write(line[written:])
+
+            stat = path.stat()
+            state = self._states.setdefault(path, _TailState())
+            if state.inode != stat.st_ino:
+                state.offset = 0
+                state.inode = stat.st_ino
+                state.own_lines.clear()
+
+            if state.offset == start:
+                state.offset = start + len(line)
+            else:
+                state.own_lines.add(start)
+
+    def forget(self, path: Path) -> None:
+        """ファイルの追従状態を破棄します。
+
+        Args:
+            path: JSONLファイルのパス
+        """
+        with self._lock:
+            self._states.pop(path, None)
+
+    def get_offset(self, path: Path) -> int:
+        """読み込み済みのバイトオフセットを取得します。
+
+        Args:
+            path: JSONLファイルのパス
+
+        Returns:
+            バイトオフセット（未追従の場合は0）
+        """
+        with self._lock:
+            state = self._states.get(path)
+            return state.offset if state else 0
+
+
+def _parse_jsonl_lines(
+    chunk: bytes,
+    path: Path,
+    base_offset: int = 0,
+    skip_offsets: set[int] | None = None,
+) -> list[dict[str, Any]]:
+    """JSONLのバイト列をパースします。
+
+    Args:
+        chunk: 改行区切りのバイト列
+        path: ログ出力用のファイルパス
+        base_offset: chunkの先頭のファイル内オフセット
+        skip_offsets: スキップする行の開始オフセット（該当した行は集合から取り除く）
+
+    Returns:
+        パースした辞書のリスト（不正な行はスキップ）
+    """
+    records: list[dict[str, Any]] = []
+    line_offset = base_offset
+    for line in chunk.split(b"\n"):
+        start = line_offset
+        line_offset += len(line) + 1
+        if skip_offsets and start in skip_offsets:
+            skip_offsets.discard(start)
+            continue
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            logger.warning(f"Skipping invalid log line in {path}: {e}")
+            continue
+        if isinstance(data, dict):
+            records.append(data)
+    return records
+
+
+# 思考ログのセカンダリインデックス（フィルタ名 -> 属性値の取得関数）
+THINKING_LOG_FACETS: dict[str, Callable[[ThinkingLogEntry], str]] = {
+    "agent": lambda entry: entry.agent_name,
+    "category": lambda entry: entry.category,
+    "emotion": lambda entry: entry.emotion,
+}
+
+
+def _estimate_entry_size(entry: ThinkingLogEntry) -> int:
+    """保持ポリシー用に思考ログのサイズを見積もります。
+
+    Args:
+        entry: 思考ログエントリ
+
+    Returns:
+        見積もりバイト数
+    """
+    return len(entry.content.encode("utf-8"))
+
+
+def content_hash(content: str) -> bytes:
+    """重複判定用の安定したコンテンツハッシュを計算します。
+
+    Args:
+        content: 思考ログの内容
+
+    Returns:
+        16バイトのハッシュ値
+    """
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+class _DedupIndex:
+    """容量上限付きの重複判定インデックス
+
+    コンテンツハッシュを挿入順に保持し、容量を超えた場合は
+    最も古いハッシュから破棄します。
+
+    Attributes:
+        _capacity: 保持するハッシュの最大数
+        _keys: 挿入順のハッシュ集合
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """_DedupIndexを初期化します。
+
+        Args:
+            capacity: 保持するハッシュの最大数
+        """
+        self._capacity = capacity
+        self._keys: OrderedDict[bytes, None] = OrderedDict()
+
+    def add(self, key: bytes) -> bool:
+        """ハッシュを追加します。
+
+        Args:
+            key: コンテンツハッシュ
+
+        Returns:
+            新規の場合True、既に存在する場合False
+        """
+        if key in self._keys:
+            return False
+
+        self._keys[key] = None
+        if len(self._keys) > self._capacity:
+            self._keys.popitem(last=False)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
 
 class ThinkingLogHandler:
     """思考ログハンドラー
@@ -64,26 +368,50 @@ class ThinkingLogHandler:
     Agent Teamsから送信される思考ログを収集・配信します。
 
     Attributes:
-        _logs: チームごとの思考ログ
+        _logs: チームごとの思考ログ（タイムスタンプ順・エージェント/カテゴリ/感情別のインデックス付き）
         _callbacks: 更新コールバックのリスト
-        _observer: watchdog Observerインスタンス
+        _watch_service: ファイル監視サービス
+        _handler: 監視サービスに登録中のイベントハンドラー
         _log_dir: ログディレクトリ
+        _tailer: ログファイルの追記分リーダー
+        _dedup: チームごとの重複判定インデックス
+        _retention: デフォルトの保持ポリシー
+        _team_retention: チームごとの保持ポリシー
     """
 
-    def __init__(self, log_dir: Path | str | None = None):
+    def __init__(
+        self,
+        log_dir: Path | str | None = None,
+        dedup_capacity: int = 10000,
+        retention: RetentionPolicy | None = None,
+        startup_window_bytes: int = 4 * 1024 * 1024,
+        watch_service: WatchService | None = None,
+    ):
         """ThinkingLogHandlerを初期化します。
 
         Args:
             log_dir: ログディレクトリ（指定しない場合はデフォルトを使用）
+            dedup_capacity: チームごとに重複判定に保持するハッシュの最大数
+            retention: メモリ上に保持する思考ログのデフォルト保持ポリシー
+            startup_window_bytes: 起動時に各ログファイルの末尾から読み込む最大バイト数
+            watch_service: ファイル監視サービス（指定しない場合は共有インスタンス）
         """
         if log_dir is None:
             log_dir = Path.home() / ".claude" / "thinking-logs"
 
-        self._logs: dict[str, list[ThinkingLogEntry]] = {}
+        self._logs: dict[str, IndexedRingBuffer[ThinkingLogEntry]] = {}
         self._callbacks: list[Callable[[dict[str, Any]], None]] = []
-        self._observer: BaseObserver | None = None
+        self._watch_service = watch_service or get_watch_service()
+        self._handler: _ThinkingLogEventHandler | None = None
+        self._debouncer: CoalescingDebouncer | None = None
         self._log_dir = Path(log_dir)
         self._lock = threading.Lock()
+        self._tailer = JsonlTailer()
+        self._dedup_capacity = dedup_capacity
+        self._dedup: dict[str, _DedupIndex] = {}
+        self._retention = retention or RetentionPolicy()
+        self._team_retention: dict[str, RetentionPolicy] = {}
+        self._startup_window_bytes = startup_window_bytes
 
         # ログディレクトリを作成
         self._log_dir.mkdir(parents=True, exist_ok=True)
@@ -96,26 +424,60 @@ class ThinkingLogHandler:
         if not self._log_dir.exists():
             return
 
+        # 各ファイルの末尾のみを読み込み、古い履歴はget_logs(include_history=True)で遅延読み込みする。
+        # 追従オフセットも進めておき、起動後の変更イベントで全体を読み直さないようにする
         for log_file in self._log_dir.glob("*.jsonl"):
-            try:
-                with open(log_file, encoding="utf-8") as f:
-                    for line in f:
-                        if line.strip():
-                            data = json.loads(line)
-                            entry = ThinkingLogEntry(
-                                agent_name=data.get("agentName", ""),
-                                content=data.get("content", ""),
-                                timestamp=data.get("timestamp", ""),
-                                category=data.get("category", "thinking"),
-                                emotion=data.get("emotion", "neutral"),
-                                team_name=data.get("teamName", ""),
-                            )
-                            team_name = entry.team_name or "default"
-                            if team_name not in self._logs:
-                                self._logs[team_name] = []
-                            self._logs[team_name].append(entry)
-            except (FileNotFoundError, json.JSONDecodeError) as e:
-                logger.warning(f"Failed to load log file {log_file}: {e}")
+            for data in self._tailer.read_tail(log_file, self._startup_window_bytes):
+                entry = ThinkingLogEntry.from_dict(data)
+                team_name = entry.team_name or "default"
+                if not self._get_dedup_index(team_name).add(content_hash(entry.content)):
+                    continue
+                self._get_log_buffer(team_name).append(entry)
+
+    def reload(self) -> None:
+        """メモリ上の思考ログを破棄し、ログファイルの末尾から読み込み直します。
+
+        ipcイベントバックエンドのWebワーカーが、ingestプロセスへの再接続時に
+        切断中に失われたログを取り戻すために使用します。
+        """
+        with self._lock:
+            self._logs = {}
+            self._dedup = {}
+            self._load_existing_logs()
+
+    def set_team_retention(self, team_name: str, policy: RetentionPolicy) -> None:
+        """チームごとの保持ポリシーを設定します。
+
+        Args:
+            team_name: チーム名
+            policy: 保持ポリシー
+        """
+        with self._lock:
+            self._team_retention[team_name] = policy
+            if team_name in self._logs:
+                self._logs[team_name].set_policy(policy)
+
+    def _get_log_buffer(self, team_name: str) -> IndexedRingBuffer[ThinkingLogEntry]:
+        """チームの思考ログバッファを取得します（存在しない場合は作成）。
+
+        Args:
+            team_name: チーム名
+
+        Returns:
+            思考ログのインデックス付きリングバッファ
+        """
+        buffer = self._logs.get(team_name)
+        if buffer is None:
+            policy = self._team_retention.get(team_name, self._retention)
+            buffer = IndexedRingBuffer(
+                lambda entry: entry.timestamp,
+                ThinkingLogEntry.to_dict,
+                policy,
+                _estimate_entry_size,
+                facets=THINKING_LOG_FACETS,
+            )
+            self._logs[team_name] = buffer
+        return buffer
 
     def register_callback(self, callback: Callable[[dict[str, Any]], None]) -> None:
         """更新コールバックを登録します。
@@ -128,24 +490,25 @@ class ThinkingLogHandler:
 
     def start_monitoring(self) -> None:
         """ログ監視を開始します。"""
-        if self._observer is not None:
+        if self._handler is not None:
             logger.warning("Thinking log observer is already running")
             return
 
-        handler = _ThinkingLogEventHandler(self._on_log_entry)
-        self._observer = Observer()
-        self._observer.schedule(handler, str(self._log_dir), recursive=True)
-        self._observer.start()
+        self._debouncer = CoalescingDebouncer()
+        self._handler = _ThinkingLogEventHandler(self._on_log_entry, self._tailer, self._debouncer)
+        self._watch_service.add_route(self._log_dir, self._handler)
         logger.info(f"Thinking log monitoring started: {self._log_dir}")
 
     def stop_monitoring(self) -> None:
         """ログ監視を停止します。"""
-        if self._observer is None:
+        if self._handler is None:
             return
 
-        self._observer.stop()
-        self._observer.join()
-        self._observer = None
+        self._watch_service.remove_route(self._log_dir, self._handler)
+        self._handler = None
+        if self._debouncer is not None:
+            self._debouncer.close()
+            self._debouncer = None
         logger.info("Thinking log monitoring stopped")
 
     def is_running(self) -> bool:
@@ -154,39 +517,135 @@ class ThinkingLogHandler:
         Returns:
             監視中ならTrue
         """
-        return self._observer is not None and self._observer.is_alive()
+        return self._handler is not None and self._watch_service.is_running()
 
-    def get_logs(self, team_name: str) -> list[dict[str, Any]]:
+    def get_logs(self, team_name: str, include_history: bool = False) -> list[dict[str, Any]]:
         """チームの思考ログを取得します。
 
+        Args:
+            team_name: チーム名
+            include_history: 保持ポリシーで破棄された古いログも
+                ディスク（JSONLファイル）から読み込んで含めるかどうか
+
+        Returns:
+            思考ログの辞書リスト（保持中のログはタイムスタンプの昇順）
+        """
+        if include_history:
+            return [entry.to_dict() for entry in self._read_history(team_name)]
+
+        return self.get_logs_page(team_name).items
+
+    def get_logs_page(
+        self,
+        team_name: str,
+        agent: str | None = None,
+        category: str | None = None,
+        emotion: str | None = None,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Page:
+        """保持中の思考ログをインデックスから1ページ分取得します。
+
+        エージェント・カテゴリ・感情の条件はセカンダリインデックスで絞り込むため、
+        全件を走査しません（複数の条件を指定した場合は、最も件数の少ない条件のログのみを走査します）。
+
+        Args:
+            team_name: チーム名
+            agent: エージェント名でフィルタ
+            category: カテゴリでフィルタ
+            emotion: 感情タイプでフィルタ
+            limit: 最大件数（Noneの場合は全件）
+            before: このカーソルより古いログのみを対象にする
+            after: このカーソルより新しいログのみを対象にする
+            since: このタイムスタンプ以降のログのみを対象にする
+            until: このタイムスタンプより前のログのみを対象にする
+
+        Returns:
+            取得結果（ログはタイムスタンプの昇順）
+
+        Raises:
+            ValueError: カーソルの形式が不正な場合
+        """
+        filters = {
+            name: value
+            for name, value in (("agent", agent), ("category", category), ("emotion", emotion))
+            if value
+        }
+        with self._lock:
+            buffer = self._logs.get(team_name)
+            if buffer is None:
+                return Page()
+            return buffer.page(limit, before, after, since, until, filters)
+
+    def get_version(self, team_name: str) -> int:
+        """チームの思考ログのバージョン番号を取得します。
+
+        ログが追加・破棄されるたびに新しい番号になるため、応答キャッシュのキーに使用できます。
+
         Args:
             team_name: チーム名
 
         Returns:
-            思考ログの辞書リスト
+            バージョン番号（ログのないチームは0）
         """
-        logs = self._logs.get(team_name, [])
-        return [log.to_dict() for log in logs]
+        with self._lock:
+            buffer = self._logs.get(team_name)
+            return buffer.current_version() if buffer is not None else 0
+
+    def _read_history(self, team_name: str) -> list[ThinkingLogEntry]:
+        """チームの思考ログをディスクから全て読み込みます。
 
-    def add_log(self, entry: ThinkingLogEntry) -> None:
+        Args:
+            team_name: チーム名
+
+        Returns:
+            重複を除いた思考ログエントリのリスト
+        """
+        entries: list[ThinkingLogEntry] = []
+        seen: set[bytes] = set()
+
+        for log_file in sorted(self._log_dir.glob("*.jsonl")):
+            try:
+                with open(log_file, "rb") as f:
+                    records = _parse_jsonl_lines(f.read(), log_file)
+            except OSError as e:
+                logger.warning(f"Failed to read log history {log_file}: {e}")
+                continue
+
+            for data in records:
+                entry = ThinkingLogEntry.from_dict(data)
+                if (entry.team_name or "default") != team_name:
+                    continue
+                key = content_hash(entry.content)
+                if key in seen:
+                    continue
+                seen.add(key)
+                entries.append(entry)
+
+        return entries
+
+    def add_log(self, entry: ThinkingLogEntry, persist: bool = True) -> None:
         """思考ログを追加します。
 
         Args:
             entry: 思考ログエントリ
+            persist: ログファイルに書き込むかどうか（ファイルから読み込んだエントリはFalse）
         """
         team_name = entry.team_name or "default"
+        # ハッシュ計算はロックの外で行う
+        key = content_hash(entry.content)
 
         with self._lock:
-            if team_name not in self._logs:
-                self._logs[team_name] = []
-
             # 重複チェック
-            existing_contents = {log.content for log in self._logs[team_name]}
-            if entry.content not in existing_contents:
-                self._logs[team_name].append(entry)
+            if self._get_dedup_index(team_name).add(key):
+                self._get_log_buffer(team_name).append(entry)
 
                 # ログファイルに書き込み
-                self._write_log_to_file(entry)
+                if persist:
+                    self._write_log_to_file(entry)
 
                 # コールバックを呼び出し
                 for callback in self._callbacks:
@@ -201,6 +660,21 @@ class ThinkingLogHandler:
                     except Exception as e:
                         logger.error(f"Thinking log callback error: {e}")
 
+    def _get_dedup_index(self, team_name: str) -> _DedupIndex:
+        """チームの重複判定インデックスを取得します（存在しない場合は作成）。
+
+        Args:
+            team_name: チーム名
+
+        Returns:
+            重複判定インデックス
+        """
+        index = self._dedup.get(team_name)
+        if index is None:
+            index = _DedupIndex(self._dedup_capacity)
+            self._dedup[team_name] = index
+        return index
+
     def _write_log_to_file(self, entry: ThinkingLogEntry) -> None:
         """ログをファイルに書き込みます。
 
@@ -209,20 +683,23 @@ class ThinkingLogHandler:
         """
         team_name = entry.team_name or "default"
         log_file = self._log_dir / f"{team_name}.jsonl"
+        line = json.dumps(entry.to_dict(), ensure_ascii=False) + "\n"
 
         try:
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n")
+            # 自分の書き込みで監視イベントが再読み込みを起こさないよう、追従位置も進める
+            self._tailer.append_own_line(log_file, line.encode("utf-8"))
         except OSError as e:
             logger.error(f"Failed to write log to file: {e}")
 
     def _on_log_entry(self, entry: ThinkingLogEntry) -> None:
-        """ログエントリを処理します。
+        """ログファイルから読み込んだエントリを処理します。
+
+        既にファイル上にあるエントリなので、書き戻しは行いません。
 
         Args:
             entry: 思考ログエントリ
         """
-        self.add_log(entry)
+        self.add_log(entry, persist=False)
 
 
 class _ThinkingLogEventHandler(FileSystemEventHandler):
@@ -230,28 +707,52 @@ class _ThinkingLogEventHandler(FileSystemEventHandler):
 
     Attributes:
         _on_log_entry: ログエントリコールバック
+        _tailer: ログファイルの追記分リーダー
+        _debouncer: ファイルイベントのデバウンサー
     """
 
-    def __init__(self, on_log_entry: Callable[[ThinkingLogEntry], None]):
+    def __init__(
+        self,
+        on_log_entry: Callable[[ThinkingLogEntry], None],
+        tailer: JsonlTailer | None = None,
+        debouncer: CoalescingDebouncer | None = None,
+    ):
         """イベントハンドラーを初期化します。
 
         Args:
             on_log_entry: ログエントリコールバック
+            tailer: ログファイルの追記分リーダー（指定しない場合は新規作成）
+            debouncer: ファイルイベントのデバウンサー（指定しない場合は新規作成）
         """
         super().__init__()
         self._on_log_entry = on_log_entry
-        self._last_event_time: dict[str, float] = {}
-        self._debounce_interval = 0.5
+        self._tailer = tailer or JsonlTailer()
+        self._debouncer = debouncer or CoalescingDebouncer()
 
     def on_created(self, event: FileCreatedEvent | DirCreatedEvent) -> None:
         """ファイル作成イベントを処理します。"""
         if not event.is_directory:
-            self._handle_log_file(str(event.src_path))
+            self._schedule_log_file(str(event.src_path))
 
     def on_modified(self, event: FileModifiedEvent | DirModifiedEvent) -> None:
         """ファイル変更イベントを処理します。"""
         if not event.is_directory:
-            self._handle_log_file(str(event.src_path))
+            self._schedule_log_file(str(event.src_path))
+
+    def on_deleted(self, event: FileDeletedEvent | DirDeletedEvent) -> None:
+        """ファイル削除イベントを処理します。"""
+        if not event.is_directory:
+            self._tailer.forget(Path(str(event.src_path)))
+
+    def _schedule_log_file(self, file_path: str) -> None:
+        """ログファイルの処理をデバウンサーに登録します。
+
+        Args:
+            file_path: ファイルパス
+        """
+        if not file_path.endswith(".jsonl"):
+            return
+        self._debouncer.submit(file_path, lambda: self._handle_log_file(file_path))
 
     def _handle_log_file(self, file_path: str) -> None:
         """ログファイルを処理します。
@@ -264,32 +765,15 @@ class _ThinkingLogEventHandler(FileSystemEventHandler):
         if not path.name.endswith(".jsonl"):
             return
 
-        # デバウンス処理
-        current_time = time.time()
-        last_time = self._last_event_time.get(file_path, 0)
-
-        if current_time - last_time < self._debounce_interval:
-            return
-
-        self._last_event_time[file_path] = current_time
-
-        # 新しいエントリを読み込み
+        # 追記されたエントリのみを読み込み
         try:
-            with open(path, encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        data = json.loads(line)
-                        entry = ThinkingLogEntry(
-                            agent_name=data.get("agentName", ""),
-                            content=data.get("content", ""),
-                            timestamp=data.get("timestamp", ""),
-                            category=data.get("category", "thinking"),
-                            emotion=data.get("emotion", "neutral"),
-                            team_name=data.get("teamName", ""),
-                        )
-                        self._on_log_entry(entry)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            records = self._tailer.read_new_lines(path)
+        except OSError as e:
             logger.error(f"Failed to read log file {path}: {e}")
+            return
+
+        for data in records:
+            self._on_log_entry(ThinkingLogEntry.from_dict(data))
 
 
 # シングルトンインスタンス
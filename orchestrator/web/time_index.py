@@ -0,0 +1,461 @@
+"""タイムスタンプ順インデックスモジュール
+
+このモジュールでは、メッセージや思考ログをタイムスタンプ順に保持し、
+カーソル・時間範囲によるページ取得を行うためのクラスを提供します。
+
+- TimeIndex: (タイムスタンプ, 追加番号) でソートされたキーと、変換済みの辞書を保持するインデックス
+  （エージェント名などの属性値ごとのセカンダリインデックスも保持できます）
+- IndexedRingBuffer: 保持ポリシーで破棄されたエントリをインデックスからも取り除くリングバッファ
+- Page: ページ取得の結果
+
+タイムスタンプはISO 8601形式の文字列として比較します（同じ形式であれば文字列順が時刻順になります）。
+同じタイムスタンプのエントリは追加順に並びます。
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from orchestrator.web.retention import RetentionPolicy, RingBuffer
+from orchestrator.web.versions import next_version
+
+T = TypeVar("T")
+
+# インデックスのキー（タイムスタンプ, 追加番号）
+IndexKey = tuple[str, int]
+
+
+def encode_cursor(key: IndexKey) -> str:
+    """インデックスのキーをカーソル文字列に変換します。
+
+    Args:
+        key: インデックスのキー
+
+    Returns:
+        カーソル文字列（"追加番号:タイムスタンプ"）
+    """
+    timestamp, seq = key
+    return f"{seq}:{timestamp}"
+
+
+def decode_cursor(cursor: str) -> IndexKey:
+    """カーソル文字列をインデックスのキーに変換します。
+
+    Args:
+        cursor: encode_cursorで作成したカーソル文字列
+
+    Returns:
+        インデックスのキー
+
+    Raises:
+        ValueError: カーソルの形式が不正な場合
+    """
+    seq, sep, timestamp = cursor.partition(":")
+    if not sep or not seq.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return timestamp, int(seq)
+
+
+@dataclass(frozen=True)
+class Page:
+    """ページ取得の結果
+
+    Attributes:
+        items: タイムスタンプの昇順に並んだエントリの辞書
+        has_more: 取得方向（afterを指定した場合は新しい側、それ以外は古い側）に
+            まだエントリがあるかどうか
+        before: 先頭のエントリのカーソル（より古いページの取得に使用）
+        after: 末尾のエントリのカーソル（より新しいページの取得に使用）
+        total: 条件に一致するエントリ数（limitの適用前）。
+            複数のフィルタを組み合わせた場合は数えないためNone
+    """
+
+    items: list[dict[str, Any]] = field(default_factory=list)
+    has_more: bool = False
+    before: str | None = None
+    after: str | None = None
+    total: int | None = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """辞書に変換します（itemsは含みません）。"""
+        return {
+            "hasMore": self.has_more,
+            "before": self.before,
+            "after": self.after,
+            "total": self.total,
+        }
+
+
+class TimeIndex(Generic[T]):
+    """タイムスタンプ順のインデックス
+
+    エントリは追加時に一度だけ辞書に変換され、ページ取得では変換済みの辞書を返します
+    （返される辞書は共有されるため、呼び出し側で変更しないでください）。
+    ページの位置は二分探索で求めるため、取得コストは保持件数ではなくページサイズに比例します。
+
+    facetsを指定すると、属性値ごとにソート済みのキーを保持するセカンダリインデックスを
+    追加時に更新します。フィルタ付きの取得では、最も件数の少ない属性値のキーだけを走査します。
+
+    Attributes:
+        _timestamp_of: エントリのタイムスタンプの取得関数
+        _to_dict: エントリの辞書への変換関数
+        _facet_of: 属性名ごとの属性値の取得関数
+        _keys: ソート済みのキー
+        _values: キーごとの（エントリ, 変換済みの辞書）
+        _facets: 属性名 -> 属性値 -> ソート済みのキー
+        _next_seq: 次に割り当てる追加番号
+    """
+
+    def __init__(
+        self,
+        timestamp_of: Callable[[T], str],
+        to_dict: Callable[[T], dict[str, Any]],
+        facets: Mapping[str, Callable[[T], str]] | None = None,
+    ) -> None:
+        """TimeIndexを初期化します。
+
+        Args:
+            timestamp_of: エントリのタイムスタンプの取得関数
+            to_dict: エントリの辞書への変換関数
+            facets: セカンダリインデックスを作成する属性名と属性値の取得関数
+        """
+        self._timestamp_of = timestamp_of
+        self._to_dict = to_dict
+        self._facet_of = dict(facets or {})
+        self._keys: list[IndexKey] = []
+        self._values: dict[IndexKey, tuple[T, dict[str, Any]]] = {}
+        self._facets: dict[str, dict[str, list[IndexKey]]] = {name: {} for name in self._facet_of}
+        self._next_seq = 0
+
+    def add(self, item: T) -> IndexKey:
+        """エントリを追加します。
+
+        Args:
+            item: 追加するエントリ
+
+        Returns:
+            エントリのキー
+        """
+        key = (self._timestamp_of(item) or "", self._next_seq)
+        self._next_seq += 1
+        _insert(self._keys, key)
+        for name, value_of in self._facet_of.items():
+            _insert(self._facets[name].setdefault(value_of(item), []), key)
+        self._values[key] = (item, self._to_dict(item))
+        return key
+
+    def remove(self, key: IndexKey) -> None:
+        """エントリを削除します。
+
+        Args:
+            key: addで返されたキー
+        """
+        value = self._values.pop(key, None)
+        if value is None:
+            return
+        _delete(self._keys, key)
+        for name, value_of in self._facet_of.items():
+            facet_value = value_of(value[0])
+            keys = self._facets[name].get(facet_value)
+            if keys is None:
+                continue
+            _delete(keys, key)
+            if not keys:
+                del self._facets[name][facet_value]
+
+    def clear(self) -> None:
+        """全エントリを削除します。"""
+        self._keys.clear()
+        self._values.clear()
+        for facet in self._facets.values():
+            facet.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def items(self) -> list[dict[str, Any]]:
+        """全エントリの辞書をタイムスタンプの昇順で取得します。
+
+        Returns:
+            変換済みの辞書のリスト
+        """
+        return [self._values[key][1] for key in self._keys]
+
+    def page(
+        self,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        filters: Mapping[str, str] | None = None,
+    ) -> Page:
+        """条件に一致するエントリを1ページ分取得します。
+
+        beforeを指定した場合（または何も指定しない場合）は条件に一致する新しい側から、
+        afterのみを指定した場合は古い側からlimit件を取得します。
+
+        Args:
+            limit: 最大件数（Noneの場合は全件）
+            before: このカーソルより古いエントリのみを対象にする
+            after: このカーソルより新しいエントリのみを対象にする
+            since: このタイムスタンプ以降のエントリのみを対象にする
+            until: このタイムスタンプより前のエントリのみを対象にする
+            filters: 属性名 -> 属性値の条件（全て一致するエントリのみを対象にする）
+
+        Returns:
+            取得結果
+
+        Raises:
+            ValueError: カーソルの形式が不正な場合、またはセカンダリインデックスのない属性名の場合
+        """
+        keys, residual = self._candidates(filters or {})
+        lo, hi = _range(keys, before, after, since, until)
+        forward = after is not None and before is None
+        if residual:
+            return self._scan(keys, lo, hi, limit, forward, residual)
+
+        start, end = lo, hi
+        has_more = False
+        if limit is not None:
+            if forward:
+                end = min(hi, lo + limit)
+                has_more = end < hi
+            else:
+                start = max(lo, hi - limit)
+                has_more = start > lo
+        return self._page(keys[start:end], has_more, total=hi - lo)
+
+    def _candidates(self, filters: Mapping[str, str]) -> tuple[list[IndexKey], dict[str, str]]:
+        """走査するキーのリストと、走査中に判定する残りの条件を求めます。
+
+        Args:
+            filters: 属性名 -> 属性値の条件
+
+        Returns:
+            （最も件数の少ない属性値のキー, 残りの条件）。条件がない場合は全キー
+
+        Raises:
+            ValueError: セカンダリインデックスのない属性名の場合
+        """
+        if not filters:
+            return self._keys, {}
+
+        unknown = [name for name in filters if name not in self._facets]
+        if unknown:
+            raise ValueError(f"Unknown filter: {', '.join(unknown)}")
+
+        name = min(filters, key=lambda n: len(self._facets[n].get(filters[n], ())))
+        keys = self._facets[name].get(filters[name], [])
+        return keys, {n: v for n, v in filters.items() if n != name}
+
+    def _scan(
+        self,
+        keys: list[IndexKey],
+        lo: int,
+        hi: int,
+        limit: int | None,
+        forward: bool,
+        residual: Mapping[str, str],
+    ) -> Page:
+        """残りの条件を判定しながらキーを走査し、1ページ分取得します。
+
+        Args:
+            keys: 走査するソート済みのキー
+            lo: 走査範囲の開始位置
+            hi: 走査範囲の終了位置
+            limit: 最大件数（Noneの場合は全件）
+            forward: 古い側から取得するかどうか
+            residual: 属性名 -> 属性値の残りの条件
+
+        Returns:
+            取得結果（totalはNone）
+        """
+        positions = range(lo, hi) if forward else range(hi - 1, lo - 1, -1)
+        matched: list[IndexKey] = []
+        has_more = False
+        for position in positions:
+            key = keys[position]
+            item = self._values[key][0]
+            if any(self._facet_of[n](item) != v for n, v in residual.items()):
+                continue
+            if limit is not None and len(matched) >= limit:
+                has_more = True
+                break
+            matched.append(key)
+        if not forward:
+            matched.reverse()
+        return self._page(matched, has_more, total=None)
+
+    def _page(self, keys: list[IndexKey], has_more: bool, total: int | None) -> Page:
+        """キーのリストからページを作成します。
+
+        Args:
+            keys: ページに含めるソート済みのキー
+            has_more: 取得方向にまだエントリがあるかどうか
+            total: 条件に一致するエントリ数
+
+        Returns:
+            取得結果
+        """
+        return Page(
+            items=[self._values[key][1] for key in keys],
+            has_more=has_more,
+            before=encode_cursor(keys[0]) if keys else None,
+            after=encode_cursor(keys[-1]) if keys else None,
+            total=total,
+        )
+
+
+def _insert(keys: list[IndexKey], key: IndexKey) -> None:
+    """ソート済みのキーのリストにキーを挿入します。
+
+    Args:
+        keys: ソート済みのキー
+        key: 挿入するキー
+    """
+    if not keys or keys[-1] < key:
+        # 多くの場合は最新のエントリなので末尾に追加するだけで済む
+        keys.append(key)
+    else:
+        insort(keys, key)
+
+
+def _delete(keys: list[IndexKey], key: IndexKey) -> None:
+    """ソート済みのキーのリストからキーを削除します。
+
+    Args:
+        keys: ソート済みのキー
+        key: 削除するキー
+    """
+    index = bisect_left(keys, key)
+    if index < len(keys) and keys[index] == key:
+        del keys[index]
+
+
+def _range(
+    keys: list[IndexKey],
+    before: str | None,
+    after: str | None,
+    since: str | None,
+    until: str | None,
+) -> tuple[int, int]:
+    """カーソル・時間範囲の条件に一致するキーの範囲を求めます。
+
+    Args:
+        keys: ソート済みのキー
+        before: このカーソルより古いエントリのみを対象にする
+        after: このカーソルより新しいエントリのみを対象にする
+        since: このタイムスタンプ以降のエントリのみを対象にする
+        until: このタイムスタンプより前のエントリのみを対象にする
+
+    Returns:
+        keysの（開始位置, 終了位置）
+
+    Raises:
+        ValueError: カーソルの形式が不正な場合
+    """
+    lo, hi = 0, len(keys)
+    if since is not None:
+        lo = max(lo, bisect_left(keys, (since,)))
+    if until is not None:
+        hi = min(hi, bisect_left(keys, (until,)))
+    if after is not None:
+        lo = max(lo, bisect_right(keys, decode_cursor(after)))
+    if before is not None:
+        hi = min(hi, bisect_left(keys, decode_cursor(before)))
+    return lo, max(lo, hi)
+
+
+class IndexedRingBuffer(RingBuffer[T]):
+    """タイムスタンプ順インデックス付きのリングバッファ
+
+    RingBufferと同じく追加順に保持ポリシーを適用し、
+    破棄したエントリはインデックスからも取り除きます。
+
+    Attributes:
+        index: タイムスタンプ順インデックス
+        version: 内容のバージョン番号（追加・破棄のたびに新しい番号になる）
+        _arrival_keys: 追加順のインデックスのキー（破棄時に対応するキーを求める）
+    """
+
+    def __init__(
+        self,
+        timestamp_of: Callable[[T], str],
+        to_dict: Callable[[T], dict[str, Any]],
+        policy: RetentionPolicy | None = None,
+        size_of: Callable[[T], int] | None = None,
+        items: Iterable[T] = (),
+        facets: Mapping[str, Callable[[T], str]] | None = None,
+    ) -> None:
+        """IndexedRingBufferを初期化します。
+
+        Args:
+            timestamp_of: エントリのタイムスタンプの取得関数
+            to_dict: エントリの辞書への変換関数
+            policy: 保持ポリシー（指定しない場合はデフォルト）
+            size_of: エントリサイズの見積もり関数（max_bytes使用時に必要）
+            items: 初期エントリ
+            facets: セカンダリインデックスを作成する属性名と属性値の取得関数
+        """
+        self.index: TimeIndex[T] = TimeIndex(timestamp_of, to_dict, facets)
+        self.version = next_version()
+        self._arrival_keys: deque[IndexKey] = deque()
+        super().__init__(policy, size_of)
+        self.extend(items)
+
+    def append(self, item: T) -> None:
+        """エントリを追加します。
+
+        Args:
+            item: 追加するエントリ
+        """
+        self._arrival_keys.append(self.index.add(item))
+        self.version = next_version()
+        super().append(item)
+
+    def clear(self) -> None:
+        """全エントリを破棄します（破棄数には含めません）。"""
+        super().clear()
+        self.index.clear()
+        self._arrival_keys.clear()
+        self.version = next_version()
+
+    def current_version(self) -> int:
+        """保持期間を過ぎたエントリを破棄してから、バージョン番号を返します。
+
+        Returns:
+            現在の内容のバージョン番号
+        """
+        self.expire()
+        return self.version
+
+    def page(
+        self,
+        limit: int | None = None,
+        before: str | None = None,
+        after: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        filters: Mapping[str, str] | None = None,
+    ) -> Page:
+        """保持期間を過ぎたエントリを破棄してから、1ページ分取得します。
+
+        引数はTimeIndex.pageと同じです。
+
+        Returns:
+            取得結果
+
+        Raises:
+            ValueError: カーソルの形式が不正な場合、またはセカンダリインデックスのない属性名の場合
+        """
+        self.expire()
+        return self.index.page(limit, before, after, since, until, filters)
+
+    def _pop_oldest(self) -> None:
+        """最も古いエントリを破棄し、インデックスからも取り除きます。"""
+        super()._pop_oldest()
+        self.index.remove(self._arrival_keys.popleft())
+        self.version = next_version()
@@ -0,0 +1,32 @@
+"""バージョン番号モジュール
+
+このモジュールでは、チームごとのコレクション（チーム一覧・メッセージ・タスク・思考ログ）の
+変更を表すバージョン番号を発行します。
+
+バージョン番号はプロセス全体で単調増加するため、コレクションが作り直された場合でも
+以前と同じ番号が再び使われることはありません。応答キャッシュのキーや、
+スナップショットAPIの差分取得（since）に使用します。
+
+バージョン番号はプロセスごとに独立しているため、別のプロセス（ワーカー）や
+再起動後のプロセスで発行された番号と比較しないよう、VERSION_EPOCHを併せて使用します。
+"""
+
+import itertools
+import secrets
+
+# プロセス全体で共有するバージョン番号のカウンター（0は「まだ存在しない」を表す）
+_counter = itertools.count(1)
+
+# このプロセスのバージョン番号の識別子
+VERSION_EPOCH = secrets.token_hex(8)
+
+
+def next_version() -> int:
+    """新しいバージョン番号を発行します。
+
+    itertools.countのnextはGILの下でアトミックなため、監視スレッドからも呼び出せます。
+
+    Returns:
+        これまでに発行したどの番号よりも大きいバージョン番号
+    """
+    return next(_counter)
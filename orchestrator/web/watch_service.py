@@ -0,0 +1,333 @@
+"""ファイル監視サービスモジュール
+
+このモジュールでは、チーム・タスク・思考ログの各ディレクトリを
+単一のwatchdog Observerで監視するWatchServiceクラスを提供します。
+
+各監視対象はパスのプレフィックスとイベントハンドラーの組（ルート）として登録され、
+Observerから受け取ったイベントはプレフィックスが一致するハンドラーにのみ配送されます。
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver, ObservedWatch
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(path: Path | str) -> str:
+    """ルーティング用にパスを正規化します。
+
+    Args:
+        path: パス
+
+    Returns:
+        絶対パスの文字列（末尾の区切り文字なし）
+    """
+    return os.path.normpath(os.path.abspath(str(path)))
+
+
+def _is_under(path: str, prefix: str) -> bool:
+    """pathがprefix以下にあるかどうかを判定します。
+
+    Args:
+        path: 判定するパス
+        prefix: プレフィックス
+
+    Returns:
+        prefix自身またはその配下ならTrue
+    """
+    return path == prefix or path.startswith(prefix.rstrip(os.sep) + os.sep)
+
+
+class _RoutingEventHandler(FileSystemEventHandler):
+    """ルーティングテーブルに従ってイベントを配送するハンドラー
+
+    Attributes:
+        _service: 監視サービス
+    """
+
+    def __init__(self, service: "WatchService"):
+        """ルーティングハンドラーを初期化します。
+
+        Args:
+            service: 監視サービス
+        """
+        super().__init__()
+        self._service = service
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """イベントを該当するハンドラーに配送します。
+
+        Args:
+            event: ファイルシステムイベント
+        """
+        self._service._route(event)
+
+
+class _PendingDirectoryHandler(FileSystemEventHandler):
+    """未作成の監視ディレクトリの作成を待つハンドラー
+
+    存在する最も近い祖先ディレクトリを非再帰で監視し、配下にディレクトリが
+    作成・移動された場合に監視サービスに再スケジュールを要求します。
+    イベントはルートには配送しません。
+
+    Attributes:
+        _service: 監視サービス
+    """
+
+    def __init__(self, service: "WatchService"):
+        """ハンドラーを初期化します。
+
+        Args:
+            service: 監視サービス
+        """
+        super().__init__()
+        self._service = service
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """ディレクトリの作成を処理します。
+
+        Args:
+            event: ファイルシステムイベント
+        """
+        if event.is_directory:
+            self._service._retry_pending()
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """ディレクトリの移動を処理します。
+
+        Args:
+            event: ファイルシステムイベント
+        """
+        if event.is_directory:
+            self._service._retry_pending()
+
+
+def _nearest_existing_ancestor(path: str) -> str:
+    """存在する最も近い祖先ディレクトリを返します。
+
+    Args:
+        path: 正規化済みのパス
+
+    Returns:
+        祖先ディレクトリの正規化パス
+    """
+    parent = os.path.dirname(path)
+    while parent != path and not os.path.isdir(parent):
+        path, parent = parent, os.path.dirname(parent)
+    return parent
+
+
+class WatchService:
+    """プロセス共通のファイル監視サービス
+
+    登録されたルートの監視ディレクトリを単一のObserverにスケジュールします。
+    既に監視中のディレクトリ配下のルートには新しいwatchを追加しないため、
+    スレッド数・inotifyのwatch数と重複したイベント配送を抑えられます。
+
+    まだ存在しないディレクトリのルートは、存在する最も近い祖先ディレクトリを非再帰で監視し、
+    ディレクトリが作成された時点で監視を開始します（作成からwatchの追加までの間に
+    配下に書き込まれたファイルのイベントは届きません）。
+
+    Attributes:
+        _routes: ルーティングテーブル（正規化パス -> ハンドラーのリスト）
+        _watches: スケジュール済みのwatch（正規化パス -> ObservedWatch）
+        _pending: ディレクトリの作成待ちのルート（正規化パス -> 監視中の祖先ディレクトリ）
+        _ancestor_watches: 作成待ちのための祖先ディレクトリのwatch（正規化パス -> ObservedWatch）
+        _observer: watchdog Observerインスタンス
+        _router: ルーティングハンドラー
+        _pending_handler: 祖先ディレクトリのイベントハンドラー
+        _dispatched: 配送したイベント数
+    """
+
+    def __init__(self) -> None:
+        """WatchServiceを初期化します。"""
+        self._routes: dict[str, list[FileSystemEventHandler]] = {}
+        self._watches: dict[str, ObservedWatch] = {}
+        self._pending: dict[str, str] = {}
+        self._ancestor_watches: dict[str, ObservedWatch] = {}
+        self._observer: BaseObserver | None = None
+        self._router = _RoutingEventHandler(self)
+        self._pending_handler = _PendingDirectoryHandler(self)
+        self._lock = threading.RLock()
+        self._dispatched = 0
+
+    def add_route(self, path: Path | str, handler: FileSystemEventHandler) -> None:
+        """ルートを登録し、必要であれば監視を開始します。
+
+        Args:
+            path: 監視するディレクトリ（配下のイベントがhandlerに配送されます）
+            handler: イベントハンドラー
+        """
+        prefix = _normalize(path)
+        with self._lock:
+            handlers = self._routes.setdefault(prefix, [])
+            if handler not in handlers:
+                handlers.append(handler)
+
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.start()
+                logger.info("Watch service started")
+            self._reschedule()
+        logger.info(f"Watch route added: {prefix}")
+
+    def remove_route(self, path: Path | str, handler: FileSystemEventHandler) -> None:
+        """ルートの登録を解除します。
+
+        ルートがなくなった場合はObserverを停止します。
+
+        Args:
+            path: 登録時のディレクトリ
+            handler: 登録時のイベントハンドラー
+        """
+        prefix = _normalize(path)
+        observer: BaseObserver | None = None
+        with self._lock:
+            handlers = self._routes.get(prefix, [])
+            if handler in handlers:
+                handlers.remove(handler)
+            if not handlers:
+                self._routes.pop(prefix, None)
+
+            if self._routes:
+                self._reschedule()
+            else:
+                observer = self._observer
+                self._observer = None
+                self._watches.clear()
+                self._pending.clear()
+                self._ancestor_watches.clear()
+
+        if observer is not None:
+            observer.stop()
+            observer.join()
+            logger.info("Watch service stopped")
+
+    def is_running(self) -> bool:
+        """監視中かどうかを返します。
+
+        Returns:
+            Observerが動作中ならTrue
+        """
+        with self._lock:
+            return self._observer is not None and self._observer.is_alive()
+
+    def get_stats(self) -> dict[str, Any]:
+        """監視状況の統計情報を取得します。
+
+        Returns:
+            統計情報の辞書
+        """
+        with self._lock:
+            queue_depth = self._observer.event_queue.qsize() if self._observer is not None else 0
+            return {
+                "running": self._observer is not None and self._observer.is_alive(),
+                "routes": sum(len(handlers) for handlers in self._routes.values()),
+                "watches": len(self._watches),
+                "watchedPaths": sorted(self._watches),
+                "pendingPaths": sorted(self._pending),
+                "queueDepth": queue_depth,
+                "dispatched": self._dispatched,
+            }
+
+    def _reschedule(self) -> None:
+        """ルートに合わせて監視ディレクトリを再スケジュールします（ロック内で呼び出し）。
+
+        他のルートの配下にあるディレクトリは上位のwatchでまとめて監視します。
+        存在しないディレクトリは、作成を検出できるよう最も近い祖先ディレクトリを監視します。
+        """
+        assert self._observer is not None
+
+        roots = [
+            prefix
+            for prefix in self._routes
+            if not any(other != prefix and _is_under(prefix, other) for other in self._routes)
+        ]
+
+        for prefix in list(self._watches):
+            if prefix not in roots:
+                self._observer.unschedule(self._watches.pop(prefix))
+
+        pending: dict[str, str] = {}
+        for prefix in roots:
+            if prefix in self._watches:
+                continue
+            if not os.path.isdir(prefix):
+                pending[prefix] = _nearest_existing_ancestor(prefix)
+                if self._pending.get(prefix) != pending[prefix]:
+                    logger.warning(
+                        f"Watch directory does not exist, waiting for it under {pending[prefix]}: {prefix}"
+                    )
+                continue
+            self._watches[prefix] = self._observer.schedule(self._router, prefix, recursive=True)
+            if prefix in self._pending:
+                logger.info(f"Watch directory created, watching: {prefix}")
+        self._pending = pending
+
+        ancestors = set(pending.values())
+        for ancestor in list(self._ancestor_watches):
+            if ancestor not in ancestors:
+                self._observer.unschedule(self._ancestor_watches.pop(ancestor))
+        for ancestor in ancestors:
+            if ancestor not in self._ancestor_watches:
+                self._ancestor_watches[ancestor] = self._observer.schedule(
+                    self._pending_handler, ancestor, recursive=False
+                )
+
+    def _retry_pending(self) -> None:
+        """作成待ちのディレクトリの監視を再試行します（祖先ディレクトリの変更時に呼び出し）。"""
+        with self._lock:
+            if self._observer is not None and self._pending:
+                self._reschedule()
+
+    def _route(self, event: FileSystemEvent) -> None:
+        """イベントをプレフィックスが一致するハンドラーに配送します。
+
+        Args:
+            event: ファイルシステムイベント
+        """
+        paths = [os.fsdecode(event.src_path)]
+        dest_path = getattr(event, "dest_path", "")
+        if dest_path:
+            paths.append(os.fsdecode(dest_path))
+
+        with self._lock:
+            targets = [
+                handler
+                for prefix, handlers in self._routes.items()
+                if any(_is_under(path, prefix) for path in paths)
+                for handler in handlers
+            ]
+            self._dispatched += 1
+
+        for handler in targets:
+            try:
+                handler.dispatch(event)
+            except Exception as e:
+                logger.error(f"Watch handler error for {event.src_path}: {e}")
+
+
+# シングルトンインスタンス
+_watch_service: WatchService | None = None
+_service_lock = threading.Lock()
+
+
+def get_watch_service() -> WatchService:
+    """ファイル監視サービスのシングルトンインスタンスを取得します。
+
+    Returns:
+        WatchServiceインスタンス
+    """
+    global _watch_service
+
+    with _service_lock:
+        if _watch_service is None:
+            _watch_service = WatchService()
+        return _watch_service
@@ -0,0 +1,138 @@
+"""WebSocketブロードキャストのベンチマーク
+
+接続数ごとに、ブロードキャスト1回あたりのCPU時間を計測します。
+
+- per-client: 接続ごとにsend_json（= 接続ごとにjson.dumps）する従来方式
+- encode-once: WebSocketManager.broadcast（一度だけエンコードして全接続に同じテキストを送信）
+
+使い方:
+    python scripts/benchmark_broadcast.py
+    python scripts/benchmark_broadcast.py --clients 1 10 50 100 --iterations 200
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from orchestrator.web.encoding import json_encoder_name
+from orchestrator.web.message_handler import WebSocketManager
+
+
+class _NullWebSocket:
+    """送信内容を破棄するWebSocket
+
+    send_jsonはStarletteと同様にjson.dumpsでエンコードしてから破棄します。
+    """
+
+    client = "benchmark"
+
+    async def accept(self) -> None:
+        """接続を受け入れます。"""
+
+    async def send_text(self, _data: str) -> None:
+        """テキストを破棄します。"""
+
+    async def send_json(self, data: Any) -> None:
+        """JSONにエンコードしてから破棄します。"""
+        json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    async def close(self, code: int = 1000) -> None:
+        """接続を閉じます。"""
+
+
+def _sample_message(index: int) -> dict[str, Any]:
+    """思考ログ相当のサンプルメッセージを作成します。
+
+    Args:
+        index: メッセージ番号
+
+    Returns:
+        サンプルメッセージ
+    """
+    return {
+        "type": "thinking_log",
+        "data": {
+            "teamName": "benchmark-team",
+            "agentName": f"agent-{index % 5}",
+            "content": "タスクを分析しています。" * 20,
+            "logType": "thinking",
+            "timestamp": "2026-01-01T00:00:00Z",
+            "index": index,
+        },
+    }
+
+
+async def _bench_per_client(clients: int, iterations: int) -> float:
+    """接続ごとにエンコードする従来方式を計測します。
+
+    Args:
+        clients: 接続数
+        iterations: ブロードキャスト回数
+
+    Returns:
+        ブロードキャスト1回あたりの時間（マイクロ秒）
+    """
+    websockets = [_NullWebSocket() for _ in range(clients)]
+    start = time.perf_counter()
+    for i in range(iterations):
+        message = _sample_message(i)
+        for websocket in websockets:
+            await websocket.send_json(message)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def _bench_encode_once(clients: int, iterations: int) -> float:
+    """WebSocketManager.broadcastを計測します（送信完了まで含む）。
+
+    Args:
+        clients: 接続数
+        iterations: ブロードキャスト回数
+
+    Returns:
+        ブロードキャスト1回あたりの時間（マイクロ秒）
+    """
+    manager = WebSocketManager(queue_size=iterations + 1)
+    for _ in range(clients):
+        await manager.connect(_NullWebSocket())  # type: ignore[arg-type]
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        await manager.broadcast(_sample_message(i))
+    while manager.get_stats()["queued"]:
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    await manager.close_all()
+    return elapsed / iterations * 1_000_000
+
+
+async def _main(client_counts: list[int], iterations: int) -> None:
+    """ベンチマークを実行して結果を表示します。
+
+    Args:
+        client_counts: 計測する接続数のリスト
+        iterations: ブロードキャスト回数
+    """
+    print(f"encoder: {json_encoder_name()}, iterations: {iterations}")
+    print(f"{'clients':>8} {'per-client (us)':>16} {'encode-once (us)':>17} {'speedup':>8}")
+    for clients in client_counts:
+        per_client = await _bench_per_client(clients, iterations)
+        encode_once = await _bench_encode_once(clients, iterations)
+        print(
+            f"{clients:>8} {per_client:>16.1f} {encode_once:>17.1f} {per_client / encode_once:>7.2f}x"
+        )
+
+
+def main() -> None:
+    """コマンドライン引数を解析してベンチマークを実行します。"""
+    parser = argparse.ArgumentParser(description="WebSocketブロードキャストのベンチマーク")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 50, 100], help="接続数")
+    parser.add_argument("--iterations", type=int, default=500, help="ブロードキャスト回数")
+    args = parser.parse_args()
+    asyncio.run(_main(args.clients, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
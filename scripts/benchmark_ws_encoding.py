@@ -0,0 +1,171 @@
+"""WebSocketエンコーディングのベンチマーク
+
+思考ログ・チームメッセージ相当のイベントについて、1イベントあたりの送信バイト数を計測します。
+
+- json: JSONテキスト（従来方式）
+- msgpack: キー辞書付きのMessagePack（capabilities=msgpack）
+- +deflate: permessage-deflate（コンテキスト引き継ぎあり、ブラウザとuvicornのデフォルト）で圧縮
+- batch: batchフレームにまとめた場合（capabilities=batch）
+
+使い方:
+    python scripts/benchmark_ws_encoding.py
+    python scripts/benchmark_ws_encoding.py --events 1000 --batch-size 16
+"""
+
+import argparse
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+from orchestrator.web.encoding import (
+    encode_json,
+    encode_msgpack,
+    encode_msgpack_batch,
+    msgpack_available,
+)
+
+# permessage-deflateは各メッセージの末尾の 00 00 ff ff を取り除いて送信する
+_DEFLATE_TRAILER = b"\x00\x00\xff\xff"
+
+
+def _sample_events(count: int) -> list[dict[str, Any]]:
+    """思考ログとチームメッセージを交互に含むサンプルイベントを作成します。
+
+    Args:
+        count: イベント数
+
+    Returns:
+        シーケンス番号付きのイベントのリスト
+    """
+    events: list[dict[str, Any]] = []
+    for i in range(count):
+        if i % 2 == 0:
+            event: dict[str, Any] = {
+                "type": "thinking_log",
+                "data": {
+                    "teamName": "benchmark-team",
+                    "agentName": f"agent-{i % 5}",
+                    "content": f"タスク{i}の依存関係を確認しています。Checking dependencies for task {i}.",
+                    "category": "thinking",
+                    "emotion": "neutral",
+                    "timestamp": f"2026-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}Z",
+                },
+            }
+        else:
+            event = {
+                "type": "team_message",
+                "teamName": "benchmark-team",
+                "message": {
+                    "id": f"msg-{i}",
+                    "sender": f"agent-{i % 5}",
+                    "recipient": "team-lead",
+                    "content": f"タスク{i}が完了しました。Task {i} is done.",
+                    "timestamp": f"2026-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}Z",
+                    "read": False,
+                },
+            }
+        event["seq"] = i + 1
+        events.append(event)
+    return events
+
+
+def _deflated_sizes(frames: list[bytes]) -> list[int]:
+    """permessage-deflate（コンテキスト引き継ぎあり）で圧縮したサイズを求めます。
+
+    Args:
+        frames: 送信するフレームのリスト
+
+    Returns:
+        フレームごとの圧縮後のサイズ
+    """
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    sizes = []
+    for frame in frames:
+        data = compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        sizes.append(len(data) - len(_DEFLATE_TRAILER))
+    return sizes
+
+
+def _batched(frames: list[Any], batch_size: int) -> list[list[Any]]:
+    """フレームをbatch_size件ずつに分割します。
+
+    Args:
+        frames: フレームのリスト
+        batch_size: 1バッチのフレーム数
+
+    Returns:
+        バッチのリスト
+    """
+    return [frames[i : i + batch_size] for i in range(0, len(frames), batch_size)]
+
+
+def _json_batch(texts: list[str]) -> bytes:
+    """JSONテキストをbatchフレームにまとめます（WebSocketManagerと同じ形式）。
+
+    Args:
+        texts: エンコード済みのJSONテキストのリスト
+
+    Returns:
+        UTF-8のbatchフレーム
+    """
+    return ('{"type":"batch","events":[' + ",".join(texts) + "]}").encode("utf-8")
+
+
+def _report(name: str, frames: list[bytes], events: int, baseline: float | None) -> float:
+    """1イベントあたりのバイト数を表示します。
+
+    Args:
+        name: エンコーディング名
+        frames: 送信するフレームのリスト
+        events: イベント数
+        baseline: 比較対象の1イベントあたりのバイト数
+
+    Returns:
+        1イベントあたりのバイト数
+    """
+    raw = sum(len(frame) for frame in frames) / events
+    deflated = sum(_deflated_sizes(frames)) / events
+    ratio = f"{raw / baseline:>7.0%}" if baseline else f"{'-':>7}"
+    print(f"{name:<16} {raw:>10.1f} {ratio} {deflated:>15.1f} {deflated / (baseline or raw):>7.0%}")
+    return raw
+
+
+def main() -> None:
+    """コマンドライン引数を解析してベンチマークを実行します。"""
+    parser = argparse.ArgumentParser(description="WebSocketエンコーディングのベンチマーク")
+    parser.add_argument("--events", type=int, default=500, help="イベント数")
+    parser.add_argument("--batch-size", type=int, default=16, help="1バッチのイベント数")
+    args = parser.parse_args()
+
+    events = _sample_events(args.events)
+    texts = [encode_json(event) for event in events]
+    json_frames = [text.encode("utf-8") for text in texts]
+
+    encodings: list[tuple[str, Callable[[], list[bytes]]]] = [
+        ("json", lambda: json_frames),
+        ("json batch", lambda: [_json_batch(batch) for batch in _batched(texts, args.batch_size)]),
+    ]
+    if msgpack_available():
+        packed = [encode_msgpack(event) for event in events]
+        encodings += [
+            ("msgpack", lambda: packed),
+            (
+                "msgpack batch",
+                lambda: [
+                    encode_msgpack_batch(batch) for batch in _batched(packed, args.batch_size)
+                ],
+            ),
+        ]
+    else:
+        print("msgpackがインストールされていないため、msgpackの計測をスキップします")
+
+    print(f"events: {args.events}, batch size: {args.batch_size} (bytes/event)")
+    print(f"{'encoding':<16} {'raw':>10} {'vs json':>7} {'+deflate':>15} {'vs json':>7}")
+    baseline = None
+    for name, build in encodings:
+        raw = _report(name, build(), args.events, baseline)
+        baseline = baseline or raw
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from typer.testing import CliRunner
 from orchestrator.cli.main import (
     app,
 )
+from orchestrator.web.time_index import Page
 
 runner = CliRunner()
 
@@ -110,7 +111,7 @@ class TestTeamMessages:
     def test_team_messages_empty(self, mock_monitor_class):
         """メッセージがない場合"""
         mock_monitor = MagicMock()
-        mock_monitor.get_team_messages.return_value = []
+        mock_monitor.get_team_messages_page.return_value = Page()
         mock_monitor_class.return_value = mock_monitor
 
         result = runner.invoke(app, ["team-messages", "test-team"])
@@ -131,16 +132,20 @@ class TestTeamMessages:
                 "timestamp": "2026-02-06T12:00:00Z",
                 "type": "info",
             }
-            for i in range(10)
+            for i in range(5, 10)
         ]
-        mock_monitor.get_team_messages.return_value = messages
+        mock_monitor.get_team_messages_page.return_value = Page(items=messages, has_more=True)
         mock_monitor_class.return_value = mock_monitor
 
         result = runner.invoke(app, ["team-messages", "test-team", "--limit", "5"])
 
         assert result.exit_code == 0
-        # 5件に制限されていることを確認
-        mock_monitor.get_team_messages.assert_called_once_with("test-team")
+        # 全件を取得せず、インデックスから5件だけ取得することを確認
+        mock_monitor.get_team_messages.assert_not_called()
+        mock_monitor.get_team_messages_page.assert_called_once_with(
+            "test-team", limit=5, since=None, until=None
+        )
+        assert "5件" in result.stdout
 
 
 class TestTeamTasks:
@@ -180,7 +185,7 @@ class TestShowLogs:
     def test_show_logs_empty(self, mock_handler_factory):
         """思考ログがない場合"""
         mock_handler = MagicMock()
-        mock_handler.get_logs.return_value = []
+        mock_handler.get_logs_page.return_value = Page()
         mock_handler_factory.return_value = mock_handler
 
         result = runner.invoke(app, ["show-logs", "test-team"])
@@ -192,15 +197,17 @@ class TestShowLogs:
     def test_show_logs_with_data(self, mock_handler_factory):
         """思考ログがある場合"""
         mock_handler = MagicMock()
-        mock_handler.get_logs.return_value = [
-            {
-                "agentName": "agent1",
-                "content": "テスト思考ログ",
-                "timestamp": "2026-02-06T12:00:00Z",
-                "category": "thinking",
-                "emotion": "neutral",
-            }
-        ]
+        mock_handler.get_logs_page.return_value = Page(
+            items=[
+                {
+                    "agentName": "agent1",
+                    "content": "テスト思考ログ",
+                    "timestamp": "2026-02-06T12:00:00Z",
+                    "category": "thinking",
+                    "emotion": "neutral",
+                }
+            ]
+        )
         mock_handler_factory.return_value = mock_handler
 
         result = runner.invoke(app, ["show-logs", "test-team"])
@@ -213,40 +220,42 @@ class TestShowLogs:
     def test_show_logs_with_agent_filter(self, mock_handler_factory):
         """エージェントフィルタあり"""
         mock_handler = MagicMock()
-        mock_handler.get_logs.return_value = [
-            {
-                "agentName": "agent1",
-                "content": "ログ1",
-                "timestamp": "2026-02-06T12:00:00Z",
-                "category": "thinking",
-            },
-            {
-                "agentName": "agent2",
-                "content": "ログ2",
-                "timestamp": "2026-02-06T12:01:00Z",
-                "category": "thinking",
-            },
-        ]
+        mock_handler.get_logs_page.return_value = Page(
+            items=[
+                {
+                    "agentName": "agent1",
+                    "content": "ログ1",
+                    "timestamp": "2026-02-06T12:00:00Z",
+                    "category": "thinking",
+                },
+            ]
+        )
         mock_handler_factory.return_value = mock_handler
 
         result = runner.invoke(app, ["show-logs", "test-team", "--agent", "agent1"])
 
         assert result.exit_code == 0
-        # フィルタが適用されることを確認（get_logsは全て返すが、コマンド側でフィルタ）
-        mock_handler.get_logs.assert_called_once_with("test-team")
+        # 全件を取得せず、インデックス上でフィルタすることを確認
+        mock_handler.get_logs.assert_not_called()
+        mock_handler.get_logs_page.assert_called_once_with(
+            "test-team", agent="agent1", category=None, limit=20
+        )
+        assert "ログ1" in result.stdout
 
     @patch("orchestrator.cli.main.get_thinking_log_handler")
     def test_show_logs_json(self, mock_handler_factory):
         """JSON形式で出力"""
         mock_handler = MagicMock()
-        mock_handler.get_logs.return_value = [
-            {
-                "agentName": "agent1",
-                "content": "ログ",
-                "timestamp": "2026-02-06T12:00:00Z",
-                "category": "thinking",
-            }
-        ]
+        mock_handler.get_logs_page.return_value = Page(
+            items=[
+                {
+                    "agentName": "agent1",
+                    "content": "ログ",
+                    "timestamp": "2026-02-06T12:00:00Z",
+                    "category": "thinking",
+                }
+            ]
+        )
         mock_handler_factory.return_value = mock_handler
 
         result = runner.invoke(app, ["show-logs", "test-team", "--json"])
@@ -120,6 +120,18 @@ class TestAgentHealthMonitor:
         assert len(status["test-team"]) == 2
         assert len(status["other-team"]) == 1
 
+    def test_get_team_health(self) -> None:
+        """1つのチームのヘルス状態取得テスト"""
+        monitor = AgentHealthMonitor()
+
+        monitor.register_agent("test-team", "agent1", 300.0)
+        monitor.register_agent("other-team", "agent2", 300.0)
+
+        health = monitor.get_team_health("test-team")
+        assert list(health) == ["agent1"]
+        assert health["agent1"]["isHealthy"] is True
+        assert monitor.get_team_health("unknown-team") == {}
+
     def test_update_activity(self) -> None:
         """アクティビティ更新テスト"""
         monitor = AgentHealthMonitor()
@@ -16,6 +16,7 @@ from fastapi.testclient import TestClient
 from fastapi.websockets import WebSocket
 
 from orchestrator.web.dashboard import app
+from orchestrator.web.encoding import encode_json
 from orchestrator.web.message_handler import WebSocketManager, WebSocketMessageHandler
 
 # ============================================================================
@@ -434,9 +435,9 @@ class TestVDB002_WebSocket:
         await manager.broadcast(message)
 
         # 全ての接続に送信されることを確認
-        ws1.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
-        ws3.send_json.assert_called_once_with(message)
+        ws1.send_text.assert_called_once_with(encode_json({**message, "seq": 1}))
+        ws2.send_text.assert_called_once_with(encode_json({**message, "seq": 1}))
+        ws3.send_text.assert_called_once_with(encode_json({**message, "seq": 1}))
 
     @pytest.mark.asyncio
     async def test_websocket_personal_message(self):
@@ -541,8 +542,8 @@ class TestVDB002_WebSocket:
         await manager.broadcast(update_message)
 
         # 全接続に送信されることを確認
-        ws1.send_json.assert_called_once_with(update_message)
-        ws2.send_json.assert_called_once_with(update_message)
+        ws1.send_text.assert_called_once_with(encode_json({**update_message, "seq": 1}))
+        ws2.send_text.assert_called_once_with(encode_json({**update_message, "seq": 1}))
 
     @pytest.mark.asyncio
     async def test_websocket_thinking_log_broadcast(self):
@@ -568,7 +569,7 @@ class TestVDB002_WebSocket:
 
         await manager.broadcast(log_message)
 
-        ws.send_json.assert_called_once_with(log_message)
+        ws.send_text.assert_called_once_with(encode_json({**log_message, "seq": 1}))
 
 
 # ============================================================================
@@ -603,7 +604,7 @@ class TestDashboardIntegration:
         await manager.broadcast(update_data)
 
         # WebSocketにメッセージが送信されたことを確認
-        ws.send_json.assert_called_once_with(update_data)
+        ws.send_text.assert_called_once_with(encode_json({**update_data, "seq": 1}))
 
     @pytest.mark.asyncio
     async def test_thinking_log_broadcasts_to_websocket(self):
@@ -629,4 +630,4 @@ class TestDashboardIntegration:
         await manager.broadcast(log_data)
 
         # WebSocketにメッセージが送信されたことを確認
-        ws.send_json.assert_called_once_with(log_data)
+        ws.send_text.assert_called_once_with(encode_json({**log_data, "seq": 1}))
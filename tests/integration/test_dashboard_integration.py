@@ -13,6 +13,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from orchestrator.web.dashboard import app
+from orchestrator.web.encoding import encode_json
 from orchestrator.web.message_handler import WebSocketManager
 
 
@@ -143,8 +144,8 @@ class TestWebSocketIntegration:
         message = {"type": "teams_update", "data": {"teams": []}}
         await manager.broadcast(message)
 
-        ws1.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
+        ws1.send_text.assert_called_once_with(encode_json({**message, "seq": 1}))
+        ws2.send_text.assert_called_once_with(encode_json({**message, "seq": 1}))
 
     @pytest.mark.asyncio
     async def test_websocket_disconnect_handling(self):
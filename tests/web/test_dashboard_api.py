@@ -229,6 +229,271 @@ class TestTeamsEndpoints:
         assert "error" in data
 
 
+class TestResponseCacheEndpoints:
+    """チームAPIの応答キャッシュとETagのテスト"""
+
+    @pytest.fixture
+    def monitor(self, tmp_path, monkeypatch):
+        """応答キャッシュとTeamsMonitorを設定したダッシュボードの状態"""
+        from orchestrator.web.dashboard import _global_state
+        from orchestrator.web.response_cache import ResponseCache
+        from orchestrator.web.team_models import TeamsRoot
+        from orchestrator.web.teams_monitor import TeamsMonitor
+
+        teams_monitor = TeamsMonitor(roots=TeamsRoot.from_base(tmp_path))
+        teams_monitor.apply_event(
+            {"type": "team_created", "teamName": "team-a", "team": {"name": "team-a"}}
+        )
+        monkeypatch.setattr(_global_state, "teams_monitor", teams_monitor)
+        monkeypatch.setattr(_global_state, "response_cache", ResponseCache())
+        return teams_monitor
+
+    def test_not_modified(self, monitor, client):
+        """If-None-MatchがETagに一致する場合は304を返すテスト"""
+        response = client.get("/api/teams")
+        etag = response.headers["etag"]
+
+        cached = client.get("/api/teams", headers={"If-None-Match": etag})
+
+        assert response.json()["teams"][0]["name"] == "team-a"
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+    def test_etag_changes_on_update(self, monitor, client):
+        """タスクが変更されるとETagが変わり、新しい内容を返すテスト"""
+        etag = client.get("/api/teams/team-a/tasks").headers["etag"]
+
+        monitor.apply_event(
+            {"type": "task_upserted", "teamName": "team-a", "task": {"taskId": "1", "subject": "S"}}
+        )
+        response = client.get("/api/teams/team-a/tasks", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert [task["taskId"] for task in response.json()["tasks"]] == ["1"]
+
+    def test_invalid_cursor(self, monitor, client):
+        """不正なカーソルはエラーを返し、キャッシュされないテスト"""
+        response = client.get("/api/teams/team-a/messages?before=invalid")
+
+        assert response.status_code == 200
+        assert "error" in response.json()
+
+
+class TestSnapshotEndpoint:
+    """一括スナップショットエンドポイントのテスト"""
+
+    @pytest.fixture
+    def monitor(self, tmp_path, monkeypatch):
+        """2つのチームを持つTeamsMonitorを設定したダッシュボードの状態"""
+        from orchestrator.web.dashboard import _global_state
+        from orchestrator.web.response_cache import ResponseCache
+        from orchestrator.web.team_models import TeamsRoot
+        from orchestrator.web.teams_monitor import TeamsMonitor
+
+        teams_monitor = TeamsMonitor(roots=TeamsRoot.from_base(tmp_path))
+        for name in ("team-a", "team-b"):
+            teams_monitor.apply_event(
+                {"type": "team_created", "teamName": name, "team": {"name": name}}
+            )
+            teams_monitor.apply_event(
+                {
+                    "type": "task_upserted",
+                    "teamName": name,
+                    "task": {"taskId": "1", "subject": name},
+                }
+            )
+        health_monitor = MagicMock()
+        health_monitor.get_health_status.return_value = {"team-a": {"agent1": {"isHealthy": True}}}
+        monkeypatch.setattr(_global_state, "teams_monitor", teams_monitor)
+        monkeypatch.setattr(_global_state, "thinking_log_handler", None)
+        monkeypatch.setattr(_global_state, "health_monitor", health_monitor)
+        monkeypatch.setattr(_global_state, "response_cache", ResponseCache())
+        return teams_monitor
+
+    def test_all_teams(self, monitor, client):
+        """全チームの全セクションを1回で取得するテスト"""
+        data = client.get("/api/snapshot").json()
+
+        assert [team["name"] for team in data["teams"]] == ["team-a", "team-b"]
+        assert set(data["tasks"]) == {"team-a", "team-b"}
+        assert data["messages"] == {"team-a": [], "team-b": []}
+        assert data["thinking"] == {"team-a": [], "team-b": []}
+        assert data["health"] == {"team-a": {"agent1": {"isHealthy": True}}}
+        assert data["since"] is None
+
+    def test_team_and_section_filters(self, monitor, client):
+        """チームとセクションで絞り込むテスト"""
+        data = client.get("/api/snapshot?teams=team-b&sections=tasks").json()
+
+        assert [team["name"] for team in data["teams"]] == ["team-b"]
+        assert data["tasks"]["team-b"][0]["subject"] == "team-b"
+        assert "messages" not in data
+        assert "health" not in data
+
+    def test_since_omits_unchanged_teams(self, monitor, client):
+        """前回のversion以降に変更されたチームのセクションだけを返すテスト"""
+        first = client.get("/api/snapshot").json()
+        monitor.apply_event(
+            {"type": "task_upserted", "teamName": "team-b", "task": {"taskId": "2", "subject": "S"}}
+        )
+
+        data = client.get(
+            "/api/snapshot", params={"since": first["version"], "epoch": first["epoch"]}
+        ).json()
+
+        assert list(data["tasks"]) == ["team-b"]
+        assert len(data["tasks"]["team-b"]) == 2
+        assert data["messages"] == {}
+        assert data["version"] > first["version"]
+
+    def test_since_with_other_epoch_returns_everything(self, monitor, client):
+        """epochが異なる場合は全件を返すテスト"""
+        first = client.get("/api/snapshot").json()
+
+        data = client.get(
+            "/api/snapshot", params={"since": first["version"], "epoch": "other"}
+        ).json()
+
+        assert set(data["tasks"]) == {"team-a", "team-b"}
+        assert data["since"] is None
+
+    def test_unknown_section(self, monitor, client):
+        """未知のセクションはエラーを返すテスト"""
+        data = client.get("/api/snapshot?sections=tasks,unknown").json()
+
+        assert data == {"error": "Unknown sections: unknown"}
+
+
+class TestTeamStatusEndpoint:
+    """チーム状態エンドポイントのテスト"""
+
+    @pytest.fixture
+    def monitor(self, tmp_path, monkeypatch):
+        """TeamsMonitorとヘルスモニターを設定したダッシュボードの状態"""
+        from orchestrator.web.dashboard import _global_state
+        from orchestrator.web.team_models import TeamsRoot
+        from orchestrator.web.teams_monitor import TeamsMonitor
+
+        teams_monitor = TeamsMonitor(roots=TeamsRoot.from_base(tmp_path))
+        teams_monitor.apply_event(
+            {
+                "type": "team_created",
+                "teamName": "team-a",
+                "team": {"name": "team-a", "description": "A"},
+            }
+        )
+        teams_monitor.apply_event(
+            {"type": "task_upserted", "teamName": "team-a", "task": {"taskId": "1", "subject": "S"}}
+        )
+        health_monitor = MagicMock()
+        health_monitor.get_team_health.return_value = {"agent1": {"isHealthy": True}}
+        monkeypatch.setattr(_global_state, "teams_monitor", teams_monitor)
+        monkeypatch.setattr(_global_state, "health_monitor", health_monitor)
+        return health_monitor
+
+    def test_status_from_memory(self, monitor, client):
+        """監視中の状態とチームのヘルス状態から応答するテスト"""
+        data = client.get("/api/teams/team-a/status").json()
+
+        assert data["name"] == "team-a"
+        assert data["description"] == "A"
+        assert data["taskCount"] == 1
+        assert data["schemaVersion"] == 2
+        assert data["health"] == {"agent1": {"isHealthy": True}}
+        monitor.get_team_health.assert_called_once_with("team-a")
+        monitor.get_health_status.assert_not_called()
+
+    def test_team_not_found(self, monitor, client):
+        """存在しないチームはエラーを返すテスト"""
+        data = client.get("/api/teams/unknown/status").json()
+
+        assert data == {"error": "Team not found"}
+
+    def test_websocket_reply(self, monitor):
+        """get_team_statusメッセージの応答も同じ状態から作成するテスト"""
+        from orchestrator.web.dashboard import _get_team_status_reply
+
+        reply = _get_team_status_reply({"teamName": "team-a"})
+        missing = _get_team_status_reply({"teamName": "unknown"})
+
+        assert reply["type"] == "team_status"
+        assert reply["data"]["taskCount"] == 1
+        assert missing == {"type": "error", "message": "Team not found"}
+
+
+class TestIpcBackend:
+    """ipcイベントバックエンドのWebワーカーのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_resync_from_disk(self, monkeypatch):
+        """ingestプロセスへの接続時に状態を読み直し、再同期を要求するテスト"""
+        from orchestrator.web.dashboard import _global_state, _resync_from_disk
+
+        teams_monitor = MagicMock()
+        thinking_log_handler = MagicMock()
+        event_bus = MagicMock()
+        monkeypatch.setattr(_global_state, "teams_monitor", teams_monitor)
+        monkeypatch.setattr(_global_state, "thinking_log_handler", thinking_log_handler)
+        monkeypatch.setattr(_global_state, "event_bus", event_bus)
+
+        await _resync_from_disk()
+
+        teams_monitor.reload.assert_called_once_with()
+        thinking_log_handler.reload.assert_called_once_with()
+        event_bus.publish.assert_called_once_with({"type": "resync_required"})
+
+    def test_health_endpoints_unsupported(self, monkeypatch, client):
+        """ヘルスAPIはipcバックエンドでは使用できないことを返すテスト"""
+        from orchestrator.web.dashboard import HEALTH_UNSUPPORTED_ERROR, _global_state
+
+        monkeypatch.setattr(_global_state, "event_subscriber", MagicMock())
+
+        assert client.get("/api/health").json() == {"error": HEALTH_UNSUPPORTED_ERROR}
+        assert client.post("/api/health/start").json() == {"error": HEALTH_UNSUPPORTED_ERROR}
+        assert client.post("/api/health/stop").json() == {"error": HEALTH_UNSUPPORTED_ERROR}
+
+    @pytest.mark.asyncio
+    async def test_lifespan_without_health_monitor(self, monkeypatch):
+        """ipcバックエンドではヘルスモニターを持たず、接続時の再同期を登録するテスト"""
+        from orchestrator.web.dashboard import _global_state, _resync_from_disk, lifespan
+
+        monkeypatch.setenv("ORCHESTRATOR_EVENT_BACKEND", "ipc")
+        monkeypatch.setattr(_global_state, "health_monitor", None)
+        with (
+            patch("orchestrator.web.dashboard.get_agent_health_monitor") as mock_get_health,
+            patch("orchestrator.web.dashboard.get_agent_teams_manager"),
+            patch("orchestrator.web.dashboard.get_thinking_log_handler"),
+            patch("orchestrator.web.dashboard.TeamsMonitor"),
+            patch("orchestrator.web.dashboard.IpcEventSubscriber") as mock_subscriber_class,
+        ):
+            mock_subscriber = MagicMock()
+            mock_subscriber.start = AsyncMock()
+            mock_subscriber.stop = AsyncMock()
+            mock_subscriber_class.return_value = mock_subscriber
+
+            async with lifespan(MagicMock()):
+                assert _global_state.health_monitor is None
+                assert _global_state.event_subscriber is mock_subscriber
+
+            mock_get_health.assert_not_called()
+            assert mock_subscriber_class.call_args.kwargs["on_connect"] is _resync_from_disk
+
+
+class TestMonitoringStatsEndpoint:
+    """監視統計エンドポイントのテスト"""
+
+    def test_get_monitoring_stats(self, client):
+        """ファイル監視の統計情報取得テスト"""
+        response = client.get("/api/teams/monitoring/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "watches" in data["watch"]
+        assert "queueDepth" in data["watch"]
+
+
 class TestBroadcastFunctions:
     """ブロードキャスト関数のテスト"""
 
@@ -455,6 +720,8 @@ class TestLifespan:
                 mock_ws_manager = MagicMock()
                 mock_ws_manager.broadcast = AsyncMock()
                 mock_ws_manager.close_all = AsyncMock()
+                mock_ws_manager.start_heartbeat = AsyncMock()
+                mock_ws_manager.stop_heartbeat = AsyncMock()
                 mock_ws_mgr_class.return_value = mock_ws_manager
 
                 mock_ws_handler = MagicMock()
@@ -511,6 +778,8 @@ class TestLifespan:
             ):
                 mock_ws_manager = MagicMock()
                 mock_ws_manager.close_all = AsyncMock()
+                mock_ws_manager.start_heartbeat = AsyncMock()
+                mock_ws_manager.stop_heartbeat = AsyncMock()
                 mock_ws_mgr_class.return_value = mock_ws_manager
 
                 mock_teams_monitor = MagicMock()
@@ -530,4 +799,5 @@ class TestLifespan:
                 mock_teams_monitor.stop_monitoring.assert_called_once()
                 mock_thinking.stop_monitoring.assert_called_once()
                 mock_health.stop_monitoring.assert_called_once()
+                mock_ws_manager.stop_heartbeat.assert_called_once()
                 mock_ws_manager.close_all.assert_called_once()
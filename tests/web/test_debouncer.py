@@ -0,0 +1,89 @@
+"""CoalescingDebouncerテスト
+
+ファイルイベントの集約とトレーリングエッジでの発火をテストします。
+"""
+
+import threading
+import time
+
+from orchestrator.web.debouncer import CoalescingDebouncer
+
+
+class TestCoalescingDebouncer:
+    """CoalescingDebouncerクラスのテスト"""
+
+    def test_coalesces_burst_into_last_callback(self):
+        """バースト中のイベントが最後のコールバック1回に集約される"""
+        debouncer = CoalescingDebouncer(quiet_time=0.05, max_latency=1.0)
+        fired = []
+        done = threading.Event()
+
+        def make_callback(n):
+            def callback():
+                fired.append(n)
+                done.set()
+
+            return callback
+
+        for n in range(5):
+            debouncer.submit("/path/a.json", make_callback(n))
+
+        assert done.wait(timeout=2.0)
+        debouncer.close()
+
+        assert fired == [4]
+        assert debouncer.get_stats()["coalesced"] == 4
+
+    def test_keys_are_independent(self):
+        """キーごとに別々に発火する"""
+        debouncer = CoalescingDebouncer(quiet_time=60, max_latency=60)
+        fired = []
+
+        debouncer.submit("a", lambda: fired.append("a"))
+        debouncer.submit("b", lambda: fired.append("b"))
+        assert debouncer.pending_count() == 2
+
+        debouncer.flush()
+        debouncer.close()
+
+        assert sorted(fired) == ["a", "b"]
+
+    def test_max_latency_caps_delay(self):
+        """イベントが途切れなくても最大遅延で発火する"""
+        debouncer = CoalescingDebouncer(quiet_time=0.2, max_latency=0.3)
+        fired = threading.Event()
+
+        deadline = time.monotonic() + 2.0
+        while not fired.is_set() and time.monotonic() < deadline:
+            debouncer.submit("key", fired.set)
+            time.sleep(0.02)
+        debouncer.close()
+
+        assert fired.is_set()
+
+    def test_callback_error_does_not_stop_worker(self):
+        """コールバックのエラーでワーカーが停止しない"""
+        debouncer = CoalescingDebouncer(quiet_time=0.01, max_latency=0.1)
+        done = threading.Event()
+
+        def failing():
+            raise RuntimeError("callback error")
+
+        debouncer.submit("a", failing)
+        time.sleep(0.1)
+        debouncer.submit("b", done.set)
+
+        assert done.wait(timeout=2.0)
+        debouncer.close()
+
+    def test_close_flushes_pending(self):
+        """停止時に集約中のイベントが発火する"""
+        debouncer = CoalescingDebouncer(quiet_time=60, max_latency=60)
+        fired = []
+
+        debouncer.submit("a", lambda: fired.append("a"))
+        debouncer.close()
+        debouncer.submit("b", lambda: fired.append("b"))
+
+        assert fired == ["a"]
+        assert debouncer.pending_count() == 0
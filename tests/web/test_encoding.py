@@ -0,0 +1,95 @@
+"""WebSocketメッセージのエンコードのテスト
+
+orchestrator/web/encoding.py のテストです。
+"""
+
+import json
+
+import pytest
+
+from orchestrator.web.encoding import (
+    KEY_DICTIONARY,
+    encode_json,
+    encode_msgpack,
+    encode_msgpack_batch,
+    msgpack_available,
+)
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpackは任意の依存関係
+    msgpack = None
+
+
+def _unpack(data: bytes) -> object:
+    """MessagePackをデコードし、キー辞書の番号をキー名に戻します。"""
+
+    def expand(value):
+        if isinstance(value, dict):
+            return {
+                KEY_DICTIONARY[key] if isinstance(key, int) else key: expand(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [expand(item) for item in value]
+        return value
+
+    return expand(msgpack.unpackb(data, strict_map_key=False))
+
+
+class TestEncodeJson:
+    """encode_jsonのテスト"""
+
+    def test_compact_and_non_ascii(self):
+        """区切り文字の空白がなく、非ASCII文字がそのまま出力されるテスト"""
+        text = encode_json({"type": "test", "content": "思考"})
+
+        assert text == '{"type":"test","content":"思考"}'
+        assert json.loads(text) == {"type": "test", "content": "思考"}
+
+
+@pytest.mark.skipif(not msgpack_available(), reason="msgpackがインストールされていません")
+class TestEncodeMsgpack:
+    """encode_msgpack・encode_msgpack_batchのテスト"""
+
+    def test_keys_are_replaced_with_dictionary_index(self):
+        """キー辞書にあるキーが番号に置き換えられるテスト"""
+        message = {"type": "thinking_log", "data": {"teamName": "team-a", "custom": 1}}
+
+        raw = msgpack.unpackb(encode_msgpack(message), strict_map_key=False)
+
+        assert raw[KEY_DICTIONARY.index("type")] == "thinking_log"
+        assert raw[KEY_DICTIONARY.index("data")] == {
+            KEY_DICTIONARY.index("teamName"): "team-a",
+            "custom": 1,
+        }
+
+    def test_round_trip(self):
+        """キー辞書で元のメッセージに復元できるテスト"""
+        message = {
+            "type": "team_message",
+            "seq": 3,
+            "message": {"sender": "a", "content": "こんにちは", "read": False, "tags": ["x"]},
+        }
+
+        assert _unpack(encode_msgpack(message)) == message
+
+    def test_smaller_than_json(self):
+        """JSONより小さくエンコードされるテスト"""
+        message = {
+            "type": "thinking_log",
+            "data": {"teamName": "team-a", "agentName": "agent-1", "timestamp": "2026-01-01"},
+        }
+
+        assert len(encode_msgpack(message)) < len(encode_json(message).encode("utf-8"))
+
+    def test_batch_concatenates_encoded_frames(self):
+        """エンコード済みのフレームがbatchにまとめられるテスト"""
+        frames = [encode_msgpack({"type": "test", "index": i}) for i in range(20)]
+
+        batch = _unpack(encode_msgpack_batch(frames))
+
+        assert batch == {
+            "type": "batch",
+            "events": [{"type": "test", "index": i} for i in range(20)],
+        }
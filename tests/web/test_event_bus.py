@@ -0,0 +1,161 @@
+"""EventBusテスト
+
+スレッドからイベントループへのイベント受け渡しをテストします。
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from orchestrator.web.event_bus import EventBus
+
+
+class TestEventBus:
+    """EventBusクラスのテスト"""
+
+    def test_publish_before_start(self):
+        """開始前のpublishは受け付けられない"""
+        bus = EventBus()
+
+        assert bus.publish({"type": "test"}) is False
+        assert not bus.is_running()
+
+    @pytest.mark.asyncio
+    async def test_publish_from_loop(self):
+        """イベントループ上からのpublish"""
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        bus.subscribe(handler)
+        await bus.start()
+
+        assert bus.publish({"type": "test"}) is True
+        await asyncio.sleep(0.01)
+        await bus.stop()
+
+        assert received == [{"type": "test"}]
+
+    @pytest.mark.asyncio
+    async def test_publish_from_thread(self):
+        """別スレッド（watchdog相当）からのpublish"""
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        bus.subscribe(handler)
+        await bus.start()
+
+        thread = threading.Thread(target=lambda: bus.publish({"type": "from_thread"}))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.01)
+        await bus.stop()
+
+        assert received == [{"type": "from_thread"}]
+
+    @pytest.mark.asyncio
+    async def test_fan_out_to_multiple_handlers(self):
+        """複数ハンドラーへの配信"""
+        bus = EventBus()
+        received1 = []
+        received2 = []
+
+        async def handler1(event):
+            received1.append(event)
+
+        async def handler2(event):
+            received2.append(event)
+
+        bus.subscribe(handler1)
+        bus.subscribe(handler2)
+        await bus.start()
+
+        bus.publish({"type": "test"})
+        await asyncio.sleep(0.01)
+        await bus.stop()
+
+        assert len(received1) == 1
+        assert len(received2) == 1
+
+    @pytest.mark.asyncio
+    async def test_handler_error_does_not_stop_consumer(self):
+        """ハンドラーのエラーでコンシューマーが停止しない"""
+        bus = EventBus()
+        received = []
+
+        async def failing_handler(event):
+            raise RuntimeError("handler error")
+
+        async def handler(event):
+            received.append(event)
+
+        bus.subscribe(failing_handler)
+        bus.subscribe(handler)
+        await bus.start()
+
+        bus.publish({"type": "first"})
+        bus.publish({"type": "second"})
+        await asyncio.sleep(0.01)
+        await bus.stop()
+
+        assert [e["type"] for e in received] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_drops_oldest(self):
+        """キュー溢れ時に最も古いイベントを破棄する"""
+        bus = EventBus(maxsize=2)
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        bus.subscribe(handler)
+        await bus.start()
+
+        # コンシューマーが動く前に3件投入する
+        assert bus.publish({"n": 1}) is True
+        assert bus.publish({"n": 2}) is True
+        assert bus.publish({"n": 3}) is False
+
+        stats = bus.get_stats()
+        assert stats["dropped"] == 1
+        assert stats["queueSize"] == 2
+
+        await asyncio.sleep(0.01)
+        await bus.stop()
+
+        assert [e["n"] for e in received] == [2, 3]
+        assert bus.get_stats()["delivered"] == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_from_thread(self):
+        """別スレッドからのpublishでもキュー溢れをFalseで検知できる"""
+        bus = EventBus(maxsize=2)
+
+        async def handler(event):
+            pass
+
+        bus.subscribe(handler)
+        await bus.start()
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.extend(bus.publish({"n": n}) for n in range(3))
+        )
+        thread.start()
+        thread.join()
+
+        assert results == [True, True, False]
+        assert bus.get_stats()["dropped"] == 1
+
+        await asyncio.sleep(0.01)
+        assert bus.get_stats()["delivered"] == 2
+        # 配信後は再び受け付けられる
+        assert bus.publish({"n": 3}) is True
+        await bus.stop()
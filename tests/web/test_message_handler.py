@@ -8,15 +8,20 @@ orchestrator/web/message_handler.py のテストです。
 注意: asyncioランタイム問題により、一時的にすべてのテストをスキップしています。
 """
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock
+import threading
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
+from orchestrator.web.encoding import KEY_DICTIONARY, encode_json, encode_msgpack, msgpack_available
 from orchestrator.web.message_handler import (
     WebSocketManager,
     WebSocketMessageHandler,
 )
+from orchestrator.web.retention import RetentionPolicy
+from orchestrator.web.team_models import TaskInfo
 
 
 @pytest.mark.serial
@@ -303,3 +308,760 @@ class TestWebSocketMessageHandler:
         handler.set_team_message_handler(custom_handler)
 
         assert handler._handlers["get_teams"] == custom_handler
+
+
+async def _drain(manager: WebSocketManager) -> None:
+    """全接続の送信キューが空になるまで待機します。"""
+    for _ in range(100):
+        if manager.get_stats()["queued"] == 0:
+            break
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+def _blocking_websocket() -> tuple[AsyncMock, asyncio.Event]:
+    """解放されるまで送信がブロックされるWebSocketモックを作成します。"""
+    released = asyncio.Event()
+    websocket = AsyncMock()
+
+    async def send(_message):
+        await released.wait()
+
+    websocket.send_text.side_effect = send
+    return websocket, released
+
+
+def _sent_messages(websocket: AsyncMock) -> list[dict]:
+    """send_textで送信されたメッセージをデコードして返します（シーケンス番号は除く）。"""
+    messages = [json.loads(sent.args[0]) for sent in websocket.send_text.call_args_list]
+    for message in messages:
+        message.pop("seq", None)
+    return messages
+
+
+class TestWebSocketManagerSendQueue:
+    """接続ごとの送信キューのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_in_order(self):
+        """ブロードキャストが順番に送信されるテスト"""
+        manager = WebSocketManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+
+        for i in range(5):
+            await manager.broadcast({"type": "test", "index": i})
+        await _drain(manager)
+
+        sent = [message["index"] for message in _sent_messages(websocket)]
+        assert sent == [0, 1, 2, 3, 4]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self):
+        """遅いクライアントが他のクライアントへの配信を遅らせないテスト"""
+        manager = WebSocketManager()
+        slow, released = _blocking_websocket()
+        fast = AsyncMock()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        await asyncio.wait_for(manager.broadcast({"type": "test"}), timeout=1.0)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert _sent_messages(fast) == [{"type": "test"}]
+        released.set()
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self):
+        """キュー溢れ時に最も古いメッセージを破棄するテスト"""
+        manager = WebSocketManager(queue_size=2, overflow_policy="drop_oldest")
+        websocket, released = _blocking_websocket()
+        await manager.connect(websocket)
+
+        # index 0 は送信中、1と2がキューに入り、3で1が破棄される
+        for i in range(4):
+            await manager.broadcast({"type": "test", "index": i})
+        assert manager.get_stats()["dropped"] == 1
+
+        released.set()
+        await _drain(manager)
+
+        sent = [message["index"] for message in _sent_messages(websocket)]
+        assert sent == [0, 2, 3]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy(self):
+        """キュー溢れ時に同じ種類・チームのメッセージを置き換えるテスト"""
+        manager = WebSocketManager(queue_size=2, overflow_policy="coalesce")
+        websocket, released = _blocking_websocket()
+        await manager.connect(websocket)
+
+        await manager.broadcast({"type": "init"})
+        await manager.broadcast({"type": "team_status", "teamName": "a", "v": 1})
+        await manager.broadcast({"type": "team_message", "teamName": "a"})
+        await manager.broadcast({"type": "team_status", "teamName": "a", "v": 2})
+
+        released.set()
+        await _drain(manager)
+
+        assert _sent_messages(websocket) == [
+            {"type": "init"},
+            {"type": "team_message", "teamName": "a"},
+            {"type": "team_status", "teamName": "a", "v": 2},
+        ]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy_keeps_log_events_in_order(self):
+        """coalesceポリシーでもキュー溢れ時にログイベントを置き換えず、最も古いものを破棄するテスト"""
+        manager = WebSocketManager(queue_size=2, overflow_policy="coalesce")
+        websocket, released = _blocking_websocket()
+        await manager.connect(websocket)
+
+        await manager.broadcast({"type": "init"})
+        for i in range(3):
+            await manager.broadcast({"type": "team_message", "teamName": "a", "index": i})
+        assert manager.get_stats()["dropped"] == 1
+        assert manager.get_stats()["coalesced"] == 0
+
+        released.set()
+        await _drain(manager)
+
+        sent = [message.get("index") for message in _sent_messages(websocket)]
+        assert sent == [None, 1, 2]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_state_events_replace_pending(self):
+        """送信待ちの状態イベントが新しいもので置き換えられ、ログイベントは全て送信されるテスト"""
+        manager = WebSocketManager()
+        websocket, released = _blocking_websocket()
+        await manager.connect(websocket)
+
+        await manager.broadcast({"type": "init"})
+        await manager.broadcast({"type": "team_updated", "teamName": "a", "v": 1})
+        await manager.broadcast({"type": "team_updated", "teamName": "b", "v": 1})
+        await manager.broadcast({"type": "thinking_log", "teamName": "a", "v": 1})
+        await manager.broadcast({"type": "team_updated", "teamName": "a", "v": 2})
+        await manager.broadcast({"type": "thinking_log", "teamName": "a", "v": 2})
+        await manager.broadcast({"type": "team_updated", "teamName": "a", "v": 3})
+        assert manager.get_stats()["coalesced"] == 2
+
+        released.set()
+        await _drain(manager)
+
+        assert _sent_messages(websocket) == [
+            {"type": "init"},
+            {"type": "team_updated", "teamName": "b", "v": 1},
+            {"type": "thinking_log", "teamName": "a", "v": 1},
+            {"type": "thinking_log", "teamName": "a", "v": 2},
+            {"type": "team_updated", "teamName": "a", "v": 3},
+        ]
+        assert manager.get_stats()["dropped"] == 0
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_task_upserts_are_coalesced_per_task(self):
+        """タスクの更新がタスクごとに置き換えられるテスト"""
+        manager = WebSocketManager()
+        websocket, released = _blocking_websocket()
+        await manager.connect(websocket)
+
+        await manager.broadcast({"type": "init"})
+        for status in ("pending", "in_progress", "completed"):
+            for task_id in ("1", "2"):
+                task = TaskInfo(task_id=task_id, subject="S", description="", status=status)
+                await manager.broadcast(
+                    {"type": "task_upserted", "teamName": "a", "task": task.to_dict()}
+                )
+
+        released.set()
+        await _drain(manager)
+
+        tasks = [message.get("task") for message in _sent_messages(websocket)]
+        assert tasks[0] is None
+        assert [(task["taskId"], task["status"]) for task in tasks[1:]] == [
+            ("1", "completed"),
+            ("2", "completed"),
+        ]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy(self):
+        """キュー溢れ時に接続を切断するテスト"""
+        manager = WebSocketManager(queue_size=1, overflow_policy="disconnect")
+        websocket, _released = _blocking_websocket()
+        await manager.connect(websocket)
+
+        for i in range(3):
+            await manager.broadcast({"type": "test", "index": i})
+
+        assert manager.get_connection_count() == 0
+        assert manager.get_stats()["overflowDisconnects"] == 1
+        websocket.close.assert_called_once_with(code=1013)
+
+    @pytest.mark.asyncio
+    async def test_send_error_disconnects(self):
+        """送信エラー時に接続が削除されるテスト"""
+        manager = WebSocketManager()
+        websocket = AsyncMock()
+        websocket.send_text.side_effect = RuntimeError("closed")
+        await manager.connect(websocket)
+
+        await manager.broadcast({"type": "test"})
+        await _drain(manager)
+
+        assert manager.get_connection_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_send_personal_uses_queue_order(self):
+        """個別送信がブロードキャストと同じ順序で送信されるテスト"""
+        manager = WebSocketManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+
+        await manager.send_personal({"type": "connected"}, websocket)
+        await manager.broadcast({"type": "test"})
+        await _drain(manager)
+
+        sends = [sent for sent in websocket.mock_calls if sent[0].startswith("send_")]
+        assert sends == [
+            call.send_json({"type": "connected"}),
+            call.send_text('{"type":"test","seq":1}'),
+        ]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once(self):
+        """ブロードキャストが接続数に関わらず一度だけエンコードされるテスト"""
+        manager = WebSocketManager()
+        websockets = [AsyncMock() for _ in range(3)]
+        for websocket in websockets:
+            await manager.connect(websocket)
+
+        with patch("orchestrator.web.message_handler.encode_json", wraps=encode_json) as encoder:
+            await manager.broadcast({"type": "test", "content": "日本語"})
+        await _drain(manager)
+
+        encoder.assert_called_once()
+        for websocket in websockets:
+            websocket.send_text.assert_called_once_with(
+                '{"type":"test","content":"日本語","seq":1}'
+            )
+        await manager.close_all()
+
+
+class TestWebSocketSubscriptions:
+    """購読条件による配信先の絞り込みのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_only_to_subscribers(self):
+        """ブロードキャストが購読条件に一致する接続にのみ送信されるテスト"""
+        manager = WebSocketManager()
+        team_a = AsyncMock()
+        team_b = AsyncMock()
+        everything = AsyncMock()
+        for websocket in (team_a, team_b, everything):
+            await manager.connect(websocket)
+        manager.subscribe(team_a, teams=["team-a"])
+        manager.subscribe(team_b, teams=["team-b"])
+
+        await manager.broadcast({"type": "team_message", "teamName": "team-a"})
+        await _drain(manager)
+
+        assert _sent_messages(team_a) == [{"type": "team_message", "teamName": "team-a"}]
+        team_b.send_text.assert_not_called()
+        assert _sent_messages(everything) == [{"type": "team_message", "teamName": "team-a"}]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_message(self):
+        """subscribeメッセージで購読条件が設定されるテスト"""
+        manager = WebSocketManager()
+        handler = WebSocketMessageHandler(manager)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+
+        await handler.handle_message(
+            json.dumps({"type": "subscribe", "teams": ["team-a"], "eventTypes": ["thinking_log"]}),
+            websocket,
+        )
+        await _drain(manager)
+
+        response = websocket.send_json.call_args[0][0]
+        assert response["type"] == "subscribed"
+        assert response["subscription"] == {
+            "teams": ["team-a"],
+            "eventTypes": ["thinking_log"],
+            "agents": [],
+        }
+        assert manager.get_subscription(websocket) == response["subscription"]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_message(self):
+        """unsubscribeメッセージで購読条件が解除されるテスト"""
+        manager = WebSocketManager()
+        handler = WebSocketMessageHandler(manager)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        manager.subscribe(websocket, teams=["team-a"])
+
+        await handler.handle_message(json.dumps({"type": "unsubscribe"}), websocket)
+        await _drain(manager)
+
+        response = websocket.send_json.call_args[0][0]
+        assert response["type"] == "unsubscribed"
+        assert response["subscription"]["teams"] == []
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_removes_subscription(self):
+        """切断で購読条件が削除されるテスト"""
+        manager = WebSocketManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        manager.subscribe(websocket, teams=["team-a"])
+
+        manager.disconnect(websocket)
+
+        assert manager.get_subscription(websocket) is None
+
+
+class TestWebSocketResume:
+    """シーケンス番号と再接続時の差分再送のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_assigns_sequence_numbers(self):
+        """ブロードキャストに連番のシーケンス番号が付与されるテスト"""
+        manager = WebSocketManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+
+        await manager.broadcast({"type": "a"})
+        await manager.broadcast({"type": "b"})
+        await _drain(manager)
+
+        sent = [json.loads(sent.args[0]) for sent in websocket.send_text.call_args_list]
+        assert [message["seq"] for message in sent] == [1, 2]
+        assert manager.current_seq == 2
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_gap(self):
+        """resumeで切断中のメッセージだけが再送されるテスト"""
+        manager = WebSocketManager()
+        handler = WebSocketMessageHandler(manager)
+        for i in range(5):
+            await manager.broadcast({"type": "test", "index": i})
+
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        await handler.resume(websocket, 3, manager.epoch)
+        await _drain(manager)
+
+        assert [message["index"] for message in _sent_messages(websocket)] == [3, 4]
+        response = websocket.send_json.call_args[0][0]
+        assert response == {
+            "type": "resumed",
+            "lastSeq": 3,
+            "seq": 5,
+            "epoch": manager.epoch,
+            "replayed": 2,
+        }
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_resume_respects_subscription(self):
+        """再送も購読条件で絞り込まれるテスト"""
+        manager = WebSocketManager()
+        await manager.broadcast({"type": "team_message", "teamName": "team-a"})
+        await manager.broadcast({"type": "team_message", "teamName": "team-b"})
+
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        manager.subscribe(websocket, teams=["team-b"])
+
+        assert manager.resume(websocket, 0) == 1
+        await _drain(manager)
+        assert _sent_messages(websocket) == [{"type": "team_message", "teamName": "team-b"}]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_resume_falls_back_to_snapshot(self):
+        """再送できない場合にスナップショットが送信されるテスト"""
+        manager = WebSocketManager(replay_policy=RetentionPolicy(max_entries=2))
+        snapshot_provider = MagicMock(return_value={"teams": [{"name": "team-a"}]})
+        handler = WebSocketMessageHandler(manager, snapshot_provider=snapshot_provider)
+        for i in range(5):
+            await manager.broadcast({"type": "test", "index": i})
+
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        await handler.handle_message(json.dumps({"type": "resume", "lastSeq": 1}), websocket)
+        await _drain(manager)
+
+        websocket.send_text.assert_not_called()
+        snapshot_provider.assert_called_once_with(None)
+        response = websocket.send_json.call_args[0][0]
+        assert response["type"] == "snapshot"
+        assert response["seq"] == 5
+        assert response["teams"] == [{"name": "team-a"}]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_resume_with_other_epoch_requires_resync(self):
+        """識別子が異なりスナップショットも生成できない場合にresync_requiredが送信されるテスト"""
+        manager = WebSocketManager()
+        handler = WebSocketMessageHandler(manager)
+        await manager.broadcast({"type": "test"})
+
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        await handler.handle_message(
+            json.dumps({"type": "resume", "lastSeq": 0, "epoch": "restarted"}), websocket
+        )
+        await _drain(manager)
+
+        response = websocket.send_json.call_args[0][0]
+        assert response == {"type": "resync_required", "seq": 1, "epoch": manager.epoch}
+        await manager.close_all()
+
+
+class TestWebSocketBatching:
+    """イベントのバッチ送信のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_batch_capable_client_receives_batch_frame(self):
+        """batchに対応したクライアントにイベントがまとめて送信されるテスト"""
+        manager = WebSocketManager(batch_window=0.01)
+        websocket = AsyncMock()
+        await manager.connect(websocket, ["batch"])
+
+        for i in range(3):
+            await manager.broadcast({"type": "test", "index": i})
+        await asyncio.sleep(0.05)
+
+        websocket.send_text.assert_called_once()
+        frame = json.loads(websocket.send_text.call_args[0][0])
+        assert frame["type"] == "batch"
+        assert [event["index"] for event in frame["events"]] == [0, 1, 2]
+        assert [event["seq"] for event in frame["events"]] == [1, 2, 3]
+        assert manager.get_stats()["batches"] == 1
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_max_events(self):
+        """1フレームあたりのイベント数が上限を超えないテスト"""
+        manager = WebSocketManager(batch_window=0.01, batch_max_events=2)
+        websocket = AsyncMock()
+        await manager.connect(websocket, ["batch"])
+
+        for i in range(5):
+            await manager.broadcast({"type": "test", "index": i})
+        await asyncio.sleep(0.1)
+
+        frames = [json.loads(sent.args[0]) for sent in websocket.send_text.call_args_list]
+        indexes = []
+        for frame in frames:
+            events = frame["events"] if frame["type"] == "batch" else [frame]
+            assert len(events) <= 2
+            indexes.extend(event["index"] for event in events)
+        assert indexes == [0, 1, 2, 3, 4]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_client_without_capability_is_not_batched(self):
+        """batchを要求しないクライアントには個別に送信されるテスト"""
+        manager = WebSocketManager(batch_window=0.01)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+
+        for i in range(3):
+            await manager.broadcast({"type": "test", "index": i})
+        await asyncio.sleep(0.05)
+
+        assert [message["index"] for message in _sent_messages(websocket)] == [0, 1, 2]
+        assert manager.get_stats()["batches"] == 0
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_unknown_capabilities_are_ignored(self):
+        """未対応の機能が無視されるテスト"""
+        manager = WebSocketManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket, ["batch", "unknown"])
+
+        assert manager.get_capabilities(websocket) == ["batch"]
+        await manager.close_all()
+
+
+@pytest.mark.skipif(not msgpack_available(), reason="msgpackがインストールされていません")
+class TestWebSocketMsgpack:
+    """MessagePackエンコーディングのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_connect_announces_key_dictionary(self):
+        """msgpackを要求した接続にキー辞書が最初に送信されるテスト"""
+        manager = WebSocketManager()
+        websocket = AsyncMock()
+        await manager.connect(websocket, ["msgpack"])
+        await _drain(manager)
+
+        websocket.send_json.assert_called_once_with(
+            {"type": "encoding", "format": "msgpack", "keys": list(KEY_DICTIONARY)}
+        )
+        assert manager.get_capabilities(websocket) == ["msgpack"]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_binary_to_msgpack_clients(self):
+        """msgpackの接続にはバイナリ、その他の接続にはテキストで送信されるテスト"""
+        manager = WebSocketManager()
+        binary = AsyncMock()
+        text = AsyncMock()
+        await manager.connect(binary, ["msgpack"])
+        await manager.connect(text)
+
+        message = {"type": "thinking_log", "data": {"teamName": "team-a"}}
+        await manager.broadcast(message)
+        await _drain(manager)
+
+        binary.send_bytes.assert_called_once_with(encode_msgpack({**message, "seq": 1}))
+        binary.send_text.assert_not_called()
+        text.send_text.assert_called_once_with(encode_json({**message, "seq": 1}))
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_msgpack_once(self):
+        """MessagePackへのエンコードが接続数に関わらず一度だけ行われるテスト"""
+        manager = WebSocketManager()
+        for _ in range(3):
+            await manager.connect(AsyncMock(), ["msgpack"])
+
+        with patch(
+            "orchestrator.web.message_handler.encode_msgpack", wraps=encode_msgpack
+        ) as encode:
+            await manager.broadcast({"type": "test"})
+
+        assert encode.call_count == 1
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_binary(self):
+        """msgpackの接続への再送がバイナリで行われるテスト"""
+        manager = WebSocketManager()
+        await manager.broadcast({"type": "test"})
+
+        websocket = AsyncMock()
+        await manager.connect(websocket, ["msgpack"])
+        assert manager.resume(websocket, 0) == 1
+        await _drain(manager)
+
+        websocket.send_bytes.assert_called_once_with(encode_msgpack({"type": "test", "seq": 1}))
+        await manager.close_all()
+
+
+class TestWebSocketHeartbeat:
+    """ハートビートのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_receives_ping(self):
+        """無通信の接続にpingが送信されるテスト"""
+        manager = WebSocketManager(heartbeat_interval=10, heartbeat_timeout=30)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        client = manager._clients[websocket]
+
+        assert manager.check_heartbeats(now=client.last_seen + 5) == 0
+        websocket.send_json.assert_not_called()
+
+        assert manager.check_heartbeats(now=client.last_seen + 15) == 0
+        await _drain(manager)
+
+        assert websocket.send_json.call_args[0][0]["type"] == "ping"
+        assert manager.get_connection_count() == 1
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_timed_out_connection_is_reaped(self):
+        """タイムアウトした接続が切断されるテスト"""
+        manager = WebSocketManager(heartbeat_interval=10, heartbeat_timeout=30)
+        dead = AsyncMock()
+        alive = AsyncMock()
+        await manager.connect(dead)
+        await manager.connect(alive)
+        now = manager._clients[dead].last_seen + 31
+        manager._clients[alive].last_seen = now
+
+        assert manager.check_heartbeats(now=now) == 1
+        await asyncio.sleep(0)
+
+        assert manager.get_connections() == [alive]
+        dead.close.assert_called_once_with(code=1001)
+        assert manager.get_stats()["heartbeat"]["reaped"] == 1
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_incoming_message_keeps_connection_alive(self):
+        """受信したメッセージ（pongを含む）で無通信時間がリセットされるテスト"""
+        manager = WebSocketManager(heartbeat_interval=10, heartbeat_timeout=30)
+        handler = WebSocketMessageHandler(manager)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        manager._clients[websocket].last_seen -= 100
+
+        await handler.handle_message(json.dumps({"type": "pong"}), websocket)
+
+        assert manager.check_heartbeats() == 0
+        assert manager.get_connection_count() == 1
+        stats = manager.get_stats()["heartbeat"]
+        assert stats["live"] == 1
+        assert stats["stale"] == 0
+        websocket.send_json.assert_not_called()
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop_heartbeat(self):
+        """ハートビートタスクが一定間隔でタイムアウトした接続を切断するテスト"""
+        manager = WebSocketManager(heartbeat_interval=0.01, heartbeat_timeout=0.02)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+
+        await manager.start_heartbeat()
+        await asyncio.sleep(0.1)
+        await manager.stop_heartbeat()
+
+        assert manager.get_connection_count() == 0
+        assert manager.get_stats()["heartbeat"]["reaped"] == 1
+
+
+class TestWebSocketInboundDispatch:
+    """受信メッセージの接続ごとの処理キューのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_response_carries_request_id(self):
+        """応答にリクエストのrequestIdが付与されるテスト"""
+        manager = WebSocketManager()
+        handler = WebSocketMessageHandler(manager)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+
+        await handler.handle_message(json.dumps({"type": "ping", "requestId": "r1"}), websocket)
+        await handler.handle_message(json.dumps({"type": "unknown", "requestId": 7}), websocket)
+        await handler.handle_message(json.dumps({"type": "ping"}), websocket)
+        await _drain(manager)
+
+        sent = [call.args[0] for call in websocket.send_json.call_args_list]
+        assert sent[0]["type"] == "pong"
+        assert sent[0]["requestId"] == "r1"
+        assert sent[1]["type"] == "error"
+        assert sent[1]["requestId"] == 7
+        assert "requestId" not in sent[2]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_processes_messages_in_order(self):
+        """dispatchしたメッセージが受信順に処理されるテスト"""
+        manager = WebSocketManager()
+        handler = WebSocketMessageHandler(manager)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        processed: list[int] = []
+
+        async def record(data, _websocket):
+            await asyncio.sleep(0)
+            processed.append(data["n"])
+
+        handler.register_handler("record", record)
+        for n in range(5):
+            await handler.dispatch(json.dumps({"type": "record", "n": n}), websocket)
+        for _ in range(50):
+            if len(processed) == 5:
+                break
+            await asyncio.sleep(0)
+
+        assert processed == [0, 1, 2, 3, 4]
+        handler.release(websocket)
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_rejects_when_queue_is_full(self):
+        """受信キューが満杯の場合にエラーが返されるテスト"""
+        manager = WebSocketManager()
+        handler = WebSocketMessageHandler(manager, max_pending=2)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        released = asyncio.Event()
+
+        async def slow(_data, _websocket):
+            await released.wait()
+
+        handler.register_handler("slow", slow)
+        await handler.dispatch(json.dumps({"type": "slow", "requestId": 0}), websocket)
+        await asyncio.sleep(0)
+        for n in range(1, 4):
+            await handler.dispatch(json.dumps({"type": "slow", "requestId": n}), websocket)
+        await _drain(manager)
+
+        errors = [call.args[0] for call in websocket.send_json.call_args_list]
+        # 1件目は処理中、2・3件目はキューで待機、4件目は拒否される
+        assert errors == [{"type": "error", "message": "Too many pending requests", "requestId": 3}]
+        assert handler.get_stats()["rejected"] == 1
+        assert handler.pending_count(websocket) == 2
+
+        released.set()
+        handler.release(websocket)
+        assert handler.pending_count(websocket) == 0
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_blocking_handler_runs_in_thread(self):
+        """blockingハンドラがイベントループ外のスレッドで実行されるテスト"""
+        manager = WebSocketManager()
+        handler = WebSocketMessageHandler(manager)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+        main_thread = threading.get_ident()
+
+        def read_status(data):
+            return {
+                "type": "team_status",
+                "teamName": data["teamName"],
+                "thread": threading.get_ident(),
+            }
+
+        handler.register_handler("get_team_status", read_status, blocking=True)
+        await handler.handle_message(
+            json.dumps({"type": "get_team_status", "teamName": "team-a", "requestId": "r1"}),
+            websocket,
+        )
+        await _drain(manager)
+
+        response = websocket.send_json.call_args[0][0]
+        assert response["type"] == "team_status"
+        assert response["teamName"] == "team-a"
+        assert response["requestId"] == "r1"
+        assert response["thread"] != main_thread
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_release_stops_worker(self):
+        """releaseで接続のワーカータスクが停止するテスト"""
+        manager = WebSocketManager()
+        handler = WebSocketMessageHandler(manager)
+        websocket = AsyncMock()
+        await manager.connect(websocket)
+
+        await handler.dispatch(json.dumps({"type": "ping"}), websocket)
+        task = handler._inbound[websocket][1]
+        handler.release(websocket)
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert websocket not in handler._inbound
+        await manager.close_all()
@@ -0,0 +1,193 @@
+"""プロセス間イベント配信のテスト
+
+orchestrator/web/pubsub.py のテストです。
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from orchestrator.web.pubsub import (
+    DEFAULT_SOCKET_PATH,
+    IpcEventPublisher,
+    IpcEventSubscriber,
+    event_backend_from_env,
+    event_socket_from_env,
+)
+
+
+@pytest.fixture
+def socket_path():
+    """短いパスのソケットファイル（Unixドメインソケットのパス長制限のため）"""
+    with tempfile.TemporaryDirectory(prefix="occ-") as directory:
+        yield Path(directory) / "events.sock"
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    """条件が満たされるまで待機します。"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("timed out")
+        await asyncio.sleep(0.01)
+
+
+class TestEventBackendConfig:
+    """環境変数によるイベントバックエンド設定のテスト"""
+
+    def test_default_backend(self, monkeypatch):
+        """未設定の場合はinprocess"""
+        monkeypatch.delenv("ORCHESTRATOR_EVENT_BACKEND", raising=False)
+        monkeypatch.delenv("ORCHESTRATOR_EVENT_SOCKET", raising=False)
+
+        assert event_backend_from_env() == "inprocess"
+        assert event_socket_from_env() == DEFAULT_SOCKET_PATH
+
+    def test_ipc_backend(self, monkeypatch, tmp_path: Path):
+        """ipcバックエンドとソケットパスの指定"""
+        monkeypatch.setenv("ORCHESTRATOR_EVENT_BACKEND", "IPC")
+        monkeypatch.setenv("ORCHESTRATOR_EVENT_SOCKET", str(tmp_path / "events.sock"))
+
+        assert event_backend_from_env() == "ipc"
+        assert event_socket_from_env() == tmp_path / "events.sock"
+
+    def test_unknown_backend(self, monkeypatch):
+        """未知のバックエンドはエラー"""
+        monkeypatch.setenv("ORCHESTRATOR_EVENT_BACKEND", "redis")
+
+        with pytest.raises(ValueError):
+            event_backend_from_env()
+
+
+class TestIpcEventPubSub:
+    """IpcEventPublisher・IpcEventSubscriberのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_to_multiple_subscribers(self, socket_path: Path):
+        """全ワーカーにイベントが順番に配信されるテスト"""
+        publisher = IpcEventPublisher(socket_path)
+        await publisher.start()
+        received: list[list[dict]] = [[], []]
+        subscribers = [
+            IpcEventSubscriber(events.append, socket_path, reconnect_delay=0.01)
+            for events in received
+        ]
+        for subscriber in subscribers:
+            await subscriber.start()
+        await _wait_for(lambda: publisher.get_stats()["subscribers"] == 2)
+
+        for i in range(3):
+            await publisher.publish({"type": "thinking_log", "teamName": "チーム", "index": i})
+        await _wait_for(lambda: all(len(events) == 3 for events in received))
+
+        for events in received:
+            assert [event["index"] for event in events] == [0, 1, 2]
+            assert events[0]["teamName"] == "チーム"
+        assert publisher.get_stats()["published"] == 3
+
+        for subscriber in subscribers:
+            await subscriber.stop()
+        await publisher.stop()
+        assert not socket_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_subscriber_reconnects(self, socket_path: Path):
+        """ingestプロセスが後から起動・再起動しても再接続するテスト"""
+        received: list[dict] = []
+        subscriber = IpcEventSubscriber(received.append, socket_path, reconnect_delay=0.01)
+        await subscriber.start()
+        await asyncio.sleep(0.05)
+        assert not subscriber.is_connected()
+
+        for run in range(2):
+            publisher = IpcEventPublisher(socket_path)
+            await publisher.start()
+            await _wait_for(subscriber.is_connected)
+            await _wait_for(lambda p=publisher: p.get_stats()["subscribers"] == 1)
+            await publisher.publish({"type": "test", "run": run})
+            await _wait_for(lambda r=run: len(received) == r + 1)
+            await publisher.stop()
+            await _wait_for(lambda: not subscriber.is_connected())
+
+        assert [event["run"] for event in received] == [0, 1]
+        assert subscriber.get_stats()["reconnects"] >= 1
+        await subscriber.stop()
+
+    @pytest.mark.asyncio
+    async def test_handler_error_does_not_stop_subscriber(self, socket_path: Path):
+        """コールバックのエラーで受信が止まらないテスト"""
+        publisher = IpcEventPublisher(socket_path)
+        await publisher.start()
+        received: list[dict] = []
+
+        def on_event(event: dict) -> None:
+            if event["type"] == "bad":
+                raise RuntimeError("handler error")
+            received.append(event)
+
+        subscriber = IpcEventSubscriber(on_event, socket_path, reconnect_delay=0.01)
+        await subscriber.start()
+        await _wait_for(lambda: publisher.get_stats()["subscribers"] == 1)
+
+        await publisher.publish({"type": "bad"})
+        await publisher.publish({"type": "good"})
+        await _wait_for(lambda: len(received) == 1)
+
+        assert received == [{"type": "good"}]
+        assert subscriber.get_stats()["received"] == 2
+        await subscriber.stop()
+        await publisher.stop()
+
+    @pytest.mark.asyncio
+    async def test_on_connect_called_before_each_connection(self, socket_path: Path):
+        """接続のたびに受信開始前にon_connectが呼ばれるテスト"""
+        calls: list[str] = []
+
+        async def on_connect() -> None:
+            calls.append("connect")
+
+        def on_event(event: dict) -> None:
+            calls.append(event["type"])
+
+        subscriber = IpcEventSubscriber(
+            on_event, socket_path, reconnect_delay=0.01, on_connect=on_connect
+        )
+        await subscriber.start()
+
+        for _ in range(2):
+            publisher = IpcEventPublisher(socket_path)
+            await publisher.start()
+            await _wait_for(lambda p=publisher: p.get_stats()["subscribers"] == 1)
+            await publisher.publish({"type": "event"})
+            await _wait_for(lambda: calls[-1:] == ["event"])
+            await publisher.stop()
+            await _wait_for(lambda: not subscriber.is_connected())
+
+        assert calls == ["connect", "event", "connect", "event"]
+        assert subscriber.get_stats()["connections"] == 2
+        await subscriber.stop()
+
+    @pytest.mark.asyncio
+    async def test_on_connect_error_does_not_stop_subscriber(self, socket_path: Path):
+        """on_connectのエラーで受信が止まらないテスト"""
+        publisher = IpcEventPublisher(socket_path)
+        await publisher.start()
+        received: list[dict] = []
+
+        async def on_connect() -> None:
+            raise RuntimeError("connect error")
+
+        subscriber = IpcEventSubscriber(
+            received.append, socket_path, reconnect_delay=0.01, on_connect=on_connect
+        )
+        await subscriber.start()
+        await _wait_for(lambda: publisher.get_stats()["subscribers"] == 1)
+
+        await publisher.publish({"type": "test"})
+        await _wait_for(lambda: len(received) == 1)
+
+        assert subscriber.is_connected()
+        await subscriber.stop()
+        await publisher.stop()
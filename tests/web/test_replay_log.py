@@ -0,0 +1,67 @@
+"""リプレイログのテスト
+
+orchestrator/web/replay_log.py のテストです。
+"""
+
+import pytest
+
+from orchestrator.web.replay_log import ReplayEntry, ReplayLog
+from orchestrator.web.retention import RetentionPolicy
+
+
+def _append(log: ReplayLog, count: int) -> None:
+    """連続したシーケンス番号のエントリを追加します。"""
+    for _ in range(count):
+        seq = log.current_seq + 1
+        log.append(ReplayEntry(seq=seq, message={"seq": seq}, text=str(seq)))
+
+
+class TestReplayLog:
+    """ReplayLogのテスト"""
+
+    def test_since_returns_gap(self):
+        """指定したシーケンス番号より後のエントリが返されるテスト"""
+        log = ReplayLog()
+        _append(log, 5)
+
+        entries = log.since(2)
+
+        assert [entry.seq for entry in entries] == [3, 4, 5]
+        assert log.since(5) == []
+
+    def test_since_too_old(self):
+        """保持範囲より古い番号ではNoneが返されるテスト"""
+        log = ReplayLog(RetentionPolicy(max_entries=3))
+        _append(log, 5)
+
+        assert log.oldest_seq == 3
+        assert log.since(1) is None
+        assert [entry.seq for entry in log.since(2)] == [3, 4, 5]
+
+    def test_since_future_or_other_epoch(self):
+        """未来の番号や異なる識別子ではNoneが返されるテスト"""
+        log = ReplayLog()
+        _append(log, 2)
+
+        assert log.since(3) is None
+        assert log.since(1, epoch="other") is None
+        assert [entry.seq for entry in log.since(1, epoch=log.epoch)] == [2]
+
+    def test_append_requires_contiguous_seq(self):
+        """連続しないシーケンス番号でValueErrorが発生するテスト"""
+        log = ReplayLog()
+
+        with pytest.raises(ValueError):
+            log.append(ReplayEntry(seq=2, message={}, text=""))
+
+    def test_stats(self):
+        """統計情報のテスト"""
+        log = ReplayLog(RetentionPolicy(max_entries=2))
+        _append(log, 3)
+
+        stats = log.get_stats()
+
+        assert stats["seq"] == 3
+        assert stats["oldestSeq"] == 2
+        assert stats["entries"] == 2
+        assert stats["evicted"] == 1
@@ -0,0 +1,107 @@
+"""応答キャッシュテスト
+
+ResponseCacheとETagの判定のテストです。
+"""
+
+import json
+
+from orchestrator.web.response_cache import ResponseCache, etag_matches, make_etag
+
+
+class TestEtagMatches:
+    """etag_matches関数のテスト"""
+
+    def test_matches(self):
+        """一致・不一致の判定"""
+        etag = make_etag(b"{}")
+
+        assert etag_matches(etag, etag) is True
+        assert etag_matches(f'"other", {etag}', etag) is True
+        assert etag_matches(f"W/{etag}", etag) is True
+        assert etag_matches("*", etag) is True
+        assert etag_matches('"other"', etag) is False
+        assert etag_matches(None, etag) is False
+        assert etag_matches("", etag) is False
+
+    def test_etag_depends_on_body(self):
+        """ETagは本文の内容だけで決まる"""
+        assert make_etag(b'{"a":1}') == make_etag(b'{"a":1}')
+        assert make_etag(b'{"a":1}') != make_etag(b'{"a":2}')
+
+
+class TestResponseCache:
+    """ResponseCacheクラスのテスト"""
+
+    def test_hit_does_not_rebuild(self):
+        """同じキーでは応答を作成し直さない"""
+        cache = ResponseCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"teams": ["a"]}
+
+        first = cache.get_or_build(("teams", None, 1, None), build)
+        second = cache.get_or_build(("teams", None, 1, None), build)
+
+        assert json.loads(first.body) == {"teams": ["a"]}
+        assert second is first
+        assert len(calls) == 1
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_new_version_rebuilds(self):
+        """バージョン番号が変わると応答を作成し直す"""
+        cache = ResponseCache()
+
+        first = cache.get_or_build(("tasks", "team-a", 1, None), lambda: {"tasks": []})
+        second = cache.get_or_build(("tasks", "team-a", 2, None), lambda: {"tasks": [1]})
+
+        assert first.etag != second.etag
+        assert json.loads(second.body) == {"tasks": [1]}
+
+    def test_version_zero_is_not_cached(self):
+        """存在しないコレクション（バージョン0）の応答はキャッシュしない"""
+        cache = ResponseCache()
+
+        cache.get_or_build(("tasks", "missing", 0, None), lambda: {"tasks": []})
+
+        assert cache.get_stats()["entries"] == 0
+
+    def test_lru_eviction(self):
+        """最大エントリ数を超えると最も使われていないエントリを破棄する"""
+        cache = ResponseCache(max_entries=2)
+        cache.get_or_build(("teams", None, 1, None), lambda: {"v": 1})
+        cache.get_or_build(("teams", None, 2, None), lambda: {"v": 2})
+        cache.get_or_build(("teams", None, 1, None), lambda: {"v": 1})
+        cache.get_or_build(("teams", None, 3, None), lambda: {"v": 3})
+
+        rebuilt = []
+        cache.get_or_build(("teams", None, 2, None), lambda: rebuilt.append(1) or {"v": 2})
+        cache.get_or_build(("teams", None, 3, None), lambda: rebuilt.append(1) or {"v": 3})
+
+        assert rebuilt == [1]
+        assert cache.get_stats()["entries"] == 2
+
+    def test_max_bytes(self):
+        """本文の合計サイズの上限を超えると古いエントリを破棄する"""
+        cache = ResponseCache(max_bytes=30)
+        cache.get_or_build(("a", None, 1, None), lambda: {"data": "x" * 10})
+        cache.get_or_build(("a", None, 2, None), lambda: {"data": "y" * 10})
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 1
+        assert stats["bytes"] <= 30
+
+    def test_clear(self):
+        """clearで全エントリを破棄する"""
+        cache = ResponseCache()
+        cache.get_or_build(("teams", None, 1, None), lambda: {})
+        cache.record_not_modified()
+
+        cache.clear()
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["bytes"] == 0
+        assert stats["notModified"] == 1
@@ -0,0 +1,80 @@
+"""保持ポリシーテスト
+
+RetentionPolicyとRingBufferのテストです。
+"""
+
+from orchestrator.web.retention import RetentionPolicy, RingBuffer
+
+
+class FakeClock:
+    """テスト用の時計"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRingBuffer:
+    """RingBufferクラスのテスト"""
+
+    def test_max_entries(self):
+        """最大エントリ数を超えると古いものから破棄される"""
+        buffer: RingBuffer[int] = RingBuffer(RetentionPolicy(max_entries=3))
+
+        buffer.extend(range(5))
+
+        assert list(buffer) == [2, 3, 4]
+        assert buffer.evicted == 2
+
+    def test_max_bytes(self):
+        """最大バイト数を超えると古いものから破棄される"""
+        buffer: RingBuffer[str] = RingBuffer(
+            RetentionPolicy(max_entries=None, max_bytes=10), size_of=len
+        )
+
+        buffer.extend(["aaaa", "bbbb", "cccc"])
+
+        assert list(buffer) == ["bbbb", "cccc"]
+        assert buffer.total_bytes == 8
+
+    def test_max_bytes_keeps_latest_entry(self):
+        """上限を超える単一エントリでも最新の1件は保持される"""
+        buffer: RingBuffer[str] = RingBuffer(RetentionPolicy(max_bytes=2), size_of=len)
+
+        buffer.append("too large")
+
+        assert list(buffer) == ["too large"]
+
+    def test_max_age(self):
+        """保持期間を過ぎたエントリは破棄される"""
+        clock = FakeClock()
+        buffer: RingBuffer[str] = RingBuffer(RetentionPolicy(max_age=10), clock=clock)
+
+        buffer.append("old")
+        clock.now = 5
+        buffer.append("new")
+        clock.now = 12
+
+        assert list(buffer) == ["new"]
+        assert buffer.evicted == 1
+
+    def test_set_policy_applies_immediately(self):
+        """ポリシー変更時に即座に適用される"""
+        buffer: RingBuffer[int] = RingBuffer()
+        buffer.extend(range(10))
+
+        buffer.set_policy(RetentionPolicy(max_entries=2))
+
+        assert list(buffer) == [8, 9]
+
+    def test_indexing(self):
+        """インデックスとスライスでのアクセス"""
+        buffer: RingBuffer[int] = RingBuffer()
+        buffer.extend(range(5))
+
+        assert buffer[0] == 0
+        assert buffer[-1] == 4
+        assert buffer[-2:] == [3, 4]
+        assert len(buffer) == 5
@@ -0,0 +1,162 @@
+"""WebSocketサブスクリプション管理のテスト
+
+orchestrator/web/subscriptions.py のテストです。
+"""
+
+import pytest
+
+from orchestrator.web.subscriptions import SubscriptionIndex, message_topics
+
+
+class TestMessageTopics:
+    """message_topicsのテスト"""
+
+    def test_thinking_log_topics(self):
+        """思考ログのトピック抽出テスト"""
+        topics = message_topics(
+            {
+                "type": "thinking_log",
+                "teamName": "team-a",
+                "log": {"agentName": "alice", "teamName": "team-a"},
+            }
+        )
+
+        assert topics == {"event_types": {"thinking_log"}, "teams": {"team-a"}, "agents": {"alice"}}
+
+    def test_team_message_topics(self):
+        """チームメッセージの送信者・受信者がエージェントとして抽出されるテスト"""
+        topics = message_topics(
+            {
+                "type": "team_message",
+                "teamName": "team-a",
+                "message": {"sender": "alice", "recipient": "bob"},
+            }
+        )
+
+        assert topics["agents"] == {"alice", "bob"}
+
+    def test_health_event_topics(self):
+        """ヘルスイベントのトピック抽出テスト"""
+        topics = message_topics(
+            {"type": "health_event", "event": {"teamName": "team-a", "agentName": "alice"}}
+        )
+
+        assert topics["teams"] == {"team-a"}
+        assert topics["agents"] == {"alice"}
+
+    def test_message_without_team(self):
+        """チームを持たないメッセージはチーム次元を含まないテスト"""
+        assert message_topics({"type": "teams_update"}) == {"event_types": {"teams_update"}}
+
+
+class TestSubscriptionIndex:
+    """SubscriptionIndexのテスト"""
+
+    def test_unsubscribed_connection_receives_everything(self):
+        """購読条件のない接続は全てのメッセージを受信するテスト"""
+        index: SubscriptionIndex[str] = SubscriptionIndex()
+        index.add("ws1")
+
+        assert index.match({"type": "team_message", "teamName": "team-a"}) == {"ws1"}
+        assert index.match({"type": "teams_update"}) == {"ws1"}
+
+    def test_team_subscription(self):
+        """チームで絞り込むテスト"""
+        index: SubscriptionIndex[str] = SubscriptionIndex()
+        index.subscribe("ws1", teams=["team-a"])
+        index.subscribe("ws2", teams=["team-b"])
+        index.add("ws3")
+
+        assert index.match({"type": "team_message", "teamName": "team-a"}) == {"ws1", "ws3"}
+        # チームを持たないメッセージは全員に配信
+        assert index.match({"type": "teams_update"}) == {"ws1", "ws2", "ws3"}
+
+    def test_combined_dimensions(self):
+        """複数の次元の条件が全て満たされる場合のみ一致するテスト"""
+        index: SubscriptionIndex[str] = SubscriptionIndex()
+        index.subscribe("ws1", teams=["team-a"], event_types=["thinking_log"], agents=["alice"])
+
+        alice_log = {"type": "thinking_log", "teamName": "team-a", "log": {"agentName": "alice"}}
+        bob_log = {"type": "thinking_log", "teamName": "team-a", "log": {"agentName": "bob"}}
+        task = {"type": "task_upserted", "teamName": "team-a", "task": {"owner": "alice"}}
+
+        assert index.match(alice_log) == {"ws1"}
+        assert index.match(bob_log) == set()
+        assert index.match(task) == set()
+
+    def test_unsubscribe_values_restores_wildcard(self):
+        """次元の値を全て解除するとワイルドカードに戻るテスト"""
+        index: SubscriptionIndex[str] = SubscriptionIndex()
+        index.subscribe("ws1", teams=["team-a", "team-b"])
+
+        index.unsubscribe("ws1", teams=["team-a"])
+        assert index.match({"type": "x", "teamName": "team-a"}) == set()
+        assert index.match({"type": "x", "teamName": "team-b"}) == {"ws1"}
+
+        index.unsubscribe("ws1", teams=["team-b"])
+        assert index.match({"type": "x", "teamName": "team-a"}) == {"ws1"}
+
+    def test_unsubscribe_all(self):
+        """条件なしのunsubscribeで全ての購読条件が解除されるテスト"""
+        index: SubscriptionIndex[str] = SubscriptionIndex()
+        index.subscribe("ws1", teams=["team-a"], agents=["alice"])
+
+        subscription = index.unsubscribe("ws1")
+
+        assert subscription.to_dict() == {"teams": [], "eventTypes": [], "agents": []}
+        assert index.match({"type": "x", "teamName": "team-b"}) == {"ws1"}
+
+    def test_remove_cleans_index(self):
+        """接続の削除でインデックスが掃除されるテスト"""
+        index: SubscriptionIndex[str] = SubscriptionIndex()
+        index.subscribe("ws1", teams=["team-a"])
+
+        index.remove("ws1")
+
+        assert len(index) == 0
+        assert index._index == {}
+        assert index._groups == {}
+        assert index.match({"type": "x", "teamName": "team-a"}) == set()
+
+    def test_match_agrees_with_matches(self):
+        """インデックスによる絞り込みが接続ごとの判定と一致するテスト"""
+        index: SubscriptionIndex[str] = SubscriptionIndex()
+        for i in range(5):
+            index.add(f"all{i}")
+        index.subscribe("team-a", teams=["team-a"])
+        index.subscribe("team-ab", teams=["team-a", "team-b"])
+        index.subscribe("alice", agents=["alice"])
+        index.subscribe("logs-a", teams=["team-a"], event_types=["thinking_log"])
+        index.subscribe("alice-msg", event_types=["team_message"], agents=["alice"])
+
+        messages = [
+            {"type": "thinking_log", "teamName": "team-a", "log": {"agentName": "alice"}},
+            {"type": "thinking_log", "teamName": "team-b", "log": {"agentName": "bob"}},
+            {"type": "team_message", "teamName": "team-a", "message": {"sender": "alice"}},
+            {"type": "team_message", "teamName": "team-c", "message": {"sender": "bob"}},
+            {"type": "teams_update"},
+            {},
+        ]
+        connections = set(index._subscriptions)
+        for message in messages:
+            expected = {c for c in connections if index.matches(c, message)}
+            assert index.match(message) == expected
+
+    def test_wildcard_connections_are_grouped(self):
+        """購読条件のない接続が1つのグループにまとめられるテスト"""
+        index: SubscriptionIndex[str] = SubscriptionIndex()
+        index.add("ws1")
+        index.add("ws2")
+        index.subscribe("ws3", teams=["team-a"])
+
+        assert index._groups == {frozenset(): {"ws1", "ws2"}, frozenset({"teams"}): {"ws3"}}
+
+        index.unsubscribe("ws3")
+        assert index._groups == {frozenset(): {"ws1", "ws2", "ws3"}}
+
+    def test_unknown_dimension(self):
+        """未知の次元でValueErrorが発生するテスト"""
+        index: SubscriptionIndex[str] = SubscriptionIndex()
+
+        with pytest.raises(ValueError):
+            index.subscribe("ws1", channels=["x"])
@@ -25,7 +25,7 @@ class TestTeamFileObserver:
         observer = TeamFileObserver(base_dir=tmp_path)
 
         assert observer._base_dir == tmp_path
-        assert observer._observer is None
+        assert observer._handler is None
         assert not observer.is_running()
 
     def test_register_callback(self, tmp_path: Path):
@@ -150,7 +150,7 @@ class TestTaskFileObserver:
         observer = TaskFileObserver(task_dir=tmp_path)
 
         assert observer._task_dir == tmp_path
-        assert observer._observer is None
+        assert observer._handler is None
         assert not observer.is_running()
 
     def test_register_callback(self, tmp_path: Path):
@@ -209,6 +209,87 @@ class TestTaskFileObserver:
         # （タイミング依存のため、実際の環境では検出されない場合あり）
 
 
+# ============================================================================
+# ベースディレクトリ設定テスト
+# ============================================================================
+
+
+class TestCustomBaseDirectory:
+    """ベースディレクトリ設定がイベント処理に反映されるテスト"""
+
+    def test_team_handler_uses_base_dir(self, tmp_path: Path):
+        """指定したベースディレクトリからチーム名を判定する"""
+        from orchestrator.web.team_file_observer import _TeamFileEventHandler
+
+        detected = []
+        callbacks = {
+            "config_changed": [lambda team, path: detected.append(("config", team))],
+            "inbox_changed": [lambda team, path: detected.append(("inbox", team))],
+        }
+        handler = _TeamFileEventHandler(callbacks, base_dir=tmp_path)
+
+        handler._handle_file_change("modified", str(tmp_path / "test-team" / "config.json"))
+        handler._handle_file_change(
+            "modified", str(tmp_path / "test-team" / "inboxes" / "agent1.json")
+        )
+        handler._handle_file_change("modified", "/elsewhere/other-team/config.json")
+
+        assert detected == [("config", "test-team"), ("inbox", "test-team")]
+
+    def test_relative_base_dir_matches_absolute_events(self, tmp_path: Path, monkeypatch):
+        """相対パスのベースディレクトリでも絶対パスのイベントからチーム名を判定する"""
+        from orchestrator.web.team_file_observer import (
+            _TaskFileEventHandler,
+            _TeamFileEventHandler,
+        )
+
+        monkeypatch.chdir(tmp_path)
+        detected = []
+        team_handler = _TeamFileEventHandler(
+            {"config_changed": [lambda team, path: detected.append(("config", team))]},
+            base_dir="teams",
+        )
+        task_handler = _TaskFileEventHandler(
+            [lambda team, path: detected.append(("task", team))], task_dir="tasks"
+        )
+
+        team_handler._handle_file_change(
+            "modified", str(tmp_path / "teams" / "test-team" / "config.json")
+        )
+        task_handler._handle_task_change(str(tmp_path / "tasks" / "test-team" / "1.json"))
+
+        assert detected == [("config", "test-team"), ("task", "test-team")]
+
+    def test_team_handler_ignores_nested_directory_deletion(self, tmp_path: Path):
+        """チームディレクトリ配下のディレクトリ削除はチーム削除として扱わない"""
+        from orchestrator.web.team_file_observer import _TeamFileEventHandler
+
+        deleted = []
+        handler = _TeamFileEventHandler(
+            {"team_deleted": [lambda team, path: deleted.append(team)]},
+            base_dir=tmp_path,
+        )
+
+        handler._handle_team_deleted(str(tmp_path / "test-team" / "inboxes"))
+        handler._handle_team_deleted(str(tmp_path / "test-team"))
+
+        assert deleted == ["test-team"]
+
+    def test_task_handler_uses_task_dir(self, tmp_path: Path):
+        """指定したタスクディレクトリからチーム名を判定する"""
+        from orchestrator.web.team_file_observer import _TaskFileEventHandler
+
+        detected = []
+        handler = _TaskFileEventHandler(
+            [lambda team, path: detected.append(team)], task_dir=tmp_path
+        )
+
+        handler._handle_task_change(str(tmp_path / "test-team" / "1.json"))
+        handler._handle_task_change(str(tmp_path / "orphan.json"))
+
+        assert detected == ["test-team"]
+
+
 # ============================================================================
 # 統合テスト
 # ============================================================================
@@ -15,6 +15,7 @@ from orchestrator.web.team_models import (
     TeamMessage,
     _classify_message_category,
     _detect_emotion,
+    load_task_file,
     load_team_config,
     load_team_messages,
 )
@@ -364,6 +365,34 @@ class TestLoadTeamMessages:
         assert result == []
 
 
+# ============================================================================
+# load_task_file テスト
+# ============================================================================
+
+
+class TestLoadTaskFile:
+    """load_task_file関数のテスト"""
+
+    def test_load_task_file(self, tmp_path: Path):
+        """タスクファイルの読み込み"""
+        task_file = tmp_path / "1.json"
+        task_file.write_text(json.dumps({"id": "1", "subject": "Test task", "status": "pending"}))
+
+        task = load_task_file(task_file)
+
+        assert task is not None
+        assert task.task_id == "1"
+        assert task.subject == "Test task"
+
+    def test_load_task_file_invalid(self, tmp_path: Path):
+        """不正なタスクファイルの場合はNone"""
+        task_file = tmp_path / "1.json"
+        task_file.write_text("{invalid")
+
+        assert load_task_file(task_file) is None
+        assert load_task_file(tmp_path / "missing.json") is None
+
+
 # ============================================================================
 # load_team_tasks テスト
 # ============================================================================
@@ -4,11 +4,16 @@ TeamsMonitor統合監視クラスのテストです。
 """
 
 import json
+import os
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
-from orchestrator.web.team_models import TeamInfo
-from orchestrator.web.teams_monitor import TeamsMonitor
+import pytest
+
+from orchestrator.web.retention import RetentionPolicy
+from orchestrator.web.team_models import TeamInfo, TeamsRoot, load_inbox_file
+from orchestrator.web.teams_monitor import TEAM_STATUS_SCHEMA_VERSION, TeamsMonitor
 
 # ============================================================================
 # TeamsMonitor 初期化テスト
@@ -113,13 +118,66 @@ class TestTeamsMonitorTeamManagement:
             content="Hello",
             timestamp="2026-02-06T12:00:00Z",
         )
-        monitor._messages["test-team"] = [msg]
+        monitor._messages["test-team"] = monitor._new_message_buffer("test-team", [msg])
 
         messages = monitor.get_team_messages("test-team")
 
         assert len(messages) == 1
         assert messages[0]["content"] == "Hello"
 
+    def test_get_team_messages_page(self):
+        """メッセージをタイムスタンプ順にページ単位で取得できる"""
+        from orchestrator.web.team_models import TeamMessage
+
+        monitor = TeamsMonitor()
+        messages = [
+            TeamMessage(id=f"msg-{i}", content=f"m{i}", timestamp=f"2026-02-06T12:0{i}:00Z")
+            for i in (2, 0, 1, 4, 3)
+        ]
+        monitor._messages["test-team"] = monitor._new_message_buffer("test-team", messages)
+
+        latest = monitor.get_team_messages_page("test-team", limit=2)
+        older = monitor.get_team_messages_page("test-team", limit=2, before=latest.before)
+        ranged = monitor.get_team_messages_page(
+            "test-team", since="2026-02-06T12:01:00Z", until="2026-02-06T12:03:00Z"
+        )
+
+        assert [m["content"] for m in latest.items] == ["m3", "m4"]
+        assert [m["content"] for m in older.items] == ["m1", "m2"]
+        assert older.has_more is True
+        assert [m["content"] for m in ranged.items] == ["m1", "m2"]
+        assert monitor.get_team_messages_page("unknown").items == []
+
+    def test_concurrent_append_and_page(self):
+        """監視スレッドの追加と並行してページを取得しても状態が壊れないテスト"""
+        monitor = TeamsMonitor(retention=RetentionPolicy(max_entries=20))
+        monitor._messages["test-team"] = monitor._new_message_buffer("test-team", [])
+        errors = []
+
+        def append() -> None:
+            for i in range(3000):
+                monitor.apply_event(
+                    {
+                        "type": "team_message",
+                        "teamName": "test-team",
+                        "message": {"id": f"m{i}", "timestamp": f"2026-01-01T00:00:{i % 60:02d}"},
+                    }
+                )
+
+        thread = threading.Thread(target=append)
+        thread.start()
+        try:
+            while thread.is_alive():
+                page = monitor.get_team_messages_page("test-team", limit=10)
+                monitor.get_version("messages", "test-team")
+                assert len(page.items) <= 10
+        except Exception as e:
+            errors.append(e)
+        thread.join()
+
+        assert errors == []
+        assert len(monitor.get_team_messages("test-team")) == 20
+
     def test_get_team_tasks_empty(self):
         """タスクがない場合"""
         monitor = TeamsMonitor()
@@ -128,6 +186,39 @@ class TestTeamsMonitorTeamManagement:
 
         assert tasks == []
 
+    def test_get_team_status(self, tmp_path: Path):
+        """保持中のチーム情報とタスクからチームの状態を作成するテスト"""
+        monitor = TeamsMonitor(roots=TeamsRoot.from_base(tmp_path))
+        monitor.apply_event(
+            {
+                "type": "team_created",
+                "teamName": "test-team",
+                "team": {
+                    "name": "test-team",
+                    "description": "Test",
+                    "members": [{"name": "agent1"}],
+                },
+            }
+        )
+        monitor.apply_event(
+            {
+                "type": "task_upserted",
+                "teamName": "test-team",
+                "task": {"taskId": "1", "subject": "S"},
+            }
+        )
+
+        with patch("orchestrator.web.teams_monitor.load_team_config") as mock_load:
+            status = monitor.get_team_status("test-team")
+
+        mock_load.assert_not_called()
+        assert status["schemaVersion"] == TEAM_STATUS_SCHEMA_VERSION
+        assert status["description"] == "Test"
+        assert [member["name"] for member in status["members"]] == ["agent1"]
+        assert status["taskCount"] == 1
+        assert status["tasks"][0]["taskId"] == "1"
+        assert monitor.get_team_status("unknown-team") is None
+
     def test_get_team_thinking_empty(self):
         """思考ログがない場合"""
         monitor = TeamsMonitor()
@@ -335,6 +426,190 @@ class TestTeamsMonitorEventHandlers:
         assert len(messages) == 1
         assert messages[0].content == "Hello"
 
+    def test_on_inbox_changed_broadcasts_only_new_messages(self, tmp_path: Path):
+        """inbox変更時に追加分のメッセージのみ配信されるテスト"""
+        monitor = TeamsMonitor()
+        monitor._messages.pop("test-team", None)
+        monitor._inbox_cursors.pop("test-team", None)
+        broadcasts = []
+        monitor.register_update_callback(broadcasts.append)
+
+        inbox_dir = tmp_path / "test-team" / "inboxes"
+        inbox_dir.mkdir(parents=True)
+        inbox_file = inbox_dir / "agent1.json"
+        inbox_file.write_text(json.dumps([{"id": "msg-001", "content": "First"}]))
+        monitor._on_inbox_changed("test-team", inbox_file)
+
+        # デバウンス期間内に2件追加された場合も両方配信される
+        inbox_file.write_text(
+            json.dumps(
+                [
+                    {"id": "msg-001", "content": "First"},
+                    {"id": "msg-002", "content": "Second"},
+                    {"id": "msg-003", "content": "Third"},
+                ]
+            )
+        )
+        monitor._on_inbox_changed("test-team", inbox_file)
+
+        assert [b["message"]["content"] for b in broadcasts] == ["First", "Second", "Third"]
+        assert [m.content for m in monitor._messages["test-team"]] == ["First", "Second", "Third"]
+
+    def test_on_inbox_changed_reads_only_changed_file(self, tmp_path: Path):
+        """変更されたinboxファイルのみ読み込まれるテスト"""
+        monitor = TeamsMonitor()
+        monitor._inbox_cursors.pop("test-team", None)
+
+        inbox_dir = tmp_path / "test-team" / "inboxes"
+        inbox_dir.mkdir(parents=True)
+        (inbox_dir / "agent1.json").write_text(json.dumps([{"content": "A"}]))
+        inbox_file = inbox_dir / "agent2.json"
+        inbox_file.write_text(json.dumps([{"content": "B"}]))
+
+        with patch(
+            "orchestrator.web.teams_monitor.load_inbox_file", wraps=load_inbox_file
+        ) as mock_load:
+            monitor._on_inbox_changed("test-team", inbox_file)
+            # 変更がなければ再パースしない
+            monitor._on_inbox_changed("test-team", inbox_file)
+
+        mock_load.assert_called_once_with(inbox_file)
+
+    def test_on_inbox_changed_truncated_inbox(self, tmp_path: Path):
+        """inboxが切り詰められた場合にチーム全体を読み直すテスト"""
+        monitor = TeamsMonitor()
+        monitor._messages.pop("test-team", None)
+        monitor._inbox_cursors.pop("test-team", None)
+
+        inbox_dir = tmp_path / "test-team" / "inboxes"
+        inbox_dir.mkdir(parents=True)
+        inbox_file = inbox_dir / "agent1.json"
+        inbox_file.write_text(json.dumps([{"content": "A"}, {"content": "B"}]))
+        monitor._on_inbox_changed("test-team", inbox_file)
+
+        inbox_file.write_text(json.dumps([{"content": "C"}]))
+        monitor._on_inbox_changed("test-team", inbox_file)
+
+        assert [m.content for m in monitor._messages["test-team"]] == ["C"]
+
+    def test_on_inbox_changed_message_marked_read(self, tmp_path: Path):
+        """件数が同じまま既読化されたinboxを読み直し、追加分のみ配信するテスト"""
+        monitor = TeamsMonitor(roots=TeamsRoot(teams_dir=tmp_path, tasks_dir=tmp_path / "tasks"))
+        broadcasts = []
+        monitor.register_update_callback(broadcasts.append)
+
+        inbox_dir = tmp_path / "test-team" / "inboxes"
+        inbox_dir.mkdir(parents=True)
+        inbox_file = inbox_dir / "agent1.json"
+        inbox_file.write_text(json.dumps([{"id": "msg-001", "content": "A", "read": False}]))
+        monitor._on_inbox_changed("test-team", inbox_file)
+
+        inbox_file.write_text(json.dumps([{"id": "msg-001", "content": "A", "read": True}]))
+        monitor._on_inbox_changed("test-team", inbox_file)
+
+        assert [m["read"] for m in monitor.get_team_messages("test-team")] == [True]
+
+        # 既存メッセージの書き換えと追加が同時に起きた場合も両方反映される
+        inbox_file.write_text(
+            json.dumps(
+                [
+                    {"id": "msg-001", "content": "A (edited)", "read": True},
+                    {"id": "msg-002", "content": "B"},
+                ]
+            )
+        )
+        monitor._on_inbox_changed("test-team", inbox_file)
+
+        messages = monitor.get_team_messages("test-team")
+        assert [m["content"] for m in messages] == ["A (edited)", "B"]
+        assert [b["message"]["content"] for b in broadcasts] == ["A", "B"]
+
+    def test_on_inbox_changed_respects_retention(self, tmp_path: Path):
+        """保持ポリシーを超えたメッセージがメモリから破棄されるテスト"""
+        monitor = TeamsMonitor(roots=TeamsRoot(teams_dir=tmp_path, tasks_dir=tmp_path / "tasks"))
+        monitor.set_team_retention("test-team", RetentionPolicy(max_entries=2))
+
+        inbox_dir = tmp_path / "test-team" / "inboxes"
+        inbox_dir.mkdir(parents=True)
+        inbox_file = inbox_dir / "agent1.json"
+        inbox_file.write_text(json.dumps([{"content": c} for c in ["A", "B", "C"]]))
+        monitor._on_inbox_changed("test-team", inbox_file)
+
+        assert [m["content"] for m in monitor.get_team_messages("test-team")] == ["B", "C"]
+        history = monitor.get_team_messages("test-team", include_history=True)
+        assert [m["content"] for m in history] == ["A", "B", "C"]
+
+    def test_on_task_changed_upserts_single_task(self, tmp_path: Path):
+        """変更されたタスクのみが差分として配信されるテスト"""
+        monitor = TeamsMonitor(roots=TeamsRoot(teams_dir=tmp_path / "teams", tasks_dir=tmp_path))
+        monitor._load_tasks("test-team")
+        broadcasts = []
+        monitor.register_update_callback(broadcasts.append)
+
+        task_dir = tmp_path / "test-team"
+        task_dir.mkdir()
+        (task_dir / "1.json").write_text(
+            json.dumps({"id": "1", "subject": "A", "status": "pending"})
+        )
+        task_file = task_dir / "2.json"
+        task_file.write_text(json.dumps({"id": "2", "subject": "B", "status": "pending"}))
+
+        monitor._on_task_changed("test-team", task_file)
+
+        task = monitor._tasks["test-team"]["2"].to_dict()
+        # 同梱のビルド済みフロントエンド向けに全タスクのtasks_updatedも配信される
+        assert broadcasts == [
+            {"type": "task_upserted", "teamName": "test-team", "task": task},
+            {"type": "tasks_updated", "teamName": "test-team", "tasks": [task]},
+        ]
+        assert [t["taskId"] for t in monitor.get_team_tasks("test-team")] == ["2"]
+
+        # 内容が変わらなければ配信しない
+        monitor._on_task_changed("test-team", task_file)
+        assert len(broadcasts) == 2
+
+        task_file.write_text(json.dumps({"id": "2", "subject": "B", "status": "completed"}))
+        monitor._on_task_changed("test-team", task_file)
+
+        assert broadcasts[-2]["task"]["status"] == "completed"
+        assert [t["status"] for t in broadcasts[-1]["tasks"]] == ["completed"]
+
+    def test_on_task_changed_deleted_file(self, tmp_path: Path):
+        """タスクファイル削除時にtask_deletedが配信されるテスト"""
+        monitor = TeamsMonitor(roots=TeamsRoot(teams_dir=tmp_path / "teams", tasks_dir=tmp_path))
+        task_dir = tmp_path / "test-team"
+        task_dir.mkdir()
+        task_file = task_dir / "1.json"
+        task_file.write_text(json.dumps({"id": "1", "subject": "A", "status": "pending"}))
+        monitor._load_tasks("test-team")
+        broadcasts = []
+        monitor.register_update_callback(broadcasts.append)
+
+        task_file.unlink()
+        monitor._on_task_changed("test-team", task_file)
+
+        assert broadcasts == [
+            {"type": "task_deleted", "teamName": "test-team", "taskId": "1"},
+            {"type": "tasks_updated", "teamName": "test-team", "tasks": []},
+        ]
+        assert monitor.get_team_tasks("test-team") == []
+
+    def test_on_task_changed_partial_write(self, tmp_path: Path):
+        """書き込み途中のタスクファイルは無視されるテスト"""
+        monitor = TeamsMonitor(roots=TeamsRoot(teams_dir=tmp_path / "teams", tasks_dir=tmp_path))
+        monitor._load_tasks("test-team")
+        broadcasts = []
+        monitor.register_update_callback(broadcasts.append)
+
+        task_dir = tmp_path / "test-team"
+        task_dir.mkdir()
+        task_file = task_dir / "1.json"
+        task_file.write_text('{"id": "1", "subj')
+
+        monitor._on_task_changed("test-team", task_file)
+
+        assert broadcasts == []
+
 
 # ============================================================================
 # TeamsMonitor 思考ログキャプチャテスト
@@ -352,3 +627,205 @@ class TestTeamsMonitorThinkingCapture:
         monitor._capture_thinking()
 
         # ファイルベースなので何もしない（空実行）
+
+
+# ============================================================================
+# TeamsMonitor ルートディレクトリ設定テスト
+# ============================================================================
+
+
+def _write_team(teams_dir: Path, team_name: str) -> Path:
+    """テスト用のチームディレクトリを作成します。"""
+    team_dir = teams_dir / team_name
+    (team_dir / "inboxes").mkdir(parents=True)
+    (team_dir / "config.json").write_text(json.dumps({"name": team_name, "members": []}))
+    return team_dir
+
+
+class TestTeamsMonitorRoots:
+    """TeamsMonitorのルートディレクトリ設定のテスト"""
+
+    def test_loads_teams_from_multiple_roots(self, tmp_path: Path):
+        """複数ルートのチームとタスクを読み込むテスト"""
+        root_a = TeamsRoot.from_base(tmp_path / "a")
+        root_b = TeamsRoot.from_base(tmp_path / "b")
+        _write_team(root_a.teams_dir, "team-a")
+        _write_team(root_b.teams_dir, "team-b")
+        (root_b.tasks_dir / "team-b").mkdir(parents=True)
+        (root_b.tasks_dir / "team-b" / "1.json").write_text(json.dumps({"id": "1", "subject": "B"}))
+
+        monitor = TeamsMonitor(roots=[root_a, root_b])
+
+        assert sorted(team["name"] for team in monitor.get_teams()) == ["team-a", "team-b"]
+        assert [task["taskId"] for task in monitor.get_team_tasks("team-b")] == ["1"]
+        assert monitor.get_team_tasks("team-a") == []
+
+    def test_team_created_in_second_root(self, tmp_path: Path):
+        """2つ目のルートで作成されたチームのタスクをそのルートから読み込むテスト"""
+        root_a = TeamsRoot.from_base(tmp_path / "a")
+        root_b = TeamsRoot.from_base(tmp_path / "b")
+        monitor = TeamsMonitor(roots=[root_a, root_b])
+
+        team_dir = _write_team(root_b.teams_dir, "team-b")
+        (root_b.tasks_dir / "team-b").mkdir(parents=True)
+        (root_b.tasks_dir / "team-b" / "1.json").write_text(json.dumps({"id": "1", "subject": "B"}))
+        monitor._on_team_created("team-b", team_dir)
+
+        assert [task["taskId"] for task in monitor.get_team_tasks("team-b")] == ["1"]
+
+    def test_teams_roots_from_env(self, tmp_path: Path, monkeypatch):
+        """環境変数からルートディレクトリ設定を読み込むテスト"""
+        from orchestrator.web.team_models import teams_roots_from_env
+
+        monkeypatch.setenv(
+            "ORCHESTRATOR_TEAMS_ROOTS", f"{tmp_path / 'a'}{os.pathsep}{tmp_path / 'b'}"
+        )
+
+        roots = teams_roots_from_env()
+
+        assert roots == [TeamsRoot.from_base(tmp_path / "a"), TeamsRoot.from_base(tmp_path / "b")]
+
+    def test_teams_roots_from_env_relative(self, tmp_path: Path, monkeypatch):
+        """相対パスのルートは絶対パスに変換されるテスト（監視イベントは絶対パスで届くため）"""
+        from orchestrator.web.team_models import teams_roots_from_env
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ORCHESTRATOR_TEAMS_ROOTS", "relative-root")
+
+        roots = teams_roots_from_env()
+
+        assert roots[0].teams_dir == tmp_path / "relative-root" / "teams"
+        assert roots[0].tasks_dir == tmp_path / "relative-root" / "tasks"
+
+    def test_teams_roots_from_env_default(self, monkeypatch):
+        """環境変数が未設定の場合はデフォルトのルート"""
+        from orchestrator.web.team_models import teams_roots_from_env
+
+        monkeypatch.delenv("ORCHESTRATOR_TEAMS_ROOTS", raising=False)
+
+        assert teams_roots_from_env() == [TeamsRoot.default()]
+
+
+class TestTeamsMonitorApplyEvent:
+    """他のプロセスから受信したイベントの反映のテスト"""
+
+    def test_apply_team_and_task_events(self, tmp_path: Path):
+        """チーム・メッセージ・タスクのイベントが状態に反映され、コールバックに通知されるテスト"""
+        root = TeamsRoot.from_base(tmp_path)
+        monitor = TeamsMonitor(roots=root)
+        events = []
+        monitor.register_update_callback(events.append)
+
+        team = {"name": "team-a", "description": "A", "members": []}
+        applied = [
+            {"type": "team_created", "teamName": "team-a", "team": team},
+            {
+                "type": "team_message",
+                "teamName": "team-a",
+                "message": {"id": "m1", "content": "hi"},
+            },
+            {
+                "type": "task_upserted",
+                "teamName": "team-a",
+                "task": {"taskId": "1", "subject": "S"},
+            },
+            {
+                "type": "task_upserted",
+                "teamName": "team-a",
+                "task": {"taskId": "2", "subject": "T"},
+            },
+            {"type": "task_deleted", "teamName": "team-a", "taskId": "1"},
+            {"type": "team_updated", "teamName": "team-a", "team": {**team, "description": "B"}},
+        ]
+        for event in applied:
+            assert monitor.apply_event(event) is True
+
+        assert monitor.get_teams()[0]["description"] == "B"
+        assert [message["id"] for message in monitor.get_team_messages("team-a")] == ["m1"]
+        assert [task["taskId"] for task in monitor.get_team_tasks("team-a")] == ["2"]
+        assert events == applied
+
+        assert monitor.apply_event({"type": "team_deleted", "teamName": "team-a"}) is True
+        assert monitor.get_teams() == []
+        assert monitor.get_team_tasks("team-a") == []
+
+    def test_apply_team_created_loads_existing_files(self, tmp_path: Path):
+        """作成イベントの反映時に既存のタスクをディスクから読み込むテスト"""
+        root = TeamsRoot.from_base(tmp_path)
+        monitor = TeamsMonitor(roots=root)
+        _write_team(root.teams_dir, "team-a")
+        (root.tasks_dir / "team-a").mkdir(parents=True)
+        (root.tasks_dir / "team-a" / "1.json").write_text(json.dumps({"id": "1", "subject": "A"}))
+
+        monitor.apply_event(
+            {"type": "team_created", "teamName": "team-a", "team": {"name": "team-a"}}
+        )
+
+        assert [task["taskId"] for task in monitor.get_team_tasks("team-a")] == ["1"]
+
+    def test_reload_replaces_state_from_disk(self, tmp_path: Path):
+        """再読み込みで切断中の変更がディスクから反映され、消えたチームが削除されるテスト"""
+        root = TeamsRoot.from_base(tmp_path)
+        _write_team(root.teams_dir, "team-a")
+        monitor = TeamsMonitor(roots=root)
+        monitor.apply_event(
+            {"type": "team_created", "teamName": "team-gone", "team": {"name": "team-gone"}}
+        )
+
+        _write_team(root.teams_dir, "team-b")
+        (root.tasks_dir / "team-b").mkdir(parents=True)
+        (root.tasks_dir / "team-b" / "1.json").write_text(json.dumps({"id": "1", "subject": "B"}))
+        version = monitor.get_version("teams")
+        monitor.reload()
+
+        assert sorted(team["name"] for team in monitor.get_teams()) == ["team-a", "team-b"]
+        assert [task["taskId"] for task in monitor.get_team_tasks("team-b")] == ["1"]
+        assert monitor.get_version("teams") != version
+
+    def test_apply_ignores_other_events(self, tmp_path: Path):
+        """チーム以外のイベントは反映されないテスト"""
+        monitor = TeamsMonitor(roots=TeamsRoot.from_base(tmp_path))
+
+        assert monitor.apply_event({"type": "health_event", "event": {}}) is False
+        assert monitor.apply_event({"type": "team_message"}) is False
+
+
+class TestTeamsMonitorVersions:
+    """応答キャッシュ用のバージョン番号のテスト"""
+
+    def test_versions_change_on_mutation(self, tmp_path: Path):
+        """変更されたコレクションのバージョン番号だけが新しくなるテスト"""
+        monitor = TeamsMonitor(roots=TeamsRoot.from_base(tmp_path))
+        team = {"name": "team-a", "members": []}
+
+        assert monitor.get_version("tasks", "team-a") == 0
+        assert monitor.get_version("messages", "team-a") == 0
+
+        monitor.apply_event({"type": "team_created", "teamName": "team-a", "team": team})
+        teams = monitor.get_version("teams")
+        tasks = monitor.get_version("tasks", "team-a")
+        messages = monitor.get_version("messages", "team-a")
+
+        monitor.apply_event(
+            {"type": "task_upserted", "teamName": "team-a", "task": {"taskId": "1", "subject": "S"}}
+        )
+        assert monitor.get_version("tasks", "team-a") > tasks
+        assert monitor.get_version("teams") == teams
+        assert monitor.get_version("messages", "team-a") == messages
+
+        monitor.apply_event({"type": "team_message", "teamName": "team-a", "message": {"id": "m1"}})
+        assert monitor.get_version("messages", "team-a") > messages
+
+        monitor.apply_event({"type": "team_updated", "teamName": "team-a", "team": team})
+        assert monitor.get_version("teams") > teams
+
+        monitor.apply_event({"type": "team_deleted", "teamName": "team-a"})
+        assert monitor.get_version("tasks", "team-a") == 0
+        assert monitor.get_version("messages", "team-a") == 0
+
+    def test_unknown_collection(self, tmp_path: Path):
+        """未知のコレクションはValueErrorになるテスト"""
+        monitor = TeamsMonitor(roots=TeamsRoot.from_base(tmp_path))
+
+        with pytest.raises(ValueError):
+            monitor.get_version("health")
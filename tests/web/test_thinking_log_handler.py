@@ -8,7 +8,9 @@ import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+from orchestrator.web.retention import RetentionPolicy
 from orchestrator.web.thinking_log_handler import (
+    JsonlTailer,
     ThinkingLogEntry,
     ThinkingLogHandler,
     get_thinking_log_handler,
@@ -146,6 +148,48 @@ class TestThinkingLogHandler:
             # コールバックは1回のみ
             callback.assert_called_once()
 
+    def test_add_log_dedup_index_is_bounded(self) -> None:
+        """重複判定インデックスが容量上限で古いものから破棄されるテスト"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            handler = ThinkingLogHandler(log_dir=tmpdir, dedup_capacity=2)
+
+            for content in ["a", "b", "c"]:
+                handler.add_log(
+                    ThinkingLogEntry(
+                        agent_name="agent", content=content, timestamp="", team_name="t"
+                    )
+                )
+
+            assert len(handler._dedup["t"]) == 2
+
+            # 破棄された "a" は再度受け付けられ、保持中の "c" は重複として扱われる
+            handler.add_log(
+                ThinkingLogEntry(agent_name="agent", content="a", timestamp="", team_name="t")
+            )
+            handler.add_log(
+                ThinkingLogEntry(agent_name="agent", content="c", timestamp="", team_name="t")
+            )
+
+            assert [log["content"] for log in handler.get_logs("t")] == ["a", "b", "c", "a"]
+
+    def test_load_existing_logs_populates_dedup_index(self) -> None:
+        """既存ログの読み込み時に重複判定インデックスが構築されるテスト"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            line = (
+                json.dumps({"agentName": "agent1", "content": "Existing", "teamName": "test-team"})
+                + "\n"
+            )
+            (Path(tmpdir) / "test-team.jsonl").write_text(line * 2, encoding="utf-8")
+
+            handler = ThinkingLogHandler(log_dir=tmpdir)
+            handler.add_log(
+                ThinkingLogEntry(
+                    agent_name="agent1", content="Existing", timestamp="", team_name="test-team"
+                )
+            )
+
+            assert len(handler.get_logs("test-team")) == 1
+
     def test_add_log_different_teams(self) -> None:
         """異なるチームのログ追加テスト"""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -244,6 +288,35 @@ class TestThinkingLogHandler:
             assert len(logs) == 1
             assert logs[0]["content"] == "Existing log"
 
+    def test_reload(self, tmp_path: Path) -> None:
+        """再読み込みでメモリ上のログがログファイルの内容に置き換わるテスト"""
+        handler = ThinkingLogHandler(log_dir=tmp_path)
+        handler.add_log(
+            ThinkingLogEntry(
+                agent_name="agent1",
+                content="Memory only",
+                timestamp="2026-02-06T12:00:00",
+                team_name="test-team",
+            ),
+            persist=False,
+        )
+        (tmp_path / "test-team.jsonl").write_text(
+            json.dumps(
+                {
+                    "agentName": "agent1",
+                    "content": "On disk",
+                    "timestamp": "2026-02-06T12:00:01",
+                    "teamName": "test-team",
+                }
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+
+        handler.reload()
+
+        assert [log["content"] for log in handler.get_logs("test-team")] == ["On disk"]
+
 
 class TestSendThinkingLog:
     """send_thinking_log関数のテスト"""
@@ -348,51 +421,376 @@ class TestThinkingLogEventHandler:
             assert len(callback_called) == 0
 
     def test_event_handler_debounce(self) -> None:
-        """デバウンス処理のテスト"""
+        """デバウンス処理のテスト（バースト中の最後の書き込みも処理される）"""
         import tempfile
-        import time
 
+        from orchestrator.web.debouncer import CoalescingDebouncer
         from orchestrator.web.thinking_log_handler import _ThinkingLogEventHandler
 
         with tempfile.TemporaryDirectory() as tmpdir:
             log_file = Path(tmpdir) / "test.jsonl"
-            with open(log_file, "w", encoding="utf-8") as f:
-                f.write(
-                    json.dumps(
-                        {
-                            "agentName": "agent1",
-                            "content": "Test log",
-                            "timestamp": "2026-02-06T12:00:00",
-                        }
-                    )
-                    + "\n"
-                )
+            log_file.touch()
 
             callback_called = []
 
             def callback(entry):
                 callback_called.append(entry)
 
-            handler = _ThinkingLogEventHandler(callback)
+            debouncer = CoalescingDebouncer(quiet_time=60, max_latency=60)
+            handler = _ThinkingLogEventHandler(callback, debouncer=debouncer)
 
-            # 1回目の処理
-            handler._handle_log_file(str(log_file))
-            first_count = len(callback_called)
+            class MockEvent:
+                is_directory = False
 
-            # デバウンス期間内に2回目を呼び出す（無視される）
-            handler._handle_log_file(str(log_file))
-            second_count = len(callback_called)
+                def __init__(self, path):
+                    self.src_path = path
 
-            # デバウンス期間が終わるのを待つ
-            time.sleep(0.6)
+            # 書き込みのたびにイベントが発生しても、発火までは処理されない
+            for i in range(3):
+                with open(log_file, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"agentName": "agent1", "content": f"Test log {i}"}) + "\n")
+                handler.on_modified(MockEvent(str(log_file)))
 
-            # 3回目の処理（デバウンス期間終了後）
-            handler._handle_log_file(str(log_file))
-            third_count = len(callback_called)
+            assert callback_called == []
+            assert debouncer.pending_count() == 1
+
+            # 発火時に最後の書き込みまで含めて1回で処理される
+            debouncer.flush()
+            debouncer.close()
+
+            assert [entry.content for entry in callback_called] == [
+                "Test log 0",
+                "Test log 1",
+                "Test log 2",
+            ]
+
+
+class TestJsonlTailer:
+    """JsonlTailerのテスト"""
+
+    @staticmethod
+    def _line(content: str) -> str:
+        return json.dumps({"agentName": "agent1", "content": content}) + "\n"
+
+    def test_reads_only_appended_lines(self, tmp_path: Path) -> None:
+        """追記分のみを読み込むテスト"""
+        log_file = tmp_path / "test.jsonl"
+        log_file.write_text(self._line("first"), encoding="utf-8")
+        tailer = JsonlTailer()
+
+        assert [r["content"] for r in tailer.read_new_lines(log_file)] == ["first"]
+        assert tailer.read_new_lines(log_file) == []
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(self._line("second"))
+
+        assert [r["content"] for r in tailer.read_new_lines(log_file)] == ["second"]
+        assert tailer.get_offset(log_file) == log_file.stat().st_size
+
+    def test_partial_trailing_line(self, tmp_path: Path) -> None:
+        """書き込み途中の末尾行を持ち越すテスト"""
+        log_file = tmp_path / "test.jsonl"
+        line = self._line("partial")
+        log_file.write_text(line[:10], encoding="utf-8")
+        tailer = JsonlTailer()
+
+        assert tailer.read_new_lines(log_file) == []
+        assert tailer.get_offset(log_file) == 0
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(line[10:])
+
+        assert [r["content"] for r in tailer.read_new_lines(log_file)] == ["partial"]
+
+    def test_truncation_rereads_from_start(self, tmp_path: Path) -> None:
+        """切り詰め時に先頭から読み直すテスト"""
+        log_file = tmp_path / "test.jsonl"
+        log_file.write_text(self._line("old-1") + self._line("old-2"), encoding="utf-8")
+        tailer = JsonlTailer()
+        tailer.read_new_lines(log_file)
+
+        log_file.write_text(self._line("new"), encoding="utf-8")
+
+        assert [r["content"] for r in tailer.read_new_lines(log_file)] == ["new"]
+
+    def test_rotation_rereads_from_start(self, tmp_path: Path) -> None:
+        """ローテーション（ファイル置き換え）時に先頭から読み直すテスト"""
+        log_file = tmp_path / "test.jsonl"
+        log_file.write_text(self._line("old"), encoding="utf-8")
+        tailer = JsonlTailer()
+        tailer.read_new_lines(log_file)
+
+        rotated = tmp_path / "test.jsonl.1"
+        log_file.rename(rotated)
+        replacement = tmp_path / "replacement.jsonl"
+        replacement.write_text(self._line("rotated-1") + self._line("rotated-2"), encoding="utf-8")
+        replacement.rename(log_file)
+
+        assert [r["content"] for r in tailer.read_new_lines(log_file)] == ["rotated-1", "rotated-2"]
+
+    def test_invalid_line_is_skipped(self, tmp_path: Path) -> None:
+        """不正な行をスキップして後続の行を読み込むテスト"""
+        log_file = tmp_path / "test.jsonl"
+        log_file.write_text("invalid json\n" + self._line("valid"), encoding="utf-8")
+        tailer = JsonlTailer()
+
+        assert [r["content"] for r in tailer.read_new_lines(log_file)] == ["valid"]
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """存在しないファイルのテスト"""
+        tailer = JsonlTailer()
+
+        assert tailer.read_new_lines(tmp_path / "missing.jsonl") == []
+
+    def test_own_line_with_concurrent_external_append(self, tmp_path: Path, monkeypatch) -> None:
+        """自分の書き込みの直前に他プロセスが追記しても、自分の行のみを読み飛ばすテスト"""
+        import builtins
+
+        import orchestrator.web.thinking_log_handler as module
+
+        log_file = tmp_path / "test.jsonl"
+        log_file.write_text(self._line("first"), encoding="utf-8")
+        tailer = JsonlTailer()
+        tailer.read_new_lines(log_file)
+
+        class RacingFile:
+            """書き込みの直前に他プロセスの追記を割り込ませるファイル"""
+
+            def __init__(self, f) -> None:
+                self._f = f
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args) -> None:
+                self._f.close()
+
+            def seek(self, *args):
+                return self._f.seek(*args)
+
+            def tell(self):
+                return self._f.tell()
+
+            def write(self, data):
+                with builtins.open(log_file, "a", encoding="utf-8") as other:
+                    other.write(TestJsonlTailer._line("external"))
+                return self._f.write(data)
+
+        def racing_open(path, mode="r", *args, **kwargs):
+            f = builtins.open(path, mode, *args, **kwargs)  # noqa: SIM115
+            return RacingFile(f) if "a" in mode else f
+
+        monkeypatch.setattr(module, "open", racing_open, raising=False)
+        tailer.append_own_line(log_file, self._line("own").encode("utf-8"))
+        monkeypatch.undo()
+
+        assert [r["content"] for r in tailer.read_new_lines(log_file)] == ["external"]
+        assert tailer.get_offset(log_file) == log_file.stat().st_size
+
+    def test_read_tail_skips_partial_first_line(self, tmp_path: Path) -> None:
+        """末尾のみの読み込みで途中から始まる行を読み飛ばすテスト"""
+        log_file = tmp_path / "test.jsonl"
+        log_file.write_text(
+            self._line("first") + self._line("second") + self._line("third"), encoding="utf-8"
+        )
+        tailer = JsonlTailer()
+
+        window = len(self._line("third").encode("utf-8")) + 5
+        records = tailer.read_tail(log_file, window)
+
+        assert [r["content"] for r in records] == ["third"]
+        assert tailer.get_offset(log_file) == log_file.stat().st_size
+
+    def test_handler_does_not_reread_existing_logs(self, tmp_path: Path) -> None:
+        """起動時に読み込んだログを変更イベントで再送しないテスト"""
+        from orchestrator.web.thinking_log_handler import _ThinkingLogEventHandler
+
+        log_file = tmp_path / "test-team.jsonl"
+        log_file.write_text(self._line("existing"), encoding="utf-8")
+        handler = ThinkingLogHandler(log_dir=tmp_path)
+
+        received = []
+        event_handler = _ThinkingLogEventHandler(received.append, handler._tailer)
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(self._line("appended"))
+        event_handler._handle_log_file(str(log_file))
+
+        assert [entry.content for entry in received] == ["appended"]
+
+
+class TestThinkingLogHandlerOwnWrites:
+    """自プロセスの書き込みによる再読み込みループ防止のテスト"""
+
+    @staticmethod
+    def _entry(content: str) -> ThinkingLogEntry:
+        return ThinkingLogEntry(
+            agent_name="agent1",
+            content=content,
+            timestamp="2026-02-06T12:00:00",
+            team_name="test-team",
+        )
+
+    def test_own_write_is_not_reread(self, tmp_path: Path) -> None:
+        """add_logの書き込みが変更イベントで再パースされないテスト"""
+        from orchestrator.web.thinking_log_handler import _ThinkingLogEventHandler
+
+        handler = ThinkingLogHandler(log_dir=tmp_path)
+        callback = Mock()
+        handler.register_callback(callback)
+        event_handler = _ThinkingLogEventHandler(handler._on_log_entry, handler._tailer)
+
+        with patch.object(handler, "add_log", wraps=handler.add_log) as mock_add_log:
+            handler.add_log(self._entry("own"))
+            event_handler._handle_log_file(str(tmp_path / "test-team.jsonl"))
+
+        mock_add_log.assert_called_once()
+        callback.assert_called_once()
+
+    def test_external_lines_pending_before_own_write(self, tmp_path: Path) -> None:
+        """未読の外部追記がある状態で自分が書き込んだ場合のテスト"""
+        handler = ThinkingLogHandler(log_dir=tmp_path)
+        log_file = tmp_path / "test-team.jsonl"
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self._entry("external").to_dict()) + "\n")
+        handler.add_log(self._entry("own"))
+
+        records = handler._tailer.read_new_lines(log_file)
+
+        assert [r["content"] for r in records] == ["external"]
+
+    def test_external_entry_is_not_written_back(self, tmp_path: Path) -> None:
+        """ファイルから読み込んだエントリを書き戻さないテスト"""
+        handler = ThinkingLogHandler(log_dir=tmp_path)
+        log_file = tmp_path / "test-team.jsonl"
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self._entry("external").to_dict()) + "\n")
+
+        for data in handler._tailer.read_new_lines(log_file):
+            handler._on_log_entry(ThinkingLogEntry.from_dict(data))
+
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 1
+        assert len(handler.get_logs("test-team")) == 1
+
+
+class TestThinkingLogHandlerRetention:
+    """思考ログの保持ポリシーのテスト"""
+
+    @staticmethod
+    def _entry(content: str) -> ThinkingLogEntry:
+        return ThinkingLogEntry(
+            agent_name="agent1",
+            content=content,
+            timestamp="2026-02-06T12:00:00",
+            team_name="test-team",
+        )
+
+    def test_retention_bounds_memory(self, tmp_path: Path) -> None:
+        """保持ポリシーを超えたログがメモリから破棄されるテスト"""
+        handler = ThinkingLogHandler(log_dir=tmp_path, retention=RetentionPolicy(max_entries=2))
+
+        for i in range(5):
+            handler.add_log(self._entry(f"log-{i}"))
+
+        assert [log["content"] for log in handler.get_logs("test-team")] == ["log-3", "log-4"]
+
+    def test_include_history_reads_from_disk(self, tmp_path: Path) -> None:
+        """破棄されたログをディスクから読み込めるテスト"""
+        handler = ThinkingLogHandler(log_dir=tmp_path)
+        handler.set_team_retention("test-team", RetentionPolicy(max_entries=1))
+
+        for i in range(3):
+            handler.add_log(self._entry(f"log-{i}"))
+
+        logs = handler.get_logs("test-team", include_history=True)
+
+        assert len(handler.get_logs("test-team")) == 1
+        assert [log["content"] for log in logs] == ["log-0", "log-1", "log-2"]
+
+    def test_startup_reads_only_tail_window(self, tmp_path: Path) -> None:
+        """起動時にログファイルの末尾のみを読み込むテスト"""
+        log_file = tmp_path / "test-team.jsonl"
+        lines = [json.dumps(self._entry(f"log-{i}").to_dict()) + "\n" for i in range(10)]
+        log_file.write_text("".join(lines), encoding="utf-8")
+
+        window = sum(len(line.encode("utf-8")) for line in lines[-3:])
+        handler = ThinkingLogHandler(log_dir=tmp_path, startup_window_bytes=window)
+
+        assert [log["content"] for log in handler.get_logs("test-team")] == [
+            "log-7",
+            "log-8",
+            "log-9",
+        ]
+        assert len(handler.get_logs("test-team", include_history=True)) == 10
+
+
+class TestThinkingLogHandlerIndexedQuery:
+    """思考ログのインデックスによる絞り込みのテスト"""
+
+    @staticmethod
+    def _add(handler: ThinkingLogHandler, index: int, agent: str, category: str) -> None:
+        handler.add_log(
+            ThinkingLogEntry(
+                agent_name=agent,
+                content=f"log-{index}",
+                timestamp=f"2026-02-06T12:00:{index:02d}",
+                category=category,
+                emotion="happy" if index % 2 else "neutral",
+                team_name="test-team",
+            ),
+            persist=False,
+        )
+
+    def test_filter_by_agent_with_pagination(self, tmp_path: Path) -> None:
+        """エージェントで絞り込み、古いページを順に取得できるテスト"""
+        handler = ThinkingLogHandler(log_dir=tmp_path)
+        for i in range(10):
+            self._add(handler, i, "agent1" if i % 3 else "agent2", "thinking")
+
+        latest = handler.get_logs_page("test-team", agent="agent1", limit=3)
+        older = handler.get_logs_page("test-team", agent="agent1", limit=3, before=latest.before)
+
+        assert [log["content"] for log in latest.items] == ["log-5", "log-7", "log-8"]
+        assert [log["content"] for log in older.items] == ["log-1", "log-2", "log-4"]
+        assert latest.total == 6
+        assert older.has_more is False
+
+    def test_combined_filters(self, tmp_path: Path) -> None:
+        """エージェント・カテゴリ・感情の条件を組み合わせられるテスト"""
+        handler = ThinkingLogHandler(log_dir=tmp_path)
+        for i in range(8):
+            self._add(
+                handler, i, "agent1" if i < 6 else "agent2", "action" if i % 4 else "thinking"
+            )
+
+        page = handler.get_logs_page(
+            "test-team", agent="agent1", category="action", emotion="happy"
+        )
+
+        assert [log["content"] for log in page.items] == ["log-1", "log-3", "log-5"]
+        assert handler.get_logs_page("test-team", agent="unknown").items == []
+
+    def test_version_changes_on_add(self, tmp_path: Path) -> None:
+        """ログを追加するとチームのバージョン番号が新しくなるテスト"""
+        handler = ThinkingLogHandler(log_dir=tmp_path)
+        assert handler.get_version("test-team") == 0
+
+        self._add(handler, 0, "agent1", "thinking")
+        first = handler.get_version("test-team")
+        self._add(handler, 1, "agent1", "thinking")
+
+        assert first > 0
+        assert handler.get_version("test-team") > first
+
+    def test_evicted_logs_leave_indexes(self, tmp_path: Path) -> None:
+        """保持ポリシーで破棄されたログがセカンダリインデックスからも消えるテスト"""
+        handler = ThinkingLogHandler(log_dir=tmp_path, retention=RetentionPolicy(max_entries=3))
+        for i in range(6):
+            self._add(handler, i, "agent1" if i < 3 else "agent2", "thinking")
 
-            # デバウンスにより2回目はスキップされる
-            assert first_count == second_count
-            assert third_count >= first_count
+        assert handler.get_logs_page("test-team", agent="agent1").items == []
+        assert handler.get_logs_page("test-team", agent="agent2").total == 3
 
 
 class TestThinkingLogHandlerEdgeCases:
@@ -0,0 +1,231 @@
+"""タイムスタンプ順インデックステスト
+
+TimeIndexとIndexedRingBufferのテストです。
+"""
+
+import pytest
+
+from orchestrator.web.retention import RetentionPolicy
+from orchestrator.web.time_index import (
+    IndexedRingBuffer,
+    TimeIndex,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def _timestamp(entry: dict) -> str:
+    return entry["timestamp"]
+
+
+def _entry(minute: int, name: str = "") -> dict:
+    return {"timestamp": f"2026-01-01T00:{minute:02d}:00Z", "name": name or f"m{minute}"}
+
+
+def _names(items: list[dict]) -> list[str]:
+    return [item["name"] for item in items]
+
+
+def _index(minutes: list[int]) -> TimeIndex[dict]:
+    index: TimeIndex[dict] = TimeIndex(_timestamp, dict)
+    for minute in minutes:
+        index.add(_entry(minute))
+    return index
+
+
+class TestCursor:
+    """カーソルのエンコード・デコードのテスト"""
+
+    def test_round_trip(self):
+        """タイムスタンプに区切り文字を含んでも元に戻る"""
+        key = ("2026-01-01T00:00:00Z", 12)
+
+        assert decode_cursor(encode_cursor(key)) == key
+
+    def test_invalid_cursor(self):
+        """不正なカーソルはValueError"""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestTimeIndex:
+    """TimeIndexクラスのテスト"""
+
+    def test_items_sorted_by_timestamp(self):
+        """追加順に関わらずタイムスタンプ順に並ぶ"""
+        index = _index([3, 1, 2, 5, 4])
+
+        assert _names(index.items()) == ["m1", "m2", "m3", "m4", "m5"]
+
+    def test_same_timestamp_keeps_insertion_order(self):
+        """同じタイムスタンプは追加順に並ぶ"""
+        index: TimeIndex[dict] = TimeIndex(_timestamp, dict)
+        index.add(_entry(1, "a"))
+        index.add(_entry(1, "b"))
+
+        assert _names(index.items()) == ["a", "b"]
+
+    def test_limit_returns_newest(self):
+        """limitのみの場合は最新のlimit件"""
+        page = _index(list(range(10))).page(limit=3)
+
+        assert _names(page.items) == ["m7", "m8", "m9"]
+        assert page.has_more is True
+        assert page.total == 10
+
+    def test_before_cursor_pages_backwards(self):
+        """beforeカーソルで古いページを順に取得できる"""
+        index = _index(list(range(7)))
+
+        first = index.page(limit=3)
+        second = index.page(limit=3, before=first.before)
+        third = index.page(limit=3, before=second.before)
+
+        assert _names(second.items) == ["m1", "m2", "m3"]
+        assert _names(third.items) == ["m0"]
+        assert third.has_more is False
+
+    def test_after_cursor_pages_forwards(self):
+        """afterカーソルで新しいページを取得できる"""
+        index = _index(list(range(6)))
+        oldest = index.page(limit=2, since="2026-01-01T00:00:00Z", until="2026-01-01T00:01:00Z")
+
+        page = index.page(limit=3, after=oldest.after)
+
+        assert _names(oldest.items) == ["m0"]
+        assert _names(page.items) == ["m1", "m2", "m3"]
+        assert page.has_more is True
+
+    def test_since_until_range(self):
+        """sinceは含み、untilは含まない"""
+        page = _index(list(range(10))).page(
+            since="2026-01-01T00:03:00Z", until="2026-01-01T00:06:00Z"
+        )
+
+        assert _names(page.items) == ["m3", "m4", "m5"]
+        assert page.has_more is False
+
+    def test_cursor_survives_removal(self):
+        """カーソルのエントリが削除されても位置を求められる"""
+        index: TimeIndex[dict] = TimeIndex(_timestamp, dict)
+        keys = [index.add(_entry(minute)) for minute in range(5)]
+        cursor = encode_cursor(keys[3])
+
+        index.remove(keys[3])
+
+        assert _names(index.page(before=cursor).items) == ["m0", "m1", "m2"]
+        assert _names(index.page(after=cursor).items) == ["m4"]
+
+    def test_converts_once(self):
+        """辞書への変換は追加時に一度だけ行われる"""
+        calls = []
+
+        def to_dict(entry: dict) -> dict:
+            calls.append(entry)
+            return dict(entry)
+
+        index: TimeIndex[dict] = TimeIndex(_timestamp, to_dict)
+        index.add(_entry(1))
+        index.page()
+        index.page(limit=1)
+
+        assert len(calls) == 1
+
+
+class TestIndexedRingBuffer:
+    """IndexedRingBufferクラスのテスト"""
+
+    def test_eviction_removes_from_index(self):
+        """保持ポリシーで破棄されたエントリはインデックスからも削除される"""
+        buffer: IndexedRingBuffer[dict] = IndexedRingBuffer(
+            _timestamp,
+            dict,
+            RetentionPolicy(max_entries=3),
+            items=[_entry(m) for m in (4, 0, 2, 1, 3)],
+        )
+
+        # 追加順で古い4と0が破棄される
+        assert _names(buffer.page().items) == ["m1", "m2", "m3"]
+        assert len(buffer.index) == 3
+        assert buffer.evicted == 2
+
+    def test_clear(self):
+        """clearでインデックスも空になる"""
+        buffer: IndexedRingBuffer[dict] = IndexedRingBuffer(_timestamp, dict, items=[_entry(1)])
+
+        buffer.clear()
+
+        assert buffer.page().items == []
+        assert len(buffer.index) == 0
+
+    def test_version_changes_on_mutation(self):
+        """追加・破棄・clearのたびにバージョン番号が新しくなる"""
+        buffer: IndexedRingBuffer[dict] = IndexedRingBuffer(
+            _timestamp, dict, RetentionPolicy(max_entries=2)
+        )
+        versions = [buffer.current_version()]
+
+        for minute in range(3):
+            buffer.append(_entry(minute))
+            versions.append(buffer.current_version())
+        assert buffer.current_version() == versions[-1]
+        buffer.clear()
+        versions.append(buffer.current_version())
+
+        assert len(set(versions)) == len(versions)
+
+
+class TestTimeIndexFacets:
+    """セカンダリインデックスのテスト"""
+
+    @staticmethod
+    def _index() -> TimeIndex[dict]:
+        index: TimeIndex[dict] = TimeIndex(
+            _timestamp,
+            dict,
+            facets={"agent": lambda entry: entry["agent"], "kind": lambda entry: entry["kind"]},
+        )
+        for minute in range(12):
+            entry = _entry(minute)
+            entry["agent"] = "a" if minute % 2 else "b"
+            entry["kind"] = "x" if minute % 3 else "y"
+            index.add(entry)
+        return index
+
+    def test_single_filter(self):
+        """1つの条件はセカンダリインデックスだけで取得できる"""
+        page = self._index().page(limit=2, filters={"agent": "a"})
+
+        assert _names(page.items) == ["m9", "m11"]
+        assert page.total == 6
+        assert page.has_more is True
+
+    def test_combined_filters_paginate(self):
+        """複数の条件を組み合わせてページ送りできる"""
+        index = self._index()
+
+        first = index.page(limit=1, filters={"agent": "a", "kind": "y"})
+        second = index.page(limit=1, before=first.before, filters={"agent": "a", "kind": "y"})
+        forward = index.page(limit=5, after=second.before, filters={"agent": "a", "kind": "y"})
+
+        assert _names(first.items) == ["m9"]
+        assert first.total is None
+        assert _names(second.items) == ["m3"]
+        assert second.has_more is False
+        assert _names(forward.items) == ["m9"]
+
+    def test_removal_updates_facets(self):
+        """削除したエントリはセカンダリインデックスからも消える"""
+        index: TimeIndex[dict] = TimeIndex(_timestamp, dict, facets={"name": lambda e: e["name"]})
+        key = index.add(_entry(1, "a"))
+        index.add(_entry(2, "b"))
+
+        index.remove(key)
+
+        assert index.page(filters={"name": "a"}).items == []
+        assert _names(index.page(filters={"name": "b"}).items) == ["b"]
+
+    def test_unknown_filter(self):
+        """セカンダリインデックスのない条件はValueError"""
+        with pytest.raises(ValueError):
+            self._index().page(filters={"emotion": "happy"})
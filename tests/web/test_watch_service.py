@@ -0,0 +1,144 @@
+"""WatchServiceテスト
+
+単一Observerによるファイル監視とルーティングをテストします。
+"""
+
+import threading
+from pathlib import Path
+
+from watchdog.events import FileCreatedEvent, FileMovedEvent, FileSystemEventHandler
+
+from orchestrator.web.watch_service import WatchService, get_watch_service
+
+
+class RecordingHandler(FileSystemEventHandler):
+    """受け取ったイベントを記録するハンドラー"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events = []
+        self.received = threading.Event()
+
+    def on_any_event(self, event) -> None:
+        self.events.append(event)
+        self.received.set()
+
+
+class TestWatchService:
+    """WatchServiceクラスのテスト"""
+
+    def test_routes_by_path_prefix(self, tmp_path: Path):
+        """プレフィックスが一致するハンドラーにのみ配送される"""
+        (tmp_path / "teams").mkdir()
+        (tmp_path / "tasks").mkdir()
+        service = WatchService()
+        team_handler = RecordingHandler()
+        task_handler = RecordingHandler()
+        service.add_route(tmp_path / "teams", team_handler)
+        service.add_route(tmp_path / "tasks", task_handler)
+
+        try:
+            service._route(FileCreatedEvent(str(tmp_path / "teams" / "a" / "config.json")))
+            service._route(FileCreatedEvent(str(tmp_path / "teams-other" / "b.json")))
+        finally:
+            service.remove_route(tmp_path / "teams", team_handler)
+            service.remove_route(tmp_path / "tasks", task_handler)
+
+        assert len(team_handler.events) == 1
+        assert task_handler.events == []
+
+    def test_moved_event_routed_by_destination(self, tmp_path: Path):
+        """移動イベントは移動先のプレフィックスでも配送される"""
+        (tmp_path / "logs").mkdir()
+        service = WatchService()
+        handler = RecordingHandler()
+        service.add_route(tmp_path / "logs", handler)
+
+        try:
+            service._route(
+                FileMovedEvent(str(tmp_path / "tmp.jsonl"), str(tmp_path / "logs" / "a.jsonl"))
+            )
+        finally:
+            service.remove_route(tmp_path / "logs", handler)
+
+        assert len(handler.events) == 1
+
+    def test_single_observer_and_nested_roots(self, tmp_path: Path):
+        """複数ルートを1つのObserverで監視し、入れ子のルートはまとめられる"""
+        (tmp_path / "teams" / "team-a").mkdir(parents=True)
+        (tmp_path / "tasks").mkdir()
+        service = WatchService()
+        handlers = [RecordingHandler() for _ in range(3)]
+        service.add_route(tmp_path / "teams" / "team-a", handlers[0])
+        service.add_route(tmp_path / "tasks", handlers[1])
+        service.add_route(tmp_path / "teams", handlers[2])
+
+        try:
+            stats = service.get_stats()
+            assert stats["running"]
+            assert stats["routes"] == 3
+            assert stats["watches"] == 2
+            assert stats["watchedPaths"] == sorted(
+                [str(tmp_path / "teams"), str(tmp_path / "tasks")]
+            )
+        finally:
+            service.remove_route(tmp_path / "teams" / "team-a", handlers[0])
+            service.remove_route(tmp_path / "tasks", handlers[1])
+            service.remove_route(tmp_path / "teams", handlers[2])
+
+        assert not service.is_running()
+        assert service.get_stats()["watches"] == 0
+
+    def test_missing_directory_is_pending(self, tmp_path: Path):
+        """存在しないディレクトリは作成待ちとして祖先ディレクトリで待機する"""
+        service = WatchService()
+        handler = RecordingHandler()
+        service.add_route(tmp_path / "missing" / "tasks", handler)
+
+        try:
+            assert service.is_running()
+            stats = service.get_stats()
+            assert stats["watches"] == 0
+            assert stats["pendingPaths"] == [str(tmp_path / "missing" / "tasks")]
+            assert list(service._ancestor_watches) == [str(tmp_path)]
+        finally:
+            service.remove_route(tmp_path / "missing" / "tasks", handler)
+
+    def test_watches_directory_created_later(self, tmp_path: Path):
+        """後から作成されたディレクトリの監視が開始され、イベントが配送される"""
+        service = WatchService()
+        handler = RecordingHandler()
+        target = tmp_path / "root" / "tasks"
+        service.add_route(target, handler)
+
+        try:
+            target.mkdir(parents=True)
+            for _ in range(100):
+                if service.get_stats()["watchedPaths"] == [str(target)]:
+                    break
+                threading.Event().wait(0.05)
+            assert service.get_stats()["pendingPaths"] == []
+            assert service._ancestor_watches == {}
+
+            (target / "1.json").write_text("{}")
+            assert handler.received.wait(timeout=5)
+        finally:
+            service.remove_route(target, handler)
+
+    def test_dispatches_real_file_events(self, tmp_path: Path):
+        """実際のファイル変更がハンドラーに配送される"""
+        service = WatchService()
+        handler = RecordingHandler()
+        service.add_route(tmp_path, handler)
+
+        try:
+            (tmp_path / "test.json").write_text("{}")
+            assert handler.received.wait(timeout=5)
+        finally:
+            service.remove_route(tmp_path, handler)
+
+        assert service.get_stats()["dispatched"] >= 1
+
+    def test_get_watch_service_singleton(self):
+        """シングルトンインスタンスのテスト"""
+        assert get_watch_service() is get_watch_service()